@@ -0,0 +1,18 @@
+"""
+Suite de benchmarks de TennisRPG v2
+
+Usage:
+    python -m TennisRPG_v2.benchmarks --output baseline.json
+    python -m TennisRPG_v2.benchmarks --compare baseline.json --threshold 0.1
+"""
+from .runner import (
+    BenchmarkCase, BenchmarkResult, Comparison, run_case, run_cases,
+    save_baseline, load_baseline, compare_results
+)
+from .scenarios import build_world, simulate_weeks, default_cases
+
+__all__ = [
+    'BenchmarkCase', 'BenchmarkResult', 'Comparison', 'run_case', 'run_cases',
+    'save_baseline', 'load_baseline', 'compare_results',
+    'build_world', 'simulate_weeks', 'default_cases'
+]
@@ -0,0 +1,73 @@
+"""
+Point d'entrée de la suite de benchmarks
+"""
+import argparse
+import sys
+
+from .runner import (
+    DEFAULT_SEED, DEFAULT_THRESHOLD, run_cases, save_baseline, load_baseline,
+    compare_results, format_results, format_comparisons
+)
+from .scenarios import default_cases
+from ..utils.profiler import profiler
+
+
+def main(argv=None) -> int:
+    """
+    Exécute les benchmarks, écrit une baseline et/ou compare avec une baseline existante
+
+    Returns:
+        Code de sortie (1 si une régression ou un cas absent de la baseline est détecté,
+        2 si la baseline a été mesurée avec d'autres paramètres)
+    """
+    parser = argparse.ArgumentParser(prog="python -m TennisRPG_v2.benchmarks",
+                                     description="Benchmarks de la simulation TennisRPG")
+    parser.add_argument("--output", help="Fichier JSON où écrire la baseline")
+    parser.add_argument("--compare", metavar="BASELINE", help="Baseline JSON à comparer")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Écart relatif toléré sur la médiane (défaut: %(default)s)")
+    parser.add_argument("--filter", default="", help="Ne garde que les benchmarks contenant ce texte")
+    parser.add_argument("--repeats", type=int, help="Nombre de mesures par benchmark")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--quick", action="store_true", help="Tailles réduites")
+    parser.add_argument("--profile", action="store_true",
+                        help="Affiche la répartition du temps par phase de simulation")
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        profiler.enable()
+
+    cases = [case for case in default_cases(args.quick) if args.filter in case.name]
+    results = run_cases(cases, seed=args.seed, repeats=args.repeats,
+                        progress=lambda result: print(f"  ✓ {result.name}", file=sys.stderr))
+    print(format_results(results))
+    if args.profile:
+        print()
+        profiler.report()
+
+    if args.output:
+        save_baseline(results, args.output, args.seed)
+        print(f"\nBaseline écrite dans {args.output}")
+
+    if args.compare:
+        try:
+            comparisons = compare_results(results, load_baseline(args.compare), args.threshold)
+        except ValueError as e:
+            print(f"\n❌ Comparaison impossible: {e}")
+            return 2
+        print()
+        print(format_comparisons(comparisons))
+        regressions = [comparison.name for comparison in comparisons if comparison.is_regression]
+        missing = [comparison.name for comparison in comparisons if comparison.is_missing]
+        if missing:
+            print(f"\n❌ {len(missing)} cas absent(s) de la baseline: {', '.join(missing)}")
+        if regressions:
+            print(f"\n❌ {len(regressions)} régression(s) au-delà de {args.threshold:.0%}: {', '.join(regressions)}")
+        if missing or regressions:
+            return 1
+        print(f"\n✅ Aucune régression au-delà de {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
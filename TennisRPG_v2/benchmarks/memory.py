@@ -0,0 +1,271 @@
+"""
+Suivi de l'empreinte mémoire sur une longue carrière
+
+Usage:
+    python -m TennisRPG_v2.benchmarks.memory --seasons 10 --output memoire.json
+"""
+import argparse
+import contextlib
+import gc
+import io
+import json
+import sys
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass, field, asdict
+from enum import Enum
+from types import ModuleType, FunctionType, BuiltinFunctionType, MethodType
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..core.game_session_state import GameSessionState
+from ..entities.tournament import MatchResult, TournamentResult
+from ..utils.cache_manager import elo_cache, ranking_cache, tournament_cache, display_cache
+from ..utils.constants import TIME_CONSTANTS, GAME_CONSTANTS
+from .runner import DEFAULT_SEED, seed_everything
+from .scenarios import build_world, simulate_weeks
+
+# Objets partagés par tout le programme: jamais comptés dans un composant
+_SHARED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType, Enum)
+
+
+def deep_sizeof(obj: Any) -> int:
+    """
+    Taille mémoire approximative d'un objet et de tout ce qu'il référence
+
+    Chaque objet n'est compté qu'une fois. Les tableaux numpy et DataFrames
+    sont mesurés via leurs buffers; classes, modules, fonctions et membres
+    d'Enum sont ignorés car partagés.
+
+    Args:
+        obj: Objet à mesurer
+
+    Returns:
+        Taille en octets
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, _SHARED_TYPES):
+            continue
+        seen.add(id(current))
+
+        if isinstance(current, (pd.DataFrame, pd.Series)):
+            total += int(np.sum(current.memory_usage(deep=True)))
+            continue
+        if isinstance(current, np.ndarray):
+            total += sys.getsizeof(current) if current.base is None else current.nbytes
+            continue
+
+        total += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset, deque)):
+            stack.extend(current)
+        else:
+            if hasattr(current, "__dict__"):
+                stack.append(current.__dict__)
+            for slot in getattr(type(current), "__slots__", ()):
+                if hasattr(current, slot):
+                    stack.append(getattr(current, slot))
+    return total
+
+
+@dataclass
+class MemorySample:
+    """Mesure mémoire à une frontière de saison"""
+    season: int
+    players: int
+    components: Dict[str, int]
+    live_objects: Dict[str, int]
+    traced_current: Optional[int] = None
+    traced_peak: Optional[int] = None
+
+    @property
+    def bytes_per_player(self) -> float:
+        return self.components["players"] / self.players if self.players else 0.0
+
+
+@dataclass
+class MemoryReport:
+    """Mesures successives et pentes de croissance"""
+    samples: List[MemorySample] = field(default_factory=list)
+
+    def slopes(self) -> Dict[str, float]:
+        """
+        Croissance moyenne par saison de chaque composant (régression linéaire)
+
+        Returns:
+            Dictionnaire {composant: octets par saison}
+        """
+        if len(self.samples) < 2:
+            return {}
+        seasons = np.array([sample.season for sample in self.samples], dtype=float)
+        slopes = {}
+        for name in self.samples[0].components:
+            values = np.array([sample.components[name] for sample in self.samples], dtype=float)
+            slopes[name] = float(np.polyfit(seasons, values, 1)[0])
+        for name in self.samples[0].live_objects:
+            values = np.array([sample.live_objects[name] for sample in self.samples], dtype=float)
+            slopes[f"live:{name}"] = float(np.polyfit(seasons, values, 1)[0])
+        return slopes
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit le rapport en dictionnaire JSON"""
+        return {
+            "samples": [dict(asdict(sample), bytes_per_player=sample.bytes_per_player) for sample in self.samples],
+            "slopes_per_season": self.slopes()
+        }
+
+    def format_table(self) -> str:
+        """Tableau par saison puis pentes de croissance"""
+        if not self.samples:
+            return "Aucune mesure"
+        names = list(self.samples[0].components)
+        header = f"{'saison':>6} {'joueurs':>8} {'o/joueur':>10} " + " ".join(f"{name[:14]:>14}" for name in names)
+        lines = [header, "-" * len(header)]
+        for sample in self.samples:
+            lines.append(f"{sample.season:>6} {sample.players:>8} {sample.bytes_per_player:>10.0f} "
+                         + " ".join(f"{sample.components[name]:>14,}" for name in names))
+
+        slopes = self.slopes()
+        if slopes:
+            lines.append("")
+            lines.append("Croissance par saison:")
+            for name, slope in sorted(slopes.items(), key=lambda item: abs(item[1]), reverse=True):
+                unit = "objets" if name.startswith("live:") else "octets"
+                flag = "  ⚠️ croît" if slope >= 1 and not name.startswith("live:") and name != "players" else ""
+                lines.append(f"   {name:<28} {slope:>+14,.0f} {unit}{flag}")
+        return "\n".join(lines)
+
+
+class MemoryGrowthTracker:
+    """
+    Simule des saisons et mesure la mémoire de chaque composant à chaque fin de saison
+
+    Le pool actif garde une taille constante (les retraités sont remplacés):
+    tout composant dont la taille croît de saison en saison grandit donc avec
+    la durée de la carrière et non avec la taille du monde.
+    """
+
+    def __init__(self, state: GameSessionState, use_tracemalloc: bool = True):
+        """
+        Args:
+            state: Monde de jeu à simuler
+            use_tracemalloc: Mesure aussi la mémoire allouée par Python (plus lent)
+        """
+        self.state = state
+        self.use_tracemalloc = use_tracemalloc
+        self.report = MemoryReport()
+
+    def measure_components(self) -> Dict[str, int]:
+        """Mesure chaque composant suivi"""
+        state = self.state
+        tournaments = state.tournament_manager.runs
+        ranking_manager = state.ranking_manager
+
+        return {
+            "players": deep_sizeof(state.all_players),
+            "elo_ratings": sum(deep_sizeof(player.career.elo_ratings) for player in state.all_players.values()),
+            "points_history": deep_sizeof(ranking_manager.atp_points_history) if ranking_manager else 0,
+            "rank_history": deep_sizeof(ranking_manager.rank_history) if ranking_manager else 0,
+            "match_results": sum(deep_sizeof(tournament.match_results) for tournament in tournaments),
+            "retirement_log": deep_sizeof(state.retirement_manager.retirement_log),
+            "generated_names": deep_sizeof(state.player_generator.generated_names),
+            "match_log": deep_sizeof(state.match_log),
+            "head_to_head": deep_sizeof(state.head_to_head),
+            "career_stats": deep_sizeof(state.career_stats),
+        }
+
+    @staticmethod
+    def count_live_objects() -> Dict[str, int]:
+        """Compte les résultats de matchs et de tournois encore vivants et les entrées de cache"""
+        gc.collect()
+        # Les clés de cache référencent joueurs et classements: on compte les entrées plutôt que les octets
+        counts = {"cache_entries": sum(len(cache.cache) for cache in (elo_cache, ranking_cache,
+                                                                      tournament_cache, display_cache)),
+                  "MatchResult": 0, "TournamentResult": 0}
+        for obj in gc.get_objects():
+            if isinstance(obj, MatchResult):
+                counts["MatchResult"] += 1
+            elif isinstance(obj, TournamentResult):
+                counts["TournamentResult"] += 1
+        return counts
+
+    def sample(self, season: int) -> MemorySample:
+        """Prend une mesure et l'ajoute au rapport"""
+        traced_current = traced_peak = None
+        if self.use_tracemalloc and tracemalloc.is_tracing():
+            traced_current, traced_peak = tracemalloc.get_traced_memory()
+
+        sample = MemorySample(
+            season=season,
+            players=len(self.state.all_players),
+            components=self.measure_components(),
+            live_objects=self.count_live_objects(),
+            traced_current=traced_current,
+            traced_peak=traced_peak
+        )
+        self.report.samples.append(sample)
+        return sample
+
+    def run(self, seasons: int, quiet: bool = True) -> MemoryReport:
+        """
+        Simule des saisons complètes en mesurant la mémoire à chaque frontière
+
+        Args:
+            seasons: Nombre de saisons
+            quiet: Masque les affichages du jeu
+
+        Returns:
+            Rapport des mesures
+        """
+        started_tracing = self.use_tracemalloc and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        try:
+            self.sample(0)
+            for season in range(1, seasons + 1):
+                output = contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext()
+                with output:
+                    simulate_weeks(self.state, TIME_CONSTANTS["WEEKS_PER_YEAR"])
+                self.sample(season)
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+        return self.report
+
+
+def main(argv=None) -> int:
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(prog="python -m TennisRPG_v2.benchmarks.memory",
+                                     description="Croissance mémoire de TennisRPG sur plusieurs saisons")
+    parser.add_argument("--seasons", type=int, default=5)
+    parser.add_argument("--pool-size", type=int, default=GAME_CONSTANTS["NPC_POOL_SIZE"])
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--output", help="Fichier JSON du rapport")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="Désactive tracemalloc (plus rapide)")
+    args = parser.parse_args(argv)
+
+    seed_everything(args.seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        state = build_world(args.pool_size)
+    tracker = MemoryGrowthTracker(state, use_tracemalloc=not args.no_tracemalloc)
+    report = tracker.run(args.seasons)
+
+    print(report.format_table())
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report.to_dict(), f, indent=2)
+        print(f"\nRapport écrit dans {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+"""
+Moteur de benchmarks - mesures répétées, baseline JSON et détection de régressions
+"""
+import contextlib
+import io
+import json
+import platform
+import random
+import statistics
+import time
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple, Any
+
+import numpy as np
+from faker import Faker
+
+# Un cas prépare son état puis retourne (fonction mesurée, remise à zéro optionnelle entre deux mesures)
+CaseSetup = Callable[[], Tuple[Callable[[], Any], Optional[Callable[[], Any]]]]
+
+BASELINE_VERSION = 1
+DEFAULT_SEED = 1234
+DEFAULT_THRESHOLD = 0.10  # Régression signalée au-delà de +10% sur la médiane
+
+
+@dataclass
+class BenchmarkCase:
+    """Définition d'un benchmark"""
+    name: str
+    setup: CaseSetup
+    repeats: int = 7
+    warmup: int = 1
+    number: int = 1  # Appels par mesure (temps rapporté par appel)
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BenchmarkResult:
+    """Résultat d'un benchmark (temps en secondes par appel)"""
+    name: str
+    samples: List[float]
+    params: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def p95(self) -> float:
+        return float(np.percentile(self.samples, 95))
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.samples)
+
+    @property
+    def minimum(self) -> float:
+        return min(self.samples)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit le résultat en dictionnaire pour la baseline"""
+        data = asdict(self)
+        data.update({"median": self.median, "p95": self.p95, "mean": self.mean, "min": self.minimum})
+        return data
+
+
+@dataclass
+class Comparison:
+    """Comparaison d'un résultat avec la baseline (baseline_median None: cas absent de la baseline)"""
+    name: str
+    baseline_median: Optional[float]
+    current_median: float
+    threshold: float
+
+    @property
+    def is_missing(self) -> bool:
+        return self.baseline_median is None
+
+    @property
+    def ratio(self) -> float:
+        return self.current_median / self.baseline_median if self.baseline_median else float("inf")
+
+    @property
+    def is_regression(self) -> bool:
+        return not self.is_missing and self.ratio > 1 + self.threshold
+
+    @property
+    def is_failure(self) -> bool:
+        return self.is_missing or self.is_regression
+
+    @property
+    def is_improvement(self) -> bool:
+        return not self.is_missing and self.ratio < 1 - self.threshold
+
+
+def seed_everything(seed: int) -> None:
+    """Fixe les graines de random, numpy et Faker"""
+    random.seed(seed)
+    np.random.seed(seed)
+    Faker.seed(seed)
+
+
+def run_case(case: BenchmarkCase, seed: int = DEFAULT_SEED, quiet: bool = True,
+             repeats: Optional[int] = None) -> BenchmarkResult:
+    """
+    Exécute un benchmark: préparation, échauffement puis mesures répétées
+
+    Args:
+        case: Benchmark à exécuter
+        seed: Graine fixée avant la préparation
+        quiet: Masque les affichages du jeu pendant l'exécution
+        repeats: Nombre de mesures (défaut: celui du cas)
+
+    Returns:
+        Résultat avec un temps par appel pour chaque mesure
+    """
+    output = contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext()
+    with output:
+        seed_everything(seed)
+        run, reset = case.setup()
+
+        for _ in range(case.warmup):
+            for _ in range(case.number):
+                run()
+            if reset:
+                reset()
+
+        samples = []
+        for _ in range(repeats or case.repeats):
+            start = time.perf_counter()
+            for _ in range(case.number):
+                run()
+            samples.append((time.perf_counter() - start) / case.number)
+            if reset:
+                reset()
+
+    return BenchmarkResult(name=case.name, samples=samples, params=dict(case.params))
+
+
+def run_cases(cases: List[BenchmarkCase], seed: int = DEFAULT_SEED, quiet: bool = True,
+              repeats: Optional[int] = None,
+              progress: Optional[Callable[[BenchmarkResult], None]] = None) -> List[BenchmarkResult]:
+    """Exécute une liste de benchmarks dans l'ordre"""
+    results = []
+    for case in cases:
+        result = run_case(case, seed, quiet, repeats)
+        results.append(result)
+        if progress:
+            progress(result)
+    return results
+
+
+def environment_info() -> Dict[str, str]:
+    """Décrit la machine et les versions utilisées pour la baseline"""
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine()
+    }
+
+
+def save_baseline(results: List[BenchmarkResult], path: str, seed: int = DEFAULT_SEED) -> None:
+    """Écrit les résultats dans un fichier de baseline JSON"""
+    data = {
+        "version": BASELINE_VERSION,
+        "created": datetime.now().isoformat(),
+        "seed": seed,
+        "environment": environment_info(),
+        "results": {result.name: result.to_dict() for result in results}
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, Any]]:
+    """Lit une baseline et retourne les résultats par nom de benchmark"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def compare_results(results: List[BenchmarkResult], baseline: Dict[str, Dict[str, Any]],
+                    threshold: float = DEFAULT_THRESHOLD) -> List[Comparison]:
+    """
+    Compare des résultats à une baseline (médianes)
+
+    Args:
+        results: Résultats courants
+        baseline: Résultats de référence par nom
+        threshold: Écart relatif toléré avant de signaler une régression
+
+    Returns:
+        Une comparaison par résultat; un cas absent de la baseline est un échec (is_missing)
+
+    Raises:
+        ValueError: Si un cas a été mesuré avec d'autres paramètres que dans la baseline
+    """
+    # Paramètres normalisés comme dans la baseline JSON (tuples -> listes)
+    mismatched = [
+        result.name for result in results
+        if result.name in baseline and json.loads(json.dumps(result.params)) != baseline[result.name].get("params", {})
+    ]
+    if mismatched:
+        raise ValueError(f"Paramètres différents de la baseline: {', '.join(mismatched)}")
+
+    return [
+        Comparison(result.name, baseline[result.name]["median"] if result.name in baseline else None,
+                   result.median, threshold)
+        for result in results
+    ]
+
+
+def _format_time(seconds: float) -> str:
+    """Formate une durée avec une unité lisible"""
+    if seconds >= 1:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.1f} µs"
+
+
+def format_results(results: List[BenchmarkResult]) -> str:
+    """Tableau des résultats"""
+    lines = [f"{'Benchmark':<40} {'médiane':>12} {'p95':>12} {'min':>12} {'n':>4}", "-" * 84]
+    for result in results:
+        lines.append(f"{result.name:<40} {_format_time(result.median):>12} {_format_time(result.p95):>12} "
+                     f"{_format_time(result.minimum):>12} {len(result.samples):>4}")
+    return "\n".join(lines)
+
+
+def format_comparisons(comparisons: List[Comparison]) -> str:
+    """Tableau de comparaison avec la baseline"""
+    lines = [f"{'Benchmark':<40} {'baseline':>12} {'actuel':>12} {'ratio':>8}  statut", "-" * 84]
+    for comparison in comparisons:
+        if comparison.is_missing:
+            lines.append(f"{comparison.name:<40} {'-':>12} {_format_time(comparison.current_median):>12} "
+                         f"{'-':>8}  ABSENT DE LA BASELINE")
+            continue
+        status = "RÉGRESSION" if comparison.is_regression else "amélioration" if comparison.is_improvement else "ok"
+        lines.append(f"{comparison.name:<40} {_format_time(comparison.baseline_median):>12} "
+                     f"{_format_time(comparison.current_median):>12} {comparison.ratio:>7.2f}x  {status}")
+    return "\n".join(lines)
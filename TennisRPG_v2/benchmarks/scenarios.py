@@ -0,0 +1,179 @@
+"""
+Scénarios de benchmark - monde de jeu sans interface et cas mesurés
+"""
+import tempfile
+import weakref
+from typing import List
+
+from ..core.game_session_controller import GameSessionController
+from ..core.game_session_state import GameSessionState
+from ..core.save_manager import SaveManager
+from ..entities.player import Player, Gender
+from ..entities.spectialized_tournaments import ATP250, Masters1000, GrandSlam
+from ..managers.player_archive import RetiredPlayerArchive
+from ..managers.player_generator import PlayerGenerator
+from ..utils.constants import TIME_CONSTANTS, GAME_CONSTANTS
+from .runner import BenchmarkCase
+
+
+def build_world(pool_size: int, gender: Gender = Gender.MALE) -> GameSessionState:
+    """
+    Construit un monde de jeu sans joueur principal, prêt à simuler
+
+    Args:
+        pool_size: Nombre de PNJ
+        gender: Genre des joueurs
+
+    Returns:
+        État de session avec pool, classements et gestionnaires initialisés
+    """
+    state = GameSessionState()
+    # Archive et journal des matchs en mémoire: pas de fichier créé, mais le coût d'écriture reste mesuré
+    state.retirement_manager.player_archive = RetiredPlayerArchive()
+    state.match_log.directory = None
+    state.add_players(state.player_generator.generate_player_pool(pool_size, gender))
+    state.initialize_ranking_manager()
+    state.initialize_atp_points_manager()
+    state.initialize_activity_manager()
+    return state
+
+
+def simulate_weeks(state: GameSessionState, weeks: int, start_week: int = 1) -> None:
+    """Simule des semaines comme la simulation préliminaire (retraites et fin de saison du journal en fin d'année)"""
+    controller = GameSessionController(None, state)
+    weeks_per_year = TIME_CONSTANTS["WEEKS_PER_YEAR"]
+    for offset in range(weeks):
+        week = (start_week - 1 + offset) % weeks_per_year + 1
+        controller._simulate_week_preliminarily(week)
+        if week == weeks_per_year:
+            state.process_retirements()
+            state.end_match_season()
+
+
+def _simulate_match_case(number: int) -> BenchmarkCase:
+    def setup():
+        tournament = ATP250("Benchmark Open", "Benchmark", 32, "Hard")
+        player1 = Player(gender=Gender.MALE, first_name="Alpha", last_name="Bench", country="France", level=20)
+        player2 = Player(gender=Gender.MALE, first_name="Beta", last_name="Bench", country="Spain", level=18)
+
+        def reset():
+            player1.physical.fatigue = 0
+            player2.physical.fatigue = 0
+
+        return (lambda: tournament.simulate_match(player1, player2)), reset
+    return BenchmarkCase("simulate_match", setup, repeats=9, number=number)
+
+
+def _play_tournament_case(tournament_factory, draw_size: int, pool_size: int) -> BenchmarkCase:
+    def setup():
+        state = build_world(pool_size)
+        tournament = tournament_factory()
+        participants = list(state.all_players.values())[:draw_size]
+
+        def reset():
+            tournament.participants.clear()
+            tournament.match_results.clear()
+            tournament.eliminated_players.clear()
+            for participant in participants:
+                participant.physical.fatigue = 0
+                tournament.add_participant(participant)
+
+        def run():
+            state.tournament_manager.play_tournament(
+                tournament, verbose=False, atp_points_manager=state.atp_points_manager, week=10
+            )
+
+        reset()
+        return run, reset
+    return BenchmarkCase(f"play_tournament[{draw_size}]", setup, params={"draw_size": draw_size})
+
+
+def _select_players_case(pool_size: int) -> BenchmarkCase:
+    def setup():
+        state = build_world(pool_size)
+        tournament = GrandSlam("Benchmark Slam", "Benchmark", "Hard")
+        return (lambda: state.tournament_manager.select_players_for_tournament(
+            tournament, state.all_players, state.ranking_manager)), None
+    return BenchmarkCase(f"select_players_for_tournament[{pool_size}]", setup, params={"pool_size": pool_size})
+
+
+def _week_case(pool_size: int) -> BenchmarkCase:
+    def setup():
+        state = build_world(pool_size)
+        weeks = iter(range(1, 10 ** 6))
+        return (lambda: simulate_weeks(state, 1, next(weeks))), None
+    return BenchmarkCase(f"simulate_week[{pool_size}]", setup, params={"pool_size": pool_size})
+
+
+def _season_case(pool_size: int, repeats: int) -> BenchmarkCase:
+    def setup():
+        state = build_world(pool_size)
+        return (lambda: simulate_weeks(state, TIME_CONSTANTS["WEEKS_PER_YEAR"])), None
+    return BenchmarkCase(f"simulate_season[{pool_size}]", setup, repeats=repeats, warmup=0,
+                         params={"pool_size": pool_size})
+
+
+def _ranking_update_case(pool_size: int) -> BenchmarkCase:
+    def setup():
+        state = build_world(pool_size)
+        return state.ranking_manager.update_weekly_rankings, None
+    return BenchmarkCase(f"update_weekly_rankings[{pool_size}]", setup, repeats=9, params={"pool_size": pool_size})
+
+
+def _pool_generation_case(count: int) -> BenchmarkCase:
+    def setup():
+        return (lambda: PlayerGenerator().generate_player_pool(count, Gender.MALE)), None
+    return BenchmarkCase(f"generate_player_pool[{count}]", setup, repeats=5, params={"count": count})
+
+
+def _save_load_cases(pool_size: int) -> List[BenchmarkCase]:
+    def build():
+        state = build_world(pool_size)
+        directory = tempfile.TemporaryDirectory(prefix="tennisrpg_bench_")
+        save_manager = SaveManager(directory.name)
+        # Le répertoire temporaire vit aussi longtemps que le gestionnaire
+        weakref.finalize(save_manager, directory.cleanup)
+        return state.create_game_state_for_save(), save_manager
+
+    def save_setup():
+        game_state, save_manager = build()
+        return (lambda: save_manager.save_game(game_state, "benchmark")), None
+
+    def load_setup():
+        game_state, save_manager = build()
+        save_manager.save_game(game_state, "benchmark")
+        return (lambda: save_manager.load_game("benchmark")), None
+
+    params = {"pool_size": pool_size}
+    return [BenchmarkCase(f"save_game[{pool_size}]", save_setup, repeats=5, params=params),
+            BenchmarkCase(f"load_game[{pool_size}]", load_setup, repeats=5, params=params)]
+
+
+def default_cases(quick: bool = False) -> List[BenchmarkCase]:
+    """
+    Retourne la suite de benchmarks standard
+
+    Args:
+        quick: Moins de mesures et de tailles (vérification rapide)
+
+    Returns:
+        Liste des benchmarks
+    """
+    # Une semaine complète remplit tous les tableaux: le pool doit avoir la taille du jeu
+    pool_size = GAME_CONSTANTS["NPC_POOL_SIZE"]
+    save_sizes = (200, 1000) if quick else (200, 1000, 3000)
+
+    cases = [
+        _simulate_match_case(number=200 if quick else 1000),
+        _play_tournament_case(lambda: ATP250("Benchmark 250", "Benchmark", 32, "Hard"), 32, pool_size),
+        _play_tournament_case(lambda: Masters1000("Benchmark 1000", "Benchmark", 96, "Hard"), 96, pool_size),
+        _play_tournament_case(lambda: GrandSlam("Benchmark Slam", "Benchmark", "Hard"), 128, pool_size),
+        _select_players_case(pool_size),
+        _week_case(pool_size),
+        _season_case(pool_size, repeats=1 if quick else 3),
+        _ranking_update_case(pool_size),
+        _pool_generation_case(100 if quick else 500),
+    ]
+    for size in save_sizes:
+        cases.extend(_save_load_cases(size))
+    return cases
@@ -0,0 +1,107 @@
+"""
+Gestionnaire de sauvegarde automatique en arrière-plan
+"""
+import queue
+import threading
+from typing import Optional, Dict, Any
+
+from .save_manager import SaveManager, GameState
+from ..utils.error_handler import logger
+
+
+class AutosaveManager:
+    """
+    Sauvegarde automatique non bloquante
+
+    L'instantané est pris sur le thread du jeu (sérialisation en dictionnaires
+    des seuls joueurs modifiés grâce aux deltas), puis l'écriture JSON, le fsync
+    et le renommage atomique sont faits sur un thread dédié. Les sauvegardes
+    sont écrites dans l'ordre de leur demande.
+    """
+
+    def __init__(self, save_manager: SaveManager):
+        """
+        Initialise le gestionnaire de sauvegarde automatique
+
+        Args:
+            save_manager: Gestionnaire de sauvegarde utilisé pour l'écriture
+        """
+        self.save_manager = save_manager
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self.completed_saves = 0
+        self.last_error: Optional[Exception] = None
+
+    @staticmethod
+    def get_autosave_filename(game_state: GameState) -> str:
+        """Retourne le nom du fichier de sauvegarde automatique de la partie"""
+        if game_state.main_player:
+            return f"autosave_{game_state.main_player.first_name}_{game_state.main_player.last_name}"
+        return "autosave"
+
+    def request_autosave(self, game_state: GameState, filename: str = None) -> bool:
+        """
+        Prend un instantané de l'état et planifie son écriture en arrière-plan
+
+        Args:
+            game_state: État du jeu à sauvegarder
+            filename: Nom du fichier (défaut: autosave du joueur principal)
+
+        Returns:
+            True si la sauvegarde a été planifiée
+        """
+        filename = filename or self.get_autosave_filename(game_state)
+        try:
+            pending_save = self.save_manager.prepare_save(game_state, filename, incremental=True)
+        except Exception as e:
+            self.last_error = e
+            logger.error(f"Autosave snapshot failed: {e}")
+            return False
+
+        self._ensure_worker()
+        self._queue.put(pending_save)
+        return True
+
+    def flush(self) -> None:
+        """Attend que toutes les sauvegardes planifiées soient écrites"""
+        if self._worker is not None:
+            self._queue.join()
+
+    def shutdown(self) -> None:
+        """Écrit les sauvegardes en attente puis arrête le thread d'écriture"""
+        with self._worker_lock:
+            worker = self._worker
+            if worker is None:
+                return
+            self._queue.put(None)
+            worker.join()
+            self._worker = None
+
+    @property
+    def pending_count(self) -> int:
+        """Nombre de sauvegardes en attente d'écriture"""
+        return self._queue.unfinished_tasks
+
+    def _ensure_worker(self) -> None:
+        """Démarre le thread d'écriture si nécessaire"""
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="autosave-writer", daemon=True)
+                self._worker.start()
+
+    def _run(self) -> None:
+        """Boucle du thread d'écriture"""
+        while True:
+            pending_save = self._queue.get()
+            try:
+                if pending_save is None:
+                    return
+                self.save_manager.write_prepared_save(pending_save)
+                self.completed_saves += 1
+            except Exception as e:
+                self.last_error = e
+                # write_prepared_save has already re-marked the players dirty and dropped the base
+                logger.error(f"Autosave write failed for {pending_save['filename']}, next autosave will be full: {e}")
+            finally:
+                self._queue.task_done()
@@ -10,6 +10,8 @@ from typing import Dict, List, Optional
 from ..entities.player import Player, Gender
 from ..entities.ranking import RankingType
 from ..utils.constants import TIME_CONSTANTS, GAME_CONSTANTS
+from ..utils.profiler import profile_phase
+from ..managers.player_generator import preload_name_banks
 from .game_session_ui import GameSessionUI
 from .game_session_state import GameSessionState
 
@@ -28,6 +30,9 @@ class GameSessionController:
         # Démarre le chronométrage
         self.state.start_session_timing()
         
+        # Charge les banques de noms en arrière-plan pendant la création du joueur
+        preload_name_banks(background=True)
+        
         # 1. Création du joueur principal
         self._create_main_player()
         
@@ -100,11 +105,17 @@ class GameSessionController:
         
         # Simule 1 année préliminaire (réduit pour performance)
         preliminary_start_year = TIME_CONSTANTS["GAME_START_YEAR"] - 1
+        self.state.match_log.current_year = preliminary_start_year
         for year in range(1):
             current_sim_year = preliminary_start_year + year
             self.ui.display_preliminary_simulation_year(current_sim_year)
             
-            for week in range(1, TIME_CONSTANTS["WEEKS_PER_YEAR"]*10 + 1):  # 52 semaines par an, 10 ans de simulation
+            simulated_weeks = TIME_CONSTANTS["WEEKS_PER_YEAR"] * 10
+            # Les semaines simulées précèdent la première saison de jeu (historique des rangs daté)
+            first_history_year = TIME_CONSTANTS["GAME_START_YEAR"] - simulated_weeks // TIME_CONSTANTS["WEEKS_PER_YEAR"]
+            for week in range(1, simulated_weeks + 1):  # 52 semaines par an, 10 ans de simulation
+                self.state.sync_ranking_clock(first_history_year + (week - 1) // TIME_CONSTANTS["WEEKS_PER_YEAR"],
+                                              (week - 1) % TIME_CONSTANTS["WEEKS_PER_YEAR"] + 1)
                 self._simulate_week_preliminarily(week)
                 
                 # Progress tous les 6 mois
@@ -118,6 +129,7 @@ class GameSessionController:
         self.ui.display_preliminary_simulation_complete(simulation_time)
         self.state.set_preliminary_complete()
         
+    @profile_phase("preliminary_week")
     def _simulate_week_preliminarily(self, week: int) -> None:
         """Simule une semaine sans le joueur principal"""
         # Simule tous les tournois de la semaine
@@ -209,7 +221,7 @@ class GameSessionController:
             return
             
         points_to_defend = self.state.ranking_manager.get_points_to_defend(
-            self.state.main_player.full_name
+            self.state.main_player.player_id
         )
         
         self.ui.display_atp_points_to_defend(
@@ -351,6 +363,9 @@ class GameSessionController:
         
         # Récupération naturelle de fatigue - utilisation méthode centralisée
         self.state.apply_natural_fatigue_recovery()
+
+        # Sauvegarde automatique en arrière-plan (ne bloque pas la boucle de jeu)
+        self.state.autosave()
         
     def _process_end_of_year_retirements(self) -> None:
         """Traite les retraites et la rotation des joueurs en fin d'année"""
@@ -2,17 +2,28 @@
 Game Session State - Gestion de l'état du jeu
 Extrait de GameSession pour une meilleure séparation des responsabilités
 """
+import os
 import time
-from typing import Dict, Optional
-from ..entities.player import Player
+import uuid
+import numpy as np
+from typing import Any, Dict, List, Optional, Union
+from ..entities.player import Player, apply_fatigue_changes
 from ..managers.player_generator import PlayerGenerator
 from ..managers.tournament_manager import TournamentManager
 from ..managers.ranking_manager import RankingManager
 from ..managers.weekly_activity_manager import WeeklyActivityManager
 from ..managers.atp_points_manager import ATPPointsManager
 from ..managers.retirement_manager import RetirementManager
-from ..utils.constants import TIME_CONSTANTS
+from ..managers.player_archive import RetiredPlayerArchive
+from ..managers.match_log import MatchLog
+from ..managers.head_to_head import HeadToHeadRecords
+from ..managers.career_stats import CareerStatistics
+from ..managers.results_elo import ResultsEloEngine
+from ..managers.glicko_engine import Glicko2Engine
+from ..utils.constants import TIME_CONSTANTS, SAVE_CONSTANTS, ELO_CONSTANTS
+from ..utils.profiler import profile_phase
 from .save_manager import SaveManager, GameState
+from .autosave_manager import AutosaveManager
 
 
 class GameSessionState:
@@ -21,7 +32,7 @@ class GameSessionState:
     def __init__(self):
         # État principal du jeu
         self.main_player: Optional[Player] = None
-        self.all_players: Dict[str, Player] = {}
+        self.all_players: Dict[int, Player] = {}
         self.current_week: int = 1
         self.current_year: int = TIME_CONSTANTS["GAME_START_YEAR"]
         
@@ -33,6 +44,14 @@ class GameSessionState:
         self.atp_points_manager: Optional[ATPPointsManager] = None
         self.retirement_manager = RetirementManager(self.player_generator)
         self.save_manager = SaveManager()
+        self.autosave_manager = AutosaveManager(self.save_manager)
+        self.world_id: str = uuid.uuid4().hex
+        self.attach_player_archive()
+        self.match_log: Optional[MatchLog] = None
+        self.head_to_head: Optional[HeadToHeadRecords] = None
+        self.career_stats: Optional[CareerStatistics] = None
+        self.results_elo: Optional[ResultsEloEngine] = None  # Optionnel (ELO_CONSTANTS)
+        self.attach_match_observers()
         
         # État de session
         self.session_start_time: Optional[float] = None
@@ -45,18 +64,18 @@ class GameSessionState:
         
     def add_player(self, player: Player) -> None:
         """Ajoute un joueur au pool"""
-        self.all_players[player.full_name] = player
+        self.all_players[player.player_id] = player
         
-    def add_players(self, players: Dict[str, Player]) -> None:
+    def add_players(self, players: Dict[int, Player]) -> None:
         """Ajoute plusieurs joueurs au pool"""
-        self.all_players.update(players)
+        self.all_players.update((player.player_id, player) for player in players.values())
         
-    def remove_player(self, player_name: str) -> bool:
-        """Retire un joueur du pool"""
-        if player_name in self.all_players:
-            del self.all_players[player_name]
-            return True
-        return False
+    def remove_player(self, player_key: Union[int, str]) -> bool:
+        """Retire un joueur du pool (par identifiant, ou par nom pour compatibilité)"""
+        if isinstance(player_key, str):
+            player_key = next((player_id for player_id, player in self.all_players.items()
+                               if player.full_name == player_key), None)
+        return self.all_players.pop(player_key, None) is not None
         
     def get_player_count(self) -> int:
         """Retourne le nombre de joueurs"""
@@ -81,17 +100,21 @@ class GameSessionState:
             # Synchronise avec la semaine qu'on vient d'avancer
             self.ranking_manager.current_week = self.current_week
             # Retire les points qui expirent cette semaine
-            for player_name, player in self.ranking_manager.players.items():
-                points_to_lose = self.ranking_manager.get_points_to_defend(player_name, self.current_week)
-                player.career.atp_points = max(0,player.career.atp_points - points_to_lose)
+            for player_id, player in self.ranking_manager.players.items():
+                points_to_lose = self.ranking_manager.get_points_to_defend(player_id, self.current_week)
+                if points_to_lose:
+                    player.career.atp_points = max(0, player.career.atp_points - points_to_lose)
+                    player.career.mark_dirty()
             # Remet à zéro la colonne de la nouvelle semaine
-            week_col = f"week_{self.current_week}"
-            if week_col in self.ranking_manager.atp_points_history.columns:
-                self.ranking_manager.atp_points_history[week_col] = 0
+            self.ranking_manager.reset_week_points(self.current_week)
+            # Classements de la semaine écoulée (mis à jour par les activités)
+            self.record_best_rankings()
         
         if self.current_week > TIME_CONSTANTS["WEEKS_PER_YEAR"]:
             self.current_week = 1
+            self.end_match_season(self.current_year)
             self.current_year += 1
+            self.sync_ranking_clock()
             return True  # Nouvelle année
         return False
         
@@ -102,11 +125,112 @@ class GameSessionState:
     def stop_game(self) -> None:
         """Arrête le jeu"""
         self.game_running = False
+        # Termine l'écriture des sauvegardes automatiques en cours
+        self.autosave_manager.shutdown()
+        if self.retirement_manager.player_archive:
+            self.retirement_manager.player_archive.close()
+
+    def attach_player_archive(self, ancestors: Optional[List[List[Any]]] = None) -> None:
+        """
+        Associe au gestionnaire de retraites l'archive des retraités de la partie courante
+
+        Args:
+            ancestors: Branches de l'archive visibles depuis la sauvegarde chargée
+        """
+        if self.retirement_manager.player_archive:
+            self.retirement_manager.player_archive.close()
+        db_path = os.path.join(self.save_manager.save_directory,
+                               SAVE_CONSTANTS["PLAYER_ARCHIVE_DIRECTORY"], f"{self.world_id}.sqlite")
+        self.retirement_manager.player_archive = RetiredPlayerArchive(db_path, ancestors)
+
+    def attach_match_observers(self, game_state: Optional[GameState] = None) -> None:
+        """
+        Crée (ou restaure) le journal des matchs, les face-à-face et les statistiques de
+        carrière de la partie courante et les abonne aux tournois
+
+        Args:
+            game_state: Sauvegarde à restaurer (None: historique vide)
+        """
+        observers = self.tournament_manager.match_observers
+        for observer in (self.match_log, self.head_to_head, self.career_stats, self.results_elo):
+            if observer in observers:
+                observers.remove(observer)
+
+        directory = os.path.join(self.save_manager.save_directory,
+                                 SAVE_CONSTANTS["MATCH_LOG_DIRECTORY"], self.world_id)
+        if game_state and game_state.match_log_state:
+            self.match_log = MatchLog.from_dict(game_state.match_log_state, directory)
+            for delta in game_state.get_component_deltas("match_log_state"):
+                self.match_log.apply_delta(delta)
+        else:
+            self.match_log = MatchLog(directory, current_year=self.current_year)
+        if game_state and game_state.head_to_head_state:
+            self.head_to_head = HeadToHeadRecords.from_dict(game_state.head_to_head_state)
+            for delta in game_state.get_component_deltas("head_to_head_state"):
+                self.head_to_head.apply_delta(delta)
+        else:
+            self.head_to_head = HeadToHeadRecords()
+        if game_state and game_state.career_stats_state:
+            self.career_stats = CareerStatistics.from_dict(game_state.career_stats_state)
+            for delta in game_state.get_component_deltas("career_stats_state"):
+                self.career_stats.apply_delta(delta)
+        else:
+            self.career_stats = CareerStatistics()
+        observers.extend([self.match_log, self.head_to_head, self.career_stats])
+
+        # ELO dynamique: activé par la configuration ou déjà présent dans la sauvegarde
+        if game_state and game_state.results_elo_state:
+            self.results_elo = ResultsEloEngine.from_dict(game_state.results_elo_state)
+            for delta in game_state.get_component_deltas("results_elo_state"):
+                self.results_elo.apply_delta(delta)
+        elif ELO_CONSTANTS["RESULTS_ELO_ENABLED"]:
+            self.results_elo = ResultsEloEngine()
+        else:
+            self.results_elo = None
+        if self.results_elo:
+            observers.append(self.results_elo)
+
+    def end_match_season(self, year: Optional[int] = None) -> None:
+        """
+        Clôt la saison de l'historique des matchs (archivage du journal, compteurs de saison)
+
+        Args:
+            year: Année terminée (défaut: année courante du journal)
+        """
+        self.match_log.end_season(year)
+        self.career_stats.end_season()
+
+    def sync_ranking_clock(self, year: Optional[int] = None, week: Optional[int] = None) -> None:
+        """
+        Aligne la date du gestionnaire des classements (datation de l'historique des rangs)
+
+        Args:
+            year: Année (défaut: année courante de la partie)
+            week: Semaine (défaut: semaine courante de la partie)
+        """
+        if self.ranking_manager:
+            self.ranking_manager.current_year = self.current_year if year is None else year
+            self.ranking_manager.current_week = self.current_week if week is None else week
+
+    def record_best_rankings(self) -> None:
+        """Met à jour le meilleur classement de carrière de chaque joueur"""
+        if self.ranking_manager:
+            players = list(self.all_players.values())
+            player_ids = np.fromiter((player.player_id for player in players), dtype=np.int64, count=len(players))
+            self.career_stats.update_best_ranks(player_ids, self.ranking_manager.get_player_ranks(players))
         
     def initialize_ranking_manager(self) -> None:
         """Initialise le ranking manager avec tous les joueurs"""
         if self.all_players:
             self.ranking_manager = RankingManager(list(self.all_players.values()))
+            self.subscribe_ranking_engine()
+
+    def subscribe_ranking_engine(self) -> None:
+        """Abonne aux tournois le moteur Glicko-2 du gestionnaire des classements courant"""
+        observers = self.tournament_manager.match_observers
+        observers[:] = [observer for observer in observers if not isinstance(observer, Glicko2Engine)]
+        if self.ranking_manager:
+            observers.append(self.ranking_manager.glicko_engine)
             
     def initialize_atp_points_manager(self) -> None:
         """Initialise l'ATP points manager"""
@@ -124,7 +248,7 @@ class GameSessionState:
         """Ajoute le joueur principal aux managers après simulation préliminaire"""
         if self.main_player:
             # Ajoute au pool principal
-            self.all_players[self.main_player.full_name] = self.main_player
+            self.all_players[self.main_player.player_id] = self.main_player
             
             # Ajoute aux managers
             if self.atp_points_manager:
@@ -137,21 +261,27 @@ class GameSessionState:
         """Remet le temps au début du jeu principal"""
         self.current_week = 1
         self.current_year = TIME_CONSTANTS["GAME_START_YEAR"]
+        self.sync_ranking_clock()
+        # Archive la saison préliminaire du journal des matchs
+        if self.match_log.current_year < self.current_year:
+            self.end_match_season()
         
     def age_main_player(self) -> None:
         """Vieillit le joueur principal d'un an"""
         if self.main_player and hasattr(self.main_player.career, 'age'):
             self.main_player.career.age += 1
+            self.main_player.career.mark_dirty()
             
     def apply_natural_fatigue_recovery(self) -> None:
         """Applique la récupération naturelle de fatigue au joueur principal"""
         if self.main_player:
             self.main_player.recover_fatigue(TIME_CONSTANTS["FATIGUE_NATURAL_RECOVERY"])
             
+    @profile_phase("fatigue_recovery")
     def apply_natural_fatigue_recovery_all(self) -> None:
-        """Applique la récupération naturelle de fatigue à tous les joueurs"""
-        for player in self.all_players.values():
-            player.recover_fatigue(TIME_CONSTANTS["FATIGUE_NATURAL_RECOVERY"])
+        """Applique la récupération naturelle de fatigue à tous les joueurs (en un lot)"""
+        players = list(self.all_players.values())
+        apply_fatigue_changes(players, np.full(len(players), -TIME_CONSTANTS["FATIGUE_NATURAL_RECOVERY"]))
             
     def create_game_state_for_save(self) -> GameState:
         """Crée un objet GameState pour la sauvegarde"""
@@ -162,6 +292,17 @@ class GameSessionState:
         game_state.current_year = self.current_year
         game_state.is_preliminary_complete = self.is_preliminary_complete
         game_state.retirement_log = self.retirement_manager.retirement_log if self.retirement_manager else []
+        game_state.world_id = self.world_id
+        if self.retirement_manager.player_archive:
+            game_state.archive_lineage = self.retirement_manager.player_archive.get_lineage()
+        # Composants sérialisés par le gestionnaire de sauvegarde (changements seuls dans les deltas)
+        game_state.components = {
+            "ranking_state": self.ranking_manager,
+            "match_log_state": self.match_log,
+            "head_to_head_state": self.head_to_head,
+            "career_stats_state": self.career_stats,
+            "results_elo_state": self.results_elo
+        }
         
         # Calcule le temps de jeu
         if self.session_start_time:
@@ -173,20 +314,39 @@ class GameSessionState:
         """Charge l'état depuis un objet GameState"""
         try:
             self.main_player = game_state.main_player
-            self.all_players = game_state.all_players
+            # Les anciennes sauvegardes indexent le pool par nom
+            self.all_players = {player.player_id: player for player in game_state.all_players.values()}
             self.current_week = game_state.current_week
             self.current_year = game_state.current_year
             self.is_preliminary_complete = game_state.is_preliminary_complete
             
             # Recrée les managers avec les données chargées
             if self.all_players:
-                self.initialize_ranking_manager()
+                if game_state.ranking_state:
+                    # Restaure classements et historique des points sans tout recalculer
+                    self.ranking_manager = RankingManager.from_dict(
+                        list(self.all_players.values()), game_state.ranking_state
+                    )
+                    for delta in game_state.get_component_deltas("ranking_state"):
+                        self.ranking_manager.apply_delta(delta)
+                    self.subscribe_ranking_engine()
+                else:
+                    self.initialize_ranking_manager()
+                self.sync_ranking_clock()
                 self.initialize_atp_points_manager()
                 self.initialize_activity_manager()
                 
                 # Restaure le retirement_log
                 if hasattr(game_state, 'retirement_log'):
                     self.retirement_manager.retirement_log = game_state.retirement_log
+
+            # Archive des retraités de cette partie, limitée aux retraites connues de la sauvegarde
+            # (rien n'est supprimé: d'autres sauvegardes de la même partie peuvent y faire référence)
+            self.world_id = game_state.world_id
+            self.attach_player_archive(game_state.archive_lineage)
+            if game_state.archive_lineage is None:
+                self.retirement_manager.player_archive.include_legacy_rows(self.current_year)
+            self.attach_match_observers(game_state)
                     
             # Remet à jour le temps de début de session
             self.session_start_time = time.time()
@@ -196,9 +356,16 @@ class GameSessionState:
             print(f"Erreur lors du chargement de l'état: {e}")
             return False
             
+    def autosave(self) -> bool:
+        """Planifie une sauvegarde automatique non bloquante de la partie"""
+        if not SAVE_CONSTANTS["AUTOSAVE_ENABLED"] or not self.main_player:
+            return False
+        return self.autosave_manager.request_autosave(self.create_game_state_for_save())
+
     def save_game(self, filename: str) -> bool:
         """Sauvegarde le jeu"""
         try:
+            self.autosave_manager.flush()
             game_state = self.create_game_state_for_save()
             return self.save_manager.save_game(game_state, filename)
         except Exception as e:
@@ -208,9 +375,12 @@ class GameSessionState:
     def load_game(self, filename: str) -> bool:
         """Charge une sauvegarde"""
         try:
+            self.autosave_manager.flush()
             game_state = self.save_manager.load_game(filename)
-            if game_state:
-                return self.load_from_game_state(game_state)
+            if game_state and self.load_from_game_state(game_state):
+                # Les sauvegardes incrémentales de ce fichier repartent des composants restaurés
+                self.save_manager.record_loaded_components(filename, self.create_game_state_for_save())
+                return True
             return False
         except Exception as e:
             print(f"Erreur lors du chargement: {e}")
@@ -237,6 +407,7 @@ class GameSessionState:
         """Met à jour les classements hebdomadaires"""
         if self.ranking_manager:
             self.ranking_manager.update_weekly_rankings()
+            self.record_best_rankings()
             
     def get_players_by_age_threshold(self, min_age: int) -> list:
         """Retourne les joueurs au-dessus d'un âge donné"""
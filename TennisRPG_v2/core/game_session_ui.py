@@ -186,15 +186,18 @@ class GameSessionUI(IGameUI):
         print("\n📊 QUEL CLASSEMENT SOUHAITEZ-VOUS VOIR ?")
         print("1. Classement ATP (52 semaines glissantes)")
         print("2. ATP Race (année en cours)")
+        print("3. Classement Glicko-2 (résultats des matchs)")
         
         while True:
-            choice = input("\n🎯 Votre choix (1-2) : ").strip()
+            choice = input("\n🎯 Votre choix (1-3) : ").strip()
             if choice == '1':
                 return RankingType.ATP
             elif choice == '2':
                 return RankingType.ATP_RACE
+            elif choice == '3':
+                return RankingType.GLICKO
             else:
-                print("❌ Choix invalide. Utilisez 1 ou 2.")
+                print("❌ Choix invalide. Utilisez 1, 2 ou 3.")
                 
     def get_ranking_display_range(self) -> Tuple[int, int]:
         """Interface pour choisir la plage d'affichage du classement"""
@@ -245,7 +248,7 @@ class GameSessionUI(IGameUI):
         for i in range(1, 5):  # 4 semaines suivantes
             future_week = (week_to_use + i - 1) % 52 + 1
             future_defend = ranking_manager.get_points_to_defend(
-                main_player.full_name, future_week
+                main_player.player_id, future_week
             )
             if future_defend > 0:
                 future_points.append((future_week, future_defend))
@@ -4,11 +4,25 @@ Gestionnaire de sauvegarde et chargement - Save/Load System
 import json
 import pickle
 import os
-from typing import Dict, Optional, Any, List
+import tempfile
+import threading
+import uuid
+from typing import Dict, Optional, Any, List, Tuple
 # from dataclasses import asdict  # TODO: Supprimé - non utilisé actuellement
 from datetime import datetime
 
 from ..entities.player import Player
+from ..managers.retirement_archive import RetirementArchive
+from ..utils.constants import SAVE_CONSTANTS
+
+# Fichier d'index des sauvegardes (caché pour ne pas apparaître dans la liste)
+SAVE_INDEX_FILENAME = ".save_index.json"
+SAVE_INDEX_VERSION = 1
+# Extension du journal de deltas associé à une sauvegarde de base
+DELTA_EXTENSION = ".delta.jsonl"
+# États des composants de la partie (classements, journal des matchs...) sauvegardés avec l'état
+COMPONENT_FIELDS = ("ranking_state", "match_log_state", "head_to_head_state",
+					"career_stats_state", "results_elo_state")
 
 
 class GameState:
@@ -16,29 +30,187 @@ class GameState:
 
 	def __init__(self):
 		self.main_player: Optional[Player] = None
-		self.all_players: Dict[str, Player] = {}
+		self.all_players: Dict[int, Player] = {}
 		self.current_week: int = 1
 		self.current_year: int = 2024
 		self.is_preliminary_complete: bool = False
 		self.save_date: str = ""
 		self.game_version: str = "2.0"
 		self.playtime_hours: float = 0.0
-		self.retirement_log: List[Dict] = []  # Historique des retraites
+		self.retirement_log: RetirementArchive = RetirementArchive()  # Historique des retraites
+		self.ranking_state: Optional[Dict[str, Any]] = None  # Classements et historique des points (compact)
+		self.world_id: str = uuid.uuid4().hex  # Identifiant de la partie (archive des retraités)
+		self.archive_lineage: Optional[List[List[Any]]] = None  # Branches visibles de l'archive des retraités
+		self.match_log_state: Optional[Dict[str, Any]] = None  # Journal des matchs (saison en cours, colonnes)
+		self.head_to_head_state: Optional[Dict[str, Any]] = None  # Face-à-face entre joueurs (colonnes)
+		self.career_stats_state: Optional[Dict[str, Any]] = None  # Statistiques de carrière (colonnes)
+		self.results_elo_state: Optional[Dict[str, Any]] = None  # ELO dynamique (optionnel, colonnes)
+		# Composants vivants, sérialisés à la sauvegarde à la place des états ci-dessus (par champ).
+		# Ceux qui fournissent save_cursor / to_delta_dict n'écrivent que leurs changements dans les deltas.
+		self.components: Dict[str, Any] = {}
+		# Deltas des composants lus avec la sauvegarde, à rejouer après leur restauration (par champ)
+		self.component_deltas: Dict[str, List[Dict[str, Any]]] = {}
+
+	def get_header(self) -> Dict[str, Any]:
+		"""
+		Retourne l'en-tête de la sauvegarde (métadonnées affichées dans le menu)
+
+		Returns:
+			Dictionnaire léger décrivant la sauvegarde
+		"""
+		player_name = "Inconnu"
+		if self.main_player:
+			player_name = f"{self.main_player.first_name} {self.main_player.last_name}".strip()
 
-	def to_dict(self) -> Dict[str, Any]:
-		"""Convertit l'état en dictionnaire pour JSON"""
 		return {
-			"main_player": self.main_player.to_dict() if self.main_player else None,
-			"all_players": {name: player.to_dict() for name, player in self.all_players.items()},
+			"player_name": player_name,
+			"week": self.current_week,
+			"year": self.current_year,
+			"save_date": self.save_date,
+			"version": self.game_version,
+			"playtime": self.playtime_hours
+		}
+
+	def _metadata_to_dict(self) -> Dict[str, Any]:
+		"""Retourne les propriétés scalaires de l'état"""
+		return {
 			"current_week": self.current_week,
 			"current_year": self.current_year,
 			"is_preliminary_complete": self.is_preliminary_complete,
 			"save_date": self.save_date,
 			"game_version": self.game_version,
 			"playtime_hours": self.playtime_hours,
-			"retirement_log": self.retirement_log
+			"world_id": self.world_id,
+			"archive_lineage": self.archive_lineage
+		}
+
+	def to_dict(self) -> Dict[str, Any]:
+		"""Convertit l'état en dictionnaire pour JSON"""
+		data = {
+			"header": self.get_header(),
+			"main_player": self.main_player.to_dict() if self.main_player else None,
+			"all_players": {str(key): player.to_dict() for key, player in self.all_players.items()}
+		}
+		data.update(self._metadata_to_dict())
+		data["retirement_log"] = RetirementArchive.from_saved(self.retirement_log).to_dict()
+		for field in COMPONENT_FIELDS:
+			data[field] = self.get_component_state(field)
+		return data
+
+	def get_component_state(self, field: str) -> Optional[Dict[str, Any]]:
+		"""État complet d'un composant (composant vivant s'il est enregistré)"""
+		component = self.components.get(field)
+		return component.to_dict() if component is not None else getattr(self, field)
+
+	def get_component_cursors(self) -> Dict[str, Any]:
+		"""Positions de sauvegarde des composants incrémentaux, avec le composant concerné"""
+		return {
+			field: (component, component.save_cursor())
+			for field, component in self.components.items()
+			if component is not None and hasattr(component, "save_cursor")
 		}
 
+	def get_component_deltas(self, field: str) -> List[Dict[str, Any]]:
+		"""Deltas à rejouer sur un composant restauré depuis son état de base"""
+		return self.component_deltas.get(field, [])
+
+	def get_player_versions(self) -> Dict[str, int]:
+		"""Versions de sauvegarde des joueurs, par clé sérialisée"""
+		return {str(key): player.save_version for key, player in self.all_players.items()}
+
+	def to_delta_dict(self, saved_versions: Dict[str, int], saved_retirement_count: int,
+					  saved_main_version: Optional[int] = None,
+					  component_cursors: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+		"""
+		Convertit l'état en enregistrement delta (joueurs modifiés uniquement)
+
+		Un joueur est modifié si sa version de sauvegarde diffère de celle
+		enregistrée par la sauvegarde visée: chaque fichier suit ainsi ses
+		propres changements, indépendamment des autres sauvegardes.
+
+		Args:
+			saved_versions: Versions des joueurs déjà présents dans la sauvegarde (par clé)
+			saved_retirement_count: Nombre de retraites déjà sauvegardées
+			saved_main_version: Version sauvegardée du joueur principal
+			component_cursors: Positions des composants dans la sauvegarde (get_component_cursors)
+
+		Returns:
+			Dictionnaire delta à ajouter au journal de la sauvegarde, ou None si
+			un composant ne peut pas exprimer ses changements (sauvegarde complète)
+		"""
+		main_player_changed = self.main_player is not None and self.main_player.save_version != saved_main_version
+		current_keys = {str(key): player for key, player in self.all_players.items()}
+		cursors = component_cursors or {}
+
+		components = {}
+		full_states = {}
+		for field in COMPONENT_FIELDS:
+			component = self.components.get(field)
+			if component is None or not hasattr(component, "save_cursor"):
+				full_states[field] = self.get_component_state(field)
+				continue
+			saved_component, cursor = cursors.get(field, (None, None))
+			if saved_component is not component:
+				return None
+			component_delta = component.to_delta_dict(cursor)
+			if component_delta is None:
+				return None
+			components[field] = component_delta
+
+		delta = {
+			"header": self.get_header(),
+			"metadata": self._metadata_to_dict(),
+			"main_player": self.main_player.to_dict() if main_player_changed else None,
+			"players": {
+				key: player.to_dict() for key, player in current_keys.items()
+				if saved_versions.get(key) != player.save_version
+			},
+			"removed_players": [key for key in saved_versions if key not in current_keys],
+			"retirement_log_appended": self.retirement_log[saved_retirement_count:],
+			"components": components
+		}
+		delta.update(full_states)
+		return delta
+
+	@staticmethod
+	def apply_delta(data: Dict[str, Any], delta: Dict[str, Any]) -> None:
+		"""
+		Applique un enregistrement delta à un dictionnaire de sauvegarde complet
+
+		Args:
+			data: Dictionnaire de sauvegarde (modifié en place)
+			delta: Enregistrement produit par to_delta_dict
+		"""
+		data["header"] = delta["header"]
+		data.update(delta["metadata"])
+		if delta.get("main_player") is not None:
+			data["main_player"] = delta["main_player"]
+
+		all_players = data.setdefault("all_players", {})
+		for key in delta.get("removed_players", []):
+			all_players.pop(key, None)
+		all_players.update(delta.get("players", {}))
+
+		retirement_log = RetirementArchive.from_saved(data.get("retirement_log"))
+		retirement_log.extend(delta.get("retirement_log_appended", []))
+		data["retirement_log"] = retirement_log
+
+		# États complets (remplacent la base) puis changements des composants incrémentaux
+		component_deltas = data.setdefault("component_deltas", {})
+		for field in COMPONENT_FIELDS:
+			if delta.get(field) is not None:
+				data[field] = delta[field]
+				component_deltas.pop(field, None)
+		for field, component_delta in delta.get("components", {}).items():
+			component_deltas.setdefault(field, []).append(component_delta)
+
+	def clear_dirty_players(self) -> None:
+		"""Marque tous les joueurs comme sauvegardés"""
+		if self.main_player:
+			self.main_player.clear_dirty()
+		for player in self.all_players.values():
+			player.clear_dirty()
+
 	@classmethod
 	def from_dict(cls, data: Dict[str, Any]) -> 'GameState':
 		"""Crée un GameState depuis un dictionnaire"""
@@ -48,11 +220,11 @@ class GameState:
 		if data.get("main_player"):
 			state.main_player = Player.from_dict(data["main_player"])
 
-		# Charge tous les joueurs
-		state.all_players = {
-			name: Player.from_dict(player_data)
-			for name, player_data in data.get("all_players", {}).items()
-		}
+		# Charge tous les joueurs (clés par identifiant; les anciennes sauvegardes gardent leurs clés)
+		state.all_players = {}
+		for key, player_data in data.get("all_players", {}).items():
+			player = Player.from_dict(player_data)
+			state.all_players[player.player_id if key == str(player.player_id) else key] = player
 
 		# Charge les autres propriétés
 		state.current_week = data.get("current_week", 1)
@@ -61,7 +233,22 @@ class GameState:
 		state.save_date = data.get("save_date", "")
 		state.game_version = data.get("game_version", "2.0")
 		state.playtime_hours = data.get("playtime_hours", 0.0)
-		state.retirement_log = data.get("retirement_log", [])
+		state.retirement_log = RetirementArchive.from_saved(data.get("retirement_log"))
+		state.ranking_state = data.get("ranking_state")
+		state.world_id = data.get("world_id") or state.world_id
+		state.archive_lineage = data.get("archive_lineage")
+		state.match_log_state = data.get("match_log_state")
+		state.head_to_head_state = data.get("head_to_head_state")
+		state.career_stats_state = data.get("career_stats_state")
+		state.results_elo_state = data.get("results_elo_state")
+		state.component_deltas = data.get("component_deltas", {})
+
+		# Le joueur principal est le même objet que son entrée dans le pool
+		if state.main_player:
+			for key, player in state.all_players.items():
+				if player.player_id == state.main_player.player_id:
+					state.all_players[key] = state.main_player
+					break
 
 		return state
 
@@ -77,6 +264,13 @@ class SaveManager:
 			save_directory: Répertoire où stocker les sauvegardes
 		"""
 		self.save_directory = save_directory
+		self._saves_cache: Optional[List[Dict[str, Any]]] = None  # Dernière liste construite
+		# Bases auxquelles des deltas peuvent être ajoutés, par fichier (versions des joueurs sauvegardés)
+		self._incremental_bases: Dict[str, Dict[str, Any]] = {}
+		# Protège les bases incrémentales, invalidées par le thread d'écriture en cas d'échec
+		self._base_lock = threading.RLock()
+		# Protège l'index, partagé avec le thread de sauvegarde automatique
+		self._index_lock = threading.RLock()
 		self._ensure_save_directory()
 
 	def _ensure_save_directory(self) -> None:
@@ -84,47 +278,265 @@ class SaveManager:
 		if not os.path.exists(self.save_directory):
 			os.makedirs(self.save_directory)
 
-	def save_game(self, game_state: GameState, filename: str = None) -> bool:
+	def save_game(self, game_state: GameState, filename: str = None, incremental: bool = False) -> bool:
 		"""
 		Sauvegarde l'état du jeu
 
 		Args:
 			game_state: État du jeu à sauvegarder
 			filename: Nom du fichier (optionnel)
+			incremental: Ajoute uniquement les joueurs modifiés au journal de deltas
+				si la sauvegarde de base existe déjà (compactée périodiquement)
 
 		Returns:
 			True si la sauvegarde a réussi
 		"""
 		try:
-			if not filename:
-				# Génère un nom de fichier automatique
-				player_name = "unknown"
-				if game_state.main_player:
-					player_name = f"{game_state.main_player.first_name}_{game_state.main_player.last_name}"
+			pending_save = self.prepare_save(game_state, filename, incremental)
+			self.write_prepared_save(pending_save)
 
-				timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-				filename = f"{player_name}_{timestamp}.json"
+			print(f"✅ Jeu sauvegardé: {pending_save['filename']}")
+			return True
 
-			# Assure l'extension .json
-			if not filename.endswith('.json'):
-				filename += '.json'
+		except Exception as e:
+			print(f"❌ Erreur lors de la sauvegarde: {e}")
+			return False
 
-			filepath = os.path.join(self.save_directory, filename)
+	def prepare_save(self, game_state: GameState, filename: str = None, incremental: bool = False) -> Dict[str, Any]:
+		"""
+		Prend un instantané sérialisable de l'état (sans écriture disque)
 
-			# Met à jour la date de sauvegarde
-			game_state.save_date = datetime.now().isoformat()
+		Le contenu sérialisé ne référence plus les objets du jeu: il peut être écrit
+		plus tard, par exemple depuis un autre thread, via write_prepared_save.
+		Seule la liste des joueurs inclus est conservée, pour les marquer de
+		nouveau comme modifiés si l'écriture échoue.
 
-			# Sauvegarde en JSON pour la lisibilité
-			with open(filepath, 'w', encoding='utf-8') as f:
-				json.dump(game_state.to_dict(), f, indent=2, ensure_ascii=False)
+		Args:
+			game_state: État du jeu à sauvegarder
+			filename: Nom du fichier (optionnel)
+			incremental: Produit un delta si possible
 
-			print(f"✅ Jeu sauvegardé: {filename}")
-			return True
+		Returns:
+			Sauvegarde en attente d'écriture
+		"""
+		if not filename:
+			# Génère un nom de fichier automatique
+			player_name = "unknown"
+			if game_state.main_player:
+				player_name = f"{game_state.main_player.first_name}_{game_state.main_player.last_name}"
+
+			timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+			filename = f"{player_name}_{timestamp}.json"
+
+		# Assure l'extension .json
+		if not filename.endswith('.json'):
+			filename += '.json'
+
+		# Met à jour la date de sauvegarde
+		game_state.save_date = datetime.now().isoformat()
+
+		# Joueurs dont les modifications partent dans cette sauvegarde (remarqués si l'écriture échoue)
+		saved_players = [player for player in game_state.all_players.values() if player.is_dirty]
+		if game_state.main_player and game_state.main_player.is_dirty:
+			saved_players.append(game_state.main_player)
+
+		with self._base_lock:
+			payload = None
+			if incremental and self._can_append_delta(filename, game_state):
+				base = self._incremental_bases[filename]
+				payload = game_state.to_delta_dict(base["player_versions"], base["retirement_count"],
+												   base["main_player_version"], base["component_cursors"])
+			if payload is not None:
+				base["delta_count"] += 1
+				payload["sequence"] = base["delta_count"]
+				kind = "delta"
+			else:
+				payload = game_state.to_dict()
+				kind = "full"
+				base = self._incremental_bases[filename] = {
+					"generation": uuid.uuid4().hex,
+					"world_id": game_state.world_id,
+					"delta_count": 0
+				}
+
+			# La base suit les sauvegardes planifiées; discard_prepared_save l'invalide en cas d'échec
+			generation = base["generation"]
+			payload["generation"] = generation
+			self._record_saved_state(base, game_state)
+		game_state.clear_dirty_players()
 
-		except Exception as e:
-			print(f"❌ Erreur lors de la sauvegarde: {e}")
+		return {
+			"filename": filename,
+			"kind": kind,
+			"generation": generation,
+			"payload": payload,
+			"header": game_state.get_header(),
+			"saved_players": saved_players
+		}
+
+	def write_prepared_save(self, pending_save: Dict[str, Any]) -> None:
+		"""
+		Écrit une sauvegarde préparée par prepare_save et met à jour l'index
+
+		En cas d'échec, la sauvegarde est abandonnée via discard_prepared_save
+		avant que l'exception ne soit propagée.
+
+		Args:
+			pending_save: Sauvegarde en attente d'écriture
+		"""
+		filename = pending_save["filename"]
+		filepath = os.path.join(self.save_directory, filename)
+
+		try:
+			if pending_save["kind"] == "delta":
+				# Un delta préparé sur une base abandonnée ne doit plus être ajouté
+				with self._base_lock:
+					base = self._incremental_bases.get(filename)
+					if not base or base["generation"] != pending_save["generation"]:
+						raise RuntimeError(f"Base de sauvegarde abandonnée pour {filename}")
+				self._append_delta(filepath, pending_save["payload"])
+			else:
+				self._write_full_save(filepath, pending_save["payload"])
+		except Exception:
+			self.discard_prepared_save(pending_save)
+			raise
+
+		# Met à jour l'index des sauvegardes avec le seul en-tête
+		self._update_index_entry(filename, pending_save["header"])
+
+	def record_loaded_components(self, filename: str, game_state: GameState) -> None:
+		"""
+		Associe à la base chargée les composants restaurés depuis cette sauvegarde
+
+		À appeler juste après leur restauration (avant toute modification):
+		les sauvegardes incrémentales suivantes n'écrivent que leurs changements.
+
+		Args:
+			filename: Nom de la sauvegarde chargée
+			game_state: État portant les composants restaurés
+		"""
+		if not filename.endswith('.json'):
+			filename += '.json'
+		with self._base_lock:
+			base = self._incremental_bases.get(filename)
+			if base and base["world_id"] == game_state.world_id:
+				base["component_cursors"] = game_state.get_component_cursors()
+
+	def discard_prepared_save(self, pending_save: Dict[str, Any]) -> None:
+		"""
+		Abandonne une sauvegarde préparée dont l'écriture a échoué
+
+		Les joueurs qu'elle contenait sont de nouveau marqués comme modifiés et
+		la base incrémentale correspondante est invalidée: la prochaine
+		sauvegarde sera complète et reprendra ces changements.
+
+		Args:
+			pending_save: Sauvegarde retournée par prepare_save
+		"""
+		filename = pending_save["filename"]
+		with self._base_lock:
+			base = self._incremental_bases.get(filename)
+			if base and base["generation"] == pending_save["generation"]:
+				del self._incremental_bases[filename]
+		for player in pending_save.get("saved_players", []):
+			player.mark_dirty()
+
+	def _write_full_save(self, filepath: str, payload: Dict[str, Any]) -> None:
+		"""
+		Écrit une sauvegarde complète (base) et supprime le journal de deltas
+
+		La base porte une génération: si le programme s'arrête entre le
+		renommage et la suppression du journal, les anciens deltas (d'une autre
+		génération) sont ignorés au chargement.
+		"""
+		# Sauvegarde en JSON pour la lisibilité
+		self._atomic_write_json(filepath, payload, indent=2)
+
+		delta_path = self._get_delta_path(filepath)
+		if os.path.exists(delta_path):
+			os.remove(delta_path)
+
+	@staticmethod
+	def _record_saved_state(base: Dict[str, Any], game_state: GameState) -> None:
+		"""Enregistre dans la base ce que contient désormais la sauvegarde"""
+		base["player_versions"] = game_state.get_player_versions()
+		base["main_player_version"] = game_state.main_player.save_version if game_state.main_player else None
+		base["retirement_count"] = len(game_state.retirement_log)
+		base["component_cursors"] = game_state.get_component_cursors()
+
+	def _can_append_delta(self, filename: str, game_state: GameState) -> bool:
+		"""
+		Vérifie qu'un delta peut être ajouté à la sauvegarde
+
+		Les deltas ne sont valides que pour une base écrite ou chargée par ce
+		gestionnaire pour la même partie, tant que le seuil de compaction
+		n'est pas atteint.
+		"""
+		base = self._incremental_bases.get(filename)
+		if not base or base["world_id"] != game_state.world_id:
+			return False
+		if base["delta_count"] >= SAVE_CONSTANTS["DELTA_COMPACTION_THRESHOLD"]:
+			return False
+
+		filepath = os.path.join(self.save_directory, filename)
+		if not os.path.exists(filepath):
 			return False
 
+		delta_path = self._get_delta_path(filepath)
+		if os.path.exists(delta_path):
+			max_delta_size = os.path.getsize(filepath) * SAVE_CONSTANTS["DELTA_MAX_SIZE_RATIO"]
+			if os.path.getsize(delta_path) > max_delta_size:
+				return False
+		return True
+
+	def _append_delta(self, filepath: str, delta: Dict[str, Any]) -> None:
+		"""Ajoute un enregistrement delta au journal de la sauvegarde"""
+		line = json.dumps(delta, ensure_ascii=False, separators=(',', ':'))
+		with open(self._get_delta_path(filepath), 'a', encoding='utf-8') as f:
+			f.write(line + "\n")
+			f.flush()
+			os.fsync(f.fileno())
+
+	@staticmethod
+	def _get_delta_path(filepath: str) -> str:
+		"""Retourne le chemin du journal de deltas d'une sauvegarde"""
+		return filepath[:-len('.json')] + DELTA_EXTENSION
+
+	def _read_deltas(self, filepath: str, generation: Optional[str] = None) -> Tuple[List[Dict[str, Any]], bool]:
+		"""
+		Lit les enregistrements delta d'une sauvegarde
+
+		Seuls les deltas de la génération de la base, numérotés sans trou à
+		partir de 1, sont rejoués. La lecture s'arrête à la première ligne
+		tronquée (écriture interrompue), périmée (journal d'une base précédente)
+		ou hors séquence (delta dont l'écriture a échoué).
+
+		Args:
+			filepath: Chemin de la sauvegarde de base
+			generation: Génération de la base (None pour les anciennes sauvegardes)
+
+		Returns:
+			Tuple (deltas dans l'ordre d'écriture, True si tout le journal a été rejoué)
+		"""
+		delta_path = self._get_delta_path(filepath)
+		if not os.path.exists(delta_path):
+			return [], True
+
+		deltas = []
+		with open(delta_path, 'r', encoding='utf-8') as f:
+			for line in f:
+				line = line.strip()
+				if not line:
+					continue
+				try:
+					delta = json.loads(line)
+				except ValueError:
+					return deltas, False
+				if delta.get("generation") != generation or delta.get("sequence", len(deltas) + 1) != len(deltas) + 1:
+					return deltas, False
+				deltas.append(delta)
+		return deltas, True
+
 	def load_game(self, filename: str) -> Optional[GameState]:
 		"""
 		Charge l'état du jeu
@@ -149,7 +561,24 @@ class SaveManager:
 			with open(filepath, 'r', encoding='utf-8') as f:
 				data = json.load(f)
 
+			# Rejoue le journal de deltas sur la base
+			deltas, journal_complete = self._read_deltas(filepath, data.get("generation"))
+			for delta in deltas:
+				GameState.apply_delta(data, delta)
+
 			game_state = GameState.from_dict(data)
+			game_state.clear_dirty_players()
+			with self._base_lock:
+				# Les versions des joueurs rechargés ne correspondent plus aux autres bases
+				self._incremental_bases = {}
+				# Un journal contenant des lignes ignorées n'est plus prolongé: la prochaine sauvegarde sera complète
+				if journal_complete:
+					base = self._incremental_bases[filename] = {
+						"generation": data.get("generation"),
+						"world_id": game_state.world_id,
+						"delta_count": len(deltas)
+					}
+					self._record_saved_state(base, game_state)
 			print(f"✅ Jeu chargé: {filename}")
 			return game_state
 
@@ -161,50 +590,201 @@ class SaveManager:
 		"""
 		Liste toutes les sauvegardes disponibles
 
+		Les informations proviennent de l'index du répertoire : seules les
+		sauvegardes absentes de l'index ou modifiées depuis (anciennes versions,
+		copies manuelles) sont relues en entier, puis ajoutées à l'index.
+
 		Returns:
 			Liste des informations de sauvegarde
 		"""
 		saves = []
 
 		if not os.path.exists(self.save_directory):
+			self._saves_cache = saves
 			return saves
 
-		for filename in os.listdir(self.save_directory):
-			if filename.endswith('.json'):
-				filepath = os.path.join(self.save_directory, filename)
-				try:
-					with open(filepath, 'r', encoding='utf-8') as f:
-						data = json.load(f)
-
-					# Extrait les informations importantes
-					save_info = {
-						"filename": filename,
-						"player_name": "Inconnu",
-						"week": data.get("current_week", 0),
-						"year": data.get("current_year", 0),
-						"save_date": data.get("save_date", ""),
-						"version": data.get("game_version", "1.0"),
-						"playtime": data.get("playtime_hours", 0.0),
-						"file_size": os.path.getsize(filepath)
-					}
+		with self._index_lock:
+			return self._list_saves_locked()
 
-					# Nom du joueur principal
-					if data.get("main_player"):
-						main_player_data = data["main_player"]
-						first_name = main_player_data.get("first_name", "")
-						last_name = main_player_data.get("last_name", "")
-						save_info["player_name"] = f"{first_name} {last_name}".strip()
+	def _list_saves_locked(self) -> List[Dict[str, Any]]:
+		"""Construit la liste des sauvegardes (verrou de l'index détenu)"""
+		saves = []
+		index = self._read_index()
+		index_changed = False
+		present_files = set()
 
-					saves.append(save_info)
+		for filename in os.listdir(self.save_directory):
+			if filename.startswith('.') or not filename.endswith('.json'):
+				continue
 
-				except Exception as e:
-					print(f"⚠️  Erreur lecture {filename}: {e}")
-					continue
+			filepath = os.path.join(self.save_directory, filename)
+			present_files.add(filename)
+			try:
+				mtime, file_size = self._stat_save(filepath)
+				entry = index.get(filename)
+
+				# Entrée absente ou périmée: relit la sauvegarde complète une seule fois
+				if not entry or entry.get("mtime") != mtime or entry.get("file_size") != file_size:
+					entry = self._read_header_from_file(filepath)
+					entry["mtime"] = mtime
+					entry["file_size"] = file_size
+					index[filename] = entry
+					index_changed = True
+
+				save_info = {"filename": filename}
+				save_info.update({key: value for key, value in entry.items() if key != "mtime"})
+				saves.append(save_info)
+
+			except Exception as e:
+				print(f"⚠️  Erreur lecture {filename}: {e}")
+				continue
+
+		# Retire de l'index les sauvegardes supprimées
+		for filename in list(index.keys()):
+			if filename not in present_files:
+				del index[filename]
+				index_changed = True
+
+		if index_changed:
+			self._write_index(index)
 
 		# Trie par date de sauvegarde (plus récent en premier)
 		saves.sort(key=lambda x: x["save_date"], reverse=True)
+		self._saves_cache = saves
 		return saves
 
+	def _read_header_from_file(self, filepath: str) -> Dict[str, Any]:
+		"""
+		Lit l'en-tête d'une sauvegarde (chemin lent, sans index)
+
+		Args:
+			filepath: Chemin du fichier de sauvegarde
+
+		Returns:
+			En-tête de la sauvegarde
+		"""
+		with open(filepath, 'r', encoding='utf-8') as f:
+			data = json.load(f)
+
+		# L'en-tête du dernier delta valide décrit l'état le plus récent
+		deltas, _ = self._read_deltas(filepath, data.get("generation"))
+		if deltas:
+			return dict(deltas[-1]["header"])
+
+		if isinstance(data.get("header"), dict):
+			return dict(data["header"])
+
+		# Ancien format sans en-tête: extrait les informations importantes
+		header = {
+			"player_name": "Inconnu",
+			"week": data.get("current_week", 0),
+			"year": data.get("current_year", 0),
+			"save_date": data.get("save_date", ""),
+			"version": data.get("game_version", "1.0"),
+			"playtime": data.get("playtime_hours", 0.0)
+		}
+
+		# Nom du joueur principal
+		if data.get("main_player"):
+			main_player_data = data["main_player"]
+			first_name = main_player_data.get("first_name", "")
+			last_name = main_player_data.get("last_name", "")
+			header["player_name"] = f"{first_name} {last_name}".strip()
+
+		return header
+
+	def _stat_save(self, filepath: str) -> tuple:
+		"""
+		Retourne la signature (date de modification, taille) d'une sauvegarde et de ses deltas
+
+		Args:
+			filepath: Chemin de la sauvegarde de base
+
+		Returns:
+			Tuple (mtime, taille totale en octets)
+		"""
+		stat = os.stat(filepath)
+		mtime, file_size = stat.st_mtime, stat.st_size
+
+		delta_path = self._get_delta_path(filepath)
+		if os.path.exists(delta_path):
+			delta_stat = os.stat(delta_path)
+			mtime = max(mtime, delta_stat.st_mtime)
+			file_size += delta_stat.st_size
+		return mtime, file_size
+
+	def _get_index_path(self) -> str:
+		"""Retourne le chemin du fichier d'index des sauvegardes"""
+		return os.path.join(self.save_directory, SAVE_INDEX_FILENAME)
+
+	def _read_index(self) -> Dict[str, Dict[str, Any]]:
+		"""
+		Lit l'index des sauvegardes
+
+		Returns:
+			Dictionnaire {nom_fichier: en-tête}, vide si l'index est absent ou invalide
+		"""
+		index_path = self._get_index_path()
+		if not os.path.exists(index_path):
+			return {}
+
+		try:
+			with open(index_path, 'r', encoding='utf-8') as f:
+				data = json.load(f)
+		except (OSError, ValueError):
+			return {}
+
+		if data.get("version") != SAVE_INDEX_VERSION:
+			return {}
+		return data.get("saves", {})
+
+	def _write_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+		"""Écrit l'index des sauvegardes de manière atomique"""
+		self._atomic_write_json(self._get_index_path(), {"version": SAVE_INDEX_VERSION, "saves": index})
+
+	def _update_index_entry(self, filename: str, header: Dict[str, Any]) -> None:
+		"""
+		Met à jour l'entrée d'une sauvegarde dans l'index
+
+		Args:
+			filename: Nom du fichier de sauvegarde
+			header: En-tête de la sauvegarde
+		"""
+		mtime, file_size = self._stat_save(os.path.join(self.save_directory, filename))
+
+		entry = dict(header)
+		entry["mtime"] = mtime
+		entry["file_size"] = file_size
+
+		with self._index_lock:
+			index = self._read_index()
+			index[filename] = entry
+			self._write_index(index)
+			self._saves_cache = None
+
+	@staticmethod
+	def _atomic_write_json(filepath: str, data: Any, indent: Optional[int] = None) -> None:
+		"""
+		Écrit un fichier JSON de manière atomique (fichier temporaire, fsync puis renommage)
+
+		Args:
+			filepath: Chemin du fichier final
+			data: Données sérialisables en JSON
+			indent: Indentation JSON (optionnelle)
+		"""
+		directory = os.path.dirname(filepath) or "."
+		fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=".json")
+		try:
+			with os.fdopen(fd, 'w', encoding='utf-8') as f:
+				json.dump(data, f, indent=indent, ensure_ascii=False)
+				f.flush()
+				os.fsync(f.fileno())
+			os.replace(temp_path, filepath)
+		except Exception:
+			if os.path.exists(temp_path):
+				os.remove(temp_path)
+			raise
+
 	def display_saves_menu(self) -> None:
 		"""Affiche le menu des sauvegardes"""
 		saves = self.list_saves()
@@ -234,7 +814,8 @@ class SaveManager:
 		Returns:
 			Nom du fichier ou None
 		"""
-		saves = self.list_saves()
+		# Réutilise la liste affichée par le menu plutôt que de relire le répertoire
+		saves = self._saves_cache if self._saves_cache is not None else self.list_saves()
 		if 1 <= index <= len(saves):
 			return saves[index - 1]["filename"]
 		return None
@@ -0,0 +1,158 @@
+"""
+Calendrier compilé - la saison sous forme de tableaux immuables
+
+Le calendrier déclaratif (tournaments_database) est compilé une seule fois
+à l'import: chaque tournoi reçoit un identifiant (ordre semaine puis ordre
+de déclaration) et ses caractéristiques sont rangées dans des tableaux
+numpy en lecture seule et une description immuable (TournamentSpec),
+partageables entre plusieurs parties.
+"""
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from .tournaments_data import TournamentCategory
+from .tournaments_database import tournois
+from ..entities.tournament import ROUND_INDEX, ROUND_KEYS, TournamentSpec
+from ..utils.constants import TIME_CONSTANTS, TOURNAMENT_SURFACES
+
+CATEGORIES = tuple(TournamentCategory)
+SURFACES = tuple(TOURNAMENT_SURFACES.values())
+
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    """Rend un tableau non modifiable"""
+    array.flags.writeable = False
+    return array
+
+
+@dataclass(frozen=True)
+class SeasonCalendar:
+    """
+    Calendrier d'une saison, en colonnes indexées par identifiant de tournoi
+
+    Les tournois de la semaine w ont les identifiants
+    week_offsets[w] à week_offsets[w + 1] - 1 (ordre de déclaration);
+    importance_order contient les mêmes identifiants, triés par importance
+    décroissante à l'intérieur de chaque semaine.
+    """
+    names: Tuple[str, ...]
+    locations: Tuple[str, ...]
+    weeks: np.ndarray
+    week_offsets: np.ndarray
+    importance_order: np.ndarray
+    category_codes: np.ndarray
+    surface_codes: np.ndarray
+    draw_sizes: np.ndarray
+    importance: np.ndarray
+    atp_points: np.ndarray
+    xp_points: np.ndarray
+    name_index: Mapping[str, int]
+    specs: Tuple[TournamentSpec, ...]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def week_ids(self, week: int, by_importance: bool = False) -> np.ndarray:
+        """
+        Identifiants des tournois d'une semaine
+
+        Args:
+            week: Numéro de la semaine
+            by_importance: Trie par importance décroissante plutôt que par ordre de déclaration
+
+        Returns:
+            Tableau (vide si la semaine n'existe pas)
+        """
+        if not 0 < week < len(self.week_offsets) - 1:
+            return self.week_offsets[:0]
+        ids = self.importance_order if by_importance else np.arange(len(self.names))
+        return ids[self.week_offsets[week]:self.week_offsets[week + 1]]
+
+    def find(self, name: str) -> Optional[int]:
+        """Identifiant d'un tournoi d'après son nom (None si inconnu)"""
+        return self.name_index.get(name)
+
+    def category(self, tournament_id: int) -> TournamentCategory:
+        return CATEGORIES[self.category_codes[tournament_id]]
+
+    def surface(self, tournament_id: int) -> str:
+        return SURFACES[self.surface_codes[tournament_id]]
+
+    def round_points(self, tournament_id: int, round_key: str) -> Tuple[int, int]:
+        """
+        Barème d'un tour
+
+        Returns:
+            (points ATP, points XP)
+        """
+        column = ROUND_INDEX.get(round_key)
+        if column is None:
+            return 0, 0
+        return int(self.atp_points[tournament_id, column]), int(self.xp_points[tournament_id, column])
+
+
+def iter_database(database: Dict[int, List['Tournament']]) -> List['Tournament']:
+    """Tournois d'un calendrier déclaratif dans l'ordre des identifiants compilés"""
+    return [tournament for week in sorted(database) for tournament in database[week]]
+
+
+def compile_calendar(database: Dict[int, List['Tournament']]) -> SeasonCalendar:
+    """
+    Compile un calendrier déclaratif {semaine: [tournois]} en tableaux
+
+    Les barèmes par tour sont résolus avec les règles des tournois eux-mêmes
+    (configurations selon le nombre de tours du tableau).
+
+    Args:
+        database: Calendrier déclaratif
+
+    Returns:
+        Calendrier compilé
+    """
+    tournaments = iter_database(database)
+    count = len(tournaments)
+    last_week = max(TIME_CONSTANTS["WEEKS_PER_YEAR"], max(database, default=0))
+
+    weeks = np.array([week for week in sorted(database) for _ in database[week]], dtype=np.int16)
+    per_week = np.bincount(weeks, minlength=last_week + 2)[:last_week + 2]
+    week_offsets = np.zeros(last_week + 2, dtype=np.int32)
+    week_offsets[1:] = np.cumsum(per_week)[:-1]
+
+    importance = np.array([tournament.tournament_importance for tournament in tournaments], dtype=np.int8)
+    # Tri stable par (semaine, importance décroissante)
+    importance_order = np.lexsort((-importance.astype(np.int16), weeks)).astype(np.int32)
+
+    specs = tuple(TournamentSpec.from_tournament(tournament, tournament_id, int(weeks[tournament_id]))
+                  for tournament_id, tournament in enumerate(tournaments))
+    atp_points = np.zeros((count, len(ROUND_KEYS)), dtype=np.int32)
+    xp_points = np.zeros((count, len(ROUND_KEYS)), dtype=np.int32)
+    for spec in specs:
+        atp_points[spec.tournament_id], xp_points[spec.tournament_id] = spec.award_tables
+
+    names = tuple(tournament.name for tournament in tournaments)
+    name_index = {}
+    for tournament_id, name in enumerate(names):
+        name_index.setdefault(name, tournament_id)
+
+    return SeasonCalendar(
+        names=names,
+        locations=tuple(tournament.location for tournament in tournaments),
+        weeks=_frozen(weeks),
+        week_offsets=_frozen(week_offsets),
+        importance_order=_frozen(importance_order),
+        category_codes=_frozen(np.array([CATEGORIES.index(t.category) for t in tournaments], dtype=np.int8)),
+        surface_codes=_frozen(np.array([SURFACES.index(t.surface) for t in tournaments], dtype=np.int8)),
+        draw_sizes=_frozen(np.array([tournament.num_players for tournament in tournaments], dtype=np.int16)),
+        importance=_frozen(importance),
+        atp_points=_frozen(atp_points),
+        xp_points=_frozen(xp_points),
+        name_index=MappingProxyType(name_index),
+        specs=specs
+    )
+
+
+# Calendrier de la saison, partagé par toutes les parties
+CALENDAR = compile_calendar(tournois)
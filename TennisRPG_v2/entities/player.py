@@ -1,12 +1,16 @@
 """
 Entité Player - Joueur de tennis.
 """
+import itertools
 import random
+import threading
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
 from ..utils.constants import (
 	ARCHETYPES, PLAYER_CONSTANTS, STATS_WEIGHTS, HEIGHT_IMPACTS,
 	TalentLevel, TALENT_STAT_MULTIPLIERS
@@ -14,19 +18,80 @@ from ..utils.constants import (
 from ..utils.helpers import (
 	generate_height, calculate_weighted_elo, calculate_experience_required, get_random_hand,
 	get_random_backhand, get_gender_agreement, calculate_fatigue_level, get_age_progression_factor,
-	calculate_tournament_xp
+	get_age_progression_factors, calculate_tournament_xp
 )
 
+from ..utils.cache_manager import display_cache, CACHE_MISS
+from ..utils.profiler import profile_phase
 from ..data.surface_data import SURFACE_IMPACTS
 
 
+# Identifiants entiers stables des joueurs (clés des journaux et statistiques en colonnes)
+_player_id_lock = threading.Lock()
+_next_player_id = 1
+
+
+def allocate_player_id() -> int:
+	"""Retourne un nouvel identifiant de joueur unique"""
+	global _next_player_id
+	with _player_id_lock:
+		player_id = _next_player_id
+		_next_player_id += 1
+	return player_id
+
+
+def reserve_player_id(player_id: int) -> None:
+	"""Garantit que les prochains identifiants alloués dépassent un identifiant chargé"""
+	global _next_player_id
+	with _player_id_lock:
+		_next_player_id = max(_next_player_id, player_id + 1)
+
+
 class Gender(Enum):
 	MALE = "m"
 	FEMALE = "f"
 
 
+# Horloge des versions, partagée par tous les objets: une version n'est jamais réutilisée
+_version_clock = itertools.count(1)
+
+
+class DirtyTrackingMixin:
+	"""
+	Version estampillée par mark_dirty()
+
+	Sert aux sauvegardes incrémentales (objet modifié depuis la dernière
+	sauvegarde) et à l'invalidation des caches (version enregistrée à l'écriture).
+	Les affectations restent des écritures d'attribut simples: le code qui
+	modifie un état sauvegardé appelle mark_dirty() une fois ses écritures faites.
+	Chaque estampille vient d'une horloge globale, si bien qu'un objet créé
+	plus tard a toujours une version supérieure.
+	"""
+
+	_version = 0
+	_saved_version = -1
+
+	@property
+	def version(self) -> int:
+		"""Version courante (strictement croissante)"""
+		return self._version
+
+	@property
+	def is_dirty(self) -> bool:
+		"""Indique si l'objet a été modifié depuis la dernière sauvegarde"""
+		return self._version != self._saved_version
+
+	def mark_dirty(self) -> None:
+		"""Estampille une nouvelle version après une modification"""
+		self._version = next(_version_clock)
+
+	def clear_dirty(self) -> None:
+		"""Marque l'objet comme sauvegardé"""
+		self._saved_version = self._version
+
+
 @dataclass
-class PlayerStats:
+class PlayerStats(DirtyTrackingMixin):
 	"""Statistiques du joueur"""
 	coup_droit: int = PLAYER_CONSTANTS["BASE_STAT_VALUE"]
 	revers: int = PLAYER_CONSTANTS["BASE_STAT_VALUE"]
@@ -37,6 +102,9 @@ class PlayerStats:
 	endurance: int = PLAYER_CONSTANTS["BASE_STAT_VALUE"]
 	reflexes: int = PLAYER_CONSTANTS["BASE_STAT_VALUE"]
 
+	def __post_init__(self):
+		self.mark_dirty()
+
 	def to_dict(self) -> Dict[str, int]:
 		return {
 			"Coup droit": self.coup_droit,
@@ -64,10 +132,11 @@ class PlayerStats:
 		for french_name, english_attr in mapping.items():
 			if french_name in stats_dict:
 				setattr(self, english_attr, stats_dict[french_name])
+		self.mark_dirty()
 
 
 @dataclass
-class PlayerCareer:
+class PlayerCareer(DirtyTrackingMixin):
 	"""Données de carrière d'un joueur"""
 	level: int = 1
 	xp_points: int = 0
@@ -79,9 +148,12 @@ class PlayerCareer:
 	# ELO stocké pour chaque surface pour éviter les recalculs
 	elo_ratings: Optional[Dict[str, int]] = None
 
+	def __post_init__(self):
+		self.mark_dirty()
+
 
 @dataclass
-class PlayerPhysical:
+class PlayerPhysical(DirtyTrackingMixin):
 	"""Données physiques d'un joueur"""
 	height: int = 180  # Todo: modification possible
 	dominant_hand: str = ""
@@ -93,24 +165,32 @@ class PlayerPhysical:
 			self.dominant_hand = get_random_hand()
 		if not self.backhand_style:
 			self.backhand_style = get_random_backhand()
+		self.mark_dirty()
 
 	def recover_fatigue(self, amount: int):
 		"""Récupère une certaine quantité de fatigue"""
 		self.fatigue = max(0, self.fatigue - amount)
+		self.mark_dirty()
 
 
-class Player:
+class Player(DirtyTrackingMixin):
 	"""Joueur de tennis"""
 
 	def __init__(self, gender: Gender, first_name: str, last_name: str,
 				 country: str, height: Optional[int] = None,
 				 level: int = 1, archetype: Optional[str] = None,
 				 is_main_player: bool = False, age: Optional[int] = None,
-				 talent_level: Optional[TalentLevel] = None):
+				 talent_level: Optional[TalentLevel] = None, player_id: Optional[int] = None):
 
 		# Validation des paramètres
 		self._validate_init_params(gender, first_name, last_name, country, height, level)
 
+		# Identifiant: nouveau, ou celui d'un joueur rechargé (jamais réalloué)
+		if player_id is None:
+			player_id = allocate_player_id()
+		else:
+			reserve_player_id(player_id)
+		self.player_id = player_id
 		self.gender = gender
 		self.first_name = first_name
 		self.last_name = last_name
@@ -164,6 +244,42 @@ class Player:
 	def full_name(self) -> str:
 		return f"{self.first_name} {self.last_name}"
 
+	def _check_components(self) -> None:
+		"""Estampille le joueur si l'un de ses composants a été remplacé par un autre objet"""
+		components = (id(self.stats), id(self.career), id(self.physical))
+		if components != self.__dict__.get("_component_ids"):
+			self._component_ids = components
+			self.mark_dirty()
+
+	@property
+	def version(self) -> int:
+		"""
+		Version du joueur pour l'invalidation des caches (strictement croissante)
+
+		La plus récente des estampilles du joueur (identité), de ses statistiques
+		et de sa carrière (points, niveau, âge). Les estampilles venant d'une
+		horloge globale et un composant remplacé estampillant le joueur, la
+		version ne recule jamais, même si l'ancien composant avait été plus
+		modifié que le nouveau. La fatigue (composant physique) n'en fait pas
+		partie: les caches qui en dépendent déclarent aussi self.physical.
+		"""
+		self._check_components()
+		return max(self._version, self.stats._version, self.career._version)
+
+	@property
+	def save_version(self) -> int:
+		"""Version du joueur pour les sauvegardes incrémentales (fatigue comprise)"""
+		return max(self.version, self.physical._version)
+
+	@property
+	def is_dirty(self) -> bool:
+		"""Indique si le joueur ou l'un de ses composants a changé depuis la dernière sauvegarde"""
+		return self.save_version != self._saved_version
+
+	def clear_dirty(self) -> None:
+		"""Marque le joueur et ses composants comme sauvegardés"""
+		self._saved_version = self.save_version
+
 	@property
 	def elo(self) -> int:
 		"""Retourne l'ELO général stocké du joueur"""
@@ -174,6 +290,7 @@ class Player:
 		"""Définit l'ELO général du joueur"""
 		self._initialize_elo_ratings()
 		self.career.elo_ratings["General"] = value
+		self.career.mark_dirty()
 
 	def get_elo(self, surface: Optional[str] = None) -> int:
 		"""Retourne l'ELO pour une surface donnée ou général"""
@@ -268,6 +385,7 @@ class Player:
 
 		self.career.xp_points += adjusted_xp
 		self.career.xp_total += adjusted_xp  # Track les XP totaux
+		self.career.mark_dirty()
 
 		if self.is_main_player:
 			print(f"\n{self.full_name} a gagné {adjusted_xp} pts d'xp.")
@@ -291,6 +409,7 @@ class Player:
 			self.career.xp_points -= calculate_experience_required(self.career.level)
 			self.career.level += 1
 			self.career.ap_points += PLAYER_CONSTANTS["BASE_POINTS"]
+			self.career.mark_dirty()
 			level_changed = True
 
 			if self.is_main_player:
@@ -331,6 +450,7 @@ class Player:
 				stats_dict[chosen_attr] += 1
 				self.career.ap_points -= 1
 
+		self.career.mark_dirty()
 		self.stats.update_from_dict(stats_dict)
 		# Recalculer les ELO après changement de stats
 		self._recalculate_all_elo_ratings()
@@ -376,6 +496,7 @@ class Player:
 			except (ValueError, IndexError):
 				print("Choix invalide. Veuillez réessayer.")
 
+		self.career.mark_dirty()
 		self.stats.update_from_dict(stats_dict)
 		# Recalculer les ELO après changement de stats
 		self._recalculate_all_elo_ratings()
@@ -383,6 +504,7 @@ class Player:
 	def add_atp_points(self, points: int):
 		"""Ajoute des points ATP au joueur"""
 		self.career.atp_points += points
+		self.career.mark_dirty()
 		if self.is_main_player:
 			print(f"{self.first_name} {self.last_name} a gagné {points} points ATP.")
 
@@ -392,6 +514,7 @@ class Player:
 		fatigue_added = calculate_fatigue_level(activity, sets_played, tournament_category)
 		self.physical.fatigue = min(PLAYER_CONSTANTS["MAX_FATIGUE"],
 									self.physical.fatigue + fatigue_added)
+		self.physical.mark_dirty()
 
 		return fatigue_added if display else None
 
@@ -399,10 +522,11 @@ class Player:
 		"""Le joueur se repose"""
 		rest_amount = calculate_fatigue_level("Repos")
 		self.physical.fatigue = max(0, self.physical.fatigue - rest_amount)
+		self.physical.mark_dirty()
 
 	def recover_fatigue(self, recovery_amount: int):
 		"""Récupère de la fatigue naturellement"""
-		self.physical.fatigue = max(0, self.physical.fatigue - recovery_amount)
+		self.physical.recover_fatigue(recovery_amount)
 
 	def should_participate(self) -> bool:
 		"""
@@ -423,6 +547,15 @@ class Player:
 		Returns:
 			Chaîne formatée pour l'affichage
 		"""
+		key = ("display_card", self, ranking_position)
+		card = display_cache.get(key)
+		if card is CACHE_MISS:
+			card = self._build_display_card(ranking_position)
+			display_cache.set(key, card, depends_on=(self, self.physical))
+		return card
+
+	def _build_display_card(self, ranking_position: int = None) -> str:
+		"""Construit la carte d'affichage du joueur (voir get_display_card)"""
 		width = 46
 		lines = []
 
@@ -496,9 +629,11 @@ class Player:
 		if self.career.elo_ratings is None:
 			career_dict["elo_ratings"] = {}
 		else:
-			career_dict["elo_ratings"] = self.career.elo_ratings
+			# Copie: la sauvegarde peut être écrite depuis un autre thread
+			career_dict["elo_ratings"] = dict(self.career.elo_ratings)
 
 		return {
+			"player_id": self.player_id,
 			"gender": self.gender.value,
 			"first_name": self.first_name,
 			"last_name": self.last_name,
@@ -535,7 +670,8 @@ class Player:
 			country=data["country"],
 			is_main_player=data.get("is_main_player", False),
 			age=saved_age,
-			talent_level=talent_level
+			talent_level=talent_level,
+			player_id=data.get("player_id")
 		)
 
 		# Restaure les attributs principaux
@@ -578,4 +714,72 @@ class Player:
 		player.physical.backhand_style = physical_data["backhand_style"]
 		player.physical.fatigue = physical_data["fatigue"]
 
+		player.mark_dirty()
+		player.stats.mark_dirty()
+		player.career.mark_dirty()
+		player.physical.mark_dirty()
 		return player
+
+
+# Expérience requise pour passer au niveau suivant, indexée par niveau
+_XP_REQUIRED = np.array([calculate_experience_required(level) for level in range(PLAYER_CONSTANTS["MAX_LEVEL"] + 1)],
+						dtype=np.int64)
+
+
+@profile_phase("xp_batch")
+def gain_experience_batch(players: List[Player], xp: np.ndarray) -> np.ndarray:
+	"""
+	Fait gagner de l'xp à un lot de joueurs (mêmes règles que Player.gain_experience)
+
+	Les facteurs de niveau et d'âge sont calculés sur des tableaux, avec le
+	niveau de chaque joueur au début du lot (un joueur peut apparaître
+	plusieurs fois). Seuls les joueurs qui montent de niveau passent par
+	_check_level_up, et le joueur principal par gain_experience (affichage).
+
+	Args:
+		players: Joueurs
+		xp: XP de base de chaque joueur
+
+	Returns:
+		XP réellement gagnés après application des facteurs
+	"""
+	count = len(players)
+	xp = np.asarray(xp, dtype=np.int64)
+	levels = np.fromiter((player.career.level for player in players), dtype=np.int64, count=count)
+	ages = np.fromiter((player.career.age for player in players), dtype=np.int64, count=count)
+
+	max_level = PLAYER_CONSTANTS["MAX_LEVEL"]
+	level_factors = np.maximum(1 - ((levels - 1) / max_level) * 0.4, 0.5)
+	adjusted_xp = np.round(xp * (level_factors * get_age_progression_factors(ages))).astype(np.int64)
+
+	for index in np.flatnonzero(adjusted_xp > 0):
+		player = players[index]
+		if player.is_main_player:
+			player.gain_experience(int(xp[index]))
+			continue
+		career = player.career
+		career.xp_points += int(adjusted_xp[index])
+		career.xp_total += int(adjusted_xp[index])
+		career.mark_dirty()
+		if career.level < max_level and career.xp_points >= _XP_REQUIRED[career.level]:
+			player._check_level_up()
+
+	return adjusted_xp
+
+
+def apply_fatigue_changes(players: List[Player], changes: np.ndarray) -> None:
+	"""
+	Ajoute des variations de fatigue à un lot de joueurs (bornées entre 0 et MAX_FATIGUE)
+
+	Seuls les joueurs dont la fatigue change sont modifiés (sauvegardes incrémentales).
+
+	Args:
+		players: Joueurs
+		changes: Variation de fatigue de chaque joueur (négative pour une récupération)
+	"""
+	fatigue = np.fromiter((player.physical.fatigue for player in players), dtype=np.int64, count=len(players))
+	new_fatigue = np.clip(fatigue + np.asarray(changes, dtype=np.int64), 0, PLAYER_CONSTANTS["MAX_FATIGUE"])
+	for index in np.flatnonzero(new_fatigue != fatigue):
+		physical = players[index].physical
+		physical.fatigue = int(new_fatigue[index])
+		physical.mark_dirty()
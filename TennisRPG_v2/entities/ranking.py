@@ -2,16 +2,20 @@
 Entité Ranking - Structure de données pour les classements de Tennis
 """
 
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass
 
+import numpy as np
+
 
 class RankingType(Enum):
 	"""Types de classements disponibles"""
 	ELO = "elo"
 	ATP = "atp"
 	ATP_RACE = "atp_race"
+	GLICKO = "glicko"
 
 
 @dataclass
@@ -33,29 +37,126 @@ class RankingEntry:
 
 
 class Ranking:
-	"""Structure de données pour un classement - Entité pure sans logique métier"""
+	"""
+	Structure de données pour un classement - Entité pure sans logique métier
+
+	L'ordre du classement est conservé tel quel depuis la dernière mise à
+	jour (tableau d'identifiants, rang = position + 1): une page est une
+	tranche O(k). Les index de recherche des rangs (dictionnaire pour un
+	joueur, identifiants triés pour un tableau) sont construits à la
+	demande et dimensionnés par le nombre de classés, pas par le plus grand
+	identifiant attribué, qui ne cesse de croître au fil des retraites.
+	"""
+
+	_SCAN_CHUNK = 256  # Taille des tranches parcourues pour les pages filtrées
 
-	def __init__(self, players: Dict[str, 'Player']):
+	def __init__(self, players: Dict[int, 'Player']):
 		"""Initialise un classement vide"""
 		self.players = players
-		self.rankings: Dict[str, int] = {}  # player_name -> rank
+		self.order = np.zeros(0, dtype=np.int64)  # Identifiants dans l'ordre du classement
+		self._rankings: Optional[Dict[int, int]] = None
+		self._sorted_ids: Optional[Tuple[np.ndarray, np.ndarray]] = None  # (identifiants triés, rangs)
+		self.version = 0  # Incrémentée à chaque mise à jour (invalidation des caches)
+
+	def __len__(self) -> int:
+		return len(self.order)
 
 	def update_rankings(self, ranked_players: List['Player']) -> None:
 		"""Met à jour les rankings avec une liste ordonnée de joueurs"""
-		self.rankings = {
-			player.full_name: rank 
-			for rank, player in enumerate(ranked_players, 1)
-		}
+		self.restore_rankings([player.player_id for player in ranked_players])
+
+	def restore_rankings(self, ordered_ids: List[int]) -> None:
+		"""Met à jour les rankings depuis une liste ordonnée d'identifiants (ex: chargement de sauvegarde)"""
+		order = np.asarray(ordered_ids, dtype=np.int64)
+		order.flags.writeable = False
+		self.order = order
+		self._rankings = None
+		self._sorted_ids = None
+		self.version += 1
+
+	@property
+	def rank_table(self) -> np.ndarray:
+		"""
+		Rangs indexés par identifiant de joueur (0 = non classé)
+
+		Construit à chaque appel, à la taille du plus grand identifiant classé:
+		réservé à l'instantané hebdomadaire de l'historique des rangs.
+		"""
+		table = np.zeros(int(self.order.max()) + 1 if len(self.order) else 0, dtype=np.int32)
+		table[self.order] = np.arange(1, len(self.order) + 1, dtype=np.int32)
+		return table
+
+	@property
+	def rankings(self) -> Dict[int, int]:
+		"""Dictionnaire {player_id: rang}, construit à la demande"""
+		if self._rankings is None:
+			self._rankings = {player_id: rank for rank, player_id in enumerate(self.order.tolist(), 1)}
+		return self._rankings
 
 	def get_player_rank(self, player: 'Player') -> int:
 		"""Obtient le rang d'un joueur (0 si non classé)"""
-		return self.rankings.get(player.full_name, 0)
+		return self.rankings.get(player.player_id, 0)
+
+	def get_ranks(self, player_ids: np.ndarray) -> np.ndarray:
+		"""
+		Rangs d'un tableau d'identifiants en une seule indexation
 
-	def get_ranked_players(self, top_n: Optional[int] = None) -> List['Player']:
+		Returns:
+			Tableau des rangs (0 si non classé)
+		"""
+		if self._sorted_ids is None:
+			sorter = np.argsort(self.order, kind="stable")
+			self._sorted_ids = (self.order[sorter], (sorter + 1).astype(np.int32))
+		sorted_ids, sorted_ranks = self._sorted_ids
+
+		player_ids = np.asarray(player_ids, dtype=np.int64)
+		positions = np.minimum(np.searchsorted(sorted_ids, player_ids), max(len(sorted_ids) - 1, 0))
+		ranks = np.zeros(len(player_ids), dtype=np.int32)
+		if len(sorted_ids):
+			known = sorted_ids[positions] == player_ids
+			ranks[known] = sorted_ranks[positions[known]]
+		return ranks
+
+	def get_page(self, start_rank: int = 1, count: Optional[int] = None) -> np.ndarray:
+		"""
+		Identifiants des joueurs classés du rang start_rank au rang start_rank + count - 1
+
+		Returns:
+			Vue en lecture seule sur l'ordre du classement (pas de copie)
+		"""
+		start = max(start_rank, 1) - 1
+		return self.order[start:start + count if count is not None else None]
+
+	def get_ranked_players(self, top_n: Optional[int] = None, start_rank: int = 1) -> List['Player']:
 		"""Retourne les joueurs classés par ordre de rang"""
-		sorted_items = sorted(self.rankings.items(), key=lambda x: x[1])
-		
-		if top_n:
-			sorted_items = sorted_items[:top_n]
-			
-		return [self.players[player_name] for player_name, _ in sorted_items]
\ No newline at end of file
+		return [self.players[player_id] for player_id in self.get_page(start_rank, top_n).tolist()]
+
+	def iter_ranked(self, start_rank: int = 1) -> Iterator[Tuple[int, 'Player']]:
+		"""
+		Parcourt le classement à partir d'un rang, par tranches, sans copier tout l'ordre
+
+		Yields:
+			Tuples (rang, joueur)
+		"""
+		for offset in range(max(start_rank, 1) - 1, len(self.order), self._SCAN_CHUNK):
+			chunk = self.order[offset:offset + self._SCAN_CHUNK].tolist()
+			for rank, player_id in enumerate(chunk, offset + 1):
+				yield rank, self.players[player_id]
+
+	def get_filtered_page(self, predicate: Callable[['Player'], bool], start_rank: int = 1,
+						  count: Optional[int] = None) -> List[Tuple[int, 'Player']]:
+		"""
+		Joueurs classés vérifiant un critère (pays, âge...), avec leur rang global
+
+		Le parcours s'arrête dès que count joueurs ont été trouvés.
+
+		Args:
+			predicate: Critère de sélection
+			start_rank: Rang à partir duquel chercher
+			count: Nombre maximal de joueurs (None = tous)
+
+		Returns:
+			Liste de tuples (rang, joueur)
+		"""
+		matches = ((rank, player) for rank, player in self.iter_ranked(start_rank) if predicate(player))
+		return list(islice(matches, count))
@@ -9,11 +9,13 @@ from .tournament import Tournament, TournamentResult, TournamentStatus
 from ..data.tournaments_data import TournamentCategory, SPECIAL_TOURNAMENT_CONFIG
 from ..utils.constants import TOURNAMENT_CONSTANTS
 from ..utils.helpers import get_round_display_name, get_gender_agreement, seed
+from ..utils.profiler import profile_phase
 
 
 class EliminationTournament(Tournament):
 	"""Tournoi à élimination directe classique"""
 
+	@profile_phase("play_tournament")
 	def play_tournament(self, verbose: bool = None, atp_points_manager=None, week: int = None, ranking_manager=None) -> TournamentResult:
 		"""Joue un tournoi à élimination directe"""
 		assert len(self.participants) == self.num_players, (f"Le tournoi contient le mauvais nombre de joueurs"
@@ -78,6 +80,10 @@ class EliminationTournament(Tournament):
 		# Suivi des derniers tours pour chaque joueur
 		last_rounds = {player: 0 for player in self.participants}
 
+		# Récompenses (joueur, tour atteint), attribuées en un lot à la fin du tournoi
+		awarded_players = []
+		awarded_rounds = []
+
 		# Joue tous les tours
 		for round_num in range(1, num_rounds + 1):
 			if not bracket:
@@ -85,6 +91,7 @@ class EliminationTournament(Tournament):
 				
 			round_name = phase_names[round_num - 1]
 			next_bracket = []
+			round_first_match = len(self.match_results)
 
 			# Affichage du round
 			if verbose:
@@ -104,10 +111,11 @@ class EliminationTournament(Tournament):
 				if player1 and player2:
 					# Match normal
 					if verbose:
-						print(f"⚔️  {player1.full_name} vs {player2.full_name}")
+						self._display_matchup(player1, player2)
 					
 					match_result = self.simulate_match(player1, player2)
 					self.match_results.append(match_result)
+					self._notify_match(match_result, round_name, week)
 					
 					winner = match_result.winner
 					loser = match_result.loser
@@ -124,15 +132,8 @@ class EliminationTournament(Tournament):
 						phase_name = get_round_display_name(round_name)
 						print(f"\n❌ {loser.full_name} éliminé(e) {phase_name}!")
 					
-					# Attribue points ATP et XP
-					atp_points = self.assign_atp_points(loser, round_name, atp_points_manager, week)
-					xp_points = self.calculate_xp_points(round_name)
-					if xp_points > 0:
-						loser.gain_experience(xp_points)
-					
-					# Suit les points ATP du joueur principal
-					if main_player and loser == main_player:
-						self._main_player_atp_points += atp_points
+					awarded_players.append(loser)
+					awarded_rounds.append(round_name)
 					
 					next_bracket.append(winner)
 					
@@ -150,6 +151,8 @@ class EliminationTournament(Tournament):
 						print(f"👍 {player2.full_name} qualifié{gender_suffix} d'office (bye)")
 					next_bracket.append(player2)
 
+			self._notify_round_completed(round_name, round_first_match, week)
+
 			# Prépare le bracket pour le tour suivant
 			bracket = []
 			for i in range(0, len(next_bracket), 2):
@@ -167,20 +170,16 @@ class EliminationTournament(Tournament):
 			if verbose:
 				print(f"{'=' * 60}")
 
-		# Attribue les points au vainqueur
-		atp_points_winner = self.assign_atp_points(winner, "winner", atp_points_manager, week)
-		
-		# Combine XP du vainqueur + bonus de completion du tournoi
-		xp_points_winner = self.calculate_xp_points("winner")
-		total_xp = xp_points_winner + TOURNAMENT_CONSTANTS["TOURNAMENT_COMPLETION_BONUS"]
-		if total_xp > 0:
-			winner.gain_experience(total_xp)
+		# Attribue points ATP et XP de tous les joueurs (XP du vainqueur + bonus de completion du tournoi)
+		awarded_players.append(winner)
+		awarded_rounds.append("winner")
+		awarded_points = self.award_results(awarded_players, awarded_rounds, atp_points_manager, week,
+											winner_bonus_xp=TOURNAMENT_CONSTANTS["TOURNAMENT_COMPLETION_BONUS"])
 
 		# Récapitulatif pour le joueur principal
 		if main_player:
-			if winner == main_player:
-				# Le joueur principal a gagné
-				self._main_player_atp_points += atp_points_winner
+			self._main_player_atp_points = sum(points for player, points in zip(awarded_players, awarded_points.tolist())
+											   if player == main_player)
 
 			# Calcule les XP réellement gagnés
 			main_player_xp_gained = main_player.career.xp_total - main_player_initial_xp_total
@@ -191,7 +190,9 @@ class EliminationTournament(Tournament):
 
 		self.status = TournamentStatus.COMPLETED
 
-		return self._create_tournament_result(winner)
+		result = self._create_tournament_result(winner)
+		self._notify_tournament_completed(result, week)
+		return result
 
 	
 
@@ -277,6 +278,7 @@ class ATPFinals(Tournament):
 
 		self.config = SPECIAL_TOURNAMENT_CONFIG["ATP_FINALS"]
 
+	@profile_phase("play_tournament")
 	def play_tournament(self, verbose: bool = None, atp_points_manager=None, week: int = None) -> TournamentResult:
 		"""Joue le tournoi ATP Finals"""
 		if len(self.participants) != 8:
@@ -290,6 +292,10 @@ class ATPFinals(Tournament):
 		main_player_initial_xp_total = 0
 		self._main_player_atp_points = 0  # Track les points ATP du joueur principal
 
+		# Récompenses (joueur, tour atteint), attribuées en un lot à la fin du tournoi
+		self._awarded_players = []
+		self._awarded_rounds = []
+
 		for player in self.participants:
 			if hasattr(player, 'is_main_player') and player.is_main_player:
 				main_player = player
@@ -312,13 +318,14 @@ class ATPFinals(Tournament):
 		if verbose:
 			print(f"\n📊 PHASE DE POULES")
 			print("-" * 30)
-		qualified_players = self._play_group_stage(verbose, atp_points_manager, week)
+		qualified_players = self._play_group_stage(verbose, week)
+		self._notify_round_completed("round_robin", 0, week)
 
 		# Phase finale (demi-finales + finale)
 		if verbose:
 			print(f"\n📊 PHASE FINALE")
 			print("-" * 30)
-		winner = self._play_knockout_stage(qualified_players, verbose, atp_points_manager, week)
+		winner = self._play_knockout_stage(qualified_players, verbose, week)
 
 		# Affichage du vainqueur seulement si verbose ou si joueur principal gagne
 		if verbose or (hasattr(winner, 'is_main_player') and winner.is_main_player):
@@ -327,20 +334,17 @@ class ATPFinals(Tournament):
 				print(f"🎉 Félicitations pour cette victoire exceptionnelle!")
 				print(f"{'=' * 60}")
 
-		# Attribue les points au vainqueur
-		atp_points_winner = self.assign_atp_points(winner, "winner", atp_points_manager, week)
-		
-		# Combine XP du vainqueur + bonus de completion du tournoi
-		xp_points_winner = self.calculate_xp_points("winner")
-		total_xp = xp_points_winner + TOURNAMENT_CONSTANTS["TOURNAMENT_COMPLETION_BONUS"]
-		if total_xp > 0:
-			winner.gain_experience(total_xp)
+		# Attribue points ATP et XP de tous les joueurs (XP du vainqueur + bonus de completion du tournoi)
+		self._awarded_players.append(winner)
+		self._awarded_rounds.append("winner")
+		awarded_points = self.award_results(self._awarded_players, self._awarded_rounds, atp_points_manager, week,
+											winner_bonus_xp=TOURNAMENT_CONSTANTS["TOURNAMENT_COMPLETION_BONUS"])
 
 		# Récapitulatif pour le joueur principal
 		if main_player:
-			if winner == main_player:
-				# Le joueur principal a gagné
-				self._main_player_atp_points += atp_points_winner
+			self._main_player_atp_points = sum(points for player, points in
+											   zip(self._awarded_players, awarded_points.tolist())
+											   if player == main_player)
 
 			# Calcule les XP réellement gagnés
 			main_player_xp_gained = main_player.career.xp_total - main_player_initial_xp_total
@@ -351,10 +355,11 @@ class ATPFinals(Tournament):
 
 		self.status = TournamentStatus.COMPLETED
 
-		return self._create_tournament_result(winner)
+		result = self._create_tournament_result(winner)
+		self._notify_tournament_completed(result, week)
+		return result
 
-	def _play_group_stage(self, verbose: bool = True, atp_points_manager=None,
-					week=None) -> List['Player']:
+	def _play_group_stage(self, verbose: bool = True, week=None) -> List['Player']:
 		"""Joue la phase de poules"""
 		# Divise en 2 groupes de 4 joueurs
 		group1 = self.participants[:4]
@@ -366,8 +371,8 @@ class ATPFinals(Tournament):
 			print()
 
 		# Joue chaque groupe
-		qualified1 = self._play_group(group1, "A", verbose, atp_points_manager=atp_points_manager, week=week)
-		qualified2 = self._play_group(group2, "B", verbose, atp_points_manager=atp_points_manager, week=week)
+		qualified1 = self._play_group(group1, "A", verbose, week=week)
+		qualified2 = self._play_group(group2, "B", verbose, week=week)
 
 		if verbose:
 			print(f"\n✅ Qualifiés du Groupe A: {', '.join([p.full_name for p in qualified1])}")
@@ -375,7 +380,7 @@ class ATPFinals(Tournament):
 
 		return qualified1 + qualified2
 
-	def _play_group(self, players: List['Player'], group_name: str, verbose: bool = True, atp_points_manager=None,
+	def _play_group(self, players: List['Player'], group_name: str, verbose: bool = True,
 					week=None) -> List['Player']:
 		"""Joue un groupe de 4 joueurs"""
 		if verbose:
@@ -388,10 +393,11 @@ class ATPFinals(Tournament):
 		for i in range(len(players)):
 			for j in range(i + 1, len(players)):
 				if verbose:
-					print(f"⚔️  {players[i].full_name} vs {players[j].full_name}")
+					self._display_matchup(players[i], players[j])
 
 				match_result = self.simulate_match(players[i], players[j])
 				self.match_results.append(match_result)
+				self._notify_match(match_result, "round_robin", week)
 
 				if verbose:
 					print(
@@ -406,15 +412,9 @@ class ATPFinals(Tournament):
 				results[match_result.loser]["sets_won"] += match_result.sets_lost
 				results[match_result.loser]["sets_lost"] += match_result.sets_won
 
-				# Points ATP pour chaque victoire en poule
-				atp_points_gained = self.assign_atp_points(match_result.winner, "round_robin_win", atp_points_manager, week)
-				# Track les points ATP du joueur principal
-				if hasattr(match_result.winner, 'is_main_player') and match_result.winner.is_main_player:
-					if hasattr(self, '_main_player_atp_points'):
-						self._main_player_atp_points += atp_points_gained
-				xp_points = self.calculate_xp_points("round_robin_win")
-				if xp_points > 0:
-					match_result.winner.gain_experience(xp_points)
+				# Points ATP et XP pour chaque victoire en poule
+				self._awarded_players.append(match_result.winner)
+				self._awarded_rounds.append("round_robin_win")
 
 		# Affiche le classement du groupe seulement si verbose
 		if verbose:
@@ -444,7 +444,7 @@ class ATPFinals(Tournament):
 
 		return qualified
 
-	def _play_knockout_stage(self, qualified_players: List['Player'], verbose: bool = True, atp_points_manager=None, week=None) -> 'Player':
+	def _play_knockout_stage(self, qualified_players: List['Player'], verbose: bool = True, week=None) -> 'Player':
 		"""Joue la phase finale (demi-finales + finale)"""
 		if verbose:
 			print(f"\n🥉 DEMI-FINALES")
@@ -452,37 +452,30 @@ class ATPFinals(Tournament):
 
 		# Demi-finales
 		if verbose:
-			print(f"⚔️  {qualified_players[0].full_name} vs {qualified_players[3].full_name}")
+			self._display_matchup(qualified_players[0], qualified_players[3])
 		semi1 = self.simulate_match(qualified_players[0], qualified_players[3])
 		if verbose:
 			print(f"   ✅ {semi1.winner.full_name} gagne {semi1.sets_won}-{semi1.sets_lost}")
 
 		if verbose:
-			print(f"⚔️  {qualified_players[1].full_name} vs {qualified_players[2].full_name}")
+			self._display_matchup(qualified_players[1], qualified_players[2])
 		semi2 = self.simulate_match(qualified_players[1], qualified_players[2])
 		if verbose:
 			print(f"   ✅ {semi2.winner.full_name} gagne {semi2.sets_won}-{semi2.sets_lost}")
 
+		semis_first_match = len(self.match_results)
 		self.match_results.extend([semi1, semi2])
+		self._notify_match(semi1, "semifinalist", week)
+		self._notify_match(semi2, "semifinalist", week)
+		self._notify_round_completed("semifinalist", semis_first_match, week)
 
 		# Enregistre les demi-finalistes éliminés
 		self.eliminated_players[semi1.loser] = "semifinalist"
 		self.eliminated_players[semi2.loser] = "semifinalist"
 
-		# Attribue les points
-		atp_points_semi1 = self.assign_atp_points(semi1.loser, "semifinalist", atp_points_manager, week)
-		atp_points_semi2 = self.assign_atp_points(semi2.loser, "semifinalist", atp_points_manager, week)
-		# Track les points ATP du joueur principal
-		if hasattr(semi1.loser, 'is_main_player') and semi1.loser.is_main_player:
-			if hasattr(self, '_main_player_atp_points'):
-				self._main_player_atp_points += atp_points_semi1
-		if hasattr(semi2.loser, 'is_main_player') and semi2.loser.is_main_player:
-			if hasattr(self, '_main_player_atp_points'):
-				self._main_player_atp_points += atp_points_semi2
-		xp_points_semi = self.calculate_xp_points("semifinalist")
-		if xp_points_semi > 0:
-			semi1.loser.gain_experience(xp_points_semi)
-			semi2.loser.gain_experience(xp_points_semi)
+		# Points ATP et XP des demi-finalistes
+		self._awarded_players.extend([semi1.loser, semi2.loser])
+		self._awarded_rounds.extend(["semifinalist", "semifinalist"])
 
 		if verbose:
 			print(f"\n🥇 FINALE")
@@ -490,25 +483,21 @@ class ATPFinals(Tournament):
 
 		# Finale
 		if verbose:
-			print(f"🎾 {semi1.winner.full_name} vs {semi2.winner.full_name}")
+			self._display_matchup(semi1.winner, semi2.winner, icon="🎾")
 		final_match = self.simulate_match(semi1.winner, semi2.winner)
 		if verbose:
 			print(f"   🏆 {final_match.winner.full_name} gagne {final_match.sets_won}-{final_match.sets_lost}")
 
 		self.match_results.append(final_match)
+		self._notify_match(final_match, "finalist", week)
+		self._notify_round_completed("finalist", len(self.match_results) - 1, week)
 
 		# Enregistre le finaliste
 		self.eliminated_players[final_match.loser] = "finalist"
 
-		# Attribue les points au finaliste
-		atp_points_finalist = self.assign_atp_points(final_match.loser, "finalist", atp_points_manager, week)
-		# Track les points ATP du joueur principal
-		if hasattr(final_match.loser, 'is_main_player') and final_match.loser.is_main_player:
-			if hasattr(self, '_main_player_atp_points'):
-				self._main_player_atp_points += atp_points_finalist
-		xp_points_final = self.calculate_xp_points("finalist")
-		if xp_points_final > 0:
-			final_match.loser.gain_experience(xp_points_final)
+		# Points ATP et XP du finaliste
+		self._awarded_players.append(final_match.loser)
+		self._awarded_rounds.append("finalist")
 
 		return final_match.winner
 
@@ -1,17 +1,28 @@
 """
 Entité Tournament - Tournois de tennis
 """
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Mapping, Any
+from dataclasses import dataclass, field
+from copy import deepcopy
+from types import MappingProxyType
 from enum import Enum
 from abc import ABC, abstractmethod
 import random
 
+import numpy as np
+
 from ..data.tournaments_data import (
 	TournamentCategory, ATP_POINTS_CONFIG, XP_POINTS_CONFIG,
 	ELIGIBILITY_THRESHOLDS, SPECIAL_TOURNAMENT_CONFIG
 )
 from ..utils.constants import TOURNAMENT_CONSTANTS, TOURNAMENT_FORMATS, TOURNAMENT_SURFACES
+from ..utils.profiler import profile_phase
+from .player import gain_experience_batch
+
+# Tours pouvant rapporter des points ATP ou de l'XP (colonnes des barèmes compilés)
+ROUND_KEYS = ("winner", "finalist", "semifinalist", "quarterfinalist", "round_16", "round_32",
+			  "round_64", "round_128", "round_robin_win", "participation")
+ROUND_INDEX = MappingProxyType({round_key: column for column, round_key in enumerate(ROUND_KEYS)})
 
 
 class TournamentStatus(Enum):
@@ -45,6 +56,30 @@ class TournamentResult:
 	match_results: List[MatchResult]
 
 
+class MatchObserver:
+	"""
+	Observateur des matchs joués (journal des matchs, statistiques...)
+
+	Les méthodes par défaut ne font rien: une sous-classe ne redéfinit que
+	les événements qui l'intéressent. Les observateurs sont attachés par
+	TournamentManager.play_tournament le temps d'un tournoi.
+	"""
+
+	def on_match(self, tournament: 'Tournament', result: MatchResult, round_name: str, week: Optional[int]) -> None:
+		"""Appelé après chaque match"""
+
+	def on_round_completed(self, tournament: 'Tournament', round_name: str,
+						   results: List[MatchResult], week: Optional[int]) -> None:
+		"""Appelé quand tous les matchs d'un tour sont joués"""
+
+	def on_tournament_completed(self, tournament: 'Tournament', result: TournamentResult, week: Optional[int]) -> None:
+		"""Appelé à la fin du tournoi"""
+
+	def describe_matchup(self, player1: 'Player', player2: 'Player') -> Optional[str]:
+		"""Ligne affichée avant un match du joueur principal (None: rien à afficher)"""
+		return None
+
+
 class Tournament(ABC):
 	"""Classe de base pour tous les tournois"""
 
@@ -72,8 +107,12 @@ class Tournament(ABC):
 		# État du tournoi
 		self.status = TournamentStatus.PREPARATION
 		self.participants: List['Player'] = []
+		self._participant_ids: set = set()  # Identifiants des participants (détection des doublons)
 		self.match_results: List[MatchResult] = []
 		self.eliminated_players: Dict['Player', str] = {}
+		self.match_observers: List[MatchObserver] = []
+		self.spec: Optional['TournamentSpec'] = None  # Description immuable (tournois créés depuis le calendrier)
+		self._award_tables: Optional[Tuple[np.ndarray, np.ndarray]] = None  # Barèmes (ATP, XP) par tour
 
 		# Configuration automatique
 		self.eligibility_threshold = ELIGIBILITY_THRESHOLDS.get(category, 400)
@@ -181,18 +220,14 @@ class Tournament(ABC):
 		if len(self.participants) >= self.num_players:
 			return False
 
-		# Vérification robuste des doublons basée sur les attributs uniques
-		player_already_in = any(
-			p.first_name == player.first_name and 
-			p.last_name == player.last_name and 
-			p.country == player.country 
-			for p in self.participants
-		)
-		
-		if player_already_in:
+		# Doublons: comparaison des identifiants (ensemble construit au premier ajout de la liste courante)
+		if len(self._participant_ids) != len(self.participants):
+			self._participant_ids = {p.player_id for p in self.participants}
+		if player.player_id in self._participant_ids:
 			return False
 
 		self.participants.append(player)
+		self._participant_ids.add(player.player_id)
 		return True
 
 	def get_seeded_players(self, num_seeds: int, ranking_manager=None) -> List['Player']:
@@ -244,15 +279,74 @@ class Tournament(ABC):
 		Returns:
 			Points ATP attribués
 		"""
-		# Détermine le nombre de tours pour les tournois avec configurations multiples
-		round_key = self._get_round_key_for_tournament(round_reached)
-		points = self.atp_points_config.get(round_key, 0)
+		return int(self.award_results([player], [round_reached], atp_points_manager, week, award_xp=False)[0])
 
-		if points > 0:
-			atp_points_manager.add_tournament_points(player, week, points)
+	@profile_phase("atp_points")
+	def award_results(self, players: List['Player'], rounds_reached: List[str], atp_points_manager=None,
+					  week: int = None, winner_bonus_xp: int = 0, award_xp: bool = True) -> np.ndarray:
+		"""
+		Attribue en un lot les points ATP et l'XP des joueurs récompensés
+
+		Les barèmes sont lus dans les tableaux du tournoi; les points ATP
+		(totaux, course, historique hebdomadaire) passent par un seul appel
+		au gestionnaire, qui ne marque les classements à recalculer qu'une
+		fois. Un joueur peut apparaître plusieurs fois (victoires en poule).
+
+		Args:
+			players: Joueurs récompensés
+			rounds_reached: Tour atteint par chaque joueur (les tours hors ROUND_KEYS ne rapportent rien)
+			atp_points_manager: Gestionnaire des points ATP pour le système glissant
+			week: Semaine courante pour le système glissant
+			winner_bonus_xp: XP supplémentaire du vainqueur (bonus de fin de tournoi)
+			award_xp: Attribue aussi l'XP
+
+		Returns:
+			Points ATP attribués, dans l'ordre des joueurs
+		"""
+		columns = np.array([ROUND_INDEX.get(round_reached, -1) for round_reached in rounds_reached], dtype=np.intp)
+		known = columns >= 0
+		atp_table, xp_table = self.award_tables
+		points = np.where(known, atp_table[columns], 0)
+
+		if atp_points_manager is not None and points.any():
+			atp_points_manager.add_tournament_points_batch(players, points, week)
+
+		if award_xp:
+			xp_points = np.where(known, xp_table[columns], 0)
+			xp_points += np.where(columns == ROUND_INDEX["winner"], winner_bonus_xp, 0)
+			gain_experience_batch(players, xp_points)
 
 		return points
 
+	@property
+	def award_tables(self) -> Tuple[np.ndarray, np.ndarray]:
+		"""
+		Barèmes du tournoi indexés par tour (colonnes ROUND_KEYS)
+
+		Returns:
+			(points ATP, points XP), compilés au premier accès ou repris de la description du calendrier
+		"""
+		if self._award_tables is None:
+			self._award_tables = self.compile_award_tables()
+		return self._award_tables
+
+	def compile_award_tables(self) -> Tuple[np.ndarray, np.ndarray]:
+		"""
+		Résout les configurations de points pour chaque tour
+
+		Returns:
+			(points ATP, points XP), tableaux int32 en lecture seule
+		"""
+		atp_points = np.zeros(len(ROUND_KEYS), dtype=np.int32)
+		xp_points = np.zeros(len(ROUND_KEYS), dtype=np.int32)
+		for column, round_key in enumerate(ROUND_KEYS):
+			config_key = self._get_round_key_for_tournament(round_key)
+			atp_points[column] = self.atp_points_config.get(config_key, 0)
+			xp_points[column] = self.xp_points_config.get(config_key, 0)
+		atp_points.flags.writeable = False
+		xp_points.flags.writeable = False
+		return atp_points, xp_points
+
 	def _get_round_key_for_tournament(self, round_reached: str) -> str:
 		"""
 		Détermine la clé de configuration ATP en fonction du tournoi et du tour
@@ -301,9 +395,10 @@ class Tournament(ABC):
 		Returns:
 			Points XP calculés
 		"""
-		# Détermine le nombre de tours pour les tournois avec configurations multiples
-		round_key = self._get_round_key_for_tournament(round_reached)
-		return self.xp_points_config.get(round_key, 0)
+		column = ROUND_INDEX.get(round_reached)
+		if column is None:
+			return self.xp_points_config.get(self._get_round_key_for_tournament(round_reached), 0)
+		return int(self.award_tables[1][column])
 
 	def assign_xp_points(self, player: 'Player', round_reached: str) -> int:
 		"""
@@ -377,6 +472,32 @@ class Tournament(ABC):
 			sets_lost=sets_lost
 		)
 
+	def _display_matchup(self, player1: 'Player', player2: 'Player', icon: str = "⚔️ ") -> None:
+		"""Affiche l'affiche d'un match, complétée par les observateurs si le joueur principal joue"""
+		print(f"{icon} {player1.full_name} vs {player2.full_name}")
+		if getattr(player1, 'is_main_player', False) or getattr(player2, 'is_main_player', False):
+			for observer in self.match_observers:
+				description = observer.describe_matchup(player1, player2)
+				if description:
+					print(description)
+
+	def _notify_match(self, result: MatchResult, round_name: str, week: Optional[int]) -> None:
+		"""Transmet un match aux observateurs"""
+		for observer in self.match_observers:
+			observer.on_match(self, result, round_name, week)
+
+	def _notify_round_completed(self, round_name: str, first_match_index: int, week: Optional[int]) -> None:
+		"""Transmet aux observateurs les matchs d'un tour (depuis first_match_index)"""
+		if self.match_observers:
+			results = self.match_results[first_match_index:]
+			for observer in self.match_observers:
+				observer.on_round_completed(self, round_name, results, week)
+
+	def _notify_tournament_completed(self, result: TournamentResult, week: Optional[int]) -> None:
+		"""Transmet le résultat final aux observateurs"""
+		for observer in self.match_observers:
+			observer.on_tournament_completed(self, result, week)
+
 	@property
 	def has_main_player(self) -> bool:
 		"""Vérifie si le joueur principal participe à ce tournoi"""
@@ -403,3 +524,76 @@ class Tournament(ABC):
 	def __repr__(self) -> str:
 		return f"Tournament(name='{self.name}', category={self.category}, players={len(self.participants)})"
 
+
+
+@dataclass(frozen=True)
+class TournamentSpec:
+	"""
+	Description immuable d'un tournoi du calendrier
+
+	Partagée par toutes les parties d'un même processus; chaque partie joue
+	ses propres instances (runs) créées par create_run, dont l'état
+	(participants, résultats, éliminations) ne concerne qu'elle.
+	"""
+	tournament_id: int
+	week: int
+	name: str
+	location: str
+	surface: str
+	category: TournamentCategory
+	num_players: int
+	sets_to_win: int
+	run_class: type
+	format_attributes: Mapping[str, Any]  # Attributs propres au format (nombre de tours, configuration...)
+	atp_points_config: Mapping[str, int]
+	xp_points_config: Mapping[str, int]
+	award_tables: Tuple[np.ndarray, np.ndarray] = field(compare=False)  # Barèmes (ATP, XP) par tour, en lecture seule
+
+	@classmethod
+	def from_tournament(cls, tournament: Tournament, tournament_id: int, week: int) -> 'TournamentSpec':
+		"""
+		Extrait la description d'un tournoi déclaré
+
+		Args:
+			tournament: Tournoi modèle (calendrier déclaratif)
+			tournament_id: Identifiant dans le calendrier compilé
+			week: Semaine du tournoi
+
+		Returns:
+			Description immuable
+		"""
+		# Attributs ajoutés par la sous-classe au-delà de Tournament.__init__
+		probe = object.__new__(type(tournament))
+		Tournament.__init__(probe, tournament.name, tournament.location, tournament.surface,
+							tournament.category, tournament.num_players, tournament.sets_to_win)
+		format_attributes = {name: value for name, value in vars(tournament).items() if name not in vars(probe)}
+
+		return cls(
+			tournament_id=tournament_id,
+			week=week,
+			name=tournament.name,
+			location=tournament.location,
+			surface=tournament.surface,
+			category=tournament.category,
+			num_players=tournament.num_players,
+			sets_to_win=tournament.sets_to_win,
+			run_class=type(tournament),
+			format_attributes=MappingProxyType(format_attributes),
+			atp_points_config=MappingProxyType(dict(tournament.atp_points_config)),
+			xp_points_config=MappingProxyType(dict(tournament.xp_points_config)),
+			award_tables=tournament.compile_award_tables()
+		)
+
+	def create_run(self) -> Tournament:
+		"""Crée une instance jouable du tournoi, propre à une partie"""
+		run = object.__new__(self.run_class)
+		Tournament.__init__(run, self.name, self.location, self.surface,
+							self.category, self.num_players, self.sets_to_win)
+		# Copie profonde: les valeurs mutables (config...) ne doivent pas être partagées entre parties
+		for name, value in self.format_attributes.items():
+			setattr(run, name, deepcopy(value))
+		run.atp_points_config = self.atp_points_config
+		run.xp_points_config = self.xp_points_config
+		run._award_tables = self.award_tables
+		run.spec = self
+		return run
@@ -1,18 +1,20 @@
 """
 Gestionnaire des points ATP avec système de points glissants.
 """
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+import numpy as np
 
 
 class ATPPointsManager:
 	"""Gestionnaire des points ATP - délègue au RankingManager pour éviter la duplication."""
 
-	def __init__(self, players: Dict[str, 'Player'], ranking_manager: 'RankingManager'):
+	def __init__(self, players: Dict[int, 'Player'], ranking_manager: 'RankingManager'):
 		"""
 		Initialise le gestionnaire avec les joueurs.
 
 		Args:
-			players: Dictionnaire des joueurs
+			players: Dictionnaire des joueurs par identifiant
 			ranking_manager: Gestionnaire des classements (requis)
 		"""
 		self.players = players
@@ -31,8 +33,8 @@ class ATPPointsManager:
 		self.ranking_manager.add_player(player)
 		
 		# S'assurer que le joueur est aussi dans le dictionnaire local
-		if player.full_name not in self.players:
-			self.players[player.full_name] = player
+		if player.player_id not in self.players:
+			self.players[player.player_id] = player
 
 	def add_tournament_points(self, player: 'Player', week: int, points: int):
 		"""
@@ -46,20 +48,50 @@ class ATPPointsManager:
 		if week < 1 or week > 52:
 			raise ValueError("La semaine doit être entre 1 et 52.")
 
-		# S'assurer que le joueur existe
-		if player.full_name not in self.players:
+		# S'assurer que le joueur existe (le ranking manager fait référence, indexé par identifiant)
+		if player.player_id not in self.ranking_manager.players:
 			self.add_player(player)
 
 		# Met à jour les points ATP totaux du joueur
 		player.career.atp_points += points
 		player.career.atp_race_points += points
+		player.career.mark_dirty()
 		
 		# Délègue la gestion de l'historique au ranking manager
-		self.ranking_manager.add_atp_points(player.full_name, points, week)
+		self.ranking_manager.add_atp_points(player.player_id, points, week)
 		
 		# Marque les classements comme nécessitant une mise à jour
 		self.ranking_manager.mark_rankings_for_update()
 
+	def add_tournament_points_batch(self, players: List['Player'], points: np.ndarray, week: int):
+		"""
+		Ajoute en un lot les points ATP d'un tournoi (totaux, course et historique)
+
+		Les classements ne sont marqués à recalculer qu'une seule fois.
+
+		Args:
+			players: Joueurs récompensés (un joueur peut apparaître plusieurs fois)
+			points: Points de chaque entrée
+			week: Semaine de l'année (1-52)
+		"""
+		if week < 1 or week > 52:
+			raise ValueError("La semaine doit être entre 1 et 52.")
+
+		weekly_points: Dict[int, int] = {}
+		for player, player_points in zip(players, np.asarray(points).tolist()):
+			if player_points <= 0:
+				continue
+			if player.player_id not in self.ranking_manager.players:
+				self.add_player(player)
+			player.career.atp_points += player_points
+			player.career.atp_race_points += player_points
+			player.career.mark_dirty()
+			weekly_points[player.player_id] = weekly_points.get(player.player_id, 0) + player_points
+
+		if weekly_points:
+			self.ranking_manager.add_atp_points_batch(weekly_points, week)
+			self.ranking_manager.mark_rankings_for_update()
+
 	def remove_weekly_points(self, player: 'Player', week: int):
 		"""
 		Retire les points ATP de la même semaine l'année précédente (système glissant sur 52 semaines).
@@ -72,10 +104,11 @@ class ATPPointsManager:
 			raise ValueError("La semaine doit être entre 1 et 52.")
 
 		# Délègue au ranking manager pour obtenir les points à retirer
-		points_to_remove = self.ranking_manager.get_points_to_defend(player.full_name, week)
+		points_to_remove = self.ranking_manager.get_points_to_defend(player.player_id, week)
 
 		if points_to_remove > 0:
 			player.career.atp_points -= points_to_remove
+			player.career.mark_dirty()
 			# Le ranking manager gère déjà la remise à zéro via advance_week()
 			
 			# Marque les classements comme nécessitant une mise à jour
@@ -98,9 +131,9 @@ class ATPPointsManager:
 			
 			# Délègue au ranking manager
 			week_col = f"week_{week}"
-			if (player.full_name in self.ranking_manager.atp_points_history.index and 
+			if (player.player_id in self.ranking_manager.atp_points_history.index and 
 				week_col in self.ranking_manager.atp_points_history.columns):
-				return int(self.ranking_manager.atp_points_history.loc[player.full_name, week_col])
+				return int(self.ranking_manager.atp_points_history.loc[player.player_id, week_col])
 			return 0
 
 		return player.career.atp_points
@@ -120,6 +153,4 @@ class ATPPointsManager:
 			results: Dictionnaire {joueur: points_gagnés}
 			week: Semaine du tournoi
 		"""
-		for player, points in results.items():
-			if points > 0:
-				self.add_tournament_points(player, week, points)
+		self.add_tournament_points_batch(list(results), np.fromiter(results.values(), dtype=np.int64), week)
@@ -0,0 +1,255 @@
+"""
+Statistiques de carrière - compteurs en colonnes indexées par identifiant de joueur
+"""
+from array import array
+from typing import Dict, List, Optional, Tuple, Any
+
+import numpy as np
+
+from ..entities.tournament import MatchObserver, MatchResult, Tournament, TournamentResult
+from ..utils.constants import TOURNAMENT_SURFACES
+from ..utils.serialization import encode_array, decode_array
+
+# Compteurs tenus pour la carrière et pour la saison en cours (une ligne chacun)
+CAREER_COUNTERS = ("matches", "wins", "titles", "finals")
+_COUNTER_INDEX = {name: row for row, name in enumerate(CAREER_COUNTERS)}
+_MATCHES, _WINS, _TITLES, _FINALS = range(len(CAREER_COUNTERS))
+
+SURFACES = tuple(TOURNAMENT_SURFACES.values())
+_SURFACE_INDEX = {surface: row for row, surface in enumerate(SURFACES)}
+
+
+class CareerStatistics(MatchObserver):
+    """
+    Compteurs de carrière de tous les joueurs
+
+    Chaque compteur est une ligne d'un tableau numpy dont la colonne est
+    l'identifiant du joueur: les tournois mettent à jour un tour entier en
+    une opération vectorisée, et un classement (« plus de titres cette
+    saison ») se lit directement dans la ligne concernée, sans parcourir
+    l'historique des matchs.
+
+    Les identifiants des joueurs dont un compteur change sont journalisés:
+    une sauvegarde incrémentale n'écrit que leurs colonnes, sans comparer
+    l'ensemble des compteurs.
+    """
+
+    # Entrées gardées dans le journal des joueurs modifiés (une position plus ancienne impose une sauvegarde complète)
+    DELTA_LOG_LIMIT = 100_000
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Args:
+            capacity: Nombre initial de colonnes (agrandi au besoin)
+        """
+        self._career = np.zeros((len(CAREER_COUNTERS), capacity), dtype=np.int32)
+        self._season = np.zeros((len(CAREER_COUNTERS), capacity), dtype=np.int32)
+        self._surface_wins = np.zeros((len(SURFACES), capacity), dtype=np.int32)
+        self._surface_losses = np.zeros((len(SURFACES), capacity), dtype=np.int32)
+        self._best_rank = np.zeros(capacity, dtype=np.int32)  # 0: jamais classé
+        self._touched_log = array("i")  # Identifiants des joueurs modifiés, dans l'ordre
+        self._touched_count = 0  # Entrées journalisées depuis la création (ou le chargement)
+
+    @property
+    def capacity(self) -> int:
+        return self._best_rank.shape[0]
+
+    # ------------------------------------------------------------------
+    # Mise à jour
+    # ------------------------------------------------------------------
+    def on_round_completed(self, tournament: Tournament, round_name: str,
+                           results: List[MatchResult], week: Optional[int]) -> None:
+        """Comptabilise tous les matchs d'un tour (observateur des tournois)"""
+        if not results:
+            return
+        winners = np.fromiter((result.winner.player_id for result in results), dtype=np.int64, count=len(results))
+        losers = np.fromiter((result.loser.player_id for result in results), dtype=np.int64, count=len(results))
+        self._ensure_capacity(max(winners.max(), losers.max()))
+
+        # np.add.at: un joueur peut jouer plusieurs matchs d'un même tour (poules)
+        for counters in (self._career, self._season):
+            np.add.at(counters[_MATCHES], winners, 1)
+            np.add.at(counters[_MATCHES], losers, 1)
+            np.add.at(counters[_WINS], winners, 1)
+
+        surface = _SURFACE_INDEX.get(tournament.surface)
+        if surface is not None:
+            np.add.at(self._surface_wins[surface], winners, 1)
+            np.add.at(self._surface_losses[surface], losers, 1)
+        self._touch(winners)
+        self._touch(losers)
+
+    def on_tournament_completed(self, tournament: Tournament, result: TournamentResult, week: Optional[int]) -> None:
+        """Comptabilise le titre et les finales (observateur des tournois)"""
+        winner_id, finalist_id = result.winner.player_id, result.finalist.player_id
+        self._ensure_capacity(max(winner_id, finalist_id))
+        for counters in (self._career, self._season):
+            counters[_TITLES, winner_id] += 1
+            counters[_FINALS, winner_id] += 1
+            counters[_FINALS, finalist_id] += 1
+        self._touch(np.array([winner_id, finalist_id]))
+
+    def update_best_ranks(self, player_ids: np.ndarray, ranks: np.ndarray) -> None:
+        """
+        Met à jour le meilleur classement de chaque joueur
+
+        Args:
+            player_ids: Identifiants des joueurs
+            ranks: Classement actuel de chaque joueur (0 si non classé)
+        """
+        if not len(player_ids):
+            return
+        player_ids = np.asarray(player_ids, dtype=np.int64)
+        ranks = np.asarray(ranks, dtype=np.int32)
+        self._ensure_capacity(player_ids.max())
+        best = self._best_rank[player_ids]
+        improved = (ranks > 0) & ((best == 0) | (ranks < best))
+        self._best_rank[player_ids[improved]] = ranks[improved]
+        self._touch(player_ids[improved])
+
+    def end_season(self) -> None:
+        """Remet à zéro les compteurs de la saison"""
+        self._touch(np.flatnonzero(self._season.any(axis=0)))
+        self._season[:] = 0
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+    def get_player_stats(self, player_id: int) -> Dict[str, Any]:
+        """
+        Statistiques d'un joueur
+
+        Returns:
+            Compteurs de carrière et de saison, bilan par surface et meilleur classement
+        """
+        if player_id >= self.capacity:
+            self._ensure_capacity(player_id)
+        stats = {name: int(self._career[row, player_id]) for row, name in enumerate(CAREER_COUNTERS)}
+        stats["season"] = {name: int(self._season[row, player_id]) for row, name in enumerate(CAREER_COUNTERS)}
+        stats["surfaces"] = {
+            surface: (int(self._surface_wins[row, player_id]), int(self._surface_losses[row, player_id]))
+            for row, surface in enumerate(SURFACES)
+        }
+        best_rank = int(self._best_rank[player_id])
+        stats["best_rank"] = best_rank or None
+        return stats
+
+    def get_leaderboard(self, counter: str = "titles", limit: int = 10, season: bool = False) -> List[Tuple[int, int]]:
+        """
+        Meilleurs joueurs pour un compteur
+
+        Args:
+            counter: Nom du compteur (voir CAREER_COUNTERS)
+            limit: Nombre de joueurs retournés
+            season: Compteurs de la saison en cours plutôt que de la carrière
+
+        Returns:
+            Liste de (identifiant, valeur) par valeur décroissante, sans les valeurs nulles
+        """
+        values = (self._season if season else self._career)[_COUNTER_INDEX[counter]]
+        limit = min(limit, len(values))
+        if limit <= 0:
+            return []
+        # Sélection partielle des k meilleurs, seuls ceux-ci sont triés
+        top = np.argpartition(values, -limit)[-limit:]
+        top = top[np.argsort(-values[top], kind="stable")]
+        return [(int(player_id), int(values[player_id])) for player_id in top if values[player_id] > 0]
+
+    # ------------------------------------------------------------------
+    # Sérialisation
+    # ------------------------------------------------------------------
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit les compteurs en colonnes encodées pour la sauvegarde"""
+        used = self._used_columns()
+        return {
+            "career": {name: encode_array(self._career[row, :used].copy()) for row, name in enumerate(CAREER_COUNTERS)},
+            "season": {name: encode_array(self._season[row, :used].copy()) for row, name in enumerate(CAREER_COUNTERS)},
+            "surface_wins": {surface: encode_array(self._surface_wins[row, :used].copy())
+                             for row, surface in enumerate(SURFACES)},
+            "surface_losses": {surface: encode_array(self._surface_losses[row, :used].copy())
+                               for row, surface in enumerate(SURFACES)},
+            "best_rank": encode_array(self._best_rank[:used].copy())
+        }
+
+    def save_cursor(self) -> int:
+        """Position de sauvegarde (nombre d'entrées du journal des joueurs modifiés)"""
+        return self._touched_count
+
+    def to_delta_dict(self, cursor: int) -> Optional[Dict[str, Any]]:
+        """
+        Compteurs des joueurs modifiés depuis une position de sauvegarde
+
+        Args:
+            cursor: Position retournée par save_cursor
+
+        Returns:
+            Dictionnaire delta (identifiants et colonnes complètes de ces joueurs),
+            None si le journal ne remonte plus jusqu'à la position (sauvegarde complète)
+        """
+        missing = self._touched_count - cursor
+        if missing > len(self._touched_log):
+            return None
+        changed = np.unique(np.frombuffer(self._touched_log, dtype=np.int32)[len(self._touched_log) - missing:])
+        columns = np.vstack([self._career[:, changed], self._season[:, changed], self._surface_wins[:, changed],
+                             self._surface_losses[:, changed], self._best_rank[np.newaxis, changed]])
+        return {
+            "player_ids": encode_array(changed),
+            "columns": encode_array(columns)
+        }
+
+    def apply_delta(self, delta: Dict[str, Any]) -> None:
+        """Remplace les colonnes des joueurs d'un delta produit par to_delta_dict"""
+        player_ids = decode_array(delta["player_ids"]).astype(np.int64)
+        if not len(player_ids):
+            return
+        columns = decode_array(delta["columns"])
+        self._ensure_capacity(player_ids.max())
+        rows = 0
+        for counters in (self._career, self._season, self._surface_wins, self._surface_losses):
+            counters[:, player_ids] = columns[rows:rows + len(counters)]
+            rows += len(counters)
+        self._best_rank[player_ids] = columns[rows]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CareerStatistics':
+        """Recrée les compteurs depuis to_dict"""
+        best_rank = decode_array(data["best_rank"])
+        stats = cls(capacity=max(len(best_rank), 1))
+        stats._best_rank[:len(best_rank)] = best_rank
+        for counters, key, names in ((stats._career, "career", CAREER_COUNTERS),
+                                     (stats._season, "season", CAREER_COUNTERS),
+                                     (stats._surface_wins, "surface_wins", SURFACES),
+                                     (stats._surface_losses, "surface_losses", SURFACES)):
+            for row, name in enumerate(names):
+                if name in data.get(key, {}):
+                    column = decode_array(data[key][name])
+                    counters[row, :len(column)] = column
+        return stats
+
+    # ------------------------------------------------------------------
+    # Interne
+    # ------------------------------------------------------------------
+    def _ensure_capacity(self, player_id: int) -> None:
+        """Agrandit les tableaux pour contenir la colonne player_id"""
+        if player_id < self.capacity:
+            return
+        extra = max(int(player_id) + 1, self.capacity * 2) - self.capacity
+        self._career = np.pad(self._career, ((0, 0), (0, extra)))
+        self._season = np.pad(self._season, ((0, 0), (0, extra)))
+        self._surface_wins = np.pad(self._surface_wins, ((0, 0), (0, extra)))
+        self._surface_losses = np.pad(self._surface_losses, ((0, 0), (0, extra)))
+        self._best_rank = np.pad(self._best_rank, (0, extra))
+
+    def _touch(self, player_ids: np.ndarray) -> None:
+        """Journalise les joueurs dont un compteur vient de changer"""
+        if not len(player_ids):
+            return
+        self._touched_log.frombytes(np.asarray(player_ids, dtype=np.int32).tobytes())
+        self._touched_count += len(player_ids)
+        if len(self._touched_log) > 2 * self.DELTA_LOG_LIMIT:
+            del self._touched_log[:len(self._touched_log) - self.DELTA_LOG_LIMIT]
+
+    def _used_columns(self) -> int:
+        """Nombre de colonnes jusqu'au dernier joueur ayant une statistique"""
+        used = np.flatnonzero(self._career[_MATCHES] | self._best_rank)
+        return int(used[-1]) + 1 if len(used) else 0
@@ -0,0 +1,280 @@
+"""
+Moteur Glicko-2 - mise à jour hebdomadaire vectorisée des classements
+"""
+from typing import Dict, List, Optional, Any, Tuple
+
+import numpy as np
+
+from ..entities.tournament import MatchObserver, MatchResult, Tournament
+from ..utils.constants import GLICKO_CONSTANTS
+from ..utils.serialization import encode_array, decode_array
+
+
+class Glicko2Engine(MatchObserver):
+    """
+    Classement Glicko-2 de tous les joueurs, une période de notation par semaine
+
+    Les matchs de la semaine sont seulement collectés (deux entiers par
+    match); close_rating_period met ensuite à jour classement, écart (RD)
+    et volatilité de tous les joueurs en un passage vectorisé, y compris
+    le calcul itératif de la volatilité, résolu pour tous les joueurs à la
+    fois. Les valeurs sont stockées sur l'échelle Glicko-2 (mu, phi), en
+    colonnes indexées par identifiant de joueur.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Args:
+            capacity: Nombre initial de colonnes (agrandi au besoin)
+        """
+        self._mu = np.zeros(capacity, dtype=np.float64)
+        self._phi = np.full(capacity, self._initial_phi(), dtype=np.float64)
+        self._sigma = np.full(capacity, GLICKO_CONSTANTS["INITIAL_VOLATILITY"], dtype=np.float64)
+        self._known = np.zeros(capacity, dtype=bool)
+        self._period_winners: List[int] = []
+        self._period_losers: List[int] = []
+        # Matchs des dernières périodes closes, rejoués par les sauvegardes incrémentales
+        self._closed_periods: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._closed_count = 0
+        self._revision = 0  # Modifications hors période (set_rating)
+
+    @property
+    def capacity(self) -> int:
+        return self._known.shape[0]
+
+    @staticmethod
+    def _initial_phi() -> float:
+        return GLICKO_CONSTANTS["INITIAL_RD"] / GLICKO_CONSTANTS["SCALE"]
+
+    # ------------------------------------------------------------------
+    # Collecte et période de notation
+    # ------------------------------------------------------------------
+    def on_match(self, tournament: Tournament, result: MatchResult, round_name: str, week: Optional[int]) -> None:
+        """Collecte un match de la période (observateur des tournois)"""
+        self._period_winners.append(result.winner.player_id)
+        self._period_losers.append(result.loser.player_id)
+
+    def record(self, winner_id: int, loser_id: int) -> None:
+        """Ajoute un match à la période en cours"""
+        self._period_winners.append(winner_id)
+        self._period_losers.append(loser_id)
+
+    @property
+    def pending_matches(self) -> int:
+        """Nombre de matchs collectés depuis la dernière période"""
+        return len(self._period_winners)
+
+    def close_rating_period(self) -> bool:
+        """
+        Met à jour tous les joueurs avec les matchs de la période
+
+        Une semaine sans aucun match sur le circuit n'est pas une période de
+        notation (l'incertitude des joueurs n'augmente pas).
+
+        Returns:
+            True si une période a été calculée
+        """
+        if not self._period_winners:
+            return False
+        winners = np.array(self._period_winners, dtype=np.int64)
+        losers = np.array(self._period_losers, dtype=np.int64)
+        self._period_winners = []
+        self._period_losers = []
+        self._closed_periods.append((winners.astype(np.int32), losers.astype(np.int32)))
+        del self._closed_periods[:-GLICKO_CONSTANTS["DELTA_PERIODS"]]
+        self._closed_count += 1
+        self._ensure_capacity(max(winners.max(), losers.max()))
+        self._known[winners] = True
+        self._known[losers] = True
+
+        # Chaque match vu de chacun des deux joueurs
+        players = np.concatenate([winners, losers])
+        opponents = np.concatenate([losers, winners])
+        scores = np.concatenate([np.ones(len(winners)), np.zeros(len(losers))])
+
+        mu, phi, sigma = self._mu, self._phi, self._sigma
+        g = 1.0 / np.sqrt(1.0 + 3.0 * phi[opponents] ** 2 / np.pi ** 2)
+        expected = 1.0 / (1.0 + np.exp(-g * (mu[players] - mu[opponents])))
+        inverse_variance = np.bincount(players, weights=g * g * expected * (1.0 - expected), minlength=self.capacity)
+        improvement = np.bincount(players, weights=g * (scores - expected), minlength=self.capacity)
+
+        # Joueurs ayant joué: toutes les valeurs sont calculées depuis celles d'avant la période
+        active = np.flatnonzero(inverse_variance > 0)
+        variance = 1.0 / inverse_variance[active]
+        delta = variance * improvement[active]
+        new_sigma = self._solve_volatility(phi[active], sigma[active], variance, delta)
+        phi_star = np.sqrt(phi[active] ** 2 + new_sigma ** 2)
+        new_phi = 1.0 / np.sqrt(1.0 / phi_star ** 2 + 1.0 / variance)
+        new_mu = mu[active] + new_phi ** 2 * improvement[active]
+
+        # Joueurs classés inactifs: seule l'incertitude augmente (plafonnée à l'écart initial)
+        idle = self._known.copy()
+        idle[active] = False
+        phi[idle] = np.minimum(np.sqrt(phi[idle] ** 2 + sigma[idle] ** 2), self._initial_phi())
+
+        mu[active] = new_mu
+        phi[active] = new_phi
+        sigma[active] = new_sigma
+        return True
+
+    @staticmethod
+    def _solve_volatility(phi: np.ndarray, sigma: np.ndarray, variance: np.ndarray, delta: np.ndarray) -> np.ndarray:
+        """
+        Nouvelle volatilité de chaque joueur (algorithme d'Illinois, vectorisé)
+
+        Les itérations s'arrêtent quand tous les joueurs ont convergé; les
+        joueurs déjà convergés ne sont plus modifiés.
+        """
+        tau = GLICKO_CONSTANTS["TAU"]
+        tolerance = GLICKO_CONSTANTS["CONVERGENCE_TOLERANCE"]
+        max_iterations = GLICKO_CONSTANTS["MAX_ITERATIONS"]
+        a = np.log(sigma ** 2)
+        phi2 = phi ** 2
+        delta2 = delta ** 2
+
+        def f(x: np.ndarray) -> np.ndarray:
+            ex = np.exp(x)
+            return ex * (delta2 - phi2 - variance - ex) / (2.0 * (phi2 + variance + ex) ** 2) - (x - a) / tau ** 2
+
+        # Intervalle initial [A, B] encadrant la racine
+        upper = np.copy(a)
+        large = delta2 > phi2 + variance
+        lower = np.where(large, np.log(np.maximum(delta2 - phi2 - variance, 1e-300)), a - tau)
+        steps = np.ones(len(a))
+        for _ in range(max_iterations):
+            searching = ~large & (f(a - steps * tau) < 0)
+            if not searching.any():
+                break
+            steps[searching] += 1
+        lower = np.where(large, lower, a - steps * tau)
+
+        f_upper, f_lower = f(upper), f(lower)
+        for _ in range(max_iterations):
+            running = np.abs(lower - upper) > tolerance
+            if not running.any():
+                break
+            candidate = upper + (upper - lower) * f_upper / (f_lower - f_upper)
+            f_candidate = f(candidate)
+            crossed = running & (f_candidate * f_lower <= 0)
+            halved = running & ~crossed
+            upper = np.where(crossed, lower, upper)
+            f_upper = np.where(crossed, f_lower, np.where(halved, f_upper / 2.0, f_upper))
+            lower = np.where(running, candidate, lower)
+            f_lower = np.where(running, f_candidate, f_lower)
+        return np.exp(upper / 2.0)
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+    def set_rating(self, player_id: int, rating: float, rd: float,
+                   volatility: float = GLICKO_CONSTANTS["INITIAL_VOLATILITY"]) -> None:
+        """Définit le classement d'un joueur (échelle Glicko)"""
+        self._ensure_capacity(player_id)
+        self._mu[player_id] = (rating - GLICKO_CONSTANTS["INITIAL_RATING"]) / GLICKO_CONSTANTS["SCALE"]
+        self._phi[player_id] = rd / GLICKO_CONSTANTS["SCALE"]
+        self._sigma[player_id] = volatility
+        self._known[player_id] = True
+        self._revision += 1
+
+    def get_rating(self, player_id: int) -> Dict[str, float]:
+        """
+        Classement d'un joueur (échelle Glicko)
+
+        Returns:
+            Dictionnaire {rating, rd, volatility} (valeurs initiales si le joueur n'a jamais joué)
+        """
+        if player_id >= self.capacity:
+            # Lecture seule: un identifiant inconnu n'agrandit pas les tableaux
+            return {
+                "rating": float(GLICKO_CONSTANTS["INITIAL_RATING"]),
+                "rd": GLICKO_CONSTANTS["SCALE"] * self._initial_phi(),
+                "volatility": float(GLICKO_CONSTANTS["INITIAL_VOLATILITY"])
+            }
+        return {
+            "rating": GLICKO_CONSTANTS["INITIAL_RATING"] + GLICKO_CONSTANTS["SCALE"] * float(self._mu[player_id]),
+            "rd": GLICKO_CONSTANTS["SCALE"] * float(self._phi[player_id]),
+            "volatility": float(self._sigma[player_id])
+        }
+
+    def get_ratings(self, player_ids: np.ndarray) -> np.ndarray:
+        """Classements (échelle Glicko) d'un lot de joueurs, dans l'ordre des identifiants (lecture seule)"""
+        player_ids = np.asarray(player_ids, dtype=np.int64)
+        known = player_ids < self.capacity
+        mu = np.zeros(len(player_ids), dtype=np.float64)  # Joueurs hors des tableaux: note initiale
+        mu[known] = self._mu[player_ids[known]]
+        return GLICKO_CONSTANTS["INITIAL_RATING"] + GLICKO_CONSTANTS["SCALE"] * mu
+
+    # ------------------------------------------------------------------
+    # Sérialisation
+    # ------------------------------------------------------------------
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit l'état en colonnes encodées pour la sauvegarde"""
+        player_ids = np.flatnonzero(self._known).astype(np.int32)
+        return {
+            "player_ids": encode_array(player_ids),
+            "mu": encode_array(self._mu[player_ids]),
+            "phi": encode_array(self._phi[player_ids]),
+            "sigma": encode_array(self._sigma[player_ids]),
+            "period_winners": encode_array(np.array(self._period_winners, dtype=np.int32)),
+            "period_losers": encode_array(np.array(self._period_losers, dtype=np.int32))
+        }
+
+    def save_cursor(self) -> Tuple[int, int]:
+        """Position de sauvegarde (modifications hors période, périodes closes)"""
+        return self._revision, self._closed_count
+
+    def to_delta_dict(self, cursor: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        """
+        Matchs des périodes closes depuis une position de sauvegarde
+
+        Les périodes sont rejouées au chargement (calcul déterministe), ce qui
+        évite de réécrire les notes de tous les joueurs chaque semaine.
+
+        Args:
+            cursor: Position retournée par save_cursor
+
+        Returns:
+            Dictionnaire delta, ou None si les périodes ne sont plus disponibles
+        """
+        revision, closed_count = cursor
+        missing = self._closed_count - closed_count
+        if revision != self._revision or missing > len(self._closed_periods):
+            return None
+        periods = self._closed_periods[len(self._closed_periods) - missing:]
+        return {
+            "periods": [[encode_array(winners), encode_array(losers)] for winners, losers in periods],
+            "period_winners": encode_array(np.array(self._period_winners, dtype=np.int32)),
+            "period_losers": encode_array(np.array(self._period_losers, dtype=np.int32))
+        }
+
+    def apply_delta(self, delta: Dict[str, Any]) -> None:
+        """Rejoue les périodes d'un delta produit par to_delta_dict"""
+        for winners, losers in delta["periods"]:
+            self._period_winners = decode_array(winners).tolist()
+            self._period_losers = decode_array(losers).tolist()
+            self.close_rating_period()
+        self._period_winners = decode_array(delta["period_winners"]).tolist()
+        self._period_losers = decode_array(delta["period_losers"]).tolist()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Glicko2Engine':
+        """Recrée l'état depuis to_dict"""
+        player_ids = decode_array(data["player_ids"]).astype(np.int64)
+        engine = cls(capacity=max(int(player_ids.max()) + 1 if len(player_ids) else 0, 1024))
+        engine._known[player_ids] = True
+        engine._mu[player_ids] = decode_array(data["mu"])
+        engine._phi[player_ids] = decode_array(data["phi"])
+        engine._sigma[player_ids] = decode_array(data["sigma"])
+        engine._period_winners = decode_array(data["period_winners"]).tolist()
+        engine._period_losers = decode_array(data["period_losers"]).tolist()
+        return engine
+
+    def _ensure_capacity(self, player_id: int) -> None:
+        """Agrandit les tableaux pour contenir la colonne player_id (nouveaux joueurs aux valeurs initiales)"""
+        if player_id < self.capacity:
+            return
+        extra = max(int(player_id) + 1, self.capacity * 2) - self.capacity
+        self._mu = np.pad(self._mu, (0, extra))
+        self._phi = np.pad(self._phi, (0, extra), constant_values=self._initial_phi())
+        self._sigma = np.pad(self._sigma, (0, extra), constant_values=GLICKO_CONSTANTS["INITIAL_VOLATILITY"])
+        self._known = np.pad(self._known, (0, extra))
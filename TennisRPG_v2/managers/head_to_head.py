@@ -0,0 +1,127 @@
+"""
+Face-à-face entre joueurs - compteurs de victoires par paire d'identifiants
+"""
+from array import array
+from typing import Dict, List, Optional, Tuple, Any
+
+import numpy as np
+
+from ..entities.player import Player
+from ..entities.tournament import MatchObserver, MatchResult, Tournament
+from ..utils.serialization import encode_array, decode_array
+
+
+class HeadToHeadRecords(MatchObserver):
+    """
+    Bilan des confrontations de chaque paire de joueurs
+
+    Stockage creux: seules les paires qui se sont rencontrées ont une entrée,
+    indexée par (plus petit identifiant, plus grand identifiant) et contenant
+    les victoires de chacun. Mise à jour et lecture en O(1).
+
+    Les dernières victoires sont aussi journalisées (deux entiers par match)
+    pour que les sauvegardes incrémentales n'écrivent que les nouveaux matchs.
+    """
+
+    # Victoires conservées pour les sauvegardes incrémentales (au-delà: sauvegarde complète)
+    DELTA_LOG_LIMIT = 100_000
+
+    def __init__(self):
+        self._records: Dict[Tuple[int, int], List[int]] = {}
+        self._log_winners = array("i")
+        self._log_losers = array("i")
+        self._win_count = 0  # Victoires enregistrées depuis la création (ou le chargement)
+
+    def on_match(self, tournament: Tournament, result: MatchResult, round_name: str, week: Optional[int]) -> None:
+        """Met à jour le bilan après un match (observateur des tournois)"""
+        self.record_win(result.winner.player_id, result.loser.player_id)
+
+    def record_win(self, winner_id: int, loser_id: int) -> None:
+        """Ajoute une victoire de winner_id sur loser_id"""
+        if winner_id < loser_id:
+            key, slot = (winner_id, loser_id), 0
+        else:
+            key, slot = (loser_id, winner_id), 1
+        record = self._records.get(key)
+        if record is None:
+            record = self._records[key] = [0, 0]
+        record[slot] += 1
+
+        self._log_winners.append(winner_id)
+        self._log_losers.append(loser_id)
+        self._win_count += 1
+        if len(self._log_winners) > 2 * self.DELTA_LOG_LIMIT:
+            del self._log_winners[:self.DELTA_LOG_LIMIT]
+            del self._log_losers[:self.DELTA_LOG_LIMIT]
+
+    def get_record(self, player_id: int, opponent_id: int) -> Tuple[int, int]:
+        """
+        Bilan d'un joueur contre un adversaire
+
+        Returns:
+            (victoires du joueur, victoires de l'adversaire)
+        """
+        if player_id < opponent_id:
+            wins, losses = self._records.get((player_id, opponent_id), (0, 0))
+        else:
+            losses, wins = self._records.get((opponent_id, player_id), (0, 0))
+        return wins, losses
+
+    def describe_matchup(self, player1: Player, player2: Player) -> Optional[str]:
+        """Ligne d'affichage du face-à-face avant un match"""
+        wins, losses = self.get_record(player1.player_id, player2.player_id)
+        if wins + losses == 0:
+            return "   🆕 Première confrontation"
+        return f"   📊 Face-à-face: {player1.full_name} {wins} - {losses} {player2.full_name}"
+
+    def __len__(self) -> int:
+        """Nombre de paires qui se sont rencontrées"""
+        return len(self._records)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit les bilans en colonnes encodées pour la sauvegarde"""
+        pairs = np.array(list(self._records.keys()), dtype=np.int32).reshape(-1, 2)
+        wins = np.array(list(self._records.values()), dtype=np.int32).reshape(-1, 2)
+        return {
+            "low_ids": encode_array(np.ascontiguousarray(pairs[:, 0])),
+            "high_ids": encode_array(np.ascontiguousarray(pairs[:, 1])),
+            "low_wins": encode_array(np.ascontiguousarray(wins[:, 0])),
+            "high_wins": encode_array(np.ascontiguousarray(wins[:, 1]))
+        }
+
+    def save_cursor(self) -> int:
+        """Position de sauvegarde (nombre de victoires enregistrées)"""
+        return self._win_count
+
+    def to_delta_dict(self, cursor: int) -> Optional[Dict[str, Any]]:
+        """
+        Victoires enregistrées depuis une position de sauvegarde
+
+        Args:
+            cursor: Position retournée par save_cursor
+
+        Returns:
+            Dictionnaire delta, ou None si ces victoires ne sont plus journalisées
+        """
+        missing = self._win_count - cursor
+        if missing > len(self._log_winners):
+            return None
+        start = len(self._log_winners) - missing
+        return {
+            "winners": encode_array(np.array(self._log_winners[start:], dtype=np.int32)),
+            "losers": encode_array(np.array(self._log_losers[start:], dtype=np.int32))
+        }
+
+    def apply_delta(self, delta: Dict[str, Any]) -> None:
+        """Rejoue les victoires d'un delta produit par to_delta_dict"""
+        for winner_id, loser_id in zip(decode_array(delta["winners"]).tolist(), decode_array(delta["losers"]).tolist()):
+            self.record_win(winner_id, loser_id)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'HeadToHeadRecords':
+        """Recrée les bilans depuis to_dict"""
+        records = cls()
+        columns = zip(*(decode_array(data[name]).tolist() for name in ("low_ids", "high_ids", "low_wins", "high_wins")))
+        records._records = {(low_id, high_id): [low_wins, high_wins]
+                            for low_id, high_id, low_wins, high_wins in columns}
+        return records
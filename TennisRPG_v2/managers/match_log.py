@@ -0,0 +1,437 @@
+"""
+Journal des matchs - stockage en colonnes par blocs, archivé par saison
+"""
+import os
+import uuid
+from typing import Dict, List, Optional, Tuple, Any
+
+import numpy as np
+
+from ..entities.tournament import MatchObserver, MatchResult, Tournament
+from ..utils.constants import TIME_CONSTANTS
+from ..utils.serialization import encode_array, decode_array
+
+# Une ligne par match (les chaînes sont codées par les tables du journal)
+MATCH_DTYPE = np.dtype([
+    ("year", np.int16),
+    ("week", np.int16),
+    ("tournament", np.int32),
+    ("round", np.int8),
+    ("winner", np.int32),
+    ("loser", np.int32),
+    ("sets_won", np.int8),
+    ("sets_lost", np.int8),
+])
+
+# Index d'une saison archivée: (identifiants triés, offsets, lignes)
+SeasonIndex = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+class MatchLog(MatchObserver):
+    """
+    Journal persistant de tous les matchs joués
+
+    Les matchs de la saison courante sont ajoutés dans des blocs numpy
+    préalloués (aucune réallocation pendant la simulation) avec, pour chaque
+    joueur, la liste de ses lignes. En fin de saison, le bloc est archivé
+    (fichier .npy par saison si un répertoire est fourni, en mémoire sinon)
+    avec un index par joueur trié: retrouver les matchs d'un joueur coûte
+    O(nombre de ses matchs) quelle que soit la taille de l'historique.
+
+    Chaque fichier de saison porte une étiquette unique: deux sauvegardes
+    divergentes de la même partie (rechargement d'une sauvegarde plus
+    ancienne) n'écrasent jamais la saison archivée l'une de l'autre.
+    """
+
+    DEFAULT_CHUNK_SIZE = 4096
+
+    def __init__(self, directory: Optional[str] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 current_year: Optional[int] = None):
+        """
+        Initialise le journal
+
+        Args:
+            directory: Répertoire des saisons archivées (None: tout reste en mémoire)
+            chunk_size: Nombre de matchs par bloc préalloué
+            current_year: Année de la saison en cours
+        """
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.current_year = current_year or TIME_CONSTANTS["GAME_START_YEAR"]
+
+        # Saison courante
+        self._chunks: List[np.ndarray] = []
+        self._chunk_fill = chunk_size  # Force l'allocation du premier bloc
+        self._season_rows = 0
+        self._player_rows: Dict[int, List[int]] = {}
+
+        # Saisons archivées: None tant qu'un fichier n'a pas été ouvert
+        self._seasons: Dict[int, Optional[np.ndarray]] = {}
+        self._season_indexes: Dict[int, SeasonIndex] = {}
+        # Étiquette du fichier de chaque saison archivée sur disque ("" = ancien nom sans étiquette)
+        self._season_tags: Dict[int, str] = {}
+
+        # Tables de codage
+        self._tournament_names: List[str] = []
+        self._tournament_codes: Dict[str, int] = {}
+        self._round_names: List[str] = []
+        self._round_codes: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # Enregistrement
+    # ------------------------------------------------------------------
+    def on_match(self, tournament: Tournament, result: MatchResult, round_name: str, week: Optional[int]) -> None:
+        """Ajoute un match au journal (observateur des tournois)"""
+        self.record(tournament.name, round_name, week or 0,
+                    result.winner.player_id, result.loser.player_id, result.sets_won, result.sets_lost)
+
+    def record(self, tournament_name: str, round_name: str, week: int, winner_id: int, loser_id: int,
+               sets_won: int, sets_lost: int) -> int:
+        """
+        Ajoute un match à la saison courante
+
+        Returns:
+            Ligne du match dans la saison
+        """
+        if self._chunk_fill == self.chunk_size:
+            self._chunks.append(np.empty(self.chunk_size, dtype=MATCH_DTYPE))
+            self._chunk_fill = 0
+
+        self._chunks[-1][self._chunk_fill] = (
+            self.current_year, week, self._encode(tournament_name, self._tournament_names, self._tournament_codes),
+            self._encode(round_name, self._round_names, self._round_codes),
+            winner_id, loser_id, sets_won, sets_lost
+        )
+        row = self._season_rows
+        self._chunk_fill += 1
+        self._season_rows += 1
+
+        self._player_rows.setdefault(winner_id, []).append(row)
+        self._player_rows.setdefault(loser_id, []).append(row)
+        return row
+
+    def end_season(self, year: Optional[int] = None) -> None:
+        """
+        Archive la saison courante et démarre la suivante
+
+        Args:
+            year: Année terminée (défaut: année courante du journal)
+        """
+        year = self.current_year if year is None else year
+        season = self.get_current_season()
+        if len(season):
+            index = self._build_index(season)
+            if self.directory:
+                os.makedirs(self.directory, exist_ok=True)
+                self._season_tags[year] = uuid.uuid4().hex[:12]
+                np.save(self._season_path(year), season)
+                np.savez(self._index_path(year), ids=index[0], offsets=index[1], rows=index[2])
+                self._seasons[year] = None
+            else:
+                self._seasons[year] = season
+            self._season_indexes[year] = index
+
+        self._start_season(year + 1)
+
+    def _start_season(self, year: int) -> None:
+        """Vide la saison courante et passe à l'année donnée"""
+        self._chunks = []
+        self._chunk_fill = self.chunk_size
+        self._season_rows = 0
+        self._player_rows = {}
+        self.current_year = year
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return self._season_rows + sum(len(self._get_season(year)) for year in self._seasons)
+
+    @property
+    def seasons(self) -> List[int]:
+        """Années archivées"""
+        return sorted(self._seasons)
+
+    def get_current_season(self) -> np.ndarray:
+        """Matchs de la saison en cours"""
+        if not self._chunks:
+            return np.empty(0, dtype=MATCH_DTYPE)
+        season = np.concatenate(self._chunks)
+        return season[:self._season_rows]
+
+    def get_season(self, year: int) -> np.ndarray:
+        """Matchs d'une saison (archivée ou en cours)"""
+        if year == self.current_year:
+            return self.get_current_season()
+        if year not in self._seasons:
+            return np.empty(0, dtype=MATCH_DTYPE)
+        return self._get_season(year)
+
+    def get_player_matches(self, player_id: int, year: Optional[int] = None) -> np.ndarray:
+        """
+        Matchs d'un joueur, dans l'ordre chronologique
+
+        Args:
+            player_id: Identifiant du joueur
+            year: Saison (toutes si None)
+
+        Returns:
+            Tableau structuré (MATCH_DTYPE)
+        """
+        years = [year] if year is not None else self.seasons + [self.current_year]
+        parts = []
+        for season_year in years:
+            if season_year == self.current_year:
+                parts.append(self._take_current(self._player_rows.get(player_id, [])))
+            elif season_year in self._seasons:
+                ids, offsets, rows = self._get_season_index(season_year)
+                position = np.searchsorted(ids, player_id)
+                if position < len(ids) and ids[position] == player_id:
+                    parts.append(self._get_season(season_year)[rows[offsets[position]:offsets[position + 1]]])
+        if not parts:
+            return np.empty(0, dtype=MATCH_DTYPE)
+        return np.concatenate(parts)
+
+    def tournament_name(self, code: int) -> str:
+        """Nom du tournoi d'un code"""
+        return self._tournament_names[code]
+
+    def round_name(self, code: int) -> str:
+        """Nom du tour d'un code"""
+        return self._round_names[code]
+
+    def to_records(self, matches: np.ndarray) -> List[Dict[str, Any]]:
+        """Convertit des lignes du journal en dictionnaires lisibles"""
+        return [
+            {
+                "year": int(match["year"]),
+                "week": int(match["week"]),
+                "tournament": self._tournament_names[match["tournament"]],
+                "round": self._round_names[match["round"]],
+                "winner_id": int(match["winner"]),
+                "loser_id": int(match["loser"]),
+                "score": f"{int(match['sets_won'])}-{int(match['sets_lost'])}"
+            }
+            for match in matches
+        ]
+
+    # ------------------------------------------------------------------
+    # Sérialisation
+    # ------------------------------------------------------------------
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convertit le journal en dictionnaire pour la sauvegarde
+
+        Les saisons archivées sur disque ne sont référencées que par leur
+        année et l'étiquette de leur fichier; les autres sont incluses dans
+        la sauvegarde.
+        """
+        return {
+            "current_year": self.current_year,
+            "chunk_size": self.chunk_size,
+            "tournaments": list(self._tournament_names),
+            "rounds": list(self._round_names),
+            "current_season": self._encode_season(self.get_current_season()),
+            "archived_seasons": {str(year): tag for year, tag in self._season_tags.items()},
+            "seasons": {str(year): self._encode_season(self._get_season(year))
+                        for year in self.seasons if year not in self._season_tags}
+        }
+
+    def save_cursor(self) -> Tuple[int, int, int, int]:
+        """Position de sauvegarde (saison, matchs de la saison, tailles des tables de codage)"""
+        return self.current_year, self._season_rows, len(self._tournament_names), len(self._round_names)
+
+    def to_delta_dict(self, cursor: Tuple[int, int, int, int]) -> Dict[str, Any]:
+        """
+        Matchs ajoutés depuis une position de sauvegarde
+
+        Pour chaque saison depuis celle de la position: les lignes nouvelles,
+        et pour les saisons terminées depuis, l'étiquette de leur fichier.
+
+        Args:
+            cursor: Position retournée par save_cursor
+
+        Returns:
+            Dictionnaire delta (jamais None: le journal ne fait que croître)
+        """
+        year, rows, tournament_count, round_count = cursor
+        seasons = []
+        for season_year in range(year, self.current_year + 1):
+            start = rows if season_year == year else 0
+            if season_year == self.current_year:
+                appended = self._current_rows(start)
+            else:
+                appended = self.get_season(season_year)[start:]
+            seasons.append({
+                "year": season_year,
+                "rows": self._encode_season(appended),
+                "ended": season_year < self.current_year,
+                "tag": self._season_tags.get(season_year)
+            })
+        return {
+            "tournaments": self._tournament_names[tournament_count:],
+            "rounds": self._round_names[round_count:],
+            "seasons": seasons
+        }
+
+    def apply_delta(self, delta: Dict[str, Any]) -> None:
+        """
+        Applique un delta produit par to_delta_dict (chargement d'une sauvegarde)
+
+        Une saison terminée reprend son fichier s'il existe; sinon ses matchs
+        restent en mémoire (et seront inclus dans la prochaine sauvegarde).
+        """
+        for name in delta["tournaments"]:
+            self._encode(name, self._tournament_names, self._tournament_codes)
+        for name in delta["rounds"]:
+            self._encode(name, self._round_names, self._round_codes)
+
+        for season in delta["seasons"]:
+            if season["year"] != self.current_year:
+                self._start_season(season["year"])
+            self._append_rows(self._decode_season(season["rows"]))
+            if not season["ended"]:
+                continue
+            tag = season["tag"]
+            if self.directory and tag is not None and os.path.exists(self._season_path(season["year"], tag)):
+                self._season_tags[season["year"]] = tag
+                self._seasons[season["year"]] = None
+            elif self._season_rows:
+                self._seasons[season["year"]] = self.get_current_season().copy()
+            self._start_season(season["year"] + 1)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], directory: Optional[str] = None) -> 'MatchLog':
+        """
+        Recrée le journal depuis to_dict
+
+        Args:
+            data: Dictionnaire sauvegardé
+            directory: Répertoire des saisons archivées de la partie
+        """
+        log = cls(directory, data.get("chunk_size", cls.DEFAULT_CHUNK_SIZE), data["current_year"])
+        log._tournament_names = list(data.get("tournaments", []))
+        log._tournament_codes = {name: code for code, name in enumerate(log._tournament_names)}
+        log._round_names = list(data.get("rounds", []))
+        log._round_codes = {name: code for code, name in enumerate(log._round_names)}
+
+        for year, season in data.get("seasons", {}).items():
+            log._seasons[int(year)] = cls._decode_season(season)
+        if directory:
+            archived = data.get("archived_seasons", {})
+            if isinstance(archived, list):
+                # Ancien format: liste d'années, fichiers sans étiquette
+                archived = {str(year): "" for year in archived}
+            for year, tag in archived.items():
+                if os.path.exists(log._season_path(int(year), tag)):
+                    log._season_tags[int(year)] = tag
+                    log._seasons[int(year)] = None
+
+        # Saison courante: rechargée par blocs, index par joueur reconstruit
+        log._append_rows(cls._decode_season(data["current_season"]))
+        return log
+
+    # ------------------------------------------------------------------
+    # Interne
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _encode(name: str, names: List[str], codes: Dict[str, int]) -> int:
+        """Code d'une chaîne, ajoutée à sa table si besoin"""
+        code = codes.get(name)
+        if code is None:
+            code = len(names)
+            names.append(name)
+            codes[name] = code
+        return code
+
+    def _append_rows(self, rows: np.ndarray) -> None:
+        """Ajoute des lignes déjà codées à la saison courante (blocs et index par joueur)"""
+        first_row = self._season_rows
+        written = 0
+        while written < len(rows):
+            if self._chunk_fill == self.chunk_size:
+                self._chunks.append(np.empty(self.chunk_size, dtype=MATCH_DTYPE))
+                self._chunk_fill = 0
+            part = rows[written:written + self.chunk_size - self._chunk_fill]
+            self._chunks[-1][self._chunk_fill:self._chunk_fill + len(part)] = part
+            self._chunk_fill += len(part)
+            written += len(part)
+        self._season_rows += len(rows)
+        for row, (winner_id, loser_id) in enumerate(zip(rows["winner"].tolist(), rows["loser"].tolist()), first_row):
+            self._player_rows.setdefault(winner_id, []).append(row)
+            self._player_rows.setdefault(loser_id, []).append(row)
+
+    def _current_rows(self, start: int) -> np.ndarray:
+        """Lignes de la saison courante à partir de start, sans concaténer les blocs antérieurs"""
+        first_chunk = start // self.chunk_size
+        if start >= self._season_rows:
+            return np.empty(0, dtype=MATCH_DTYPE)
+        rows = np.concatenate(self._chunks[first_chunk:])
+        return rows[start - first_chunk * self.chunk_size:self._season_rows - first_chunk * self.chunk_size]
+
+    def _take_current(self, rows: List[int]) -> np.ndarray:
+        """Lignes de la saison courante, sans concaténer les blocs"""
+        rows = np.asarray(rows, dtype=np.int64)
+        result = np.empty(len(rows), dtype=MATCH_DTYPE)
+        chunk_numbers = rows // self.chunk_size
+        for chunk_number in np.unique(chunk_numbers):
+            mask = chunk_numbers == chunk_number
+            result[mask] = self._chunks[chunk_number][rows[mask] % self.chunk_size]
+        return result
+
+    def _get_season(self, year: int) -> np.ndarray:
+        """Saison archivée, ouverte en lecture seule (mmap) si elle est sur disque"""
+        season = self._seasons[year]
+        if season is None:
+            season = np.load(self._season_path(year), mmap_mode="r")
+            self._seasons[year] = season
+        return season
+
+    def _get_season_index(self, year: int) -> SeasonIndex:
+        """Index par joueur d'une saison archivée"""
+        index = self._season_indexes.get(year)
+        if index is None:
+            if self.directory and os.path.exists(self._index_path(year)):
+                with np.load(self._index_path(year)) as stored:
+                    index = (stored["ids"], stored["offsets"], stored["rows"])
+            else:
+                index = self._build_index(self._get_season(year))
+            self._season_indexes[year] = index
+        return index
+
+    @staticmethod
+    def _build_index(season: np.ndarray) -> SeasonIndex:
+        """Construit l'index par joueur (lignes chronologiques de chaque joueur)"""
+        count = len(season)
+        players = np.concatenate([season["winner"], season["loser"]])
+        rows = np.concatenate([np.arange(count), np.arange(count)])
+        order = np.lexsort((rows, players))
+        players, rows = players[order], rows[order]
+        ids, starts = np.unique(players, return_index=True)
+        offsets = np.append(starts, len(players))
+        return ids, offsets, rows
+
+    def _season_file_stem(self, year: int, tag: Optional[str] = None) -> str:
+        """Nom de fichier d'une saison, sans extension (étiquette de la saison par défaut)"""
+        tag = self._season_tags.get(year, "") if tag is None else tag
+        return f"season_{year}_{tag}" if tag else f"season_{year}"
+
+    def _season_path(self, year: int, tag: Optional[str] = None) -> str:
+        return os.path.join(self.directory, self._season_file_stem(year, tag) + ".npy")
+
+    def _index_path(self, year: int) -> str:
+        return os.path.join(self.directory, self._season_file_stem(year) + "_index.npz")
+
+    @staticmethod
+    def _encode_season(season: np.ndarray) -> Dict[str, Any]:
+        """Encode une saison colonne par colonne"""
+        return {name: encode_array(np.ascontiguousarray(season[name])) for name in MATCH_DTYPE.names}
+
+    @staticmethod
+    def _decode_season(data: Dict[str, Any]) -> np.ndarray:
+        """Décode une saison encodée par _encode_season"""
+        columns = {name: decode_array(data[name]) for name in MATCH_DTYPE.names}
+        season = np.empty(len(columns["year"]), dtype=MATCH_DTYPE)
+        for name, column in columns.items():
+            season[name] = column
+        return season
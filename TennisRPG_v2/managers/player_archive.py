@@ -0,0 +1,217 @@
+"""
+Archive froide des joueurs retraités (SQLite)
+"""
+import json
+import os
+import sqlite3
+import uuid
+from typing import Dict, List, Optional, Iterable, Any, Tuple
+
+from ..entities.player import Player
+
+
+class RetiredPlayerArchive:
+    """
+    Archive des joueurs retraités stockée hors mémoire
+
+    Les retraités sont retirés du pool actif mais leur carte finale et leur
+    résumé de carrière sont conservés dans une table SQLite indexée par nom,
+    pays et année de retraite. La connexion n'est ouverte qu'au premier
+    accès, aucune base n'est donc créée pour une partie sans retraite.
+
+    Les lignes ne sont jamais supprimées: chaque session écrit dans sa propre
+    branche, et seules sont visibles la branche courante et, pour les
+    branches dont elle descend (sauvegardes rechargées), les lignes écrites
+    avant la sauvegarde. Deux sauvegardes divergentes de la même partie
+    partagent ainsi la base sans voir les retraites l'une de l'autre.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS retired_players (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            full_name TEXT NOT NULL,
+            gender TEXT NOT NULL,
+            country TEXT NOT NULL,
+            retirement_year INTEGER,
+            retirement_age INTEGER NOT NULL,
+            final_rank INTEGER,
+            atp_points INTEGER NOT NULL,
+            level INTEGER NOT NULL,
+            display_card TEXT NOT NULL,
+            player_data TEXT NOT NULL,
+            lineage TEXT NOT NULL DEFAULT ''
+        );
+        CREATE INDEX IF NOT EXISTS idx_retired_name ON retired_players (full_name);
+        CREATE INDEX IF NOT EXISTS idx_retired_country ON retired_players (country);
+        CREATE INDEX IF NOT EXISTS idx_retired_year ON retired_players (retirement_year);
+    """
+    # Branche des lignes écrites avant l'introduction des branches
+    LEGACY_LINEAGE = ""
+    # Branches visibles (table temporaire de la connexion): la requête garde la même taille quel que soit leur nombre
+    _VISIBLE = ("id <= (SELECT last_row FROM visible_lineages "
+                "WHERE visible_lineages.lineage = retired_players.lineage)")
+    _UNBOUNDED_ROW = 2 ** 63 - 1  # Borne de la branche courante (toutes ses lignes sont visibles)
+
+    _SUMMARY_COLUMNS = ("full_name, gender, country, retirement_year, retirement_age, "
+                        "final_rank, atp_points, level")
+
+    def __init__(self, db_path: str = ":memory:", ancestors: Optional[List[List[Any]]] = None):
+        """
+        Initialise l'archive
+
+        Args:
+            db_path: Chemin du fichier SQLite (":memory:" pour une archive temporaire)
+            ancestors: Branches héritées de la sauvegarde chargée ([branche, dernière ligne visible])
+        """
+        self.db_path = db_path
+        self._connection: Optional[sqlite3.Connection] = None
+        self.lineage = uuid.uuid4().hex
+        self._ancestors: List[Tuple[str, int]] = [(lineage, last_row) for lineage, last_row in ancestors or []]
+        self._last_row = 0  # Dernière ligne écrite par la branche courante
+
+    def _connect(self) -> sqlite3.Connection:
+        """Ouvre la connexion et crée (ou complète) le schéma si nécessaire"""
+        if self._connection is None:
+            directory = os.path.dirname(self.db_path)
+            if self.db_path != ":memory:" and directory:
+                os.makedirs(directory, exist_ok=True)
+            self._connection = sqlite3.connect(self.db_path)
+            self._connection.row_factory = sqlite3.Row
+            self._connection.executescript(self._SCHEMA)
+            columns = {row["name"] for row in self._connection.execute("PRAGMA table_info(retired_players)")}
+            if "lineage" not in columns:
+                self._connection.execute("ALTER TABLE retired_players ADD COLUMN lineage TEXT NOT NULL DEFAULT ''")
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_retired_lineage ON retired_players (lineage, id)")
+            self._connection.execute(
+                "CREATE TEMP TABLE visible_lineages (lineage TEXT PRIMARY KEY, last_row INTEGER NOT NULL)")
+            self._connection.executemany("INSERT OR REPLACE INTO visible_lineages VALUES (?, ?)",
+                                         self._ancestors + [(self.lineage, self._UNBOUNDED_ROW)])
+        return self._connection
+
+    def get_lineage(self) -> List[List[Any]]:
+        """
+        Branches visibles, à enregistrer avec la sauvegarde
+
+        Returns:
+            Branches héritées puis branche courante (si elle a écrit), chacune bornée à sa dernière ligne
+        """
+        lineages = [[lineage, last_row] for lineage, last_row in self._ancestors]
+        if self._last_row:
+            lineages.append([self.lineage, self._last_row])
+        return lineages
+
+    def include_legacy_rows(self, before_year: int) -> None:
+        """
+        Rend visibles les lignes antérieures aux branches (ancienne sauvegarde sans branches)
+
+        Seules les retraites des années précédant celle de la sauvegarde sont retenues.
+
+        Args:
+            before_year: Année de la sauvegarde chargée
+        """
+        if self.db_path != ":memory:" and not os.path.exists(self.db_path):
+            return
+        row = self._connect().execute(
+            "SELECT MAX(id) FROM retired_players WHERE lineage = ? AND retirement_year < ?",
+            (self.LEGACY_LINEAGE, before_year)
+        ).fetchone()
+        if row[0] is not None:
+            self._ancestors.append((self.LEGACY_LINEAGE, row[0]))
+            self._connect().execute("INSERT OR REPLACE INTO visible_lineages VALUES (?, ?)",
+                                    (self.LEGACY_LINEAGE, row[0]))
+
+    def archive_players(self, players: Iterable[Player], year: int = None,
+                        final_ranks: Dict[int, int] = None) -> int:
+        """
+        Archive des joueurs retraités en une seule transaction
+
+        Args:
+            players: Joueurs qui prennent leur retraite
+            year: Année de la retraite
+            final_ranks: Classement final par identifiant de joueur (optionnel)
+
+        Returns:
+            Nombre de joueurs archivés
+        """
+        final_ranks = final_ranks or {}
+        rows = []
+        for player in players:
+            rank = final_ranks.get(player.player_id)
+            rows.append((
+                player.full_name,
+                player.gender.value,
+                player.country,
+                year,
+                player.career.age,
+                rank,
+                player.career.atp_points or 0,
+                player.career.level,
+                # Carte construite sans passer par le cache d'affichage, qui garderait le retraité en mémoire
+                player._build_display_card(rank),
+                json.dumps(player.to_dict(), ensure_ascii=False),
+                self.lineage
+            ))
+
+        if not rows:
+            return 0
+
+        connection = self._connect()
+        with connection:
+            connection.executemany(
+                "INSERT INTO retired_players (full_name, gender, country, retirement_year, retirement_age, "
+                "final_rank, atp_points, level, display_card, player_data, lineage) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._last_row = connection.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return len(rows)
+
+    def find_by_name(self, name: str) -> List[Dict[str, Any]]:
+        """Recherche les retraités dont le nom contient le texte donné"""
+        return self._query("full_name LIKE ?", (f"%{name}%",))
+
+    def find_by_country(self, country: str) -> List[Dict[str, Any]]:
+        """Retourne les retraités d'un pays"""
+        return self._query("country = ?", (country,))
+
+    def find_by_year(self, year: int) -> List[Dict[str, Any]]:
+        """Retourne les joueurs ayant pris leur retraite une année donnée"""
+        return self._query("retirement_year = ?", (year,))
+
+    def get_display_card(self, full_name: str) -> Optional[str]:
+        """Retourne la carte finale d'un retraité"""
+        row = self._connect().execute(
+            f"SELECT display_card FROM retired_players WHERE full_name = ? AND {self._VISIBLE} "
+            "ORDER BY id DESC LIMIT 1",
+            (full_name,)
+        ).fetchone()
+        return row["display_card"] if row else None
+
+    def load_player(self, full_name: str) -> Optional[Player]:
+        """Recrée un retraité depuis l'archive"""
+        row = self._connect().execute(
+            f"SELECT player_data FROM retired_players WHERE full_name = ? AND {self._VISIBLE} "
+            "ORDER BY id DESC LIMIT 1",
+            (full_name,)
+        ).fetchone()
+        return Player.from_dict(json.loads(row["player_data"])) if row else None
+
+    def count(self) -> int:
+        """Nombre de joueurs archivés visibles"""
+        return self._connect().execute(f"SELECT COUNT(*) FROM retired_players WHERE {self._VISIBLE}").fetchone()[0]
+
+    def close(self) -> None:
+        """Ferme la connexion"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _query(self, where: str, params: tuple) -> List[Dict[str, Any]]:
+        """Exécute une recherche et retourne les résumés de carrière"""
+        rows = self._connect().execute(
+            f"SELECT {self._SUMMARY_COLUMNS} FROM retired_players WHERE {where} AND {self._VISIBLE} "
+            "ORDER BY retirement_year, final_rank IS NULL, final_rank, full_name",
+            params
+        ).fetchall()
+        return [dict(row) for row in rows]
@@ -2,7 +2,8 @@
 Générateur de joueurs automatiques (PNJ)
 """
 import random
-from typing import Dict
+from functools import partial
+from typing import Dict, List
 from faker import Faker
 from transliterate import translit
 from unidecode import unidecode
@@ -10,6 +11,46 @@ from unidecode import unidecode
 from ..entities.player import Player, Gender
 from ..data.countries import COUNTRIES_LOCALES
 from ..utils.constants import RETIREMENT_CONSTANTS, TalentLevel
+from ..utils.cache_manager import lazy_loader
+
+
+def _name_bank_key(locale: str) -> str:
+	"""Clé du LazyLoader pour la banque de noms (instance Faker) d'une locale"""
+	return f"name_bank:{locale}"
+
+
+# Locales distinctes de tous les pays, dans l'ordre de COUNTRIES_LOCALES
+_NAME_BANK_LOCALES = tuple(dict.fromkeys(locale for locales in COUNTRIES_LOCALES.values() for locale in locales))
+
+
+def get_name_bank_keys() -> List[str]:
+	"""
+	Retourne les clés de toutes les banques de noms, en enregistrant celles qui ne le sont pas
+
+	Une banque déjà enregistrée ne l'est pas à nouveau: ses échecs de
+	chargement mémorisés (et leur délai avant nouvel essai) sont conservés.
+	"""
+	keys = []
+	for locale in _NAME_BANK_LOCALES:
+		key = _name_bank_key(locale)
+		if not lazy_loader.is_registered(key):
+			lazy_loader.register_loader(key, partial(Faker, locale))
+		keys.append(key)
+	return keys
+
+
+def preload_name_banks(background: bool = True) -> list:
+	"""
+	Précharge les banques de noms (instanciation Faker coûteuse par locale)
+
+	Args:
+		background: Charge sur le pool de threads du LazyLoader
+
+	Returns:
+		Futures du préchargement
+	"""
+	keys = [key for key in get_name_bank_keys() if not lazy_loader.is_loaded(key)]
+	return lazy_loader.preload(keys, background=background)
 
 
 class PlayerGenerator:
@@ -17,6 +58,7 @@ class PlayerGenerator:
 
 	def __init__(self):
 		self.generated_names = set()  # Pour éviter les doublons
+		get_name_bank_keys()  # Enregistre les banques de noms auprès du LazyLoader
 
 	def generate_player(self, gender: Gender, level_range: tuple = (1, 25), age_range: tuple = None, talent_level: TalentLevel = None) -> Player:
 		"""
@@ -35,8 +77,8 @@ class PlayerGenerator:
 		country = random.choice(list(COUNTRIES_LOCALES.keys()))
 		locale = self._get_random_locale(country)
 
-		# Génération du nom
-		fake = Faker(locale)
+		# Génération du nom (banque de noms chargée une seule fois par locale)
+		fake = self._get_name_bank(locale)
 		first_name, last_name = self._generate_names(fake, gender)
 
 		# Translittération si nécessaire
@@ -78,6 +120,11 @@ class PlayerGenerator:
 			talent_level=talent_level
 		)
 
+	def _get_name_bank(self, locale: str) -> Faker:
+		"""Retourne l'instance Faker de la locale, chargée paresseusement et partagée"""
+		fake = lazy_loader.get_data(_name_bank_key(locale))
+		return fake if fake is not None else Faker(locale)
+
 	def _get_random_locale(self, country: str) -> str:
 		"""Sélectionne une locale aléatoire pour le pays"""
 		locales = COUNTRIES_LOCALES[country]
@@ -117,7 +164,7 @@ class PlayerGenerator:
 		weights = [30, 35, 25, 8, 2]
 		return random.choices(choices, weights=weights)[0]
 
-	def generate_player_pool(self, count: int, gender: Gender, level_range: tuple = (1, 25), age_range: tuple = None) -> Dict[str, Player]:
+	def generate_player_pool(self, count: int, gender: Gender, level_range: tuple = (1, 25), age_range: tuple = None) -> Dict[int, Player]:
 		"""
 		Génère un pool de joueurs
 
@@ -128,17 +175,17 @@ class PlayerGenerator:
 			age_range: Plage d'âges possible (défaut: jeunes joueurs)
 
 		Returns:
-			Dictionnaire {nom_complet: Player}
+			Dictionnaire {identifiant: Player}
 		"""
 		players = {}
 
 		for _ in range(count):
 			player = self.generate_player(gender, level_range, age_range)
-			players[player.full_name] = player
+			players[player.player_id] = player
 
 		return players
 
-	def generate_simulation_player_pool(self, count: int, gender: Gender, level_range: tuple = (1, 25)) -> Dict[str, Player]:
+	def generate_simulation_player_pool(self, count: int, gender: Gender, level_range: tuple = (1, 25)) -> Dict[int, Player]:
 		"""
 		Génère un pool de joueurs de tous âges pour la simulation préliminaire
 		
@@ -148,14 +195,14 @@ class PlayerGenerator:
 			level_range: Plage de niveaux
 			
 		Returns:
-			Dictionnaire {nom_complet: Player} avec joueurs de 16 à 45 ans
+			Dictionnaire {identifiant: Player} avec joueurs de 16 à 45 ans
 		"""
 		age_range = (RETIREMENT_CONSTANTS["YOUNG_PLAYER_MIN_AGE"], RETIREMENT_CONSTANTS["MAX_CAREER_AGE"])
 		return self.generate_player_pool(count, gender, level_range, age_range)
 
 
 # Fonction de compatibilité avec l'ancien code
-def generer_pnj(nombre: int, sexe: str) -> Dict[str, Player]:
+def generer_pnj(nombre: int, sexe: str) -> Dict[int, Player]:
 	"""
 	Fonction de compatibilité avec l'ancien système
 
@@ -171,7 +218,7 @@ def generer_pnj(nombre: int, sexe: str) -> Dict[str, Player]:
 	return generator.generate_player_pool(nombre, gender)
 
 
-def generer_pnj_thread(nb_joueurs: int, sexe: str, pool: Dict[str, Player]):
+def generer_pnj_thread(nb_joueurs: int, sexe: str, pool: Dict[int, Player]):
 	"""
 	Fonction de compatibilité pour génération en thread
 
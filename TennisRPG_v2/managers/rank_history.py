@@ -0,0 +1,189 @@
+"""
+Historique des classements - un instantané des rangs par semaine, stocké par blocs
+"""
+from typing import Dict, List, Optional, Any
+
+import numpy as np
+
+from ..utils.constants import TIME_CONSTANTS
+from ..utils.serialization import encode_array, decode_array
+
+# Rang stocké sur 2 octets (0 = non classé); les rangs au-delà sont plafonnés
+RANK_DTYPE = np.int16
+MAX_STORED_RANK = np.iinfo(RANK_DTYPE).max
+
+
+class RankHistory:
+    """
+    Historique hebdomadaire des rangs, indexé par identifiant de joueur
+
+    Chaque semaine ajoute une ligne (le vecteur des rangs, colonne = player_id)
+    dans des blocs préalloués de chunk_weeks semaines: l'ajout ne recopie
+    jamais l'historique existant. Les identifiants étant attribués de façon
+    croissante, seul le bloc courant est élargi lorsqu'un nouveau joueur
+    dépasse sa largeur. Les joueurs retraités gardent leur historique.
+
+    Chaque instantané est daté par un index de semaine absolu
+    (année * semaines par an + semaine - 1), ce qui ordonne les saisons.
+    """
+
+    DEFAULT_CHUNK_WEEKS = 52
+
+    def __init__(self, chunk_weeks: int = DEFAULT_CHUNK_WEEKS):
+        """
+        Initialise un historique vide
+
+        Args:
+            chunk_weeks: Nombre de semaines par bloc préalloué
+        """
+        self.chunk_weeks = chunk_weeks
+        self._chunks: List[np.ndarray] = []  # Blocs (semaines x joueurs)
+        self._chunk_fill = chunk_weeks  # Force l'allocation du premier bloc
+        self._dates: List[int] = []  # Index de semaine absolu de chaque instantané
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    @staticmethod
+    def week_index(year: int, week: int) -> int:
+        """Index de semaine absolu d'une date (année, semaine)"""
+        return year * TIME_CONSTANTS["WEEKS_PER_YEAR"] + week - 1
+
+    @property
+    def week_indexes(self) -> np.ndarray:
+        """Index de semaine absolus des instantanés, dans l'ordre chronologique"""
+        return np.array(self._dates, dtype=np.int32)
+
+    @property
+    def years(self) -> np.ndarray:
+        """Année de chaque instantané"""
+        return self.week_indexes // TIME_CONSTANTS["WEEKS_PER_YEAR"]
+
+    @property
+    def weeks(self) -> np.ndarray:
+        """Numéro de semaine (1 à 52) de chaque instantané"""
+        return self.week_indexes % TIME_CONSTANTS["WEEKS_PER_YEAR"] + 1
+
+    def record_week(self, rank_table: np.ndarray, year: int, week: int) -> None:
+        """
+        Ajoute les rangs d'une semaine
+
+        Un nouvel enregistrement daté comme le dernier instantané le remplace
+        (classements recalculés plusieurs fois dans la même semaine).
+
+        Args:
+            rank_table: Rangs indexés par identifiant de joueur (0 = non classé)
+            year: Année
+            week: Numéro de la semaine
+        """
+        ranks = np.minimum(rank_table, MAX_STORED_RANK).astype(RANK_DTYPE, copy=False)
+        date = self.week_index(year, week)
+        if self._dates and self._dates[-1] == date:
+            row = self._chunk_fill - 1
+        else:
+            if self._chunk_fill == self.chunk_weeks:
+                self._chunks.append(np.zeros((self.chunk_weeks, self._padded_width(len(ranks))), dtype=RANK_DTYPE))
+                self._chunk_fill = 0
+            row = self._chunk_fill
+            self._chunk_fill += 1
+            self._dates.append(date)
+
+        chunk = self._chunks[-1]
+        if len(ranks) > chunk.shape[1]:
+            chunk = self._chunks[-1] = np.pad(chunk, ((0, 0), (0, self._padded_width(len(ranks)) - chunk.shape[1])))
+        chunk[row, :len(ranks)] = ranks
+        chunk[row, len(ranks):] = 0
+
+    @staticmethod
+    def _padded_width(width: int) -> int:
+        """Largeur allouée avec une marge pour les futurs identifiants"""
+        return width + width // 4 + 64
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+    def get_player_history(self, player_id: int) -> np.ndarray:
+        """
+        Rangs d'un joueur semaine par semaine
+
+        Args:
+            player_id: Identifiant du joueur
+
+        Returns:
+            Tableau aligné sur week_indexes (0 = non classé)
+        """
+        history = np.zeros(len(self), dtype=RANK_DTYPE)
+        for index, chunk in enumerate(self._chunks):
+            fill = self._chunk_fill if index == len(self._chunks) - 1 else self.chunk_weeks
+            if player_id < chunk.shape[1]:
+                start = index * self.chunk_weeks
+                history[start:start + fill] = chunk[:fill, player_id]
+        return history
+
+    def get_best_rank(self, player_id: int) -> Optional[int]:
+        """Meilleur classement d'un joueur (None s'il n'a jamais été classé)"""
+        history = self.get_player_history(player_id)
+        ranked = history[history > 0]
+        return int(ranked.min()) if len(ranked) else None
+
+    def count_weeks_in_top(self, player_id: int, top_n: int) -> int:
+        """Nombre de semaines passées dans le top N (top_n=1: semaines au rang de numéro un)"""
+        history = self.get_player_history(player_id)
+        return int(np.count_nonzero((history > 0) & (history <= top_n)))
+
+    # ------------------------------------------------------------------
+    # Sauvegarde
+    # ------------------------------------------------------------------
+    def to_matrix(self, start: int = 0) -> np.ndarray:
+        """
+        Historique (semaines x joueurs) en un seul tableau
+
+        Args:
+            start: Index du premier instantané retourné (0 = historique complet)
+        """
+        width = max((chunk.shape[1] for chunk in self._chunks), default=0)
+        matrix = np.zeros((max(len(self) - start, 0), width), dtype=RANK_DTYPE)
+        for index, chunk in enumerate(self._chunks):
+            fill = self._chunk_fill if index == len(self._chunks) - 1 else self.chunk_weeks
+            chunk_start = index * self.chunk_weeks
+            skip = max(start - chunk_start, 0)
+            if skip < fill:
+                matrix[chunk_start + skip - start:chunk_start + fill - start, :chunk.shape[1]] = chunk[skip:fill]
+        return matrix
+
+    def to_dict(self, start: int = 0) -> Dict[str, Any]:
+        """
+        Convertit l'historique en dictionnaire compact (2 octets par joueur et par semaine avant compression)
+
+        Args:
+            start: Index du premier instantané sauvegardé (deltas: instantanés récents seulement)
+        """
+        return {
+            "dates": encode_array(self.week_indexes[start:]),
+            "ranks": encode_array(self.to_matrix(start))
+        }
+
+    def append_dict(self, data: Dict[str, Any]) -> None:
+        """
+        Ajoute les instantanés d'un dictionnaire produit par to_dict(start)
+
+        Un instantané daté comme le dernier de l'historique le remplace.
+        """
+        weeks_per_year = TIME_CONSTANTS["WEEKS_PER_YEAR"]
+        for date, ranks in zip(decode_array(data["dates"]).tolist(), decode_array(data["ranks"])):
+            self.record_week(ranks, date // weeks_per_year, date % weeks_per_year + 1)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], chunk_weeks: int = DEFAULT_CHUNK_WEEKS) -> 'RankHistory':
+        """Recrée l'historique depuis un dictionnaire produit par to_dict"""
+        history = cls(chunk_weeks)
+        dates = decode_array(data["dates"]).tolist()
+        matrix = decode_array(data["ranks"])
+        for start in range(0, len(dates), chunk_weeks):
+            rows = matrix[start:start + chunk_weeks]
+            chunk = np.zeros((chunk_weeks, matrix.shape[1]), dtype=RANK_DTYPE)
+            chunk[:len(rows)] = rows
+            history._chunks.append(chunk)
+            history._chunk_fill = len(rows)
+        history._dates = dates
+        return history
@@ -1,12 +1,17 @@
 """
-Gestionnaire des classements ATP, Race et ELO
+Gestionnaire des classements ATP, Race, ELO et Glicko-2
 """
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Any, Union
+import numpy as np
 import pandas as pd
 
 from ..entities.player import Player
-from ..entities.ranking import Ranking, RankingType
+from ..entities.ranking import Ranking, RankingEntry, RankingType
+from .glicko_engine import Glicko2Engine
+from .rank_history import RankHistory
 from ..utils.constants import TIME_CONSTANTS
+from ..utils.serialization import encode_array, decode_array
+from ..utils.profiler import profile_phase
 
 
 class RankingManager:
@@ -19,14 +24,21 @@ class RankingManager:
         Args:
             players: Liste initiale des joueurs
         """
-        self.players = {player.full_name: player for player in players}
+        # Joueurs, classements et historique sont indexés par identifiant (player_id)
+        self.players = {player.player_id: player for player in players}
         
         # Crée les classements
         self.atp_ranking = Ranking(self.players)
         self.atp_race_ranking = Ranking(self.players)
         self.elo_ranking = Ranking(self.players)
+        self.glicko_ranking = Ranking(self.players)
+        # Moteur Glicko-2: abonné aux tournois, une période de notation par semaine
+        self.glicko_engine = Glicko2Engine()
+        # Rangs ATP de chaque semaine (meilleur classement, semaines au sommet...)
+        self.rank_history = RankHistory()
         
         # Initialise les classements
+        self._glicko_needs_update = True
         self._initialize_all_rankings()
         
         # DataFrame pour tracker les points ATP par semaine (52 semaines glissantes)
@@ -36,8 +48,172 @@ class RankingManager:
             columns=[f"week_{i}" for i in range(1, TIME_CONSTANTS["WEEKS_PER_YEAR"] + 1)]
         )
         
+        # Révision de chaque colonne de points (sauvegardes incrémentales: colonnes modifiées seulement)
+        self._week_revisions = np.zeros(TIME_CONSTANTS["WEEKS_PER_YEAR"], dtype=np.int64)
+        
         self.current_week = 1
+        self.current_year = TIME_CONSTANTS["GAME_START_YEAR"]
         self._rankings_need_update = False  # Flag pour savoir si les classements doivent être mis à jour
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convertit l'état des classements en dictionnaire compact pour la sauvegarde
+
+        L'historique des points et l'ordre des classements sont stockés sous forme
+        de tableaux d'entiers encodés (voir utils.serialization).
+
+        Returns:
+            Dictionnaire sérialisable en JSON
+        """
+        player_ids = list(self.atp_points_history.index)
+        positions = {player_id: i for i, player_id in enumerate(player_ids)}
+
+        def encode_order(ranking: Ranking) -> Dict[str, Any]:
+            return encode_array(np.array([positions[player_id] for player_id in ranking.order.tolist()
+                                          if player_id in positions], dtype=np.int32))
+
+        return {
+            "current_week": self.current_week,
+            "current_year": self.current_year,
+            "player_ids": encode_array(np.array(player_ids, dtype=np.int32)),
+            "atp_points_history": encode_array(self.atp_points_history.to_numpy(dtype=np.int32)),
+            "rankings": {
+                RankingType.ATP.value: encode_order(self.atp_ranking),
+                RankingType.ATP_RACE.value: encode_order(self.atp_race_ranking),
+                RankingType.ELO.value: encode_order(self.elo_ranking),
+                RankingType.GLICKO.value: encode_order(self.glicko_ranking)
+            },
+            "glicko": self.glicko_engine.to_dict(),
+            "rank_history": self.rank_history.to_dict(),
+            "rankings_need_update": self._rankings_need_update
+        }
+
+    @classmethod
+    def from_dict(cls, players: List[Player], data: Dict[str, Any]) -> 'RankingManager':
+        """
+        Recrée le gestionnaire depuis une sauvegarde sans recalculer les classements
+
+        Args:
+            players: Joueurs du pool chargé
+            data: Dictionnaire produit par to_dict
+
+        Returns:
+            Gestionnaire des classements restauré
+        """
+        manager = cls.__new__(cls)
+        manager.players = {player.player_id: player for player in players}
+        manager.atp_ranking = Ranking(manager.players)
+        manager.atp_race_ranking = Ranking(manager.players)
+        manager.elo_ranking = Ranking(manager.players)
+        manager.glicko_ranking = Ranking(manager.players)
+        manager.glicko_engine = Glicko2Engine.from_dict(data["glicko"]) if "glicko" in data else Glicko2Engine()
+        manager.rank_history = RankHistory.from_dict(data["rank_history"]) if "rank_history" in data else RankHistory()
+        manager._week_revisions = np.zeros(TIME_CONSTANTS["WEEKS_PER_YEAR"], dtype=np.int64)
+        manager.current_week = data.get("current_week", 1)
+        manager.current_year = data.get("current_year", TIME_CONSTANTS["GAME_START_YEAR"])
+        manager._rankings_need_update = data.get("rankings_need_update", False)
+        manager._glicko_needs_update = RankingType.GLICKO.value not in data["rankings"]
+
+        # Historique des points: restaure les lignes des joueurs encore présents
+        if "player_ids" in data:
+            saved_ids = decode_array(data["player_ids"]).tolist()
+        else:
+            # Sauvegarde antérieure aux identifiants: lignes indexées par nom (-1 = joueur disparu)
+            ids_by_name = {player.full_name: player.player_id for player in players}
+            saved_ids = [ids_by_name.get(name, -1) for name in data["player_names"]]
+        history = decode_array(data["atp_points_history"])
+        columns = [f"week_{i}" for i in range(1, TIME_CONSTANTS["WEEKS_PER_YEAR"] + 1)]
+        manager.atp_points_history = pd.DataFrame(history, index=saved_ids, columns=columns)
+        manager.atp_points_history = manager.atp_points_history[manager.atp_points_history.index >= 0]
+        manager.atp_points_history = manager.atp_points_history.reindex(
+            list(manager.players.keys()), fill_value=0
+        )
+
+        # Classements: ordre sauvegardé, recalcul seulement si le pool a changé
+        for ranking_type, ranking in [(RankingType.ATP, manager.atp_ranking),
+                                      (RankingType.ATP_RACE, manager.atp_race_ranking),
+                                      (RankingType.ELO, manager.elo_ranking),
+                                      (RankingType.GLICKO, manager.glicko_ranking)]:
+            if ranking_type.value not in data["rankings"]:
+                # Sauvegarde antérieure au classement: recalculé
+                manager._rankings_need_update = True
+                continue
+            order = decode_array(data["rankings"][ranking_type.value])
+            ranking.restore_rankings([saved_ids[i] for i in order if saved_ids[i] in manager.players])
+
+        if set(saved_ids) != set(manager.players.keys()):
+            manager._glicko_needs_update = True
+            manager._initialize_all_rankings()
+
+        return manager
+
+    def save_cursor(self) -> Dict[str, Any]:
+        """Position de sauvegarde: révisions des colonnes de points, historique des rangs et Glicko-2"""
+        return {
+            "weeks": self._week_revisions.copy(),
+            "rank_history": len(self.rank_history),
+            "glicko": self.glicko_engine.save_cursor()
+        }
+
+    def to_delta_dict(self, cursor: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Changements depuis une position de sauvegarde
+
+        Seules les colonnes de points modifiées (en pratique la semaine en cours
+        et la semaine remise à zéro) et les nouveaux rangs hebdomadaires sont
+        écrits; l'historique complet et les ordres restent dans la base.
+
+        Args:
+            cursor: Position retournée par save_cursor
+
+        Returns:
+            Dictionnaire delta, ou None si une sauvegarde complète est nécessaire
+        """
+        glicko = self.glicko_engine.to_delta_dict(cursor["glicko"])
+        if glicko is None or len(self.rank_history) < cursor["rank_history"]:
+            return None
+
+        points_weeks = {}
+        for week in np.flatnonzero(self._week_revisions != cursor["weeks"]) + 1:
+            column = self.atp_points_history[f"week_{week}"]
+            column = column[column != 0]
+            points_weeks[str(week)] = {
+                "player_ids": encode_array(column.index.to_numpy(dtype=np.int32)),
+                "points": encode_array(column.to_numpy(dtype=np.int32))
+            }
+
+        return {
+            "current_week": self.current_week,
+            "current_year": self.current_year,
+            "points_weeks": points_weeks,
+            # Le dernier instantané sauvegardé a pu être recalculé dans la même semaine
+            "rank_history": self.rank_history.to_dict(max(cursor["rank_history"] - 1, 0)),
+            "glicko": glicko
+        }
+
+    def apply_delta(self, delta: Dict[str, Any]) -> None:
+        """
+        Applique un delta produit par to_delta_dict (chargement d'une sauvegarde)
+
+        Les classements sont ensuite recalculés à la première consultation.
+        """
+        for week, column in delta["points_weeks"].items():
+            week_col = f"week_{week}"
+            player_ids = decode_array(column["player_ids"])
+            points = decode_array(column["points"])
+            present = np.isin(player_ids, self.atp_points_history.index.to_numpy())
+            self.atp_points_history[week_col] = 0
+            self.atp_points_history.loc[player_ids[present], week_col] = points[present]
+        self.rank_history.append_dict(delta["rank_history"])
+        self.glicko_engine.apply_delta(delta["glicko"])
+        self._glicko_needs_update = True
+        self.current_week = delta["current_week"]
+        self.current_year = delta["current_year"]
+        self._rankings_need_update = True
+
+    def _touch_week(self, week: int) -> None:
+        """Signale la modification d'une colonne de points"""
+        self._week_revisions[week - 1] += 1
         
     def _initialize_all_rankings(self) -> None:
         """Initialise tous les classements avec les données actuelles des joueurs"""
@@ -65,6 +241,15 @@ class RankingManager:
         )
         self.elo_ranking.update_rankings(elo_players)
         
+        # Classement Glicko-2: les notes ne changent qu'à la clôture d'une période (update_weekly_rankings),
+        # il n'est donc retrié qu'à ce moment ou quand le pool change, pas après chaque attribution de points
+        if self._glicko_needs_update:
+            players = list(self.players.values())
+            player_ids = np.fromiter((player.player_id for player in players), dtype=np.int64, count=len(players))
+            order = np.argsort(-self.glicko_engine.get_ratings(player_ids), kind="stable")
+            self.glicko_ranking.update_rankings([players[i] for i in order])
+            self._glicko_needs_update = False
+        
         # Marque les classements comme à jour
         self._rankings_need_update = False
         
@@ -80,30 +265,34 @@ class RankingManager:
             return self.atp_race_ranking
         elif ranking_type == RankingType.ELO:
             return self.elo_ranking
+        elif ranking_type == RankingType.GLICKO:
+            return self.glicko_ranking
         else:
             raise ValueError(f"Type de classement inconnu: {ranking_type}")
         
     def add_player(self, player: Player) -> None:
         """Ajoute un nouveau joueur aux classements"""
-        if player.full_name not in self.players:
-            self.players[player.full_name] = player
+        if player.player_id not in self.players:
+            self.players[player.player_id] = player
             
             # Ajoute à l'historique ATP
-            new_row = pd.Series(0, index=self.atp_points_history.columns, name=player.full_name)
+            new_row = pd.Series(0, index=self.atp_points_history.columns, name=player.player_id)
             self.atp_points_history = pd.concat([self.atp_points_history, new_row.to_frame().T])
             
             # Met à jour tous les classements
+            self._glicko_needs_update = True
             self._initialize_all_rankings()
     
     def remove_player(self, player: Player) -> None:
         """Retire un joueur des classements"""
-        if player.full_name in self.players:
-            del self.players[player.full_name]
+        if player.player_id in self.players:
+            del self.players[player.player_id]
             
             # Retire de l'historique
-            self.atp_points_history = self.atp_points_history.drop(player.full_name, errors='ignore')
+            self.atp_points_history = self.atp_points_history.drop(player.player_id, errors='ignore')
             
             # Met à jour tous les classements
+            self._glicko_needs_update = True
             self._initialize_all_rankings()
     
     def get_player_rank(self, player: Player, ranking_type: RankingType = RankingType.ATP) -> Optional[int]:
@@ -126,18 +315,55 @@ class RankingManager:
             return self.atp_race_ranking.get_player_rank(player) 
         elif ranking_type == RankingType.ELO:
             return self.elo_ranking.get_player_rank(player)
+        elif ranking_type == RankingType.GLICKO:
+            return self.glicko_ranking.get_player_rank(player)
         else:
             return None
     
+    def get_player_ranks(self, players: List[Player], ranking_type: RankingType = RankingType.ATP) -> np.ndarray:
+        """
+        Retourne les classements d'une liste de joueurs en un seul passage
+
+        Args:
+            players: Joueurs concernés
+            ranking_type: Type de classement
+
+        Returns:
+            Tableau des rangs (0 si non classé), dans l'ordre de la liste
+        """
+        # Un seul recalcul éventuel pour tout le lot
+        if self._rankings_need_update:
+            self._initialize_all_rankings()
+        player_ids = np.fromiter((player.player_id for player in players), dtype=np.int64, count=len(players))
+        return self._get_ranking_by_type(ranking_type).get_ranks(player_ids)
+
+    @profile_phase("ranking_update")
     def update_weekly_rankings(self) -> None:
-        """Met à jour tous les classements à la fin d'une semaine"""
+        """Met à jour tous les classements à la fin d'une semaine (clôt la période Glicko-2, archive les rangs ATP)"""
+        self.glicko_engine.close_rating_period()
+        self._glicko_needs_update = True
         self._initialize_all_rankings()
+        self.rank_history.record_week(self.atp_ranking.rank_table, self.current_year, self.current_week)
+
+    def get_rank_history(self, player: Player) -> np.ndarray:
+        """Rangs ATP hebdomadaires d'un joueur, alignés sur rank_history.week_indexes (0 = non classé)"""
+        return self.rank_history.get_player_history(player.player_id)
+
+    def get_best_rank(self, player: Player) -> Optional[int]:
+        """Meilleur classement ATP hebdomadaire d'un joueur (None s'il n'a jamais été classé)"""
+        return self.rank_history.get_best_rank(player.player_id)
+
+    def get_weeks_in_top(self, player: Player, top_n: int = 1) -> int:
+        """Nombre de semaines passées dans le top N ATP (défaut: semaines au rang de numéro un)"""
+        return self.rank_history.count_weeks_in_top(player.player_id, top_n)
     
     def reset_atp_race(self) -> None:
         """Remet à zéro la race ATP (début d'année)"""
         # Remet à zéro les points de race de tous les joueurs
         for player in self.players.values():
-            player.career.atp_race_points = 0
+            if player.career.atp_race_points:
+                player.career.atp_race_points = 0
+                player.career.mark_dirty()
         
         # Met à jour le classement ATP Race
         race_players = sorted(
@@ -147,29 +373,62 @@ class RankingManager:
         )
         self.atp_race_ranking.update_rankings(race_players)
     
-    def add_atp_points(self, player_name: str, points: int, week: Optional[int] = None) -> None:
+    def _resolve_player_id(self, player_key: Union[int, str]) -> Optional[int]:
+        """
+        Identifiant d'un joueur
+        
+        Les noms complets restent acceptés pour compatibilité (recherche linéaire,
+        premier joueur portant ce nom).
+        """
+        if isinstance(player_key, str):
+            return next((player_id for player_id, player in self.players.items()
+                         if player.full_name == player_key), None)
+        return player_key
+    
+    def add_atp_points(self, player_key: Union[int, str], points: int, week: Optional[int] = None) -> None:
         """
         Ajoute des points ATP à un joueur pour une semaine donnée
         
         Args:
-            player_name: Nom du joueur
+            player_key: Identifiant du joueur (ou nom complet)
             points: Points à ajouter
             week: Semaine (par défaut semaine courante)
         """
         if week is None:
             week = self.current_week
             
+        player_id = self._resolve_player_id(player_key)
+        week_col = f"week_{week}"
+        if player_id in self.atp_points_history.index and week_col in self.atp_points_history.columns:
+            self.atp_points_history.loc[player_id, week_col] += points
+            self._touch_week(week)
+    
+    def add_atp_points_batch(self, points_by_player: Dict[int, int], week: Optional[int] = None) -> None:
+        """
+        Ajoute en une seule opération les points ATP de plusieurs joueurs pour une semaine
+        
+        Args:
+            points_by_player: Points à ajouter par identifiant de joueur
+            week: Semaine (par défaut semaine courante)
+        """
+        if week is None:
+            week = self.current_week
+            
         week_col = f"week_{week}"
-        if player_name in self.atp_points_history.index and week_col in self.atp_points_history.columns:
-            self.atp_points_history.loc[player_name, week_col] += points
+        if week_col not in self.atp_points_history.columns:
+            return
+        player_ids = [player_id for player_id in points_by_player if player_id in self.atp_points_history.index]
+        if player_ids:
+            self.atp_points_history.loc[player_ids, week_col] += [points_by_player[player_id] for player_id in player_ids]
+            self._touch_week(week)
     
-    def get_points_to_defend(self, player_name: str, week: Optional[int] = None) -> int:
+    def get_points_to_defend(self, player_key: Union[int, str], week: Optional[int] = None) -> int:
         """
         Calcule les points que le joueur doit défendre cette semaine
         (points gagnés il y a exactement 52 semaines)
         
         Args:
-            player_name: Nom du joueur
+            player_key: Identifiant du joueur (ou nom complet)
             week: Semaine à vérifier (par défaut semaine courante)
             
         Returns:
@@ -182,28 +441,102 @@ class RankingManager:
         defend_week = ((week - 1 + TIME_CONSTANTS["WEEKS_PER_YEAR"]) % TIME_CONSTANTS["WEEKS_PER_YEAR"]) + 1
         defend_week_col = f"week_{defend_week}"
         
-        if player_name in self.atp_points_history.index and defend_week_col in self.atp_points_history.columns:
-            return int(self.atp_points_history.loc[player_name, defend_week_col])
+        player_id = self._resolve_player_id(player_key)
+        if player_id in self.atp_points_history.index and defend_week_col in self.atp_points_history.columns:
+            return int(self.atp_points_history.loc[player_id, defend_week_col])
         return 0
     
     def advance_week(self) -> None:
         """Avance d'une semaine et met à jour les points ATP en conséquence"""
         # Calcule les points qui expirent pour chaque joueur
-        for player_name, player in self.players.items():
-            points_to_lose = self.get_points_to_defend(player_name, self.current_week)
-            player.career.atp_points = max(0, player.career.atp_points - points_to_lose)
+        for player_id, player in self.players.items():
+            points_to_lose = self.get_points_to_defend(player_id, self.current_week)
+            if points_to_lose:
+                player.career.atp_points = max(0, player.career.atp_points - points_to_lose)
+                player.career.mark_dirty()
         
         # Marque les classements pour mise à jour après modification des points
         self.mark_rankings_for_update()
         
-        # Avance la semaine
+        # Avance la semaine (et l'année après la dernière semaine)
+        if self.current_week == TIME_CONSTANTS["WEEKS_PER_YEAR"]:
+            self.current_year += 1
         self.current_week = (self.current_week % TIME_CONSTANTS["WEEKS_PER_YEAR"]) + 1
         
         # Remet à zéro la colonne de la nouvelle semaine
-        week_col = f"week_{self.current_week}"
+        self.reset_week_points(self.current_week)
+
+    def reset_week_points(self, week: int) -> None:
+        """Remet à zéro les points gagnés une semaine donnée (points de l'année précédente expirés)"""
+        week_col = f"week_{week}"
         if week_col in self.atp_points_history.columns:
             self.atp_points_history[week_col] = 0
+            self._touch_week(week)
     
+    def get_ranking_page(self, ranking_type: RankingType = RankingType.ATP,
+                         start_rank: int = 1, count: Optional[int] = 50) -> List[Player]:
+        """
+        Retourne les joueurs classés du rang start_rank au rang start_rank + count - 1
+
+        Tranche O(k) de l'ordre conservé depuis la dernière mise à jour (pas de tri ni de cache).
+
+        Args:
+            ranking_type: Type de classement
+            start_rank: Rang de départ (1-based)
+            count: Nombre de joueurs (None = jusqu'à la fin)
+
+        Returns:
+            Liste des joueurs de la page
+        """
+        if self._rankings_need_update:
+            self._initialize_all_rankings()
+
+        return self._get_ranking_by_type(ranking_type).get_ranked_players(count, start_rank)
+
+    def get_filtered_ranking(self, ranking_type: RankingType = RankingType.ATP,
+                             country: Optional[str] = None, min_age: Optional[int] = None,
+                             max_age: Optional[int] = None, start_rank: int = 1,
+                             count: Optional[int] = 50) -> List[RankingEntry]:
+        """
+        Retourne les joueurs classés d'un pays et/ou d'une tranche d'âge
+
+        Le classement est parcouru dans l'ordre à partir de start_rank et le
+        parcours s'arrête dès que count joueurs correspondent.
+
+        Args:
+            ranking_type: Type de classement
+            country: Pays recherché (None = tous)
+            min_age: Âge minimum inclus (None = pas de limite)
+            max_age: Âge maximum inclus (None = pas de limite)
+            start_rank: Rang à partir duquel chercher (1-based)
+            count: Nombre maximal de joueurs (None = tous)
+
+        Returns:
+            Entrées avec le rang global de chaque joueur
+        """
+        if self._rankings_need_update:
+            self._initialize_all_rankings()
+
+        def matches(player: Player) -> bool:
+            age = player.career.age
+            return ((country is None or player.country == country)
+                    and (min_age is None or age >= min_age)
+                    and (max_age is None or age <= max_age))
+
+        ranking_obj = self._get_ranking_by_type(ranking_type)
+        return [RankingEntry(player, rank, self._get_ranking_points(player, ranking_type))
+                for rank, player in ranking_obj.get_filtered_page(matches, start_rank, count)]
+
+    def _get_ranking_points(self, player: Player, ranking_type: RankingType) -> int:
+        """Valeur qui détermine le classement d'un joueur (points, ELO ou note Glicko-2)"""
+        if ranking_type == RankingType.ATP:
+            return player.career.atp_points
+        elif ranking_type == RankingType.ATP_RACE:
+            return player.career.atp_race_points
+        elif ranking_type == RankingType.ELO:
+            return player.elo
+        return int(round(self.glicko_engine.get_rating(player.player_id)["rating"]))
+
     def display_ranking(self, ranking_type: RankingType = RankingType.ATP, 
                        count: Optional[int] = 50, 
                        start_rank: int = 1) -> None:
@@ -223,18 +556,12 @@ class RankingManager:
             print(f"📍 Affichage du rang {start_rank} à {start_rank + count - 1}")
         print("=" * 60)
         
-        ranking_obj = self._get_ranking_by_type(ranking_type)
-        # Récupérer plus de joueurs pour permettre l'affichage à partir du rang souhaité
-        total_players_needed = start_rank + count - 1
-        all_players = ranking_obj.get_ranked_players(total_players_needed)
+        players_to_display = self.get_ranking_page(ranking_type, start_rank, count)
         
         # Sélectionner seulement les joueurs dans la plage demandée
-        if start_rank > len(all_players):
+        if not players_to_display:
             print("❌ Rang de départ trop élevé - pas assez de joueurs dans le classement")
             return
-            
-        end_index = min(start_rank + count - 1, len(all_players))
-        players_to_display = all_players[start_rank - 1:end_index]
         
         for i, player in enumerate(players_to_display):
             rank = start_rank + i
@@ -247,5 +574,9 @@ class RankingManager:
             elif ranking_type == RankingType.ELO:
                 points = player.elo
                 points_label = "ELO"
+            elif ranking_type == RankingType.GLICKO:
+                glicko = self.glicko_engine.get_rating(player.player_id)
+                points = f"{glicko['rating']:.0f} ±{glicko['rd']:.0f}"
+                points_label = "Glicko-2"
             
             print(f"{rank}. {player.first_name} {player.last_name} - {points_label}: {points} - Pays: {player.country}")
@@ -0,0 +1,209 @@
+"""
+ELO dynamique - classements mis à jour par les résultats des matchs, tour par tour
+"""
+from array import array
+from typing import Dict, List, Optional, Tuple, Any
+
+import numpy as np
+
+from ..entities.player import Player
+from ..entities.tournament import MatchObserver, MatchResult, Tournament
+from ..utils.constants import ELO_CONSTANTS, TOURNAMENT_SURFACES
+from ..utils.serialization import encode_array, decode_array
+
+# Ligne 0: ELO général, puis une ligne par surface
+RATING_KEYS = ("General",) + tuple(TOURNAMENT_SURFACES.values())
+_ROW_INDEX = {key: row for row, key in enumerate(RATING_KEYS)}
+
+
+class ResultsEloEngine(MatchObserver):
+    """
+    ELO fondé sur les résultats, tenu à côté de l'ELO calculé depuis les statistiques
+
+    Les ELO sont stockés en colonnes (une par identifiant de joueur). Un
+    joueur vu pour la première fois part de son ELO statistique
+    (PlayerCareer.elo_ratings), puis chaque tour terminé met à jour l'ELO
+    général et l'ELO de la surface de tous ses joueurs en une seule
+    addition vectorisée. Les matchs d'un même tour sont simultanés: les
+    probabilités sont calculées avec les ELO d'avant le tour, donc le
+    résultat ne dépend pas de l'ordre des matchs.
+
+    Les identifiants des joueurs dont l'ELO change sont journalisés pour les
+    sauvegardes incrémentales.
+    """
+
+    # Entrées gardées dans le journal des joueurs modifiés (une position plus ancienne impose une sauvegarde complète)
+    DELTA_LOG_LIMIT = 100_000
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Args:
+            capacity: Nombre initial de colonnes (agrandi au besoin)
+        """
+        self._ratings = np.zeros((len(RATING_KEYS), capacity), dtype=np.float64)
+        self._matches = np.zeros(capacity, dtype=np.int32)
+        self._known = np.zeros(capacity, dtype=bool)
+        self._touched_log = array("i")  # Identifiants des joueurs modifiés, dans l'ordre
+        self._touched_count = 0  # Entrées journalisées depuis la création (ou le chargement)
+
+    @property
+    def capacity(self) -> int:
+        return self._known.shape[0]
+
+    def on_round_completed(self, tournament: Tournament, round_name: str,
+                           results: List[MatchResult], week: Optional[int]) -> None:
+        """Applique les matchs d'un tour (observateur des tournois)"""
+        if results:
+            self.apply_results(results, tournament.surface)
+
+    def apply_results(self, results: List[MatchResult], surface: Optional[str] = None) -> None:
+        """
+        Met à jour les ELO avec un lot de matchs simultanés
+
+        Args:
+            results: Matchs du lot
+            surface: Surface des matchs (ELO général seul si inconnue)
+        """
+        count = len(results)
+        winners = np.fromiter((result.winner.player_id for result in results), dtype=np.int64, count=count)
+        losers = np.fromiter((result.loser.player_id for result in results), dtype=np.int64, count=count)
+        self._ensure_capacity(max(winners.max(), losers.max()))
+        for result in results:
+            for player in (result.winner, result.loser):
+                if not self._known[player.player_id]:
+                    self.register_player(player)
+
+        rows = [_ROW_INDEX["General"]]
+        if surface in _ROW_INDEX:
+            rows.append(_ROW_INDEX[surface])
+
+        winner_k = self._k_factors(winners)
+        loser_k = self._k_factors(losers)
+        for row in rows:
+            ratings = self._ratings[row]
+            expected = 1.0 / (1.0 + 10.0 ** ((ratings[losers] - ratings[winners]) / ELO_CONSTANTS["RATING_SCALE"]))
+            # Addition dispersée: un joueur peut jouer plusieurs matchs du lot (poules)
+            np.add.at(ratings, winners, winner_k * (1.0 - expected))
+            np.add.at(ratings, losers, -loser_k * (1.0 - expected))
+
+        np.add.at(self._matches, winners, 1)
+        np.add.at(self._matches, losers, 1)
+        self._touch(winners)
+        self._touch(losers)
+
+    def register_player(self, player: Player) -> None:
+        """Initialise les ELO d'un joueur depuis son ELO statistique"""
+        self._ensure_capacity(player.player_id)
+        for row, key in enumerate(RATING_KEYS):
+            self._ratings[row, player.player_id] = player.get_elo(None if key == "General" else key)
+        self._known[player.player_id] = True
+        self._touch(np.array([player.player_id]))
+
+    def get_rating(self, player_id: int, surface: Optional[str] = None) -> Optional[int]:
+        """
+        ELO d'un joueur
+
+        Args:
+            player_id: Identifiant du joueur
+            surface: Surface (ELO général si None)
+
+        Returns:
+            ELO arrondi, None si le joueur n'a jamais joué
+        """
+        if player_id >= self.capacity or not self._known[player_id]:
+            return None
+        return int(round(self._ratings[_ROW_INDEX[surface or "General"], player_id]))
+
+    def get_top(self, limit: int = 10, surface: Optional[str] = None) -> List[Tuple[int, int]]:
+        """
+        Meilleurs ELO
+
+        Returns:
+            Liste de (identifiant, ELO) par ELO décroissant
+        """
+        known = np.flatnonzero(self._known)
+        if not len(known) or limit <= 0:
+            return []
+        ratings = self._ratings[_ROW_INDEX[surface or "General"], known]
+        limit = min(limit, len(known))
+        top = np.argpartition(ratings, -limit)[-limit:]
+        top = top[np.argsort(-ratings[top], kind="stable")]
+        return [(int(known[index]), int(round(ratings[index]))) for index in top]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit les ELO en colonnes encodées pour la sauvegarde"""
+        player_ids = np.flatnonzero(self._known).astype(np.int32)
+        return {
+            "player_ids": encode_array(player_ids),
+            "matches": encode_array(self._matches[player_ids]),
+            "ratings": {key: encode_array(self._ratings[row, player_ids]) for row, key in enumerate(RATING_KEYS)}
+        }
+
+    def save_cursor(self) -> int:
+        """Position de sauvegarde (nombre d'entrées du journal des joueurs modifiés)"""
+        return self._touched_count
+
+    def to_delta_dict(self, cursor: int) -> Optional[Dict[str, Any]]:
+        """
+        ELO des joueurs modifiés depuis une position de sauvegarde
+
+        Args:
+            cursor: Position retournée par save_cursor
+
+        Returns:
+            Dictionnaire delta (format de to_dict restreint à ces joueurs),
+            None si le journal ne remonte plus jusqu'à la position (sauvegarde complète)
+        """
+        missing = self._touched_count - cursor
+        if missing > len(self._touched_log):
+            return None
+        player_ids = np.unique(np.frombuffer(self._touched_log, dtype=np.int32)[len(self._touched_log) - missing:])
+        return {
+            "player_ids": encode_array(player_ids),
+            "matches": encode_array(self._matches[player_ids]),
+            "ratings": {key: encode_array(self._ratings[row, player_ids]) for row, key in enumerate(RATING_KEYS)}
+        }
+
+    def apply_delta(self, delta: Dict[str, Any]) -> None:
+        """Remplace les ELO des joueurs d'un delta produit par to_delta_dict"""
+        player_ids = decode_array(delta["player_ids"]).astype(np.int64)
+        if not len(player_ids):
+            return
+        self._ensure_capacity(player_ids.max())
+        self._known[player_ids] = True
+        self._matches[player_ids] = decode_array(delta["matches"])
+        for row, key in enumerate(RATING_KEYS):
+            self._ratings[row, player_ids] = decode_array(delta["ratings"][key])
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ResultsEloEngine':
+        """Recrée les ELO depuis to_dict"""
+        player_ids = decode_array(data["player_ids"]).astype(np.int64)
+        engine = cls(capacity=int(player_ids.max()) + 1 if len(player_ids) else 1024)
+        engine._known[player_ids] = True
+        engine._matches[player_ids] = decode_array(data["matches"])
+        for row, key in enumerate(RATING_KEYS):
+            if key in data["ratings"]:
+                engine._ratings[row, player_ids] = decode_array(data["ratings"][key])
+        return engine
+
+    def _touch(self, player_ids: np.ndarray) -> None:
+        """Journalise les joueurs dont l'ELO vient de changer"""
+        self._touched_log.frombytes(np.asarray(player_ids, dtype=np.int32).tobytes())
+        self._touched_count += len(player_ids)
+        if len(self._touched_log) > 2 * self.DELTA_LOG_LIMIT:
+            del self._touched_log[:len(self._touched_log) - self.DELTA_LOG_LIMIT]
+
+    def _k_factors(self, player_ids: np.ndarray) -> np.ndarray:
+        """Facteur K de chaque joueur (provisoire tant qu'il a peu de matchs)"""
+        return np.where(self._matches[player_ids] < ELO_CONSTANTS["PROVISIONAL_MATCHES"],
+                        ELO_CONSTANTS["PROVISIONAL_K_FACTOR"], ELO_CONSTANTS["K_FACTOR"]).astype(np.float64)
+
+    def _ensure_capacity(self, player_id: int) -> None:
+        """Agrandit les tableaux pour contenir la colonne player_id"""
+        if player_id < self.capacity:
+            return
+        extra = max(int(player_id) + 1, self.capacity * 2) - self.capacity
+        self._ratings = np.pad(self._ratings, ((0, 0), (0, extra)))
+        self._matches = np.pad(self._matches, (0, extra))
+        self._known = np.pad(self._known, (0, extra))
@@ -0,0 +1,240 @@
+"""
+Historique des retraites - stockage en colonnes indexé par année
+"""
+from typing import Dict, List, Iterable, Iterator, Optional, Any, Union
+
+import numpy as np
+
+from ..utils.serialization import encode_array, decode_array
+
+
+class RetirementArchive:
+    """
+    Historique des retraites stocké en colonnes
+
+    Remplace la liste de dictionnaires de RetirementManager tout en gardant une
+    interface de liste (append, len, itération, indexation renvoyant des
+    dictionnaires). Les retraites sont indexées par année et les agrégats
+    annuels (nombre, âges, pays) sont tenus à jour à chaque ajout, ce qui rend
+    get_stats(year) indépendant de la taille de l'historique.
+    """
+
+    _INITIAL_CAPACITY = 256
+    _UNKNOWN_YEAR = "Unknown"
+    _UNKNOWN_RANKING = "N/A"
+
+    def __init__(self, entries: Iterable[Dict] = ()):
+        """
+        Initialise l'archive
+
+        Args:
+            entries: Retraites initiales au format dictionnaire (optionnel)
+        """
+        self._size = 0
+        self._ages = np.zeros(self._INITIAL_CAPACITY, dtype=np.int16)
+        self._rankings = np.zeros(self._INITIAL_CAPACITY, dtype=np.int32)  # 0 = non classé
+        self._years = np.zeros(self._INITIAL_CAPACITY, dtype=np.int32)  # 0 = année inconnue
+        self._country_codes = np.zeros(self._INITIAL_CAPACITY, dtype=np.int16)
+        self._names: List[str] = []
+        self._countries: List[str] = []  # Table des pays (code -> nom)
+        self._country_lookup: Dict[str, int] = {}
+
+        # Index et agrégats
+        self._year_rows: Dict[int, List[int]] = {}
+        self._year_stats: Dict[int, Dict[str, Any]] = {}
+        self._overall_stats: Dict[str, Any] = self._empty_stats()
+
+        self.extend(entries)
+
+    # ------------------------------------------------------------------
+    # Interface de liste
+    # ------------------------------------------------------------------
+    def append(self, entry: Dict) -> None:
+        """
+        Ajoute une retraite
+
+        Args:
+            entry: Dictionnaire avec player_name, age, ranking, year, country
+        """
+        if self._size == len(self._ages):
+            self._grow()
+
+        row = self._size
+        year = entry.get("year")
+        year_code = year if isinstance(year, int) else 0
+        ranking = entry.get("ranking")
+        country = entry.get("country", "")
+
+        self._names.append(entry.get("player_name", ""))
+        self._ages[row] = entry.get("age", 0)
+        self._rankings[row] = ranking if isinstance(ranking, int) else 0
+        self._years[row] = year_code
+        self._country_codes[row] = self._get_country_code(country)
+        self._size += 1
+
+        # Index par année et agrégats précalculés
+        self._year_rows.setdefault(year_code, []).append(row)
+        if year_code not in self._year_stats:
+            self._year_stats[year_code] = self._empty_stats()
+        self._add_to_stats(self._year_stats[year_code], int(self._ages[row]), country)
+        self._add_to_stats(self._overall_stats, int(self._ages[row]), country)
+
+    def extend(self, entries: Iterable[Dict]) -> None:
+        """Ajoute plusieurs retraites"""
+        for entry in entries:
+            self.append(entry)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Dict]:
+        for row in range(self._size):
+            yield self._row_to_dict(row)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict, List[Dict]]:
+        if isinstance(index, slice):
+            return [self._row_to_dict(row) for row in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Index de retraite hors limites")
+        return self._row_to_dict(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (RetirementArchive, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"RetirementArchive({self._size} retraites, {len(self.get_years())} années)"
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+    def get_stats(self, year: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Retourne les statistiques des retraites (format de get_retirement_stats)
+
+        Args:
+            year: Année ciblée (toutes les années si None)
+
+        Returns:
+            Dictionnaire des statistiques, vide s'il n'y a aucune retraite
+        """
+        stats = self._overall_stats if year is None else self._year_stats.get(year)
+        if not stats or stats["count"] == 0:
+            return {}
+
+        return {
+            "total_retirements": stats["count"],
+            "average_retirement_age": stats["age_sum"] / stats["count"],
+            "youngest_retiree": stats["min_age"],
+            "oldest_retiree": stats["max_age"],
+            "countries": list(stats["countries"].keys())
+        }
+
+    def get_year_entries(self, year: int) -> List[Dict]:
+        """Retourne les retraites d'une année via l'index"""
+        return [self._row_to_dict(row) for row in self._year_rows.get(year, [])]
+
+    def get_years(self) -> List[int]:
+        """Retourne les années connues, triées"""
+        return sorted(year for year in self._year_rows if year != 0)
+
+    # ------------------------------------------------------------------
+    # Sérialisation
+    # ------------------------------------------------------------------
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit l'archive en dictionnaire compact (colonnes encodées)"""
+        size = self._size
+        return {
+            "format": "columnar",
+            "names": list(self._names),
+            "countries": list(self._countries),
+            "ages": encode_array(self._ages[:size]),
+            "rankings": encode_array(self._rankings[:size]),
+            "years": encode_array(self._years[:size]),
+            "country_codes": encode_array(self._country_codes[:size])
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RetirementArchive':
+        """Recrée l'archive depuis to_dict"""
+        archive = cls()
+        countries = data.get("countries", [])
+        ages = decode_array(data["ages"])
+        rankings = decode_array(data["rankings"])
+        years = decode_array(data["years"])
+        country_codes = decode_array(data["country_codes"])
+
+        for row, name in enumerate(data.get("names", [])):
+            archive.append({
+                "player_name": name,
+                "age": int(ages[row]),
+                "ranking": int(rankings[row]) or cls._UNKNOWN_RANKING,
+                "year": int(years[row]) or cls._UNKNOWN_YEAR,
+                "country": countries[country_codes[row]] if countries else ""
+            })
+        return archive
+
+    @classmethod
+    def from_saved(cls, value: Any) -> 'RetirementArchive':
+        """
+        Convertit un historique sauvegardé (archive, format colonnes ou ancienne liste)
+
+        Args:
+            value: Valeur lue dans une sauvegarde
+
+        Returns:
+            Archive des retraites
+        """
+        if isinstance(value, RetirementArchive):
+            return value
+        if isinstance(value, dict):
+            return cls.from_dict(value)
+        return cls(value or [])
+
+    # ------------------------------------------------------------------
+    # Interne
+    # ------------------------------------------------------------------
+    def _grow(self) -> None:
+        """Double la capacité des colonnes"""
+        new_capacity = len(self._ages) * 2
+        for attr in ("_ages", "_rankings", "_years", "_country_codes"):
+            column = getattr(self, attr)
+            grown = np.zeros(new_capacity, dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, attr, grown)
+
+    def _get_country_code(self, country: str) -> int:
+        """Retourne le code d'un pays, en l'ajoutant à la table si besoin"""
+        code = self._country_lookup.get(country)
+        if code is None:
+            code = len(self._countries)
+            self._countries.append(country)
+            self._country_lookup[country] = code
+        return code
+
+    def _row_to_dict(self, row: int) -> Dict:
+        """Reconstruit le dictionnaire d'une retraite"""
+        return {
+            "player_name": self._names[row],
+            "age": int(self._ages[row]),
+            "ranking": int(self._rankings[row]) or self._UNKNOWN_RANKING,
+            "year": int(self._years[row]) or self._UNKNOWN_YEAR,
+            "country": self._countries[self._country_codes[row]]
+        }
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        """Agrégats vides"""
+        return {"count": 0, "age_sum": 0, "min_age": None, "max_age": None, "countries": {}}
+
+    @staticmethod
+    def _add_to_stats(stats: Dict[str, Any], age: int, country: str) -> None:
+        """Met à jour des agrégats avec une nouvelle retraite"""
+        stats["count"] += 1
+        stats["age_sum"] += age
+        stats["min_age"] = age if stats["min_age"] is None else min(stats["min_age"], age)
+        stats["max_age"] = age if stats["max_age"] is None else max(stats["max_age"], age)
+        stats["countries"][country] = stats["countries"].get(country, 0) + 1
@@ -2,21 +2,39 @@
 Gestionnaire des retraites et rotation des joueurs
 """
 import random
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Optional
+import numpy as np
+
 from ..entities.player import Player, Gender
 from ..managers.player_generator import PlayerGenerator
-from ..utils.helpers import should_player_retire
+from ..managers.retirement_archive import RetirementArchive
+from ..managers.player_archive import RetiredPlayerArchive
+from ..utils.helpers import calculate_retirement_probabilities
 from ..utils.constants import RETIREMENT_CONSTANTS
+from ..utils.profiler import profile_phase
 
 
 class RetirementManager:
     """Gestionnaire des retraites et de la rotation du pool de joueurs"""
     
-    def __init__(self, player_generator: PlayerGenerator = None):
+    def __init__(self, player_generator: PlayerGenerator = None,
+                 player_archive: Optional[RetiredPlayerArchive] = None):
         self.player_generator = player_generator or PlayerGenerator()
-        self.retirement_log: List[Dict] = []  # Historique des retraites
+        self.player_archive = player_archive  # Archive froide des retraités (optionnelle)
+        self._retirement_log = RetirementArchive()  # Historique des retraites (colonnes indexées par année)
+
+    @property
+    def retirement_log(self) -> RetirementArchive:
+        """Historique des retraites (interface de liste de dictionnaires)"""
+        return self._retirement_log
+
+    @retirement_log.setter
+    def retirement_log(self, value) -> None:
+        """Accepte une archive, son format sauvegardé ou une ancienne liste de dictionnaires"""
+        self._retirement_log = RetirementArchive.from_saved(value)
         
-    def process_end_of_season_retirements(self, all_players: Dict[str, Player], 
+    @profile_phase("retirements")
+    def process_end_of_season_retirements(self, all_players: Dict[int, Player], 
                                         ranking_manager=None, year: int = None, main_player_gender: Gender = None) -> Tuple[List[Player], List[Player]]:
         """
         Traite les retraites en fin de saison et génère les remplaçants
@@ -37,9 +55,9 @@ class RetirementManager:
         print("=" * 50)
         
         # Sépare les joueurs par genre pour maintenir l'équilibre
-        male_players = {name: player for name, player in all_players.items() 
+        male_players = {player.player_id: player for player in all_players.values() 
                        if player.gender == Gender.MALE and not player.is_main_player}
-        female_players = {name: player for name, player in all_players.items() 
+        female_players = {player.player_id: player for player in all_players.values() 
                          if player.gender == Gender.FEMALE and not player.is_main_player}
         
         # Détermine le genre pour les nouveaux joueurs (celui du joueur principal si spécifié)
@@ -54,31 +72,35 @@ class RetirementManager:
             new_players.extend(gender_new)
         
         # Met à jour le pool de joueurs
-        self._update_player_pool(all_players, retired_players, new_players)
+        self._update_player_pool(all_players, retired_players, new_players, ranking_manager, year)
         
         # Affiche le résumé
         self._display_retirement_summary(retired_players, new_players, year, ranking_manager)
         
         return retired_players, new_players
     
-    def _process_gender_retirements(self, gender_pool: Dict[str, Player], gender: Gender, 
+    def _process_gender_retirements(self, gender_pool: Dict[int, Player], gender: Gender, 
                                   ranking_manager=None, year: int = None, replacement_gender: Gender = None) -> Tuple[List[Player], List[Player]]:
         """Traite les retraites pour un genre spécifique"""
         retired_players = []
         new_players = []
         
+        players = list(gender_pool.values())
+        
         # Vieillit tous les joueurs d'un an
-        self._age_players(gender_pool.values())
+        ages = self._age_players(players)
         
-        # Détermine qui prend sa retraite
-        for player_name, player in gender_pool.items():
-            ranking_position = None
-            if ranking_manager:
-                ranking_position = ranking_manager.get_player_rank(player)
-            
-            if should_player_retire(player, ranking_position):
-                retired_players.append(player)
-                self._log_retirement(player, ranking_position, year)
+        # Détermine qui prend sa retraite: probabilités calculées sur tout le pool
+        # puis un seul tirage de Bernoulli vectorisé
+        ranks = ranking_manager.get_player_ranks(players) if ranking_manager else None
+        probabilities = calculate_retirement_probabilities(ages, ranks)
+        retire_mask = np.random.random(len(players)) < probabilities
+        
+        for index in np.flatnonzero(retire_mask):
+            player = players[index]
+            ranking_position = int(ranks[index]) if ranks is not None and ranks[index] > 0 else None
+            retired_players.append(player)
+            self._log_retirement(player, ranking_position, year)
         
         # Génère de nouveaux joueurs pour remplacer les retraités
         if retired_players:
@@ -95,15 +117,30 @@ class RetirementManager:
                 )
                 new_player = self.player_generator.generate_player(final_gender, level_range=(1, 5))
                 new_player.career.age = young_age
+                new_player.career.mark_dirty()
                 new_players.append(new_player)
         
         return retired_players, new_players
     
-    def _age_players(self, players: List[Player]) -> None:
-        """Vieillit tous les joueurs d'un an"""
-        for player in players:
-            if hasattr(player, 'career') and hasattr(player.career, 'age'):
-                player.career.age += 1
+    def _age_players(self, players: List[Player]) -> np.ndarray:
+        """
+        Vieillit tous les joueurs d'un an
+        
+        L'âge reste un attribut de PlayerCareer (source de vérité, sauvegardée
+        avec le joueur): une colonne numpy parallèle devrait être resynchronisée
+        à chaque ajout, retraite ou chargement. Le passage une fois par an est
+        une simple écriture d'attribut par joueur; les décisions de retraite
+        travaillent ensuite sur le tableau retourné.
+        
+        Returns:
+            Tableau des nouveaux âges, dans l'ordre de la liste
+        """
+        ages = np.fromiter((player.career.age for player in players), dtype=np.int32, count=len(players)) + 1
+        for player, age in zip(players, ages.tolist()):
+            career = player.career
+            career.age = age
+            career.mark_dirty()
+        return ages
     
     def _log_retirement(self, player: Player, ranking_position: int = None, year: int = None) -> None:
         """Enregistre une retraite dans l'historique"""
@@ -116,24 +153,26 @@ class RetirementManager:
         }
         self.retirement_log.append(retirement_entry)
     
-    def _update_player_pool(self, all_players: Dict[str, Player], 
-                           retired_players: List[Player], new_players: List[Player]) -> None:
+    def _update_player_pool(self, all_players: Dict[int, Player], 
+                           retired_players: List[Player], new_players: List[Player],
+                           ranking_manager=None, year: int = None) -> None:
         """Met à jour le pool de joueurs en retirant les retraités et ajoutant les nouveaux"""
+        # Archive les retraités avant de les retirer du pool actif
+        if self.player_archive is not None and retired_players:
+            final_ranks = {}
+            if ranking_manager:
+                ranks = ranking_manager.get_player_ranks(retired_players)
+                final_ranks = {player.player_id: int(rank)
+                               for player, rank in zip(retired_players, ranks) if rank > 0}
+            self.player_archive.archive_players(retired_players, year, final_ranks)
+        
         # Retire les joueurs retraités
         for retired_player in retired_players:
-            if retired_player.full_name in all_players:
-                del all_players[retired_player.full_name]
+            all_players.pop(retired_player.player_id, None)
         
-        # Ajoute les nouveaux joueurs
+        # Ajoute les nouveaux joueurs (l'identifiant est unique, deux homonymes ne se remplacent pas)
         for new_player in new_players:
-            # Assure que le nom est unique
-            original_name = new_player.full_name
-            counter = 1
-            while new_player.full_name in all_players:
-                new_player.first_name = f"{original_name} {counter}"
-                counter += 1
-            
-            all_players[new_player.full_name] = new_player
+            all_players[new_player.player_id] = new_player
     
     def _display_retirement_summary(self, retired_players: List[Player], 
                                    new_players: List[Player], year: int = None, 
@@ -233,27 +272,12 @@ class RetirementManager:
             print(f"   • Pays représentés: {len(countries)}")
     
     def get_retirement_stats(self, year: int = None) -> Dict:
-        """Retourne des statistiques sur les retraites"""
-        if year:
-            year_retirements = [r for r in self.retirement_log if r["year"] == year]
-        else:
-            year_retirements = self.retirement_log
-        
-        if not year_retirements:
-            return {}
-        
-        ages = [r["age"] for r in year_retirements]
-        
-        return {
-            "total_retirements": len(year_retirements),
-            "average_retirement_age": sum(ages) / len(ages),
-            "youngest_retiree": min(ages),
-            "oldest_retiree": max(ages),
-            "countries": list(set(r["country"] for r in year_retirements))
-        }
+        """Retourne des statistiques sur les retraites (agrégats annuels précalculés)"""
+        return self.retirement_log.get_stats(year or None)
     
     def force_aging_simulation(self, all_players: Dict[str, Player], years: int = 1) -> None:
         """Force le vieillissement des joueurs (utile pour les simulations préliminaires)"""
         for player in all_players.values():
             if hasattr(player, 'career') and hasattr(player.career, 'age'):
-                player.career.age += years
\ No newline at end of file
+                player.career.age += years
+                player.career.mark_dirty()
\ No newline at end of file
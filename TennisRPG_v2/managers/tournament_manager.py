@@ -4,16 +4,81 @@ Gestionnaire de tournois - utilise la base de données existante
 from typing import List, Dict
 import random
 
-from ..data.tournaments_database import tournois
-from ..entities.tournament import Tournament
+import numpy as np
+
+from ..data.calendar import CALENDAR, SeasonCalendar
+from ..entities.tournament import Tournament, TournamentSpec, TournamentResult, MatchObserver
 from ..utils.helpers import get_participation_rate
+from ..utils.profiler import profile_phase
 
 
 class TournamentManager:
     """Gestionnaire pour les tournois du calendrier"""
     
-    def __init__(self):
-        self.tournament_database = tournois
+    def __init__(self, calendar: SeasonCalendar = CALENDAR):
+        """
+        Args:
+            calendar: Calendrier compilé (partagé, immuable)
+        """
+        # Calendrier compilé: recherches par tableaux et index
+        self.calendar = calendar
+        # Instances jouées par cette partie, créées à la demande et réutilisées d'une semaine à l'autre
+        self._runs: Dict[int, Tournament] = {}
+        self.match_observers: List[MatchObserver] = []  # Journal des matchs, statistiques...
+
+    @property
+    def tournament_database(self) -> Dict[int, List[TournamentSpec]]:
+        """
+        Descriptions des tournois du calendrier par semaine
+
+        Ne crée aucune instance: les runs ne sont créés qu'à la demande
+        (get_tournaments_for_week, get_run).
+        """
+        specs = self.calendar.specs
+        return {week: [specs[tournament_id] for tournament_id in self.calendar.week_ids(week).tolist()]
+                for week in np.unique(self.calendar.weeks).tolist()}
+
+    @property
+    def runs(self) -> List[Tournament]:
+        """Instances déjà créées par cette partie"""
+        return list(self._runs.values())
+
+    def get_run(self, tournament_id: int) -> Tournament:
+        """
+        Retourne l'instance de cette partie pour un tournoi du calendrier
+
+        L'instance est créée depuis sa description au premier appel, puis
+        recyclée: un tournoi n'a lieu qu'une fois par semaine.
+
+        Args:
+            tournament_id: Identifiant du tournoi dans le calendrier
+
+        Returns:
+            Tournoi jouable propre à cette partie
+        """
+        run = self._runs.get(tournament_id)
+        if run is None:
+            run = self._runs[tournament_id] = self.calendar.specs[tournament_id].create_run()
+        return run
+    
+    def play_tournament(self, tournament: Tournament, **kwargs) -> TournamentResult:
+        """
+        Joue un tournoi en notifiant les observateurs de matchs du gestionnaire
+        
+        Les observateurs ne sont attachés au tournoi que le temps de le jouer.
+        
+        Args:
+            tournament: Tournoi à jouer
+            **kwargs: Arguments de Tournament.play_tournament
+            
+        Returns:
+            Résultat du tournoi
+        """
+        tournament.match_observers = self.match_observers
+        try:
+            return tournament.play_tournament(**kwargs)
+        finally:
+            tournament.match_observers = []
     
     def get_tournaments_for_week(self, week: int) -> List[Tournament]:
         """
@@ -25,10 +90,7 @@ class TournamentManager:
         Returns:
             Liste des tournois disponibles
         """
-        if week not in self.tournament_database:
-            return []
-        
-        return list(self.tournament_database[week])
+        return [self.get_run(tournament_id) for tournament_id in self.calendar.week_ids(week)]
     
     def get_tournaments_for_player(self, week: int, player, ranking_manager=None) -> List[Tournament]:
         """
@@ -57,8 +119,9 @@ class TournamentManager:
         
         return eligible_tournaments
     
+    @profile_phase("draw_selection")
     def select_players_for_tournament(self, tournament: Tournament, 
-                                    all_players: Dict[str, 'Player'], 
+                                    all_players: Dict[int, 'Player'], 
                                     ranking_manager=None) -> List['Player']:
         """
         Sélectionne les joueurs qui participeront au tournoi
@@ -111,13 +174,14 @@ class TournamentManager:
         if len(selected) < tournament.num_players:
             # Prend les meilleurs joueurs restants pour compléter
             remaining_needed = tournament.num_players - len(selected)
-            remaining_players = [p for p in all_eligible if p not in selected]
+            selected_ids = {p.player_id for p in selected}
+            remaining_players = [p for p in all_eligible if p.player_id not in selected_ids]
             selected.extend(remaining_players[:remaining_needed])
         
         return selected
     
     def _select_atp_finals_participants(self, tournament: Tournament, 
-                                      all_players: Dict[str, 'Player'], 
+                                      all_players: Dict[int, 'Player'], 
                                       ranking_manager=None) -> List['Player']:
         """
         Sélection spéciale pour l'ATP Finals - garantit exactement 8 participants
@@ -205,7 +269,8 @@ class TournamentManager:
         
         return random.random() < final_probability
     
-    def simulate_week_tournaments(self, week: int, all_players: Dict[str, 'Player'], 
+    @profile_phase("week_tournaments")
+    def simulate_week_tournaments(self, week: int, all_players: Dict[int, 'Player'], 
                                 ranking_manager=None, atp_points_manager=None) -> Dict[Tournament, 'TournamentResult']:
         """
         Simule tous les tournois d'une semaine
@@ -218,15 +283,15 @@ class TournamentManager:
         Returns:
             Dictionnaire des résultats par tournoi
         """
-        tournaments = self.get_tournaments_for_week(week)
         results = {}
         
-        # CRUCIAL: Trie les tournois par prestige décroissant
+        # CRUCIAL: Tournois par prestige décroissant (ordre précalculé par le calendrier)
         # Les meilleurs joueurs vont d'abord aux tournois les plus prestigieux
-        sorted_tournaments = sorted(tournaments, key=lambda t: t.tournament_importance, reverse=True)
+        sorted_tournaments = [self.get_run(tournament_id)
+                              for tournament_id in self.calendar.week_ids(week, by_importance=True)]
         
-        # Pool de joueurs disponibles (copie pour éviter de modifier l'original)
-        available_players = dict(all_players)
+        # Pool de joueurs disponibles, indexé par identifiant (copie pour éviter de modifier l'original)
+        available_players = {player.player_id: player for player in all_players.values()}
         
         for tournament in sorted_tournaments:
             # Sélectionne les participants parmi les joueurs encore disponibles
@@ -240,13 +305,12 @@ class TournamentManager:
             
             # Joue le tournoi (verbose seulement si joueur principal présent)
             if len(tournament.participants) >= 4:  # Minimum pour un tournoi
-                result = tournament.play_tournament(atp_points_manager=atp_points_manager, week=week)
+                result = self.play_tournament(tournament, atp_points_manager=atp_points_manager, week=week)
                 results[tournament] = result
             
             # CRUCIAL: Retire les participants du pool disponible
             for participant in participants:
-                if participant.full_name in available_players:
-                    del available_players[participant.full_name]
+                available_players.pop(participant.player_id, None)
             
             # Nettoie pour le prochain tournoi potentiel
             tournament.participants.clear()
@@ -266,19 +330,10 @@ class TournamentManager:
         Returns:
             Le tournoi trouvé ou None
         """
-        if week:
-            tournaments = self.get_tournaments_for_week(week)
-            for tournament in tournaments:
-                if tournament.name == name:
-                    return tournament
-        else:
-            # Cherche dans toutes les semaines
-            for week_tournaments in self.tournament_database.values():
-                for tournament in week_tournaments:
-                    if tournament.name == name:
-                        return tournament
-        
-        return None
+        tournament_id = self.calendar.find(name)
+        if tournament_id is None or (week and self.calendar.weeks[tournament_id] != week):
+            return None
+        return self.get_run(tournament_id)
     
     def get_tournament_calendar_summary(self) -> Dict[str, List[str]]:
         """
@@ -288,7 +343,7 @@ class TournamentManager:
             Dictionnaire semaine -> liste des noms de tournois
         """
         calendar = {}
-        for week, tournaments in self.tournament_database.items():
-            calendar[f"Semaine {week}"] = [t.name for t in tournaments]
+        for week in np.unique(self.calendar.weeks).tolist():
+            calendar[f"Semaine {week}"] = [self.calendar.names[i] for i in self.calendar.week_ids(week)]
         
         return calendar
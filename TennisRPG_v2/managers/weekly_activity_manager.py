@@ -5,16 +5,16 @@ import random
 from typing import Dict, List, Optional
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 from ..data.tournaments_data import TournamentCategory
-from ..entities.player import Player
+from ..entities.player import Player, apply_fatigue_changes, gain_experience_batch
 from ..entities.tournament import Tournament
 from ..managers.tournament_manager import TournamentManager
 from ..managers.ranking_manager import RankingManager
-from ..utils.constants import ACTIVITIES, TIME_CONSTANTS, BASE_TRAINING_XP
+from ..utils.constants import ACTIVITIES, TIME_CONSTANTS, BASE_TRAINING_XP, FATIGUE_VALUES
 from ..utils.helpers import get_round_display_name
-
-
-# from ..utils.constants import FATIGUE_VALUES  # TODO: Supprimé - fatigue gérée dans Player
+from ..utils.profiler import profile_phase
 
 
 class ActivityResult:
@@ -186,8 +186,9 @@ class WeeklyActivityManager:
             else:
                 print("❌ Choix invalide, veuillez réessayer")
     
+    @profile_phase("activity_week")
     def execute_activity(self, player: Player, activity: Activity, week: int, 
-                        all_players: Dict[str, Player], atp_points_manager=None) -> ActivityResult:
+                        all_players: Dict[int, Player], atp_points_manager=None) -> ActivityResult:
         """Exécute une activité choisie"""
         
         if isinstance(activity, TournamentActivity):
@@ -203,12 +204,12 @@ class WeeklyActivityManager:
             return result
     
     def _execute_tournament_activity(self, player: Player, tournament_activity: TournamentActivity,
-                                   week: int, all_players: Dict[str, Player], atp_points_manager) -> ActivityResult:
+                                   week: int, all_players: Dict[int, Player], atp_points_manager) -> ActivityResult:
         """Exécute la participation à un tournoi"""
         tournament = tournament_activity.tournament
         
         # Sélectionne les autres participants
-        available_players = {name: p for name, p in all_players.items() 
+        available_players = {p.player_id: p for p in all_players.values() 
                            if p != player and p.gender == player.gender}
         
         participants = self.tournament_manager.select_players_for_tournament(
@@ -216,15 +217,7 @@ class WeeklyActivityManager:
         )
 
         # Vérifie si le joueur principal est déjà dans les participants
-        # Utilise une comparaison robuste basée sur les attributs uniques
-        player_already_in = any(
-            p.first_name == player.first_name and 
-            p.last_name == player.last_name and 
-            p.country == player.country 
-            for p in participants
-        )
-        
-        if player_already_in:
+        if player.player_id in {p.player_id for p in participants}:
             # Le joueur est déjà qualifié automatiquement, pas besoin de l'ajouter
             pass
         else:
@@ -261,7 +254,9 @@ class WeeklyActivityManager:
             tournament.add_participant(participant)
         
         # Joue le tournoi (verbose car joueur principal présent)
-        tournament_result = tournament.play_tournament(verbose=True, atp_points_manager=atp_points_manager, week=week)
+        tournament_result = self.tournament_manager.play_tournament(
+            tournament, verbose=True, atp_points_manager=atp_points_manager, week=week
+        )
         
         # Simule les autres tournois de la semaine
         other_tournaments = [t for t in self.tournament_manager.get_tournaments_for_week(week) 
@@ -310,11 +305,11 @@ class WeeklyActivityManager:
             else:
                 print("❌ Choix invalide, veuillez réessayer")
     
-    def _simulate_other_tournaments(self, player: Player, week: int, all_players: Dict[str, Player], atp_points_manager=None) -> None:
+    def _simulate_other_tournaments(self, player: Player, week: int, all_players: Dict[int, Player], atp_points_manager=None) -> None:
         """Simule les autres tournois de la semaine (sans le joueur principal)"""
         tournaments = self.tournament_manager.get_tournaments_for_week(week)
 
-        available_players = {name: p for name, p in all_players.items() 
+        available_players = {p.player_id: p for p in all_players.values() 
                            if p != player and p.gender == player.gender}
 
         self._simulate_tournaments_list(tournaments, available_players, atp_points_manager=atp_points_manager, week=week)
@@ -322,16 +317,18 @@ class WeeklyActivityManager:
         # Met à jour les classements
         self.ranking_manager.update_weekly_rankings()
 
+    @profile_phase("activity_tournaments")
     def _simulate_tournaments_list(self, tournaments: List[Tournament], 
-                                 available_players: Dict[str, Player], 
+                                 available_players: Dict[int, Player], 
                                  exclude_players: List[Player] = None, atp_points_manager=None, week: int = None) -> None:
         """Simule une liste de tournois"""
         if exclude_players is None:
             exclude_players = []
         
-        # Retire les joueurs exclus du pool disponible
-        available_pool = {name: p for name, p in available_players.items() 
-                         if p not in exclude_players}
+        # Retire les joueurs exclus du pool disponible (pool indexé par identifiant)
+        excluded_ids = {p.player_id for p in exclude_players}
+        available_pool = {p.player_id: p for p in available_players.values() 
+                         if p.player_id not in excluded_ids}
         
         # Trie par ordre d'importance décroissant (plus prestigieux d'abord)
         sorted_tournaments = sorted(tournaments, 
@@ -355,31 +352,44 @@ class WeeklyActivityManager:
 
 
                 # Joue le tournoi en mode silencieux
-                tournament.play_tournament(verbose=False, atp_points_manager=atp_points_manager, week=week)
+                self.tournament_manager.play_tournament(
+                    tournament, verbose=False, atp_points_manager=atp_points_manager, week=week
+                )
 
                 # Retire les participants du pool disponible
                 for participant in participants:
-                    if participant.full_name in available_pool:
-                        del available_pool[participant.full_name]
+                    available_pool.pop(participant.player_id, None)
         
         # Gère les joueurs qui ne participent à aucun tournoi
         self._handle_non_participating_players(available_pool)
     
-    def _handle_non_participating_players(self, non_participating_players: Dict[str, Player]) -> None:
+    @profile_phase("idle_players")
+    def _handle_non_participating_players(self, non_participating_players: Dict[int, Player]) -> None:
         """
         Gère les joueurs qui ne participent à aucun tournoi cette semaine
         50% de chance de se reposer, 50% de chance de s'entraîner
         
+        Les mêmes règles que RestActivity et TrainingActivity sont appliquées
+        à tout le lot (la majorité du pool chaque semaine): tirages, fatigue
+        et XP d'entraînement sont calculés sur des tableaux.
+        
         Args:
             non_participating_players: Dictionnaire des joueurs qui ne participent pas
         """
-        for player in non_participating_players.values():
-            # 50% de chance de se reposer, 50% de chance de s'entraîner
-            if random.random() < 0.5:
-                # Repos
-                rest_activity = RestActivity()
-                rest_activity.execute(player)
-            else:
-                # Entraînement
-                training_activity = TrainingActivity()
-                training_activity.execute(player)
+        players = list(non_participating_players.values())
+        if not players:
+            return
+        
+        count = len(players)
+        resting = np.random.random(count) < 0.5
+        rest_min, rest_max = FATIGUE_VALUES["Repos"]
+        training_min, training_max = FATIGUE_VALUES["Entrainement"]
+        fatigue_changes = np.where(resting,
+                                   -np.random.randint(rest_min, rest_max + 1, count),
+                                   np.random.randint(training_min, training_max + 1, count))
+        apply_fatigue_changes(players, fatigue_changes)
+        
+        # XP d'entraînement
+        trainees = np.flatnonzero(~resting)
+        training_xp = np.random.randint(BASE_TRAINING_XP["min"], BASE_TRAINING_XP["max"] + 1, len(trainees))
+        gain_experience_batch([players[index] for index in trainees], training_xp)
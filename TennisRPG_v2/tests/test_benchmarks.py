@@ -0,0 +1,102 @@
+"""
+Tests de la suite de benchmarks
+"""
+import random
+
+import pytest
+
+from TennisRPG_v2.benchmarks.runner import (
+    BenchmarkCase, BenchmarkResult, run_case, save_baseline, load_baseline, compare_results
+)
+
+
+def _random_case(calls: list) -> BenchmarkCase:
+    """Cas trivial qui enregistre ses tirages aléatoires"""
+    def setup():
+        return (lambda: calls.append(random.random())), None
+    return BenchmarkCase("random", setup, repeats=5, warmup=2, number=3)
+
+
+class TestBenchmarkRunner:
+    """Tests du moteur de benchmarks"""
+
+    def test_run_case_warmup_repeats_and_seed(self):
+        """Échauffement exclu des mesures, graines fixées à chaque exécution"""
+        first_calls, second_calls = [], []
+        result = run_case(_random_case(first_calls), seed=7)
+        run_case(_random_case(second_calls), seed=7)
+
+        assert len(result.samples) == 5
+        assert len(first_calls) == (2 + 5) * 3
+        assert first_calls == second_calls
+        assert result.minimum <= result.median <= result.p95
+
+    def test_baseline_round_trip_and_regressions(self, tmp_path):
+        """Une médiane au-delà du seuil est signalée comme régression"""
+        baseline_path = str(tmp_path / "baseline.json")
+        save_baseline([BenchmarkResult("a", [1.0, 1.0, 1.0]), BenchmarkResult("b", [2.0])], baseline_path)
+        baseline = load_baseline(baseline_path)
+        assert baseline["a"]["median"] == 1.0
+
+        current = [BenchmarkResult("a", [1.05]), BenchmarkResult("b", [2.5])]
+        comparisons = {c.name: c for c in compare_results(current, baseline, threshold=0.1)}
+
+        assert set(comparisons) == {"a", "b"}
+        assert not comparisons["a"].is_regression
+        assert comparisons["b"].is_regression
+
+    def test_case_missing_from_baseline_fails(self, tmp_path):
+        """Un cas absent de la baseline est signalé comme un échec, pas ignoré"""
+        baseline_path = str(tmp_path / "baseline.json")
+        save_baseline([BenchmarkResult("a", [1.0])], baseline_path)
+
+        current = [BenchmarkResult("a", [1.0]), BenchmarkResult("new", [1.0])]
+        comparisons = {c.name: c for c in compare_results(current, load_baseline(baseline_path))}
+
+        assert comparisons["new"].is_missing and comparisons["new"].is_failure
+        assert not comparisons["new"].is_regression
+        assert not comparisons["a"].is_failure
+
+    def test_different_params_are_not_compared(self, tmp_path):
+        """Des mesures faites avec d'autres paramètres ne sont pas comparées"""
+        baseline_path = str(tmp_path / "baseline.json")
+        save_baseline([BenchmarkResult("a", [1.0], params={"players": 500, "sizes": (1, 2)})], baseline_path)
+        baseline = load_baseline(baseline_path)
+
+        assert compare_results([BenchmarkResult("a", [1.0], params={"players": 500, "sizes": (1, 2)})], baseline)
+        with pytest.raises(ValueError, match="a"):
+            compare_results([BenchmarkResult("a", [1.0], params={"players": 100, "sizes": (1, 2)})], baseline)
+
+
+class TestMemoryTracker:
+    """Tests du suivi mémoire"""
+
+    def test_deep_sizeof_counts_shared_objects_once(self):
+        """Un objet référencé deux fois n'est compté qu'une fois"""
+        from TennisRPG_v2.benchmarks.memory import deep_sizeof
+
+        payload = list(range(1000))
+        assert deep_sizeof([payload, payload]) < 2 * deep_sizeof(payload)
+        assert deep_sizeof({"a": payload}) > deep_sizeof(payload)
+
+    def test_sample_and_growth_slopes(self):
+        """Les mesures couvrent chaque composant et les pentes détectent la croissance"""
+        from TennisRPG_v2.benchmarks.memory import MemoryGrowthTracker, MemorySample
+        from TennisRPG_v2.benchmarks.scenarios import build_world
+
+        tracker = MemoryGrowthTracker(build_world(20), use_tracemalloc=False)
+        sample = tracker.sample(0)
+        assert sample.players == 20
+        assert sample.bytes_per_player > 0
+        assert set(sample.components) >= {"players", "elo_ratings", "points_history",
+                                          "retirement_log", "generated_names"}
+
+        report = tracker.report
+        report.samples = [
+            MemorySample(season, 20, {"players": 1000, "generated_names": 100 + 50 * season}, {"MatchResult": 0})
+            for season in range(4)
+        ]
+        slopes = report.slopes()
+        assert round(slopes["generated_names"]) == 50
+        assert round(slopes["players"]) == 0
+        assert "generated_names" in report.format_table()
@@ -0,0 +1,311 @@
+"""
+Tests du gestionnaire de cache pour TennisRPG v2
+"""
+import pytest
+
+from TennisRPG_v2.utils import cache_manager
+from TennisRPG_v2.utils.cache_manager import CacheManager, CACHE_MISS, _make_cached_decorator
+
+
+class TestCacheManager:
+    """Tests du cache LRU + TTL"""
+
+    def test_miss_is_distinct_from_cached_none(self):
+        """Un None mis en cache n'est pas confondu avec un miss"""
+        cache = CacheManager(max_size=10, ttl=60)
+        assert cache.get("absent") is CACHE_MISS
+
+        cache.set("none", None)
+        assert cache.get("none") is None
+        assert cache.get_stats()["hit_count"] == 1
+        assert cache.get_stats()["miss_count"] == 1
+
+    def test_lru_eviction(self):
+        """L'entrée la moins récemment utilisée est évincée"""
+        cache = CacheManager(max_size=2, ttl=60, namespace="test")
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is CACHE_MISS
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        stats = cache.get_stats()
+        assert stats["eviction_count"] == 1
+        assert stats["namespace"] == "test"
+
+    def test_concurrent_access_keeps_lru_consistent(self):
+        """Des lectures et écritures concurrentes ne corrompent ni l'ordre LRU ni les compteurs"""
+        import threading
+
+        cache = CacheManager(max_size=16, ttl=60, namespace="test")
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(2000):
+                    cache.set((offset, i % 40), i)
+                    cache.get((offset, (i * 7) % 40))
+            except Exception as error:  # pragma: no cover - échec du test
+                errors.append(error)
+
+        threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.get_stats()
+        assert errors == []
+        assert stats["size"] == 16
+        assert stats["hit_count"] + stats["miss_count"] == 4 * 2000
+
+    def test_lazy_ttl_expiry(self, monkeypatch):
+        """Les entrées expirées sont détectées à la lecture"""
+        now = [1000.0]
+        monkeypatch.setattr(cache_manager.time, "monotonic", lambda: now[0])
+        cache = CacheManager(max_size=10, ttl=5)
+        cache.set("k", "v")
+
+        now[0] += 10
+        assert cache.get("k") is CACHE_MISS
+        assert cache.get_stats()["expiration_count"] == 1
+        assert "k" not in cache.cache
+
+    def test_typed_keys_and_invalidation(self):
+        """Les clés sont des tuples typés et l'invalidation cible leurs composants"""
+        cache = CacheManager()
+        key_int = cache._generate_key("f", (1,), {})
+        key_str = cache._generate_key("f", ("1",), {})
+        assert key_int != key_str
+
+        cache.set(cache._generate_key("elo", ("Rafael Testdal", "Clay"), {}), 1800)
+        cache.set(cache._generate_key("elo", ("Roger Autre", "Clay"), {}), 1700)
+        cache.invalidate("Rafael Testdal")
+        assert len(cache.cache) == 1
+
+        with pytest.raises(TypeError):
+            cache._generate_key("f", ([1, 2],), {})
+
+    def test_decorator_caches_and_handles_unhashable(self):
+        """Le décorateur met en cache et ignore les arguments non hachables"""
+        cache = CacheManager()
+        calls = []
+
+        @_make_cached_decorator(cache, "Test")
+        def compute(value):
+            calls.append(value)
+            return None
+
+        assert compute(3) is None
+        assert compute(3) is None
+        assert calls == [3]
+
+        compute([1])
+        compute([1])
+        assert calls == [3, [1], [1]]
+
+    def test_decorator_depends_on_versioned_arguments(self):
+        """Un résultat calculé pour un joueur est recalculé dès que le joueur change"""
+        from TennisRPG_v2.entities.player import Player, Gender
+
+        cache = CacheManager()
+        player = Player(gender=Gender.MALE, first_name="Rafael", last_name="Testdal", country="Spain")
+
+        @_make_cached_decorator(cache, "Test")
+        def points(target):
+            return target.career.atp_points
+
+        assert points(player) == 0
+        player.career.atp_points += 10
+        player.career.mark_dirty()
+        assert points(player) == 10
+        assert cache.stale_count == 1
+
+
+class TestVersionedInvalidation:
+    """Tests de l'invalidation par compteurs de version"""
+
+    def test_player_version_bumps_on_changes(self):
+        """La version du joueur suit stats, points et niveau mais pas la fatigue"""
+        from TennisRPG_v2.entities.player import Player, Gender
+
+        player = Player(gender=Gender.MALE, first_name="Rafael", last_name="Testdal", country="Spain")
+        version = player.version
+        player.physical.fatigue = 50
+        player.physical.mark_dirty()
+        assert player.version == version
+
+        player.career.atp_points += 10
+        player.career.mark_dirty()
+        assert player.version > version
+        version = player.version
+        player.stats.service += 1
+        player.stats.mark_dirty()
+        assert player.version > version
+
+    def test_version_never_decreases_when_a_component_is_replaced(self):
+        """Remplacer un composant, même par un objet plus ancien, fait avancer la version"""
+        from TennisRPG_v2.entities.player import Player, PlayerStats, Gender
+
+        older_stats = PlayerStats()
+        player = Player(gender=Gender.MALE, first_name="Rafael", last_name="Testdal", country="Spain")
+        for _ in range(50):
+            player.stats.service += 1
+            player.stats.mark_dirty()
+        cache = CacheManager()
+        cache.set("card", "ancienne carte", depends_on=(player,))
+        version = player.version
+
+        player.stats = PlayerStats()
+        assert player.version > version
+        version = player.version
+        player.stats = older_stats
+        assert player.version > version
+        assert cache.get("card") is CACHE_MISS
+
+    def test_stale_entry_detected_on_read(self):
+        """Une entrée dont une dépendance a changé de version est un miss"""
+        from TennisRPG_v2.entities.player import Player, Gender
+
+        cache = CacheManager()
+        player = Player(gender=Gender.MALE, first_name="Rafael", last_name="Testdal", country="Spain")
+        cache.set(("elo", player), 1800, depends_on=(player.stats,))
+        assert cache.get(("elo", player)) == 1800
+
+        player.stats.coup_droit += 5
+        player.stats.mark_dirty()
+        assert cache.get(("elo", player)) is CACHE_MISS
+        assert cache.get_stats()["stale_count"] == 1
+
+    def test_invalidate_by_player_name(self):
+        """invalidate_player_caches retrouve les clés contenant le joueur"""
+        from TennisRPG_v2.entities.player import Player, Gender
+
+        player = Player(gender=Gender.MALE, first_name="Rafael", last_name="Testdal", country="Spain")
+        cache = CacheManager()
+        cache.set(("card", player, 1), "carte")
+        cache.invalidate("Rafael Testdal")
+        assert cache.get(("card", player, 1)) is CACHE_MISS
+
+    def test_ranking_page_follows_ranking_version(self):
+        """Les pages de classement sont recalculées après une mise à jour"""
+        from TennisRPG_v2.entities.player import Player, Gender
+        from TennisRPG_v2.managers.ranking_manager import RankingManager
+
+        first = Player(gender=Gender.MALE, first_name="Un", last_name="Premier", country="Spain")
+        second = Player(gender=Gender.MALE, first_name="Deux", last_name="Second", country="Italy")
+        first.career.atp_points = 100
+        first.career.mark_dirty()
+        manager = RankingManager([first, second])
+        assert manager.get_ranking_page(count=1) == [first]
+
+        second.career.atp_points = 500
+        second.career.mark_dirty()
+        manager.update_weekly_rankings()
+        assert manager.get_ranking_page(count=1) == [second]
+
+    def test_display_card_refreshes_after_fatigue_change(self):
+        """La carte affichée reflète la fatigue courante"""
+        from TennisRPG_v2.entities.player import Player, Gender
+
+        player = Player(gender=Gender.MALE, first_name="Rafael", last_name="Testdal", country="Spain")
+        player.physical.fatigue = 10
+        player.physical.mark_dirty()
+        card = player.get_display_card()
+        assert player.get_display_card() is card
+
+        player.physical.fatigue = 42
+        player.physical.mark_dirty()
+        assert "42" in player.get_display_card()
+
+
+class TestLazyLoader:
+    """Tests du chargement paresseux concurrent"""
+
+    def test_single_flight_loading(self):
+        """Des requêtes concurrentes sur une même clé n'exécutent qu'un chargement"""
+        import threading
+        import time as _time
+        from TennisRPG_v2.utils.cache_manager import LazyLoader
+
+        loader = LazyLoader()
+        calls = []
+
+        def slow_loader():
+            calls.append(1)
+            _time.sleep(0.05)
+            return "donnees"
+
+        loader.register_loader("calendrier", slow_loader)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(loader.get_data("calendrier")))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert calls == [1]
+        assert results == ["donnees"] * 8
+
+    def test_background_preload(self):
+        """preload(background=True) charge les clés sur le pool de threads"""
+        from TennisRPG_v2.utils.cache_manager import LazyLoader
+
+        loader = LazyLoader()
+        loader.register_loader("a", lambda: 1)
+        loader.register_loader("b", lambda: 2)
+        futures = loader.preload(["a", "b"], background=True)
+
+        assert [future.result(timeout=5) for future in futures] == [1, 2]
+        assert loader.is_loaded("a") and loader.is_loaded("b")
+        loader.shutdown()
+
+    def test_name_banks_are_registered_once(self):
+        """Un nouveau générateur ne réenregistre pas les banques de noms ni n'efface leurs échecs"""
+        from TennisRPG_v2.managers.player_generator import PlayerGenerator, get_name_bank_keys
+        from TennisRPG_v2.utils.cache_manager import lazy_loader
+
+        keys = get_name_bank_keys()
+        assert len(keys) == len(set(keys))
+        loader = lazy_loader._loaders[keys[0]]
+        lazy_loader._failures[keys[0]] = (1, float("inf"))
+        try:
+            PlayerGenerator()
+            assert lazy_loader._loaders[keys[0]] is loader
+            assert keys[0] in lazy_loader._failures
+        finally:
+            lazy_loader.clear(keys[0])
+
+    def test_failed_load_backoff(self, monkeypatch):
+        """Un échec est mémorisé et n'est retenté qu'après le délai de backoff"""
+        from TennisRPG_v2.utils.cache_manager import LazyLoader
+
+        now = [100.0]
+        monkeypatch.setattr(cache_manager.time, "monotonic", lambda: now[0])
+        loader = LazyLoader(failure_backoff=2.0)
+        attempts = []
+
+        def failing_loader():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise IOError("indisponible")
+            return "ok"
+
+        loader.register_loader("monde", failing_loader)
+        assert loader.get_data("monde") is None
+        assert loader.get_data("monde") is None
+        assert len(attempts) == 1
+
+        now[0] += 2.5
+        assert loader.get_data("monde") is None
+        assert len(attempts) == 2
+
+        # Le délai double après chaque échec
+        now[0] += 2.5
+        assert loader.get_data("monde") is None
+        assert len(attempts) == 2
+        now[0] += 2.0
+        assert loader.get_data("monde") == "ok"
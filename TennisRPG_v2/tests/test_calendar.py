@@ -0,0 +1,122 @@
+"""
+Tests du calendrier compilé pour TennisRPG v2
+"""
+import pytest
+
+from TennisRPG_v2.data.calendar import CALENDAR, ROUND_KEYS, iter_database
+from TennisRPG_v2.data.tournaments_database import tournois
+from TennisRPG_v2.managers.tournament_manager import TournamentManager
+
+
+class TestSeasonCalendar:
+    """Tests des tableaux compilés"""
+
+    def test_weeks_match_database(self):
+        """Chaque semaine expose les tournois déclarés, dans l'ordre"""
+        tournaments = iter_database(tournois)
+        assert len(CALENDAR) == len(tournaments)
+        for week, week_tournaments in tournois.items():
+            assert [CALENDAR.names[i] for i in CALENDAR.week_ids(week)] == [t.name for t in week_tournaments]
+        assert len(CALENDAR.week_ids(0)) == 0
+        assert len(CALENDAR.week_ids(999)) == 0
+
+    def test_importance_order(self):
+        """L'ordre par importance est celui du tri stable par prestige décroissant"""
+        for week, week_tournaments in tournois.items():
+            expected = sorted(week_tournaments, key=lambda t: t.tournament_importance, reverse=True)
+            assert [CALENDAR.names[i] for i in CALENDAR.week_ids(week, by_importance=True)] == \
+                [t.name for t in expected]
+
+    def test_codes_and_points_tables(self):
+        """Catégorie, surface, tableau et barèmes correspondent aux tournois"""
+        for tournament_id, tournament in enumerate(iter_database(tournois)):
+            assert CALENDAR.category(tournament_id) == tournament.category
+            assert CALENDAR.surface(tournament_id) == tournament.surface
+            assert CALENDAR.draw_sizes[tournament_id] == tournament.num_players
+            for round_key in ROUND_KEYS:
+                config_key = tournament._get_round_key_for_tournament(round_key)
+                assert CALENDAR.round_points(tournament_id, round_key) == (
+                    tournament.atp_points_config.get(config_key, 0), tournament.calculate_xp_points(round_key))
+
+    def test_arrays_are_immutable(self):
+        """Le calendrier partagé ne peut pas être modifié"""
+        with pytest.raises(ValueError):
+            CALENDAR.atp_points[0, 0] = 1
+        with pytest.raises(TypeError):
+            CALENDAR.name_index["Nouveau"] = 0
+
+
+class TestTournamentManagerLookups:
+    """Tests des recherches du gestionnaire de tournois"""
+
+    def test_get_tournament_by_name(self):
+        """Recherche par nom, avec ou sans semaine"""
+        manager = TournamentManager()
+        assert manager.get_tournament_by_name("Australian Open").name == "Australian Open"
+        assert manager.get_tournament_by_name("Australian Open", week=3) is not None
+        assert manager.get_tournament_by_name("Australian Open", week=4) is None
+        assert manager.get_tournament_by_name("Inconnu") is None
+
+    def test_calendar_summary(self):
+        """Le résumé couvre toutes les semaines déclarées"""
+        summary = TournamentManager().get_tournament_calendar_summary()
+        assert len(summary) == len(tournois)
+        assert summary["Semaine 3"][0] == "Australian Open"
+
+
+class TestTournamentRuns:
+    """Tests des instances de tournois propres à chaque partie"""
+
+    def test_runs_are_per_manager_and_recycled(self):
+        """Deux gestionnaires (deux parties) ne partagent aucune instance"""
+        first, second = TournamentManager(), TournamentManager()
+        first_run = first.get_tournament_by_name("Australian Open")
+        second_run = second.get_tournament_by_name("Australian Open")
+
+        assert first_run is not second_run
+        assert first_run.spec is second_run.spec
+        assert first.get_tournaments_for_week(3)[0] is first_run
+
+        first_run.participants.append("joueur")
+        assert second_run.participants == []
+        assert all(tournament.participants == [] for tournaments in tournois.values() for tournament in tournaments)
+
+    def test_database_view_creates_no_runs(self):
+        """La vue par semaine renvoie les descriptions sans créer d'instances"""
+        manager = TournamentManager()
+        database = manager.tournament_database
+
+        assert sum(len(specs) for specs in database.values()) == len(CALENDAR)
+        assert database[22][0] is CALENDAR.specs[CALENDAR.week_ids(22)[0]]
+        assert manager.runs == []
+        manager.get_tournaments_for_week(22)
+        assert len(manager.runs) == len(database[22])
+
+    def test_run_matches_declared_tournament(self):
+        """Une instance créée depuis sa description se comporte comme le tournoi déclaré"""
+        for tournament_id, tournament in enumerate(iter_database(tournois)):
+            run = CALENDAR.specs[tournament_id].create_run()
+            assert type(run) is type(tournament)
+            assert (run.name, run.surface, run.category, run.num_players, run.sets_to_win) == \
+                (tournament.name, tournament.surface, tournament.category, tournament.num_players,
+                 tournament.sets_to_win)
+            assert getattr(run, "num_rounds", None) == getattr(tournament, "num_rounds", None)
+            assert run.calculate_xp_points("winner") == tournament.calculate_xp_points("winner")
+
+    def test_runs_do_not_share_format_attributes(self):
+        """Modifier la configuration d'une instance ne touche ni la description ni les autres parties"""
+        spec = next(spec for spec in CALENDAR.specs if isinstance(spec.format_attributes.get("config"), dict))
+        first, second = spec.create_run(), spec.create_run()
+        assert first.config == spec.format_attributes["config"]
+
+        first.config["modifie"] = True
+        assert "modifie" not in second.config
+        assert "modifie" not in spec.format_attributes["config"]
+
+    def test_spec_is_immutable(self):
+        """La description partagée ne peut pas être modifiée"""
+        spec = CALENDAR.specs[0]
+        with pytest.raises(AttributeError):
+            spec.name = "Autre"
+        with pytest.raises(TypeError):
+            spec.atp_points_config["winner"] = 0
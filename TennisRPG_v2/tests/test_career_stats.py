@@ -0,0 +1,106 @@
+"""
+Tests des statistiques de carrière pour TennisRPG v2
+"""
+import numpy as np
+
+from TennisRPG_v2.entities.player import Gender
+from TennisRPG_v2.entities.spectialized_tournaments import ATP250
+from TennisRPG_v2.managers.career_stats import CareerStatistics
+from TennisRPG_v2.managers.player_generator import PlayerGenerator
+from TennisRPG_v2.managers.tournament_manager import TournamentManager
+from TennisRPG_v2.utils.serialization import decode_array
+
+
+def _play_small_tournament(stats: CareerStatistics, surface: str = "Clay"):
+    """Joue un ATP 250 de 8 joueurs avec les statistiques abonnées"""
+    tournament = ATP250("Test Open", "Testville", 8, surface)
+    generator = PlayerGenerator()
+    for _ in range(8):
+        tournament.add_participant(generator.generate_player(Gender.MALE))
+
+    tournament_manager = TournamentManager()
+    tournament_manager.match_observers.append(stats)
+    return tournament_manager.play_tournament(tournament, verbose=False, week=5)
+
+
+class TestCareerStatistics:
+    """Tests des compteurs de carrière"""
+
+    def test_tournament_updates_counters(self):
+        """Matchs, victoires, titre, finale et bilan par surface sont comptés"""
+        stats = CareerStatistics(capacity=4)
+        result = _play_small_tournament(stats)
+
+        winner = stats.get_player_stats(result.winner.player_id)
+        assert winner["matches"] == winner["wins"] == 3
+        assert winner["titles"] == winner["finals"] == 1
+        assert winner["surfaces"]["Clay"] == (3, 0)
+        assert winner["season"]["titles"] == 1
+
+        finalist = stats.get_player_stats(result.finalist.player_id)
+        assert (finalist["matches"], finalist["wins"], finalist["finals"], finalist["titles"]) == (3, 2, 1, 0)
+        assert finalist["surfaces"]["Clay"] == (2, 1)
+
+    def test_leaderboard_and_season_reset(self):
+        """Le classement des titres lit les compteurs, la fin de saison remet ceux de la saison à zéro"""
+        stats = CareerStatistics()
+        first = _play_small_tournament(stats)
+        _play_small_tournament(stats)
+
+        leaders = stats.get_leaderboard("titles", limit=5, season=True)
+        assert len(leaders) == 2
+        assert (first.winner.player_id, 1) in leaders
+
+        stats.end_season()
+        assert stats.get_leaderboard("titles", season=True) == []
+        assert len(stats.get_leaderboard("titles")) == 2
+
+    def test_best_rank_and_round_trip(self):
+        """Le meilleur classement ne retient que les progressions et survit à to_dict"""
+        stats = CareerStatistics(capacity=2)
+        stats.update_best_ranks(np.array([1, 2, 5]), np.array([10, 0, 3]))
+        stats.update_best_ranks(np.array([1, 5]), np.array([12, 1]))
+        result = _play_small_tournament(stats, surface="Grass")
+
+        restored = CareerStatistics.from_dict(stats.to_dict())
+        assert restored.get_player_stats(1)["best_rank"] == 10
+        assert restored.get_player_stats(2)["best_rank"] is None
+        assert restored.get_player_stats(5)["best_rank"] == 1
+        assert restored.get_player_stats(result.winner.player_id) == stats.get_player_stats(result.winner.player_id)
+
+    def test_delta_holds_changed_players_only(self):
+        """Le delta ne contient que les colonnes des joueurs modifiés depuis la sauvegarde"""
+        stats = CareerStatistics(capacity=2)
+        stats.update_best_ranks(np.array([1, 2]), np.array([4, 9]))
+        base = stats.to_dict()
+        cursor = stats.save_cursor()
+
+        stats.update_best_ranks(np.array([1, 2]), np.array([4, 3]))
+        result = _play_small_tournament(stats)
+        delta = stats.to_delta_dict(cursor)
+
+        changed = set(decode_array(delta["player_ids"]).tolist())
+        assert 2 in changed and 1 not in changed
+        assert result.winner.player_id in changed and len(changed) == 9
+
+        restored = CareerStatistics.from_dict(base)
+        restored.apply_delta(delta)
+        assert restored.get_player_stats(2)["best_rank"] == 3
+        assert restored.get_player_stats(result.winner.player_id) == stats.get_player_stats(result.winner.player_id)
+
+    def test_delta_follows_season_reset_and_log_limit(self, monkeypatch):
+        """La remise à zéro de la saison entre dans le delta; un journal tronqué impose une sauvegarde complète"""
+        stats = CareerStatistics(capacity=2)
+        result = _play_small_tournament(stats)
+        cursor = stats.save_cursor()
+        stats.end_season()
+
+        delta = stats.to_delta_dict(cursor)
+        assert len(decode_array(delta["player_ids"])) == 8
+        restored = CareerStatistics.from_dict(stats.to_dict())
+        assert restored.get_player_stats(result.winner.player_id)["season"]["wins"] == 0
+
+        monkeypatch.setattr(CareerStatistics, "DELTA_LOG_LIMIT", 4)
+        stats.update_best_ranks(np.arange(1, 12), np.arange(1, 12))
+        assert stats.to_delta_dict(cursor) is None
+        assert stats.to_delta_dict(stats.save_cursor())["player_ids"] is not None
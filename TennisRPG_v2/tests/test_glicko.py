@@ -0,0 +1,102 @@
+"""
+Tests du classement Glicko-2 pour TennisRPG v2
+"""
+import pytest
+
+from TennisRPG_v2.entities.player import Player, Gender
+from TennisRPG_v2.entities.ranking import RankingType
+from TennisRPG_v2.managers.glicko_engine import Glicko2Engine
+from TennisRPG_v2.managers.ranking_manager import RankingManager
+
+
+class TestGlicko2Engine:
+    """Tests du moteur vectorisé"""
+
+    def test_reference_example(self):
+        """Reproduit l'exemple de référence de Glickman (1500/200 contre trois adversaires)"""
+        engine = Glicko2Engine()
+        engine.set_rating(1, 1500, 200)
+        engine.set_rating(2, 1400, 30)
+        engine.set_rating(3, 1550, 100)
+        engine.set_rating(4, 1700, 300)
+        engine.record(1, 2)
+        engine.record(3, 1)
+        engine.record(4, 1)
+
+        assert engine.close_rating_period()
+        rating = engine.get_rating(1)
+        assert rating["rating"] == pytest.approx(1464.06, abs=0.01)
+        assert rating["rd"] == pytest.approx(151.52, abs=0.01)
+        assert rating["volatility"] == pytest.approx(0.05999, abs=1e-5)
+
+    def test_batch_matches_single_player_periods(self):
+        """Un joueur mis à jour dans un lot obtient le même résultat que seul"""
+        batch, alone = Glicko2Engine(), Glicko2Engine()
+        for engine in (batch, alone):
+            engine.set_rating(1, 1600, 80)
+            engine.set_rating(2, 1450, 120)
+            engine.record(1, 2)
+        # Autres matchs sans lien dans le lot
+        batch.record(10, 11)
+        batch.record(12, 10)
+        batch.close_rating_period()
+        alone.close_rating_period()
+        assert batch.get_rating(1) == pytest.approx(alone.get_rating(1))
+        assert batch.get_rating(2) == pytest.approx(alone.get_rating(2))
+
+    def test_idle_players_gain_uncertainty(self):
+        """Un joueur classé sans match voit son RD augmenter; une semaine sans match n'est pas une période"""
+        engine = Glicko2Engine()
+        engine.set_rating(1, 1500, 50)
+        assert not engine.close_rating_period()
+        assert engine.get_rating(1)["rd"] == pytest.approx(50)
+
+        engine.record(2, 3)
+        engine.close_rating_period()
+        assert engine.get_rating(1)["rd"] > 50
+        assert engine.get_rating(1)["rating"] == pytest.approx(1500)
+
+
+class TestGlickoRanking:
+    """Tests de l'intégration au gestionnaire des classements"""
+
+    def test_ranking_follows_engine_and_survives_save(self):
+        """Le classement Glicko suit les résultats de la semaine et survit à to_dict"""
+        players = [Player(Gender.MALE, f"Joueur{i}", "Glicko", "France", 180, 1) for i in range(3)]
+        manager = RankingManager(players)
+        for _ in range(3):
+            manager.glicko_engine.record(players[2].player_id, players[0].player_id)
+        manager.update_weekly_rankings()
+
+        assert manager.get_player_rank(players[2], RankingType.GLICKO) == 1
+        assert manager.get_player_rank(players[0], RankingType.GLICKO) == 3
+
+        restored = RankingManager.from_dict(players, manager.to_dict())
+        assert restored.get_player_rank(players[2], RankingType.GLICKO) == 1
+        assert restored.glicko_engine.get_rating(players[2].player_id) == \
+            pytest.approx(manager.glicko_engine.get_rating(players[2].player_id))
+
+    def test_get_rating_does_not_grow_engine(self):
+        """Lire la note d'un identifiant inconnu renvoie la note initiale sans agrandir les tableaux"""
+        engine = Glicko2Engine()
+        engine.set_rating(1, 1600, 80)
+        capacity = engine.capacity
+        rating = engine.get_rating(capacity + 1000)
+        assert rating["rating"] == pytest.approx(1500)
+        assert engine.get_ratings([1, capacity + 5000])[1] == pytest.approx(1500)
+        assert engine.capacity == capacity
+
+    def test_points_award_does_not_resort_glicko(self):
+        """Une attribution de points ne retrie pas Glicko: seule la clôture hebdomadaire le fait"""
+        players = [Player(Gender.MALE, f"Joueur{i}", "Glicko", "France", 180, 1) for i in range(3)]
+        manager = RankingManager(players)
+        for _ in range(3):
+            manager.glicko_engine.record(players[2].player_id, players[0].player_id)
+        manager.glicko_engine.close_rating_period()
+
+        manager.add_atp_points(players[1].player_id, 500)
+        manager.get_player_rank(players[1])
+        assert manager.get_player_rank(players[2], RankingType.GLICKO) != 1
+
+        manager.update_weekly_rankings()
+        assert manager.get_player_rank(players[2], RankingType.GLICKO) == 1
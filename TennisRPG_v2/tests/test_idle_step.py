@@ -0,0 +1,91 @@
+"""
+Tests de l'étape hebdomadaire vectorisée (joueurs sans tournoi) pour TennisRPG v2
+"""
+import copy
+import random
+
+import numpy as np
+
+from TennisRPG_v2.entities.player import Gender, apply_fatigue_changes, gain_experience_batch
+from TennisRPG_v2.managers.player_generator import PlayerGenerator
+from TennisRPG_v2.managers.weekly_activity_manager import WeeklyActivityManager
+from TennisRPG_v2.utils.constants import FATIGUE_VALUES, PLAYER_CONSTANTS
+
+
+def _make_players(count):
+    generator = PlayerGenerator()
+    return [generator.generate_player(Gender.MALE) for _ in range(count)]
+
+
+class TestBatchExperience:
+    """Tests du gain d'XP par lots"""
+
+    def test_matches_individual_gain_experience(self):
+        """Même XP, mêmes niveaux et mêmes attributions de points AP que joueur par joueur"""
+        players = _make_players(100)
+        for index, player in enumerate(players):
+            player.career.level = 1 + index % 20
+            player.career.age = 16 + index % 22
+            player.career.xp_points = (index * 37) % 800
+        xp = np.arange(100) * 4
+        individual, batch = copy.deepcopy(players), copy.deepcopy(players)
+
+        state = random.getstate()
+        for player, player_xp in zip(individual, xp.tolist()):
+            if player_xp > 0:
+                player.gain_experience(player_xp)
+        random.setstate(state)
+        gain_experience_batch(batch, xp)
+
+        for expected, actual in zip(individual, batch):
+            assert (actual.career.level, actual.career.xp_points, actual.career.xp_total) == \
+                (expected.career.level, expected.career.xp_points, expected.career.xp_total)
+            assert actual.stats.to_dict() == expected.stats.to_dict()
+
+    def test_repeated_player_levels_up(self):
+        """Un joueur présent plusieurs fois monte de niveau sur le cumul"""
+        player = _make_players(1)[0]
+        player.career.level, player.career.age, player.career.xp_points = 1, 24, 0
+        gain_experience_batch([player, player], np.array([100, 100]))
+        assert player.career.level == 2
+        assert player.career.xp_total == 200
+
+
+class TestIdleStep:
+    """Tests du repos / entraînement des joueurs sans tournoi"""
+
+    def test_fatigue_changes_are_bounded_and_sparse(self):
+        """La fatigue reste entre 0 et le maximum; les joueurs inchangés ne sont pas modifiés"""
+        players = _make_players(3)
+        for player, fatigue in zip(players, (5, 95, 40)):
+            player.physical.fatigue = fatigue
+        version = players[2].physical.version
+
+        apply_fatigue_changes(players, np.array([-20, 20, 0]))
+
+        assert [player.physical.fatigue for player in players] == [0, PLAYER_CONSTANTS["MAX_FATIGUE"], 40]
+        assert players[2].physical.version == version
+
+    def test_each_player_rests_or_trains(self):
+        """Chaque joueur se repose (fatigue en baisse) ou s'entraîne (fatigue et XP en hausse)"""
+        players = _make_players(200)
+        for player in players:
+            player.physical.fatigue = 50
+        initial_xp = [player.career.xp_total for player in players]
+        manager = WeeklyActivityManager(tournament_manager=None, ranking_manager=None)
+
+        manager._handle_non_participating_players({player.player_id: player for player in players})
+
+        rest_min, rest_max = FATIGUE_VALUES["Repos"]
+        training_min, training_max = FATIGUE_VALUES["Entrainement"]
+        trained = 0
+        for player, xp_before in zip(players, initial_xp):
+            change = player.physical.fatigue - 50
+            if change > 0:
+                assert training_min <= change <= training_max
+                assert player.career.xp_total > xp_before
+                trained += 1
+            else:
+                assert rest_min <= -change <= rest_max
+                assert player.career.xp_total == xp_before
+        assert 0 < trained < len(players)
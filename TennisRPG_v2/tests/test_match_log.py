@@ -0,0 +1,194 @@
+"""
+Tests du journal des matchs et des face-à-face pour TennisRPG v2
+"""
+import os
+
+from TennisRPG_v2.entities.player import Player, Gender
+from TennisRPG_v2.entities.spectialized_tournaments import ATP250
+from TennisRPG_v2.managers.head_to_head import HeadToHeadRecords
+from TennisRPG_v2.managers.match_log import MatchLog
+from TennisRPG_v2.managers.player_generator import PlayerGenerator
+from TennisRPG_v2.managers.tournament_manager import TournamentManager
+from TennisRPG_v2.utils.serialization import decode_array
+
+
+def _play_small_tournament(observer, week: int = 5):
+    """Joue un ATP 250 de 8 joueurs avec un observateur abonné"""
+    tournament = ATP250("Test Open", "Testville", 8, "Clay")
+    generator = PlayerGenerator()
+    players = [generator.generate_player(Gender.MALE) for _ in range(8)]
+    for player in players:
+        tournament.add_participant(player)
+
+    tournament_manager = TournamentManager()
+    tournament_manager.match_observers.append(observer)
+    result = tournament_manager.play_tournament(tournament, verbose=False, week=week)
+    return players, result
+
+
+class TestMatchLog:
+    """Tests de l'enregistrement et des requêtes"""
+
+    def test_records_every_match(self):
+        """Chaque match du tableau est enregistré avec son tour"""
+        match_log = MatchLog(current_year=2025)
+        players, result = _play_small_tournament(match_log)
+
+        assert len(match_log) == 7
+        season = match_log.get_current_season()
+        assert set(season["year"].tolist()) == {2025}
+        assert set(season["week"].tolist()) == {5}
+        final = match_log.to_records(season[-1:])[0]
+        assert final["round"] == "finalist"
+        assert final["tournament"] == "Test Open"
+        assert final["winner_id"] == result.winner.player_id
+
+        # Le vainqueur a joué les trois tours, tous gagnés
+        winner_matches = match_log.get_player_matches(result.winner.player_id)
+        assert len(winner_matches) == 3
+        assert (winner_matches["winner"] == result.winner.player_id).all()
+
+    def test_player_ids_are_unique(self):
+        """Chaque joueur reçoit un identifiant distinct, conservé par sérialisation"""
+        first = Player(gender=Gender.MALE, first_name="Un", last_name="Test", country="France")
+        second = Player(gender=Gender.MALE, first_name="Deux", last_name="Test", country="France")
+        assert first.player_id != second.player_id
+        assert Player.from_dict(first.to_dict()).player_id == first.player_id
+
+    def test_end_season_spills_to_disk(self, tmp_path):
+        """Une saison terminée est écrite sur disque et reste interrogeable"""
+        directory = str(tmp_path / "journal")
+        match_log = MatchLog(directory, chunk_size=4, current_year=2025)
+        players, result = _play_small_tournament(match_log)
+        match_log.end_season()
+
+        assert [name for name in os.listdir(directory) if name.endswith(".npy")] == \
+            [f"season_2025_{match_log._season_tags[2025]}.npy"]
+        assert match_log.current_year == 2026
+        assert len(match_log.get_current_season()) == 0
+        assert len(match_log.get_season(2025)) == 7
+        assert len(match_log.get_player_matches(result.winner.player_id, year=2025)) == 3
+
+        # Saison suivante: l'historique du joueur couvre les deux saisons
+        match_log.record("Autre Open", "finalist", 8, result.winner.player_id, result.finalist.player_id, 2, 1)
+        assert len(match_log.get_player_matches(result.winner.player_id)) == 4
+
+    def test_round_trip(self, tmp_path):
+        """Saisons archivées et saison courante survivent à to_dict/from_dict"""
+        directory = str(tmp_path / "journal")
+        match_log = MatchLog(directory, current_year=2025)
+        players, result = _play_small_tournament(match_log)
+        match_log.end_season()
+        _play_small_tournament(match_log, week=3)
+
+        restored = MatchLog.from_dict(match_log.to_dict(), directory)
+        assert len(restored) == len(match_log) == 14
+        assert restored.seasons == [2025]
+        assert len(restored.get_player_matches(result.winner.player_id)) == 3
+
+        in_memory = MatchLog(current_year=2025)
+        _play_small_tournament(in_memory)
+        in_memory.end_season()
+        assert len(MatchLog.from_dict(in_memory.to_dict()).get_season(2025)) == 7
+
+    def test_delta_appends_new_matches_only(self, tmp_path):
+        """Le delta ne contient que les matchs joués depuis la position de sauvegarde"""
+        directory = str(tmp_path / "journal")
+        match_log = MatchLog(directory, chunk_size=4, current_year=2025)
+        _play_small_tournament(match_log)
+        base = match_log.to_dict()
+        cursor = match_log.save_cursor()
+
+        _play_small_tournament(match_log, week=9)
+        match_log.end_season()
+        players, result = _play_small_tournament(match_log, week=2)
+        delta = match_log.to_delta_dict(cursor)
+
+        assert [len(decode_array(season["rows"]["year"])) for season in delta["seasons"]] == [7, 7]
+        assert [season["ended"] for season in delta["seasons"]] == [True, False]
+
+        restored = MatchLog.from_dict(base, directory)
+        restored.apply_delta(delta)
+        assert restored.seasons == [2025]
+        assert len(restored.get_season(2025)) == 14
+        assert (restored.get_season(2025) == match_log.get_season(2025)).all()
+        assert len(restored.get_player_matches(result.winner.player_id, year=2026)) == 3
+
+    def test_diverging_saves_keep_their_seasons(self, tmp_path):
+        """Une saison rejouée depuis une sauvegarde plus ancienne n'écrase pas le fichier de l'autre branche"""
+        directory = str(tmp_path / "journal")
+        match_log = MatchLog(directory, current_year=2025)
+        _play_small_tournament(match_log)
+        older_save = match_log.to_dict()
+        match_log.end_season()
+        newer_save = match_log.to_dict()
+
+        replayed = MatchLog.from_dict(older_save, directory)
+        _play_small_tournament(replayed, week=7)
+        replayed.end_season()
+
+        assert len(MatchLog.from_dict(newer_save, directory).get_season(2025)) == 7
+        assert len(MatchLog.from_dict(replayed.to_dict(), directory).get_season(2025)) == 14
+
+
+class TestHeadToHead:
+    """Tests des face-à-face"""
+
+    def test_records_are_symmetric(self):
+        """Le bilan se lit dans les deux sens"""
+        records = HeadToHeadRecords()
+        records.record_win(7, 3)
+        records.record_win(7, 3)
+        records.record_win(3, 7)
+
+        assert records.get_record(7, 3) == (2, 1)
+        assert records.get_record(3, 7) == (1, 2)
+        assert records.get_record(7, 8) == (0, 0)
+        assert len(records) == 1
+
+    def test_updated_by_tournament_and_saved(self):
+        """Les matchs d'un tournoi alimentent les face-à-face, conservés par to_dict"""
+        records = HeadToHeadRecords()
+        players, result = _play_small_tournament(records)
+        assert len(records) == 7
+        final = result.match_results[-1]
+        winner_id, loser_id = final.winner.player_id, final.loser.player_id
+        assert records.get_record(winner_id, loser_id) == (1, 0)
+
+        restored = HeadToHeadRecords.from_dict(records.to_dict())
+        assert restored.get_record(loser_id, winner_id) == (0, 1)
+        assert len(restored) == 7
+
+    def test_delta_holds_new_wins_only(self, monkeypatch):
+        """Le delta ne contient que les victoires depuis la sauvegarde; un journal trop court force une base"""
+        records = HeadToHeadRecords()
+        records.record_win(7, 3)
+        base = records.to_dict()
+        cursor = records.save_cursor()
+        records.record_win(3, 7)
+        records.record_win(9, 3)
+
+        delta = records.to_delta_dict(cursor)
+        assert decode_array(delta["winners"]).tolist() == [3, 9]
+        restored = HeadToHeadRecords.from_dict(base)
+        restored.apply_delta(delta)
+        assert restored.get_record(7, 3) == (1, 1)
+        assert restored.get_record(9, 3) == (1, 0)
+
+        monkeypatch.setattr(HeadToHeadRecords, "DELTA_LOG_LIMIT", 1)
+        for _ in range(3):
+            records.record_win(1, 2)
+        assert records.to_delta_dict(cursor) is None
+
+    def test_matchup_displayed_for_main_player(self, capsys):
+        """Le face-à-face est affiché avant un match du joueur principal"""
+        records = HeadToHeadRecords()
+        tournament = ATP250("Test Open", "Testville", 8, "Clay")
+        main_player = Player(gender=Gender.MALE, first_name="Jean", last_name="Test",
+                             country="France", is_main_player=True)
+        opponent = Player(gender=Gender.MALE, first_name="Paul", last_name="Pnj", country="Spain")
+        records.record_win(opponent.player_id, main_player.player_id)
+        tournament.match_observers = [records]
+
+        tournament._display_matchup(main_player, opponent)
+        assert "Jean Test 0 - 1 Paul Pnj" in capsys.readouterr().out
@@ -0,0 +1,108 @@
+"""
+Tests des identifiants entiers des joueurs pour TennisRPG v2
+"""
+from TennisRPG_v2.core.game_session_state import GameSessionState
+from TennisRPG_v2.core.save_manager import SaveManager, GameState
+from TennisRPG_v2.entities.player import Player, Gender
+from TennisRPG_v2.entities.spectialized_tournaments import ATP250
+from TennisRPG_v2.managers.ranking_manager import RankingManager
+
+
+def _homonyms():
+    """Deux joueurs différents portant le même nom"""
+    return [Player(Gender.MALE, "Jean", "Dupont", "France", 180, 1) for _ in range(2)]
+
+
+class TestHomonyms:
+    """Tests des joueurs portant le même nom"""
+
+    def test_rankings_keep_both_players(self):
+        """Le classement et l'historique distinguent deux homonymes"""
+        first, second = _homonyms()
+        manager = RankingManager([first, second])
+        second.career.atp_points = 300
+        manager.add_atp_points(second.player_id, 300, week=5)
+        manager.update_weekly_rankings()
+
+        assert manager.get_player_rank(second) == 1
+        assert manager.get_player_rank(first) == 2
+        assert manager.get_points_to_defend(second.player_id, 5) == 300
+        assert manager.get_points_to_defend(first.player_id, 5) == 0
+
+    def test_tournament_accepts_both_players(self):
+        """Un tournoi n'écarte pas un homonyme comme doublon, mais écarte le même joueur"""
+        first, second = _homonyms()
+        tournament = ATP250("Test Open", "Testville", 32, "Hard")
+        assert tournament.add_participant(first)
+        assert tournament.add_participant(second)
+        assert not tournament.add_participant(first)
+        assert len(tournament.participants) == 2
+
+
+class TestIdPersistence:
+    """Tests de la persistance par identifiant"""
+
+    def test_reload_does_not_consume_ids(self):
+        """Recharger un joueur réutilise son identifiant sans en allouer de nouveau"""
+        player = _homonyms()[0]
+        data = player.to_dict()
+        for _ in range(3):
+            assert Player.from_dict(data).player_id == player.player_id
+        assert Player(Gender.MALE, "Nouveau", "Venu", "France", 180, 1).player_id == player.player_id + 2
+
+    def test_ranking_state_is_keyed_by_id(self):
+        """Les classements sauvegardés sont restaurés par identifiant"""
+        players = _homonyms()
+        manager = RankingManager(players)
+        players[1].career.atp_points = 100
+        manager.add_atp_points(players[1].player_id, 100, week=3)
+        manager.update_weekly_rankings()
+        state = manager.to_dict()
+
+        assert "player_names" not in state
+        restored = RankingManager.from_dict(players, state)
+        assert restored.get_player_rank(players[1]) == 1
+        assert restored.get_points_to_defend(players[1].player_id, 3) == 100
+
+    def test_legacy_ranking_state_by_name(self):
+        """Une ancienne sauvegarde indexée par nom est convertie"""
+        players = [Player(Gender.MALE, f"Joueur{i}", "Ancien", "France", 180, 1) for i in range(2)]
+        manager = RankingManager(players)
+        manager.add_atp_points(players[0].player_id, 40, week=2)
+        state = manager.to_dict()
+        state.pop("player_ids")
+        state["player_names"] = [player.full_name for player in players]
+
+        restored = RankingManager.from_dict(players, state)
+        assert restored.get_points_to_defend(players[0].player_id, 2) == 40
+        assert restored.get_points_to_defend(players[0].full_name, 2) == 40
+
+    def test_game_state_round_trip(self, tmp_path):
+        """Le pool indexé par identifiant survit à une sauvegarde complète puis incrémentale"""
+        players = _homonyms()
+        game_state = GameState()
+        game_state.all_players = {player.player_id: player for player in players}
+        manager = SaveManager(str(tmp_path))
+        manager.save_game(game_state, "partie", incremental=True)
+
+        newcomer = Player(Gender.FEMALE, "Anne", "Neuve", "Italy", 170, 1)
+        game_state.all_players[newcomer.player_id] = newcomer
+        del game_state.all_players[players[0].player_id]
+        manager.save_game(game_state, "partie", incremental=True)
+
+        loaded = SaveManager(str(tmp_path)).load_game("partie")
+        assert set(loaded.all_players) == {players[1].player_id, newcomer.player_id}
+        assert loaded.all_players[newcomer.player_id].full_name == "Anne Neuve"
+
+    def test_session_canonicalizes_legacy_pool(self):
+        """Un pool indexé par nom est réindexé par identifiant au chargement"""
+        player = _homonyms()[0]
+        game_state = GameState()
+        game_state.all_players = {player.full_name: player}
+        session = GameSessionState()
+
+        session.load_from_game_state(game_state)
+
+        assert session.all_players == {player.player_id: player}
+        assert session.remove_player(player.full_name)
+        assert not session.all_players
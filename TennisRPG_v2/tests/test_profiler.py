@@ -0,0 +1,100 @@
+"""
+Tests du profileur de phases
+"""
+import json
+import time
+
+import pytest
+
+from TennisRPG_v2.utils.profiler import PhaseProfiler, profiler
+
+
+class TestPhaseProfiler:
+    """Tests du profileur de phases"""
+
+    def test_disabled_profiler_records_nothing(self):
+        """Désactivé, le profileur ne mesure rien et réutilise un contexte vide"""
+        phase_profiler = PhaseProfiler()
+        timed = phase_profiler.profiled("calc")(lambda x: x * 2)
+
+        with phase_profiler.phase("draw_selection"):
+            assert timed(21) == 42
+
+        assert phase_profiler.get_stats() == {}
+        assert phase_profiler.phase("a") is phase_profiler.phase("b")
+
+    def test_enabled_profiler_aggregates_phases(self, tmp_path):
+        """Activé, le profileur cumule temps et nombre d'appels par phase"""
+        phase_profiler = PhaseProfiler()
+        phase_profiler.enable()
+        timed = phase_profiler.profiled("calc")(lambda x: x * 2)
+
+        for _ in range(3):
+            timed(1)
+        with phase_profiler.phase("ranking_update"):
+            pass
+
+        stats = phase_profiler.get_stats()
+        assert stats["calc"]["calls"] == 3
+        assert stats["ranking_update"]["calls"] == 1
+        assert "calc" in phase_profiler.format_table()
+
+        output = tmp_path / "profile.json"
+        phase_profiler.export_json(str(output))
+        assert json.loads(output.read_text())["calc"]["calls"] == 3
+
+    def test_nested_phases_report_self_time(self):
+        """Le temps propre d'une phase exclut ses sous-phases: les parts cumulées ne dépassent pas 100 %"""
+        phase_profiler = PhaseProfiler()
+        phase_profiler.enable()
+        inner = phase_profiler.profiled("inner")(lambda: time.sleep(0.02))
+
+        with phase_profiler.phase("outer"):
+            time.sleep(0.01)
+            inner()
+
+        stats = phase_profiler.get_stats()
+        assert stats["outer"]["total"] >= stats["inner"]["total"] >= 0.02
+        assert stats["outer"]["self"] == pytest.approx(stats["outer"]["total"] - stats["inner"]["total"])
+        assert stats["inner"]["self"] == stats["inner"]["total"]
+        assert sum(phase_stats["share"] for phase_stats in stats.values()) <= 1.0
+        assert list(stats) == ["inner", "outer"]
+
+    def test_phase_names_are_unique(self):
+        """Chaque nom de phase désigne une seule étape de la simulation"""
+        import pathlib
+        import re
+
+        root = pathlib.Path(__file__).resolve().parents[1]
+        names = {}
+        for path in root.rglob("*.py"):
+            if "tests" in path.parts:
+                continue
+            for name in re.findall(r'@profile_phase\("(\w+)"\)', path.read_text(encoding="utf-8")):
+                names.setdefault(name, []).append(path.name)
+        # Les deux implémentations de play_tournament sont la même étape (jamais imbriquées)
+        assert names.pop("play_tournament") == ["spectialized_tournaments.py"] * 2
+        assert {name: files for name, files in names.items() if len(files) > 1} == {}
+
+    def test_simulation_hot_path_is_instrumented(self):
+        """Les phases de simulation sont remontées par le profileur global"""
+        from TennisRPG_v2.entities.player import Player, Gender
+        from TennisRPG_v2.entities.spectialized_tournaments import ATP250
+
+        tournament = ATP250("Profil Open", "Test", 8, "Hard")
+        for i in range(8):
+            tournament.add_participant(Player(gender=Gender.MALE, first_name=f"Joueur{i}",
+                                              last_name="Test", country="France"))
+
+        profiler.enable()
+        try:
+            tournament.play_tournament(verbose=False)
+        finally:
+            profiler.disable()
+
+        stats = profiler.get_stats()
+        profiler.reset()
+        # Instrumenté par tournoi: les 7 matchs et les gains d'XP ne sont pas des phases
+        assert stats["play_tournament"]["calls"] == 1
+        assert stats["atp_points"]["calls"] == 1
+        assert all(phase_stats["calls"] == 1 for phase_stats in stats.values())
@@ -0,0 +1,106 @@
+"""
+Tests de l'historique hebdomadaire des classements pour TennisRPG v2
+"""
+import numpy as np
+
+from TennisRPG_v2.entities.player import Player, Gender
+from TennisRPG_v2.managers.rank_history import RankHistory, MAX_STORED_RANK
+from TennisRPG_v2.managers.ranking_manager import RankingManager
+
+
+class TestRankHistory:
+    """Tests du stockage par blocs"""
+
+    def test_queries_span_chunks(self):
+        """Historique, meilleur rang et semaines au sommet sur plusieurs blocs"""
+        history = RankHistory(chunk_weeks=4)
+        for week in range(1, 11):
+            # Joueur 1: numéro un les semaines paires; joueur 2 classé 5 puis 3
+            history.record_week(np.array([0, 1 if week % 2 == 0 else 2, 5 if week < 6 else 3]), 2030, week)
+
+        assert len(history) == 10
+        assert history.weeks.tolist() == list(range(1, 11))
+        assert history.get_player_history(2).tolist() == [5] * 5 + [3] * 5
+        assert history.get_best_rank(1) == 1
+        assert history.count_weeks_in_top(1, 1) == 5
+        assert history.count_weeks_in_top(2, 3) == 5
+        assert history.get_best_rank(7) is None
+
+    def test_new_players_widen_current_chunk(self):
+        """Un identifiant au-delà de la largeur allouée n'efface pas l'historique"""
+        history = RankHistory(chunk_weeks=4)
+        history.record_week(np.array([0, 1, 2]), 2030, 1)
+        wide = np.zeros(500, dtype=np.int32)
+        wide[[1, 2, 499]] = [2, 3, 1]
+        history.record_week(wide, 2030, 2)
+
+        assert history.get_player_history(1).tolist() == [1, 2]
+        assert history.get_player_history(499).tolist() == [0, 1]
+
+    def test_same_week_replaces_last_snapshot(self):
+        """Un classement recalculé dans la même semaine remplace le dernier instantané"""
+        history = RankHistory()
+        history.record_week(np.array([0, 1, 2]), 2030, 3)
+        history.record_week(np.array([0, 2, 1]), 2030, 3)
+        assert len(history) == 1
+        assert history.get_player_history(2).tolist() == [1]
+
+    def test_same_week_of_another_year_is_a_new_snapshot(self):
+        """La semaine 3 de l'année suivante est un nouvel instantané, daté de son année"""
+        history = RankHistory()
+        history.record_week(np.array([0, 1, 2]), 2030, 3)
+        history.record_week(np.array([0, 2, 1]), 2031, 3)
+        assert len(history) == 2
+        assert history.years.tolist() == [2030, 2031]
+        assert history.weeks.tolist() == [3, 3]
+        assert history.week_indexes[1] - history.week_indexes[0] == 52
+
+    def test_round_trip_is_compact(self):
+        """La sauvegarde restitue l'historique en 2 octets par rang"""
+        history = RankHistory(chunk_weeks=3)
+        for week in range(1, 8):
+            history.record_week(np.arange(40) % 7, 2030, week)
+        history.record_week(np.array([0, 70000]), 2030, 8)
+
+        restored = RankHistory.from_dict(history.to_dict(), chunk_weeks=3)
+        assert restored.to_matrix().dtype == np.int16
+        assert (restored.to_matrix() == history.to_matrix()).all()
+        assert restored.get_player_history(1)[-1] == MAX_STORED_RANK
+
+        restored.record_week(np.arange(40) % 5, 2030, 9)
+        assert restored.get_player_history(6).tolist() == [6] * 7 + [0, 1]
+
+
+class TestRankingManagerHistory:
+    """Tests de l'intégration au gestionnaire des classements"""
+
+    def test_weekly_updates_are_recorded_and_saved(self):
+        """Chaque mise à jour hebdomadaire archive les rangs ATP, qui survivent à to_dict"""
+        players = [Player(Gender.MALE, f"Joueur{i}", "Histoire", "France", 180, 1) for i in range(3)]
+        manager = RankingManager(players)
+        for week in range(1, 5):
+            manager.current_week = week
+            players[week % 2].career.atp_points = 100 * week
+            manager.update_weekly_rankings()
+
+        assert manager.get_rank_history(players[0]).tolist() == [2, 1, 2, 1]
+        assert manager.get_weeks_in_top(players[1]) == 2
+        assert manager.get_best_rank(players[2]) == 3
+
+        restored = RankingManager.from_dict(players, manager.to_dict())
+        assert restored.get_rank_history(players[0]).tolist() == [2, 1, 2, 1]
+        assert restored.rank_history.weeks.tolist() == [1, 2, 3, 4]
+        assert restored.rank_history.years.tolist() == [manager.current_year] * 4
+
+    def test_history_spans_seasons(self):
+        """Le passage à une nouvelle saison date les instantanés de la nouvelle année"""
+        players = [Player(Gender.MALE, f"Joueur{i}", "Saison", "France", 180, 1) for i in range(2)]
+        manager = RankingManager(players)
+        manager.current_week = 52
+        manager.update_weekly_rankings()
+        manager.advance_week()
+        manager.update_weekly_rankings()
+
+        start_year = manager.current_year - 1
+        assert manager.rank_history.years.tolist() == [start_year, start_year + 1]
+        assert manager.rank_history.weeks.tolist() == [52, 1]
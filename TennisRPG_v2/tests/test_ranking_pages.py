@@ -0,0 +1,101 @@
+"""
+Tests des pages de classement (ordre conservé, pagination et filtres) pour TennisRPG v2
+"""
+import numpy as np
+import pytest
+
+from TennisRPG_v2.entities.player import Player, Gender
+from TennisRPG_v2.entities.ranking import RankingType
+from TennisRPG_v2.managers.ranking_manager import RankingManager
+
+
+def _make_manager(count=30):
+    """Pool où le joueur i a 1000 - 10 * i points (rang i + 1)"""
+    players = []
+    for i in range(count):
+        player = Player(Gender.MALE, f"Joueur{i}", "Page", "France" if i % 3 == 0 else "Spain", 180, 1,
+                        age=18 + i % 10)
+        player.career.atp_points = 1000 - 10 * i
+        players.append(player)
+    return players, RankingManager(players)
+
+
+class TestRankingOrder:
+    """Tests de l'ordre conservé par le classement"""
+
+    def test_pages_are_slices_of_the_order(self):
+        """Une page est une tranche de l'ordre, sans tri ni copie"""
+        players, manager = _make_manager()
+        ranking = manager.atp_ranking
+
+        assert manager.get_ranking_page(count=5) == players[:5]
+        assert manager.get_ranking_page(start_rank=11, count=5) == players[10:15]
+        assert manager.get_ranking_page(start_rank=28, count=10) == players[27:]
+        assert manager.get_ranking_page(start_rank=40, count=10) == []
+        assert ranking.get_page(3, 4).base is not None
+        with pytest.raises(ValueError):
+            ranking.order[0] = 0
+
+    def test_ranks_match_order(self):
+        """Le rang lu dans la table correspond à la position dans l'ordre"""
+        players, manager = _make_manager()
+        outsider = Player(Gender.MALE, "Hors", "Classement", "Italy", 180, 1)
+
+        assert [manager.get_player_rank(player) for player in players] == list(range(1, 31))
+        assert manager.atp_ranking.get_player_rank(outsider) == 0
+        assert manager.get_player_ranks(players[:3] + [outsider]).tolist() == [1, 2, 3, 0]
+        assert manager.atp_ranking.rankings[players[4].player_id] == 5
+
+    def test_rank_index_is_sized_by_the_pool(self):
+        """Les index de rangs suivent le nombre de classés, pas le plus grand identifiant"""
+        players, manager = _make_manager(count=5)
+        ranking = manager.atp_ranking
+        ranking.restore_rankings([players[2].player_id, 10 ** 9, players[0].player_id])
+
+        assert ranking.get_ranks(np.array([10 ** 9, players[0].player_id, players[1].player_id, -1])).tolist() == \
+            [2, 3, 0, 0]
+        assert ranking.get_player_rank(players[2]) == 1
+        assert len(ranking._sorted_ids[0]) == 3
+
+    def test_order_follows_updates(self):
+        """Après une mise à jour, pages et rangs reflètent le nouvel ordre"""
+        players, manager = _make_manager()
+        players[-1].career.atp_points = 5000
+        manager.update_weekly_rankings()
+
+        assert manager.get_ranking_page(count=2) == [players[-1], players[0]]
+        assert manager.get_player_rank(players[-1]) == 1
+        assert manager.get_player_rank(players[0]) == 2
+
+
+class TestFilteredRanking:
+    """Tests des classements filtrés par pays et par âge"""
+
+    def test_filter_by_country_keeps_global_rank(self):
+        """Les joueurs filtrés gardent leur rang mondial"""
+        players, manager = _make_manager()
+        entries = manager.get_filtered_ranking(country="France", count=3)
+
+        assert [entry.rank for entry in entries] == [1, 4, 7]
+        assert [entry.player for entry in entries] == [players[0], players[3], players[6]]
+        assert entries[1].points == players[3].career.atp_points
+
+    def test_filter_by_age_and_start_rank(self):
+        """Filtre par tranche d'âge à partir d'un rang donné"""
+        players, manager = _make_manager()
+        entries = manager.get_filtered_ranking(RankingType.ATP, min_age=20, max_age=21, start_rank=10, count=None)
+
+        expected = [(i + 1, player) for i, player in enumerate(players) if i >= 9 and 20 <= player.career.age <= 21]
+        assert [(entry.rank, entry.player) for entry in entries] == expected
+
+    def test_scan_stops_when_page_is_full(self):
+        """Le parcours s'arrête dès que la page est complète"""
+        players, manager = _make_manager()
+        seen = []
+
+        def predicate(player):
+            seen.append(player)
+            return True
+
+        assert len(manager.atp_ranking.get_filtered_page(predicate, count=2)) == 2
+        assert len(seen) == 2
@@ -0,0 +1,82 @@
+"""
+Tests de l'ELO dynamique (basé sur les résultats) pour TennisRPG v2
+"""
+from TennisRPG_v2.entities.player import Player, Gender
+from TennisRPG_v2.entities.spectialized_tournaments import ATP250
+from TennisRPG_v2.entities.tournament import MatchResult
+from TennisRPG_v2.managers.player_generator import PlayerGenerator
+from TennisRPG_v2.managers.results_elo import ResultsEloEngine
+from TennisRPG_v2.managers.tournament_manager import TournamentManager
+from TennisRPG_v2.utils.constants import ELO_CONSTANTS
+from TennisRPG_v2.utils.serialization import decode_array
+
+
+def _make_player(first_name: str) -> Player:
+    return Player(gender=Gender.MALE, first_name=first_name, last_name="Elo", country="France")
+
+
+class TestResultsElo:
+    """Tests des mises à jour par lots"""
+
+    def test_starts_from_stat_elo_and_moves_with_results(self):
+        """Le vainqueur gagne exactement ce que perd le perdant, ELO général et surface"""
+        engine = ResultsEloEngine(capacity=2)
+        winner, loser = _make_player("Gagnant"), _make_player("Perdant")
+        engine.apply_results([MatchResult(winner, loser, 2, 0)], "Clay")
+
+        assert engine.get_rating(winner.player_id) > winner.get_elo()
+        gain = engine.get_rating(winner.player_id, "Clay") - winner.get_elo("Clay")
+        loss = loser.get_elo("Clay") - engine.get_rating(loser.player_id, "Clay")
+        assert abs(gain - loss) <= 1
+        assert 0 < gain <= ELO_CONSTANTS["PROVISIONAL_K_FACTOR"]
+        # Surface non jouée: inchangée
+        assert engine.get_rating(winner.player_id, "Grass") == winner.get_elo("Grass")
+
+    def test_round_is_order_independent(self):
+        """Les matchs d'un tour utilisent les ELO d'avant le tour"""
+        players = [_make_player(name) for name in ("A", "B", "C", "D")]
+        round_results = [MatchResult(players[0], players[1], 2, 1), MatchResult(players[0], players[2], 2, 0),
+                         MatchResult(players[3], players[0], 2, 1)]
+
+        forward, backward = ResultsEloEngine(), ResultsEloEngine()
+        forward.apply_results(round_results, "Hard")
+        backward.apply_results(list(reversed(round_results)), "Hard")
+        for player in players:
+            assert forward.get_rating(player.player_id, "Hard") == backward.get_rating(player.player_id, "Hard")
+
+    def test_tournament_rounds_and_round_trip(self):
+        """Un tournoi met à jour les joueurs tour par tour; les ELO survivent à to_dict"""
+        engine = ResultsEloEngine()
+        tournament = ATP250("Test Open", "Testville", 8, "Grass")
+        generator = PlayerGenerator()
+        for _ in range(8):
+            tournament.add_participant(generator.generate_player(Gender.MALE))
+        tournament_manager = TournamentManager()
+        tournament_manager.match_observers.append(engine)
+        result = tournament_manager.play_tournament(tournament, verbose=False, week=5)
+
+        winner_id = result.winner.player_id
+        assert engine.get_rating(winner_id, "Grass") > result.winner.get_elo("Grass")
+        assert engine.get_top(1, "Grass")[0][1] >= engine.get_rating(winner_id, "Grass")
+
+        restored = ResultsEloEngine.from_dict(engine.to_dict())
+        assert restored.get_top(8) == engine.get_top(8)
+        assert restored.get_rating(winner_id, "Grass") == engine.get_rating(winner_id, "Grass")
+
+    def test_delta_holds_players_who_played(self):
+        """Le delta ne contient que les joueurs ayant joué depuis la sauvegarde"""
+        players = [_make_player(name) for name in ("A", "B", "C", "D")]
+        engine = ResultsEloEngine(capacity=2)
+        engine.apply_results([MatchResult(players[0], players[1], 2, 0)], "Clay")
+        base = engine.to_dict()
+        cursor = engine.save_cursor()
+
+        engine.apply_results([MatchResult(players[2], players[0], 2, 1)], "Hard")
+        delta = engine.to_delta_dict(cursor)
+        assert sorted(decode_array(delta["player_ids"]).tolist()) == sorted([players[0].player_id, players[2].player_id])
+
+        restored = ResultsEloEngine.from_dict(base)
+        restored.apply_delta(delta)
+        for player in players[:3]:
+            assert restored.get_rating(player.player_id, "Hard") == engine.get_rating(player.player_id, "Hard")
+        assert restored.get_rating(players[3].player_id) is None
@@ -1,9 +1,15 @@
 """
 Test rapide du système de retraite
 """
-from TennisRPG_v2.utils.helpers import calculate_retirement_probability, should_player_retire
+import numpy as np
+
+from TennisRPG_v2.utils.helpers import (
+    calculate_retirement_probability, calculate_retirement_probabilities, should_player_retire
+)
 from TennisRPG_v2.entities.player import Player, Gender
 from TennisRPG_v2.managers.retirement_manager import RetirementManager
+from TennisRPG_v2.managers.retirement_archive import RetirementArchive
+from TennisRPG_v2.managers.player_archive import RetiredPlayerArchive
 
 def test_retirement_probability():
     """Test des probabilités de retraite"""
@@ -56,6 +62,136 @@ def test_retirement_manager():
     stats = manager.get_retirement_stats()
     print(f"Statistiques vides: {stats}")
 
+def test_vectorized_probabilities_match_scalar():
+    """La version vectorisée donne les mêmes probabilités que la version scalaire"""
+    ages = np.array([25, 29, 30, 33, 35, 38, 41, 42, 45])
+    for ranking in [10, 50, 75, 150, 300, 800]:
+        expected = [calculate_retirement_probability(int(age), ranking) for age in ages]
+        vectorized = calculate_retirement_probabilities(ages, np.full(len(ages), ranking))
+        assert np.allclose(vectorized, expected)
+
+    expected = [calculate_retirement_probability(int(age)) for age in ages]
+    assert np.allclose(calculate_retirement_probabilities(ages), expected)
+
+
+def test_vectorized_retirement_pass():
+    """Le passage de fin de saison vieillit tout le pool et retire les joueurs trop âgés"""
+    manager = RetirementManager()
+    veteran = Player(gender=Gender.MALE, first_name="Vieux", last_name="Routier", country="France", age=41)
+    youngster = Player(gender=Gender.MALE, first_name="Jeune", last_name="Pousse", country="France", age=18)
+    pool = {veteran.full_name: veteran, youngster.full_name: youngster}
+
+    retired, new_players = manager._process_gender_retirements(pool, Gender.MALE, None, 2030, Gender.MALE)
+
+    assert veteran.career.age == 42 and youngster.career.age == 19
+    assert retired == [veteran]
+    assert len(new_players) == 1
+    assert manager.retirement_log[-1]["player_name"] == "Vieux Routier"
+
+
+def test_retirement_archive_year_stats_and_round_trip():
+    """L'archive en colonnes tient les agrégats annuels et se sérialise sans perte"""
+    entries = [
+        {"player_name": "A", "age": 34, "ranking": 120, "year": 2030, "country": "France"},
+        {"player_name": "B", "age": 38, "ranking": "N/A", "year": 2030, "country": "Spain"},
+        {"player_name": "C", "age": 40, "ranking": 15, "year": 2031, "country": "France"},
+        {"player_name": "D", "age": 36, "ranking": 300, "year": "Unknown", "country": "Italy"},
+    ]
+    archive = RetirementArchive()
+    for _ in range(100):  # Force l'agrandissement des colonnes
+        archive.extend(entries)
+
+    stats = archive.get_stats(2030)
+    assert stats["total_retirements"] == 200
+    assert stats["average_retirement_age"] == 36.0
+    assert (stats["youngest_retiree"], stats["oldest_retiree"]) == (34, 38)
+    assert sorted(stats["countries"]) == ["France", "Spain"]
+    assert archive.get_stats(2040) == {}
+    assert archive.get_stats()["total_retirements"] == 400
+    assert archive.get_years() == [2030, 2031]
+
+    restored = RetirementArchive.from_saved(archive.to_dict())
+    assert restored[:4] == entries
+    assert restored == archive
+    assert RetirementArchive.from_saved(entries)[-1] == entries[-1]
+
+    manager = RetirementManager()
+    manager.retirement_log = entries
+    assert manager.get_retirement_stats(2031)["total_retirements"] == 1
+
+
+def test_retired_players_are_archived(tmp_path):
+    """Les retraités quittent le pool actif mais restent consultables dans l'archive"""
+    archive = RetiredPlayerArchive(str(tmp_path / "archives" / "partie.sqlite"))
+    manager = RetirementManager(player_archive=archive)
+    veteran = Player(gender=Gender.MALE, first_name="Vieux", last_name="Routier", country="France", age=41)
+    veteran.career.atp_points = 1200
+    pool = {veteran.player_id: veteran}
+
+    manager.process_end_of_season_retirements(pool, None, 2030, Gender.MALE)
+
+    assert veteran.player_id not in pool
+    assert archive.count() == 1
+    summary = archive.find_by_year(2030)[0]
+    assert summary["full_name"] == "Vieux Routier"
+    assert (summary["retirement_age"], summary["atp_points"]) == (42, 1200)
+    assert archive.find_by_country("France") == [summary]
+    assert archive.find_by_name("Rout") == [summary]
+    assert "Routier" in archive.get_display_card("Vieux Routier")
+    assert archive.load_player("Vieux Routier").career.atp_points == 1200
+
+    archive.close()
+
+
+def test_archive_branches_are_never_deleted(tmp_path):
+    """Recharger une sauvegarde masque les retraites des autres branches sans les supprimer"""
+    db_path = str(tmp_path / "archives" / "partie.sqlite")
+
+    def retire(archive, last_name, year):
+        veteran = Player(gender=Gender.MALE, first_name="Vieux", last_name=last_name, country="France", age=41)
+        RetirementManager(player_archive=archive).process_end_of_season_retirements(
+            {veteran.player_id: veteran}, None, year, Gender.MALE)
+
+    archive = RetiredPlayerArchive(db_path)
+    retire(archive, "Ancien", 2030)
+    early_save = archive.get_lineage()
+    retire(archive, "Futur", 2031)
+    late_save = archive.get_lineage()
+    archive.close()
+
+    # Reprise de la sauvegarde de 2030: la retraite de 2031 est masquée, puis la partie diverge
+    branch = RetiredPlayerArchive(db_path, early_save)
+    assert [row["full_name"] for row in branch.find_by_name("Vieux")] == ["Vieux Ancien"]
+    retire(branch, "Autre", 2031)
+    assert branch.count() == 2
+    branch.close()
+
+    # La sauvegarde de 2031 retrouve sa retraite, sans celle de la branche divergente
+    late = RetiredPlayerArchive(db_path, late_save)
+    assert [row["full_name"] for row in late.find_by_year(2031)] == ["Vieux Futur"]
+    assert late.load_player("Vieux Autre") is None
+    late.close()
+
+    # Une session sans retraite n'allonge pas la chaîne des branches
+    idle = RetiredPlayerArchive(db_path, late_save)
+    assert idle.count() == 2
+    assert idle.get_lineage() == late_save
+    idle.close()
+
+
+def test_archiving_bypasses_display_cache(tmp_path):
+    """L'archivage ne garde pas les retraités en mémoire via le cache d'affichage"""
+    from TennisRPG_v2.utils.cache_manager import display_cache
+
+    archive = RetiredPlayerArchive(str(tmp_path / "partie.sqlite"))
+    veteran = Player(gender=Gender.MALE, first_name="Vieux", last_name="Cache", country="France", age=41)
+    archive.archive_players([veteran], 2030)
+
+    assert "Cache" in archive.get_display_card("Vieux Cache")
+    assert not any(key[1] is veteran for key in display_cache.cache if isinstance(key, tuple) and len(key) > 1)
+    archive.close()
+
+
 if __name__ == "__main__":
     try:
         test_retirement_probability()
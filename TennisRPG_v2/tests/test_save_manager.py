@@ -0,0 +1,362 @@
+"""
+Tests du système de sauvegarde pour TennisRPG v2
+"""
+import json
+import os
+
+from TennisRPG_v2.core.save_manager import SaveManager, GameState, SAVE_INDEX_FILENAME
+from TennisRPG_v2.entities.player import Player, Gender
+
+
+def _make_game_state(week: int = 10, year: int = 2025) -> GameState:
+    """Construit un état de jeu minimal"""
+    main_player = Player(gender=Gender.MALE, first_name="Jean", last_name="Test",
+                         country="France", is_main_player=True)
+    npc = Player(gender=Gender.MALE, first_name="Paul", last_name="Pnj", country="Spain")
+
+    game_state = GameState()
+    game_state.main_player = main_player
+    game_state.all_players = {main_player.full_name: main_player, npc.full_name: npc}
+    game_state.current_week = week
+    game_state.current_year = year
+    return game_state
+
+
+class TestSaveIndex:
+    """Tests de l'index des sauvegardes"""
+
+    def test_save_writes_header_and_index(self, tmp_path):
+        """La sauvegarde écrit un en-tête et met à jour l'index"""
+        manager = SaveManager(str(tmp_path))
+        assert manager.save_game(_make_game_state(), "partie")
+
+        with open(tmp_path / "partie.json", encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["header"]["player_name"] == "Jean Test"
+        assert data["header"]["week"] == 10
+
+        with open(tmp_path / SAVE_INDEX_FILENAME, encoding="utf-8") as f:
+            index = json.load(f)
+        assert index["saves"]["partie.json"]["year"] == 2025
+
+    def test_list_saves_reads_only_index(self, tmp_path, monkeypatch):
+        """list_saves n'ouvre pas les sauvegardes déjà indexées"""
+        manager = SaveManager(str(tmp_path))
+        manager.save_game(_make_game_state(week=3), "a")
+        manager.save_game(_make_game_state(week=7), "b")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("La sauvegarde complète ne doit pas être relue")
+
+        monkeypatch.setattr(manager, "_read_header_from_file", fail)
+        saves = manager.list_saves()
+
+        assert {save["filename"] for save in saves} == {"a.json", "b.json"}
+        assert SAVE_INDEX_FILENAME not in [save["filename"] for save in saves]
+
+        # get_save_by_index réutilise la liste déjà construite
+        monkeypatch.setattr(manager, "list_saves", fail)
+        assert manager.get_save_by_index(1) == saves[0]["filename"]
+
+    def test_legacy_save_is_indexed(self, tmp_path):
+        """Une sauvegarde sans en-tête est indexée lors du premier listage"""
+        legacy = _make_game_state(week=42).to_dict()
+        del legacy["header"]
+        with open(tmp_path / "ancienne.json", "w", encoding="utf-8") as f:
+            json.dump(legacy, f)
+
+        manager = SaveManager(str(tmp_path))
+        saves = manager.list_saves()
+
+        assert saves[0]["player_name"] == "Jean Test"
+        assert saves[0]["week"] == 42
+        with open(tmp_path / SAVE_INDEX_FILENAME, encoding="utf-8") as f:
+            assert "ancienne.json" in json.load(f)["saves"]
+
+    def test_deleted_save_removed_from_index(self, tmp_path):
+        """Les sauvegardes supprimées disparaissent de l'index"""
+        manager = SaveManager(str(tmp_path))
+        manager.save_game(_make_game_state(), "partie")
+        os.remove(tmp_path / "partie.json")
+
+        assert manager.list_saves() == []
+        assert manager.get_save_by_index(1) is None
+
+
+class TestIncrementalSaves:
+    """Tests des sauvegardes incrémentales (base + deltas)"""
+
+    def test_dirty_tracking(self):
+        """Les modifications des composants marquent le joueur comme modifié"""
+        player = Player(gender=Gender.MALE, first_name="Paul", last_name="Pnj", country="Spain")
+        assert player.is_dirty
+
+        player.clear_dirty()
+        assert not player.is_dirty
+
+        player.physical.fatigue = 12
+        player.physical.mark_dirty()
+        assert player.is_dirty
+
+    def test_delta_contains_only_dirty_players(self, tmp_path):
+        """Le delta ne contient que les joueurs modifiés et les joueurs supprimés"""
+        manager = SaveManager(str(tmp_path))
+        game_state = _make_game_state()
+        manager.save_game(game_state, "partie", incremental=True)
+        assert not (tmp_path / "partie.delta.jsonl").exists()
+
+        npc = game_state.all_players["Paul Pnj"]
+        npc.career.atp_points = 250
+        npc.career.mark_dirty()
+        newcomer = Player(gender=Gender.MALE, first_name="Luc", last_name="Neuf", country="Italy")
+        game_state.all_players[newcomer.full_name] = newcomer
+        game_state.current_week = 11
+        manager.save_game(game_state, "partie", incremental=True)
+
+        with open(tmp_path / "partie.delta.jsonl", encoding="utf-8") as f:
+            delta = json.loads(f.readline())
+        assert set(delta["players"]) == {"Paul Pnj", "Luc Neuf"}
+        assert delta["main_player"] is None
+
+        del game_state.all_players["Luc Neuf"]
+        manager.save_game(game_state, "partie", incremental=True)
+
+        loaded = SaveManager(str(tmp_path)).load_game("partie")
+        assert loaded.current_week == 11
+        assert set(loaded.all_players) == {"Jean Test", "Paul Pnj"}
+        assert loaded.all_players["Paul Pnj"].career.atp_points == 250
+        assert manager.list_saves()[0]["week"] == 11
+
+    def test_compaction_rewrites_base(self, tmp_path, monkeypatch):
+        """Le journal est compacté une fois le seuil atteint"""
+        from TennisRPG_v2.utils.constants import SAVE_CONSTANTS
+        monkeypatch.setitem(SAVE_CONSTANTS, "DELTA_COMPACTION_THRESHOLD", 2)
+
+        manager = SaveManager(str(tmp_path))
+        game_state = _make_game_state()
+        for week in range(1, 5):
+            game_state.current_week = week
+            manager.save_game(game_state, "partie", incremental=True)
+
+        # base (semaine 1), 2 deltas, puis compaction à la semaine 4
+        assert not (tmp_path / "partie.delta.jsonl").exists()
+        assert manager.load_game("partie").current_week == 4
+
+    def test_truncated_delta_is_ignored(self, tmp_path):
+        """Une dernière ligne de delta tronquée n'empêche pas le chargement"""
+        manager = SaveManager(str(tmp_path))
+        game_state = _make_game_state(week=5)
+        manager.save_game(game_state, "partie", incremental=True)
+        game_state.current_week = 6
+        manager.save_game(game_state, "partie", incremental=True)
+
+        with open(tmp_path / "partie.delta.jsonl", "a", encoding="utf-8") as f:
+            f.write('{"header": {"week"')
+
+        assert SaveManager(str(tmp_path)).load_game("partie").current_week == 6
+
+    def test_stale_journal_is_ignored(self, tmp_path):
+        """Le journal d'une base précédente (arrêt avant sa suppression) n'est pas rejoué"""
+        manager = SaveManager(str(tmp_path))
+        game_state = _make_game_state(week=5)
+        manager.save_game(game_state, "partie", incremental=True)
+        game_state.current_week = 6
+        manager.save_game(game_state, "partie", incremental=True)
+        stale_journal = (tmp_path / "partie.delta.jsonl").read_text(encoding="utf-8")
+
+        game_state.current_week = 7
+        manager.save_game(game_state, "partie")
+        (tmp_path / "partie.delta.jsonl").write_text(stale_journal, encoding="utf-8")
+
+        reloaded_manager = SaveManager(str(tmp_path))
+        assert reloaded_manager.load_game("partie").current_week == 7
+        # Le journal périmé n'est pas prolongé: la sauvegarde suivante est complète
+        reloaded_manager.save_game(game_state, "partie", incremental=True)
+        assert not (tmp_path / "partie.delta.jsonl").exists()
+
+    def test_failed_write_keeps_changes(self, tmp_path, monkeypatch):
+        """Un delta non écrit n'efface pas les modifications: la sauvegarde suivante les reprend"""
+        manager = SaveManager(str(tmp_path))
+        game_state = _make_game_state()
+        manager.save_game(game_state, "partie", incremental=True)
+
+        npc = game_state.all_players["Paul Pnj"]
+        npc.career.atp_points = 480
+        npc.career.mark_dirty()
+
+        def failing_append(filepath, delta):
+            raise OSError("disque plein")
+
+        monkeypatch.setattr(manager, "_append_delta", failing_append)
+        assert not manager.save_game(game_state, "partie", incremental=True)
+        assert npc.is_dirty
+
+        monkeypatch.undo()
+        assert manager.save_game(game_state, "partie", incremental=True)
+        assert not (tmp_path / "partie.delta.jsonl").exists()
+        assert SaveManager(str(tmp_path)).load_game("partie").all_players["Paul Pnj"].career.atp_points == 480
+
+
+class TestAutosave:
+    """Tests de la sauvegarde automatique en arrière-plan"""
+
+    def test_autosave_written_in_background(self, tmp_path):
+        """Les sauvegardes automatiques sont écrites par le thread dédié"""
+        from TennisRPG_v2.core.autosave_manager import AutosaveManager
+
+        manager = SaveManager(str(tmp_path))
+        autosave = AutosaveManager(manager)
+        game_state = _make_game_state(week=1)
+
+        for week in range(1, 4):
+            game_state.current_week = week
+            game_state.all_players["Paul Pnj"].physical.fatigue = week
+            game_state.all_players["Paul Pnj"].physical.mark_dirty()
+            assert autosave.request_autosave(game_state)
+        autosave.shutdown()
+
+        assert autosave.completed_saves == 3
+        assert autosave.last_error is None
+        loaded = manager.load_game("autosave_Jean_Test")
+        assert loaded.current_week == 3
+        assert loaded.all_players["Paul Pnj"].physical.fatigue == 3
+        assert not any(name.startswith(".tmp_") for name in os.listdir(tmp_path))
+
+    def test_manual_save_keeps_autosave_incremental(self, tmp_path):
+        """Une sauvegarde manuelle n'oblige pas l'autosave à réécrire une base complète"""
+        manager = SaveManager(str(tmp_path))
+        game_state = _make_game_state(week=1)
+        manager.save_game(game_state, "autosave", incremental=True)
+
+        npc = game_state.all_players["Paul Pnj"]
+        npc.career.atp_points = 90
+        npc.career.mark_dirty()
+        manager.save_game(game_state, "manuelle")
+        game_state.current_week = 2
+        manager.save_game(game_state, "autosave", incremental=True)
+
+        with open(tmp_path / "autosave.delta.jsonl", encoding="utf-8") as f:
+            delta = json.loads(f.readline())
+        # Le joueur sauvegardé manuellement reste modifié pour le fichier d'autosave
+        assert set(delta["players"]) == {"Paul Pnj"}
+        assert SaveManager(str(tmp_path)).load_game("autosave").all_players["Paul Pnj"].career.atp_points == 90
+
+    def test_failed_autosave_is_rewritten_in_full(self, tmp_path, monkeypatch):
+        """Après un échec d'écriture, l'autosave suivante est complète et garde les changements"""
+        from TennisRPG_v2.core.autosave_manager import AutosaveManager
+
+        manager = SaveManager(str(tmp_path))
+        autosave = AutosaveManager(manager)
+        game_state = _make_game_state(week=1)
+        autosave.request_autosave(game_state, "auto")
+        autosave.flush()
+
+        def failing_append(filepath, delta):
+            raise OSError("disque plein")
+
+        npc = game_state.all_players["Paul Pnj"]
+        npc.physical.fatigue = 40
+        npc.physical.mark_dirty()
+        monkeypatch.setattr(manager, "_append_delta", failing_append)
+        autosave.request_autosave(game_state, "auto")
+        autosave.flush()
+        assert autosave.last_error is not None
+        assert npc.is_dirty
+
+        monkeypatch.undo()
+        autosave.request_autosave(game_state, "auto")
+        autosave.shutdown()
+        assert not (tmp_path / "auto.delta.jsonl").exists()
+        assert manager.load_game("auto").all_players["Paul Pnj"].physical.fatigue == 40
+
+    def test_snapshot_is_isolated_from_live_state(self, tmp_path):
+        """L'instantané ne change plus après sa préparation"""
+        manager = SaveManager(str(tmp_path))
+        game_state = _make_game_state(week=8)
+        pending = manager.prepare_save(game_state, "instantane")
+
+        npc = game_state.all_players["Paul Pnj"]
+        npc.career.elo_ratings["General"] = 9999
+        game_state.retirement_log.append({"player_name": "X"})
+
+        manager.write_prepared_save(pending)
+        loaded = manager.load_game("instantane")
+        assert loaded.all_players["Paul Pnj"].career.elo_ratings.get("General") != 9999
+        assert loaded.retirement_log == []
+
+    def test_world_id_survives_save(self, tmp_path):
+        """L'identifiant de partie (archive des retraités) est conservé"""
+        manager = SaveManager(str(tmp_path))
+        game_state = _make_game_state()
+        manager.save_game(game_state, "partie")
+        assert manager.load_game("partie").world_id == game_state.world_id
+
+
+class TestRankingStatePersistence:
+    """Tests de la persistance des classements et de l'historique des points"""
+
+    def test_ranking_manager_round_trip(self, tmp_path):
+        """Historique, semaine courante et classements survivent à une sauvegarde"""
+        from TennisRPG_v2.managers.ranking_manager import RankingManager
+        from TennisRPG_v2.entities.ranking import RankingType
+
+        game_state = _make_game_state(week=12)
+        players = list(game_state.all_players.values())
+        ranking_manager = RankingManager(players)
+        ranking_manager.current_week = 12
+        players[1].career.atp_points = 500
+        players[1].career.mark_dirty()
+        players[1].career.atp_race_points = 500
+        ranking_manager.add_atp_points(players[1].full_name, 500, week=12)
+        ranking_manager.update_weekly_rankings()
+        game_state.ranking_state = ranking_manager.to_dict()
+
+        manager = SaveManager(str(tmp_path))
+        manager.save_game(game_state, "classements")
+        loaded = manager.load_game("classements")
+        restored = RankingManager.from_dict(list(loaded.all_players.values()), loaded.ranking_state)
+
+        npc = loaded.all_players[players[1].full_name]
+        assert restored.current_week == 12
+        assert restored.get_points_to_defend(npc.full_name, 12) == 500
+        assert restored.get_player_rank(npc) == 1
+        assert restored.get_player_rank(npc, RankingType.ATP_RACE) == 1
+
+    def test_ranking_delta_holds_only_weekly_changes(self, tmp_path):
+        """Un delta ne contient que les colonnes de points, rangs et périodes Glicko de la semaine"""
+        import numpy as np
+        from TennisRPG_v2.managers.ranking_manager import RankingManager
+
+        game_state = _make_game_state(week=12)
+        players = list(game_state.all_players.values())
+        ranking_manager = RankingManager(players)
+        ranking_manager.current_week = 12
+        ranking_manager.add_atp_points(players[0].player_id, 90, week=3)
+        ranking_manager.update_weekly_rankings()
+        game_state.components = {"ranking_state": ranking_manager}
+
+        manager = SaveManager(str(tmp_path))
+        manager.save_game(game_state, "classements", incremental=True)
+        for week in (13, 14):
+            ranking_manager.glicko_engine.record(players[1].player_id, players[0].player_id)
+            ranking_manager.advance_week()
+            ranking_manager.add_atp_points(players[1].player_id, 10 * week)
+            ranking_manager.update_weekly_rankings()
+            manager.save_game(game_state, "classements", incremental=True)
+
+        with open(tmp_path / "classements.delta.jsonl", encoding="utf-8") as f:
+            delta = json.loads(f.readlines()[-1])
+        assert "ranking_state" not in delta
+        assert set(delta["components"]["ranking_state"]["points_weeks"]) == {"14"}
+        assert len(delta["components"]["ranking_state"]["glicko"]["periods"]) == 1
+
+        loaded = SaveManager(str(tmp_path)).load_game("classements")
+        restored = RankingManager.from_dict(list(loaded.all_players.values()), loaded.ranking_state)
+        for ranking_delta in loaded.get_component_deltas("ranking_state"):
+            restored.apply_delta(ranking_delta)
+
+        assert restored.current_week == 14
+        assert (restored.atp_points_history.to_numpy() == ranking_manager.atp_points_history.to_numpy()).all()
+        assert np.array_equal(restored.rank_history.to_matrix(), ranking_manager.rank_history.to_matrix())
+        assert restored.glicko_engine.get_rating(players[1].player_id) == \
+            ranking_manager.glicko_engine.get_rating(players[1].player_id)
@@ -0,0 +1,78 @@
+"""
+Tests des barèmes compilés et de l'attribution des points par lots pour TennisRPG v2
+"""
+from TennisRPG_v2.data.calendar import CALENDAR
+from TennisRPG_v2.entities.player import Gender
+from TennisRPG_v2.entities.spectialized_tournaments import ATP250, ATPFinals
+from TennisRPG_v2.entities.tournament import ROUND_KEYS
+from TennisRPG_v2.managers.atp_points_manager import ATPPointsManager
+from TennisRPG_v2.managers.player_generator import PlayerGenerator
+from TennisRPG_v2.managers.ranking_manager import RankingManager
+from TennisRPG_v2.utils.constants import TOURNAMENT_CONSTANTS
+
+
+def _setup(tournament, count):
+    generator = PlayerGenerator()
+    players = [generator.generate_player(Gender.MALE) for _ in range(count)]
+    for player in players:
+        tournament.participants.append(player)
+    ranking_manager = RankingManager(players)
+    return players, ranking_manager, ATPPointsManager({p.player_id: p for p in players}, ranking_manager)
+
+
+class TestAwardTables:
+    """Tests des barèmes indexés par tour"""
+
+    def test_tables_match_configuration(self):
+        """Les barèmes compilés reprennent les configurations selon la taille du tableau"""
+        for num_players in (28, 32, 48, 56):
+            tournament = ATP250("Test Open", "Testville", num_players, "Hard")
+            atp_points, xp_points = tournament.award_tables
+            for column, round_key in enumerate(ROUND_KEYS):
+                config_key = tournament._get_round_key_for_tournament(round_key)
+                assert atp_points[column] == tournament.atp_points_config.get(config_key, 0)
+                assert xp_points[column] == tournament.xp_points_config.get(config_key, 0)
+
+    def test_runs_share_calendar_tables(self):
+        """Un tournoi du calendrier reprend les tableaux de sa description"""
+        run = CALENDAR.specs[0].create_run()
+        assert run.award_tables is CALENDAR.specs[0].award_tables
+        assert (run.award_tables[0] == CALENDAR.atp_points[0]).all()
+
+
+class TestBatchAwards:
+    """Tests de l'attribution en un lot"""
+
+    def test_batch_updates_totals_race_and_history(self):
+        """Un joueur présent plusieurs fois cumule ses points dans l'historique de la semaine"""
+        tournament = ATPFinals("Finals Test", "Turin", "Hard")
+        players, ranking_manager, atp_points_manager = _setup(tournament, 8)
+        winner, loser = players[0], players[1]
+        ranking_manager._rankings_need_update = False
+
+        points = tournament.award_results([winner, loser, winner], ["round_robin_win", "finalist", "winner"],
+                                          atp_points_manager, week=46)
+
+        atp_table = tournament.award_tables[0]
+        expected_winner = int(atp_table[ROUND_KEYS.index("round_robin_win")] + atp_table[ROUND_KEYS.index("winner")])
+        assert points.tolist()[1] == atp_table[ROUND_KEYS.index("finalist")]
+        assert winner.career.atp_points == winner.career.atp_race_points == expected_winner
+        assert atp_points_manager.get_player_points(winner, 46) == expected_winner
+        assert atp_points_manager.get_player_points(loser, 46) == loser.career.atp_points
+        assert ranking_manager._rankings_need_update
+
+    def test_tournament_awards_everyone_once(self):
+        """Un tournoi complet attribue à chaque joueur le barème de son dernier tour"""
+        tournament = ATP250("Test Open", "Testville", 32, "Clay")
+        players, ranking_manager, atp_points_manager = _setup(tournament, 32)
+        initial_xp = {player: player.career.xp_total for player in players}
+
+        result = tournament.play_tournament(verbose=False, atp_points_manager=atp_points_manager, week=20)
+
+        atp_table = tournament.award_tables[0]
+        for player in players:
+            round_reached = "winner" if player is result.winner else tournament.eliminated_players[player]
+            assert player.career.atp_points == atp_table[ROUND_KEYS.index(round_reached)]
+            assert atp_points_manager.get_player_points(player, 20) == player.career.atp_points
+        winner_xp = tournament.calculate_xp_points("winner") + TOURNAMENT_CONSTANTS["TOURNAMENT_COMPLETION_BONUS"]
+        assert result.winner.career.xp_total > initial_xp[result.winner] or winner_xp == 0
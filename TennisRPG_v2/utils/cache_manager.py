@@ -3,223 +3,350 @@ Cache Manager - Optimizes performance by caching expensive calculations
 Addresses performance issues identified in the refactoring report
 """
 import time
-import hashlib
-from typing import Dict, Any, Optional, Callable, Tuple
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Optional, Callable, Tuple, Hashable, List
 from functools import wraps
 from ..utils.error_handler import logger, safe_calculation
 
 
+class _CacheMiss:
+    """Sentinel type returned on cache misses (distinguishes a miss from a cached None)"""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return "CACHE_MISS"
+
+
+CACHE_MISS = _CacheMiss()
+
+
 class CacheManager:
-    """Manages caching for expensive calculations"""
+    """
+    Manages caching for expensive calculations
+
+    Ordered-dict LRU: get/set are O(1), entries expire lazily when read
+    past their TTL, and the least recently used entry is evicted when full.
+
+    Entries may also record the versions of the objects they were computed
+    from (anything exposing a monotonically increasing `version`, such as
+    Player, its components or Ranking). A read compares those versions and
+    drops the entry as stale if any of them moved.
+
+    Thread-safe: LazyLoader background threads may fill caches while the
+    simulation reads them, so every access to the ordered dict and the
+    counters holds the instance lock.
+    """
     
-    def __init__(self, max_size: int = 1000, ttl: int = 300):
-        self.cache: Dict[str, Tuple[Any, float]] = {}
+    def __init__(self, max_size: int = 1000, ttl: int = 300, namespace: str = "default"):
+        self.cache: "OrderedDict[Hashable, Tuple[Any, float, tuple]]" = OrderedDict()
+        self._lock = threading.Lock()  # Guards cache (move_to_end/popitem reorder it) and counters
         self.max_size = max_size
         self.ttl = ttl  # Time to live in seconds
+        self.namespace = namespace
         self.hit_count = 0
         self.miss_count = 0
+        self.eviction_count = 0
+        self.expiration_count = 0
+        self.stale_count = 0
         
-    def _generate_key(self, func_name: str, args: tuple, kwargs: dict) -> str:
-        """Generate a unique cache key"""
-        key_data = f"{func_name}:{str(args)}:{str(sorted(kwargs.items()))}"
-        return hashlib.md5(key_data.encode()).hexdigest()
-        
-    def _is_expired(self, timestamp: float) -> bool:
-        """Check if cache entry is expired"""
-        return time.time() - timestamp > self.ttl
-        
-    def _cleanup_expired(self) -> None:
-        """Remove expired entries"""
-        current_time = time.time()
-        expired_keys = [
-            key for key, (_, timestamp) in self.cache.items()
-            if current_time - timestamp > self.ttl
-        ]
-        for key in expired_keys:
-            del self.cache[key]
-            
-    def _evict_oldest(self) -> None:
-        """Evict oldest entries when cache is full"""
-        if len(self.cache) >= self.max_size:
-            # Remove 20% of oldest entries
-            sorted_items = sorted(
-                self.cache.items(),
-                key=lambda x: x[1][1]  # Sort by timestamp
-            )
-            
-            evict_count = max(1, self.max_size // 5)
-            for key, _ in sorted_items[:evict_count]:
-                del self.cache[key]
-                
-    def get(self, key: str) -> Optional[Any]:
-        """Get value from cache"""
-        if key in self.cache:
-            value, timestamp = self.cache[key]
-            if not self._is_expired(timestamp):
-                self.hit_count += 1
-                return value
-            else:
-                del self.cache[key]
+    def _generate_key(self, func_name: str, args: tuple, kwargs: dict) -> Hashable:
+        """
+        Generate a typed, hashable cache key
+
+        Raises:
+            TypeError: If an argument is not hashable
+        """
+        key = (func_name, args, frozenset(kwargs.items())) if kwargs else (func_name, args)
+        hash(key)
+        return key
                 
-        self.miss_count += 1
-        return None
-        
-    def set(self, key: str, value: Any) -> None:
-        """Set value in cache"""
-        self._cleanup_expired()
-        self._evict_oldest()
+    def get(self, key: Hashable, default: Any = CACHE_MISS) -> Any:
+        """Get value from cache, returning `default` (CACHE_MISS) on a miss"""
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is not None:
+                value, expires_at, dependencies = entry
+                if time.monotonic() > expires_at:
+                    # Lazy expiry: only the entry being read is checked
+                    del self.cache[key]
+                    self.expiration_count += 1
+                elif any(obj.version != version for obj, version in dependencies):
+                    del self.cache[key]
+                    self.stale_count += 1
+                else:
+                    self.cache.move_to_end(key)
+                    self.hit_count += 1
+                    return value
+
+            self.miss_count += 1
+            return default
         
-        self.cache[key] = (value, time.time())
+    def set(self, key: Hashable, value: Any, depends_on: tuple = ()) -> None:
+        """
+        Set value in cache, evicting the least recently used entry if full
+
+        Args:
+            key: Hashable cache key
+            value: Value to cache
+            depends_on: Versioned objects the value was computed from
+        """
+        dependencies = tuple((obj, obj.version) for obj in depends_on)
+        with self._lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+            self.cache[key] = (value, time.monotonic() + self.ttl, dependencies)
+
+            while len(self.cache) > self.max_size:
+                self.cache.popitem(last=False)
+                self.eviction_count += 1
         
-    def invalidate(self, pattern: str = None) -> None:
-        """Invalidate cache entries matching pattern"""
-        if pattern is None:
-            self.cache.clear()
-        else:
-            keys_to_remove = [
-                key for key in self.cache.keys()
-                if pattern in key
-            ]
-            for key in keys_to_remove:
-                del self.cache[key]
+    def invalidate(self, pattern: Any = None) -> None:
+        """Invalidate cache entries whose key contains `pattern` (all entries if None)"""
+        with self._lock:
+            if pattern is None:
+                self.cache.clear()
+            else:
+                keys_to_remove = [
+                    key for key in self.cache.keys()
+                    if _key_contains(key, pattern)
+                ]
+                for key in keys_to_remove:
+                    del self.cache[key]
                 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        total_requests = self.hit_count + self.miss_count
-        hit_rate = (self.hit_count / total_requests * 100) if total_requests > 0 else 0
-        
-        return {
-            'size': len(self.cache),
-            'max_size': self.max_size,
-            'hit_count': self.hit_count,
-            'miss_count': self.miss_count,
-            'hit_rate': round(hit_rate, 2),
-            'ttl': self.ttl
-        }
+        with self._lock:
+            total_requests = self.hit_count + self.miss_count
+            hit_rate = (self.hit_count / total_requests * 100) if total_requests > 0 else 0
+
+            return {
+                'namespace': self.namespace,
+                'size': len(self.cache),
+                'max_size': self.max_size,
+                'hit_count': self.hit_count,
+                'miss_count': self.miss_count,
+                'eviction_count': self.eviction_count,
+                'expiration_count': self.expiration_count,
+                'stale_count': self.stale_count,
+                'hit_rate': round(hit_rate, 2),
+                'ttl': self.ttl
+            }
+
+
+def _key_contains(key: Any, pattern: Any) -> bool:
+    """Check whether a (possibly nested) cache key contains `pattern`"""
+    if key == pattern or getattr(key, 'full_name', None) == pattern:
+        return True
+    if isinstance(key, str):
+        return isinstance(pattern, str) and pattern in key
+    if isinstance(key, (tuple, frozenset)):
+        return any(_key_contains(part, pattern) for part in key)
+    return False
 
 
 # Global cache instances
-elo_cache = CacheManager(max_size=500, ttl=600)  # 10 minutes for ELO
-ranking_cache = CacheManager(max_size=200, ttl=120)  # 2 minutes for rankings
-tournament_cache = CacheManager(max_size=100, ttl=1800)  # 30 minutes for tournaments
+elo_cache = CacheManager(max_size=500, ttl=600, namespace="elo")  # 10 minutes for ELO
+ranking_cache = CacheManager(max_size=200, ttl=120, namespace="ranking")  # 2 minutes for rankings
+tournament_cache = CacheManager(max_size=100, ttl=1800, namespace="tournament")  # 30 minutes for tournaments
+display_cache = CacheManager(max_size=200, ttl=600, namespace="display")  # Rendered cards, versioned
+
+
+def _versioned_arguments(args: tuple, kwargs: dict) -> tuple:
+    """Arguments exposing a `version` counter (the cached result goes stale when one moves)"""
+    return tuple(arg for arg in (*args, *kwargs.values()) if isinstance(getattr(arg, 'version', None), int))
+
+
+def _make_cached_decorator(cache: CacheManager, label: str) -> Callable:
+    """
+    Build a caching decorator bound to one cache namespace
+
+    Results depend on the versioned arguments they were computed from, so a
+    mutated Player (or Ranking, ...) misses instead of waiting for the TTL.
+    """
+    def decorator(func: Callable) -> Callable:
+        func_name = func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                key = cache._generate_key(func_name, args, kwargs)
+            except TypeError:
+                # Unhashable arguments: compute without caching
+                return func(*args, **kwargs)
+
+            cached_result = cache.get(key)
+            if cached_result is not CACHE_MISS:
+                return cached_result
+
+            # Calculate and cache result
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"{label} calculation failed: {str(e)}")
+                raise
+            cache.set(key, result, depends_on=_versioned_arguments(args, kwargs))
+            return result
+
+        return wrapper
+    return decorator
 
 
 def cached_elo_calculation(func: Callable) -> Callable:
     """Decorator for caching ELO calculations"""
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        # Generate cache key
-        key = elo_cache._generate_key(func.__name__, args, kwargs)
-        
-        # Try to get from cache
-        cached_result = elo_cache.get(key)
-        if cached_result is not None:
-            logger.debug(f"ELO cache hit for {func.__name__}")
-            return cached_result
-            
-        # Calculate and cache result
-        try:
-            result = func(*args, **kwargs)
-            elo_cache.set(key, result)
-            logger.debug(f"ELO calculated and cached for {func.__name__}")
-            return result
-        except Exception as e:
-            logger.error(f"ELO calculation failed: {str(e)}")
-            raise
-            
-    return wrapper
+    return _make_cached_decorator(elo_cache, "ELO")(func)
 
 
 def cached_ranking_calculation(func: Callable) -> Callable:
     """Decorator for caching ranking calculations"""
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        # Generate cache key
-        key = ranking_cache._generate_key(func.__name__, args, kwargs)
-        
-        # Try to get from cache
-        cached_result = ranking_cache.get(key)
-        if cached_result is not None:
-            logger.debug(f"Ranking cache hit for {func.__name__}")
-            return cached_result
-            
-        # Calculate and cache result
-        try:
-            result = func(*args, **kwargs)
-            ranking_cache.set(key, result)
-            logger.debug(f"Ranking calculated and cached for {func.__name__}")
-            return result
-        except Exception as e:
-            logger.error(f"Ranking calculation failed: {str(e)}")
-            raise
-            
-    return wrapper
+    return _make_cached_decorator(ranking_cache, "Ranking")(func)
 
 
 def cached_tournament_data(func: Callable) -> Callable:
     """Decorator for caching tournament data"""
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        # Generate cache key
-        key = tournament_cache._generate_key(func.__name__, args, kwargs)
-        
-        # Try to get from cache
-        cached_result = tournament_cache.get(key)
-        if cached_result is not None:
-            logger.debug(f"Tournament cache hit for {func.__name__}")
-            return cached_result
-            
-        # Calculate and cache result
-        try:
-            result = func(*args, **kwargs)
-            tournament_cache.set(key, result)
-            logger.debug(f"Tournament data cached for {func.__name__}")
-            return result
-        except Exception as e:
-            logger.error(f"Tournament data retrieval failed: {str(e)}")
-            raise
-            
-    return wrapper
+    return _make_cached_decorator(tournament_cache, "Tournament data")(func)
 
 
 class LazyLoader:
-    """Implements lazy loading for non-critical data"""
+    """
+    Implements lazy loading for non-critical data
+
+    Thread-safe and single-flight: concurrent requests for the same key
+    wait on one in-flight load. Keys can be preloaded in the background on a
+    small thread pool, and failed loads are remembered with an exponential
+    backoff so that a broken loader is not retried on every access.
+    """
     
-    def __init__(self):
+    def __init__(self, max_workers: int = 2, failure_backoff: float = 1.0, max_backoff: float = 60.0):
         self._loaded_data: Dict[str, Any] = {}
         self._loaders: Dict[str, Callable] = {}
+        self._in_flight: Dict[str, Future] = {}
+        self._failures: Dict[str, Tuple[int, float]] = {}  # key -> (attempts, retry_at)
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.max_workers = max_workers
+        self.failure_backoff = failure_backoff
+        self.max_backoff = max_backoff
         
     def register_loader(self, key: str, loader_func: Callable) -> None:
         """Register a loader function for a specific data key"""
-        self._loaders[key] = loader_func
+        with self._lock:
+            self._loaders[key] = loader_func
+            self._failures.pop(key, None)
         
     def get_data(self, key: str) -> Any:
-        """Get data, loading it lazily if needed"""
-        if key not in self._loaded_data:
-            if key in self._loaders:
-                try:
-                    self._loaded_data[key] = self._loaders[key]()
-                    logger.debug(f"Lazy loaded data for key: {key}")
-                except Exception as e:
-                    logger.error(f"Failed to lazy load {key}: {str(e)}")
-                    return None
-            else:
+        """Get data, loading it lazily if needed (None if unavailable)"""
+        with self._lock:
+            if key in self._loaded_data:
+                return self._loaded_data[key]
+            if key not in self._loaders:
                 logger.warning(f"No loader registered for key: {key}")
                 return None
-                
-        return self._loaded_data.get(key)
+
+            failure = self._failures.get(key)
+            if failure is not None and time.monotonic() < failure[1]:
+                # Negative result still cached: do not hammer a failing loader
+                return None
+
+            future = self._in_flight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._in_flight[key] = future
+                loader = self._loaders[key]
+
+        if is_owner:
+            self._run_loader(key, loader, future)
+
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+    def _run_loader(self, key: str, loader: Callable, future: Future) -> None:
+        """Run a loader and publish its result to every waiting caller"""
+        try:
+            value = loader()
+        except Exception as e:
+            with self._lock:
+                attempts = self._failures.get(key, (0, 0.0))[0] + 1
+                backoff = min(self.max_backoff, self.failure_backoff * 2 ** (attempts - 1))
+                self._failures[key] = (attempts, time.monotonic() + backoff)
+                self._in_flight.pop(key, None)
+            logger.error(f"Failed to lazy load {key} (attempt {attempts}, retry in {backoff:.1f}s): {str(e)}")
+            future.set_exception(e)
+            return
+
+        with self._lock:
+            self._loaded_data[key] = value
+            self._failures.pop(key, None)
+            self._in_flight.pop(key, None)
+        logger.debug(f"Lazy loaded data for key: {key}")
+        future.set_result(value)
+
+    def is_registered(self, key: str) -> bool:
+        """Check whether a loader is registered for a key"""
+        with self._lock:
+            return key in self._loaders
+
+    def is_loaded(self, key: str) -> bool:
+        """Check whether a key is already loaded"""
+        with self._lock:
+            return key in self._loaded_data
         
-    def preload(self, keys: list) -> None:
-        """Preload specific data keys"""
-        for key in keys:
-            self.get_data(key)
+    def preload(self, keys: list, background: bool = False) -> List[Future]:
+        """
+        Preload specific data keys
+
+        Args:
+            keys: Keys to load
+            background: Load on the thread pool instead of the calling thread
+
+        Returns:
+            Futures resolving to the loaded values (empty when not in background)
+        """
+        if not background:
+            for key in keys:
+                self.get_data(key)
+            return []
+
+        executor = self._get_executor()
+        return [executor.submit(self.get_data, key) for key in keys]
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the preload thread pool on first use"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="lazy-loader")
+            return self._executor
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the preload thread pool"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
             
     def clear(self, key: str = None) -> None:
-        """Clear loaded data"""
-        if key is None:
-            self._loaded_data.clear()
-        elif key in self._loaded_data:
-            del self._loaded_data[key]
+        """Clear loaded data and remembered failures"""
+        with self._lock:
+            if key is None:
+                self._loaded_data.clear()
+                self._failures.clear()
+            else:
+                self._loaded_data.pop(key, None)
+                self._failures.pop(key, None)
 
 
 # Global lazy loader instance
@@ -230,6 +357,7 @@ def invalidate_player_caches(player_name: str) -> None:
     """Invalidate all caches related to a specific player"""
     elo_cache.invalidate(player_name)
     ranking_cache.invalidate(player_name)
+    display_cache.invalidate(player_name)
     logger.info(f"Caches invalidated for player: {player_name}")
 
 
@@ -238,6 +366,7 @@ def invalidate_all_caches() -> None:
     elo_cache.invalidate()
     ranking_cache.invalidate()
     tournament_cache.invalidate()
+    display_cache.invalidate()
     lazy_loader.clear()
     logger.info("All caches invalidated")
 
@@ -248,6 +377,7 @@ def get_cache_statistics() -> Dict[str, Any]:
         'elo_cache': elo_cache.get_stats(),
         'ranking_cache': ranking_cache.get_stats(),
         'tournament_cache': tournament_cache.get_stats(),
+        'display_cache': display_cache.get_stats(),
         'lazy_loader_items': len(lazy_loader._loaded_data)
     }
 
@@ -109,11 +109,33 @@ RANKING_CONSTANTS = {
     "MAX_DISPLAY_COUNT": 500,
 }
 
+# ELO dynamique basé sur les résultats (en complément de l'ELO calculé depuis les statistiques)
+ELO_CONSTANTS = {
+    "RESULTS_ELO_ENABLED": False,  # Active le suivi des ELO issus des résultats
+    "K_FACTOR": 32,                # Facteur K standard
+    "PROVISIONAL_K_FACTOR": 40,    # Facteur K des joueurs ayant peu de matchs
+    "PROVISIONAL_MATCHES": 30,     # Nombre de matchs avant le facteur K standard
+    "RATING_SCALE": 400,           # Écart d'ELO donnant une probabilité de 10 contre 1
+}
+
+# Classement Glicko-2 (une période de notation par semaine)
+GLICKO_CONSTANTS = {
+    "INITIAL_RATING": 1500,        # Classement initial
+    "INITIAL_RD": 350,             # Écart de classement initial (et maximal)
+    "INITIAL_VOLATILITY": 0.06,    # Volatilité initiale
+    "TAU": 0.5,                    # Contrainte sur l'évolution de la volatilité
+    "SCALE": 173.7178,             # Conversion échelle Glicko / Glicko-2
+    "CONVERGENCE_TOLERANCE": 1e-6, # Précision du calcul de la volatilité
+    "MAX_ITERATIONS": 100,         # Itérations maximales du calcul de la volatilité
+    "DELTA_PERIODS": 52,           # Périodes conservées pour les sauvegardes incrémentales
+}
+
 # Types de classements disponibles
 RANKING_TYPES = {
     "ELO": "elo",
     "ATP": "atp",
-    "ATP_RACE": "atp_race"
+    "ATP_RACE": "atp_race",
+    "GLICKO": "glicko"
 }
 
 # Constantes pour les tournois
@@ -183,6 +205,15 @@ TIME_CONSTANTS = {
     "GAME_START_YEAR": 2024      # Année de début du jeu
 }
 
+# Constantes pour le système de sauvegarde
+SAVE_CONSTANTS = {
+    "AUTOSAVE_ENABLED": True,           # Sauvegarde automatique en arrière-plan chaque semaine
+    "DELTA_COMPACTION_THRESHOLD": 20,   # Nombre de deltas avant réécriture complète de la sauvegarde
+    "DELTA_MAX_SIZE_RATIO": 1.0,        # Compacte dès que les deltas dépassent la taille de la base
+    "PLAYER_ARCHIVE_DIRECTORY": "archives",  # Sous-répertoire des archives de retraités (une base par partie)
+    "MATCH_LOG_DIRECTORY": "match_logs",  # Sous-répertoire des saisons archivées du journal des matchs (un dossier par partie)
+}
+
 # Facteurs de progression par âge
 AGE_PROGRESSION_FACTORS = {
     "16-19": 1.4,  # Progression très rapide (jeune talent)
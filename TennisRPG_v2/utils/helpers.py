@@ -259,6 +259,25 @@ def get_age_progression_factor(age: int) -> float:
 		return AGE_PROGRESSION_FACTORS["34+"]
 
 
+def get_age_progression_factors(ages: np.ndarray) -> np.ndarray:
+	"""
+	Version vectorisée de get_age_progression_factor pour un lot de joueurs
+
+	Args:
+		ages: Tableau des âges des joueurs
+
+	Returns:
+		Tableau des facteurs de progression
+	"""
+	ages = np.asarray(ages)
+	return np.select(
+		[ages <= 19, ages <= 22, ages <= 26, ages <= 30, ages <= 33],
+		[AGE_PROGRESSION_FACTORS["16-19"], AGE_PROGRESSION_FACTORS["20-22"], AGE_PROGRESSION_FACTORS["23-26"],
+		 AGE_PROGRESSION_FACTORS["27-30"], AGE_PROGRESSION_FACTORS["31-33"]],
+		default=AGE_PROGRESSION_FACTORS["34+"]
+	)
+
+
 def calculate_tournament_xp(tournament_category: str, round_reached: str, base_xp: int = None) -> int:
 	"""
 	Calcule l'XP gagnée pour une performance en tournoi
@@ -318,6 +337,39 @@ def calculate_retirement_probability(age: int, atp_ranking: int = None) -> float
 	return min(1.0, max(0.0, probability))
 
 
+def calculate_retirement_probabilities(ages: np.ndarray, atp_rankings: np.ndarray = None) -> np.ndarray:
+	"""
+	Version vectorisée de calculate_retirement_probability pour tout un pool
+
+	Args:
+		ages: Tableau des âges des joueurs
+		atp_rankings: Tableau des classements ATP (0 = non classé, optionnel)
+
+	Returns:
+		Tableau des probabilités de retraite (entre 0 et 1)
+	"""
+	ages = np.asarray(ages, dtype=np.float64)
+
+	# Probabilité sigmoidale croissante avec l'âge
+	probabilities = 1 / (1 + np.exp(-0.75 * (ages - 34.33)))
+
+	# Ajustement selon le classement ATP (mêmes paliers que la version scalaire)
+	if atp_rankings is not None:
+		ranks = np.asarray(atp_rankings)
+		multipliers = np.select(
+			[ranks <= 0, ranks <= 50, ranks <= 100, ranks <= 200, ranks > 500],
+			[1.0, 0.3, 0.6, 0.9, 1.5],
+			default=1.0
+		)
+		probabilities = probabilities * multipliers
+
+	# Âge minimum et retraite forcée
+	probabilities = np.where(ages < RETIREMENT_CONSTANTS["MIN_RETIREMENT_AGE"], 0.0, probabilities)
+	probabilities = np.where(ages >= RETIREMENT_CONSTANTS["MAX_CAREER_AGE"], 1.0, probabilities)
+
+	return np.clip(probabilities, 0.0, 1.0)
+
+
 def should_player_retire(player: 'Player', atp_ranking: int = None) -> bool:
 	"""
 	Détermine si un joueur devrait prendre sa retraite
@@ -0,0 +1,215 @@
+"""
+Phase profiler for the weekly simulation hot path
+
+Disabled by default: instrumented functions pay one attribute check per call.
+Enable it with the TENNISRPG_PROFILE=1 environment variable (the breakdown is
+printed at exit, and exported as JSON to TENNISRPG_PROFILE_OUTPUT if set) or
+programmatically with profiler.enable().
+
+Each phase name should label one step of the simulation: the report ranks
+phases by self time, so a name shared by unrelated functions merges them.
+Instrument loop-level steps (a tournament, a weekly batch, a ranking update),
+not per-match or per-player calls, which run hundreds of thousands of times
+per season.
+"""
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from typing import Callable, Dict
+
+_ENV_FLAG = "TENNISRPG_PROFILE"
+_ENV_OUTPUT = "TENNISRPG_PROFILE_OUTPUT"
+
+# Shared no-op context manager returned by phase() while disabled
+_NULL_PHASE = nullcontext()
+
+
+class _Phase:
+    """Timing context manager for one phase execution"""
+
+    __slots__ = ("_profiler", "_name", "_start")
+
+    def __init__(self, profiler: 'PhaseProfiler', name: str):
+        self._profiler = profiler
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> '_Phase':
+        self._profiler._enter()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._profiler._exit(self._name, time.perf_counter() - self._start)
+
+
+class PhaseProfiler:
+    """
+    Aggregates wall time and call counts per named phase
+
+    Each phase records its inclusive time (total) and its self time, which
+    excludes the phases nested in it (e.g. point awards inside a
+    tournament). Self times do not overlap, so their wall shares add up to
+    at most 100%.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._totals: Dict[str, float] = {}
+        self._self_totals: Dict[str, float] = {}
+        self._calls: Dict[str, int] = {}
+        self._started_at = time.perf_counter()
+        self._local = threading.local()  # Per-thread stack of nested phases' time
+
+    def enable(self) -> None:
+        """Enable profiling and start a new measurement window"""
+        self.reset()
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Disable profiling (collected data is kept)"""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Clear collected data"""
+        self._totals.clear()
+        self._self_totals.clear()
+        self._calls.clear()
+        self._started_at = time.perf_counter()
+
+    def phase(self, name: str):
+        """
+        Context manager timing a phase
+
+        Args:
+            name: Phase name
+
+        Returns:
+            Timing context manager, or a shared no-op one while disabled
+        """
+        if not self.enabled:
+            return _NULL_PHASE
+        return _Phase(self, name)
+
+    def profiled(self, name: str) -> Callable:
+        """
+        Decorator timing every call of a function as a phase
+
+        Args:
+            name: Phase name
+
+        Returns:
+            Decorator
+        """
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                self._enter()
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self._exit(name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    def _stack(self) -> list:
+        """Time spent in nested phases, one slot per open phase of the current thread"""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _enter(self) -> None:
+        """Open a phase"""
+        self._stack().append(0.0)
+
+    def _exit(self, name: str, elapsed: float) -> None:
+        """Close the innermost phase and charge its time to its parent"""
+        stack = self._stack()
+        nested = stack.pop() if stack else 0.0
+        if stack:
+            stack[-1] += elapsed
+        self.record(name, elapsed, self_time=elapsed - nested)
+
+    def record(self, name: str, elapsed: float, calls: int = 1, self_time: float = None) -> None:
+        """Add a measurement to a phase (self_time defaults to elapsed: no nested phase)"""
+        self._totals[name] = self._totals.get(name, 0.0) + elapsed
+        self._self_totals[name] = self._self_totals.get(name, 0.0) + (elapsed if self_time is None else self_time)
+        self._calls[name] = self._calls.get(name, 0) + calls
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Return per-phase statistics, highest self time first
+
+        Returns:
+            Dictionary {phase: {calls, total, self, mean, share}} where total is
+            inclusive, self excludes nested phases, and share is the self time
+            as a fraction of wall time since the profiler was enabled or reset
+        """
+        wall_time = max(time.perf_counter() - self._started_at, 1e-9)
+        stats = {}
+        for name, self_total in sorted(self._self_totals.items(), key=lambda item: item[1], reverse=True):
+            calls = self._calls[name]
+            total = self._totals[name]
+            stats[name] = {
+                "calls": calls,
+                "total": total,
+                "self": self_total,
+                "mean": total / calls if calls else 0.0,
+                "share": self_total / wall_time
+            }
+        return stats
+
+    def format_table(self) -> str:
+        """Format the per-phase breakdown as a text table"""
+        lines = [f"{'Phase':<24} {'calls':>10} {'total (s)':>12} {'self (s)':>12} {'mean (ms)':>12} "
+                 f"{'self %':>8}", "-" * 83]
+        for name, phase_stats in self.get_stats().items():
+            lines.append(f"{name:<24} {phase_stats['calls']:>10} {phase_stats['total']:>12.3f} "
+                         f"{phase_stats['self']:>12.3f} {phase_stats['mean'] * 1e3:>12.4f} "
+                         f"{phase_stats['share'] * 100:>7.1f}%")
+        return "\n".join(lines)
+
+    def report(self, file=None) -> None:
+        """Print the breakdown table"""
+        print(self.format_table(), file=file or sys.stdout)
+
+    def export_json(self, path: str) -> None:
+        """Write the breakdown as JSON"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.get_stats(), f, indent=2)
+
+
+def _env_enabled() -> bool:
+    """Check the environment flag"""
+    return os.environ.get(_ENV_FLAG, "").lower() in ("1", "true", "yes", "on")
+
+
+profiler = PhaseProfiler(enabled=_env_enabled())
+
+
+def profile_phase(name: str) -> Callable:
+    """Decorator timing a function with the global profiler"""
+    return profiler.profiled(name)
+
+
+def _report_at_exit() -> None:
+    """Print (and optionally export) the breakdown when profiling from the environment"""
+    if not profiler.get_stats():
+        return
+    output = os.environ.get(_ENV_OUTPUT)
+    if output:
+        profiler.export_json(output)
+    print("\n" + profiler.format_table(), file=sys.stderr)
+
+
+if profiler.enabled:
+    atexit.register(_report_at_exit)
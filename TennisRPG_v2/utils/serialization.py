@@ -0,0 +1,46 @@
+"""
+Compact serialization helpers for numeric arrays stored in save files
+"""
+import base64
+import zlib
+from typing import Dict, Any
+
+import numpy as np
+
+
+def encode_array(array: np.ndarray) -> Dict[str, Any]:
+    """
+    Encode a numeric array as a compact JSON-compatible dictionary
+
+    The raw little-endian buffer is zlib-compressed then base64-encoded,
+    which keeps sparse matrices (point histories, counters) very small.
+
+    Args:
+        array: Array to encode
+
+    Returns:
+        Dictionary with dtype, shape and encoded data
+    """
+    array = np.ascontiguousarray(array)
+    dtype = array.dtype.newbyteorder('<')
+    raw = array.astype(dtype, copy=False).tobytes()
+    return {
+        "dtype": dtype.str,
+        "shape": list(array.shape),
+        "data": base64.b64encode(zlib.compress(raw)).decode('ascii')
+    }
+
+
+def decode_array(data: Dict[str, Any]) -> np.ndarray:
+    """
+    Decode an array produced by encode_array
+
+    Args:
+        data: Encoded array dictionary
+
+    Returns:
+        Writable numpy array
+    """
+    raw = zlib.decompress(base64.b64decode(data["data"]))
+    array = np.frombuffer(raw, dtype=np.dtype(data["dtype"]))
+    return array.reshape(data["shape"]).copy()